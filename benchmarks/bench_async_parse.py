@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Async engine page-parsing benchmark / equivalence check
+
+Fails if PortalFormState's lxml form parser and the BeautifulSoup fallback
+disagree on any page in benchmarks/owner_pages, then runs N simulated portal
+sessions on one event loop - each waits a fixed round trip, then parses the
+page's form and owners - and reports pages/second and how late a 10ms timer
+on the same loop fires, for:
+
+  • inline (BeautifulSoup) - the parsing the engine used to do on the loop
+  • inline (lxml)          - the fast parsers, still on the loop
+  • parse pool             - parse_off_loop(), what AsyncPortalSession and
+                             AsyncSearchWorker use
+
+Usage:
+    python benchmarks/bench_async_parse.py [--sessions 10 50 200] [--pages N] [--latency S]
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from owner_extractor import OwnerExtractor, lxml_html  # noqa: E402
+from bhoomi_web_APP_v3_10workers import Config, PortalFormState, parse_off_loop  # noqa: E402
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'owner_pages')
+
+
+def load_corpus(corpus_dir):
+    pages = {}
+    for name in sorted(os.listdir(corpus_dir)):
+        if name.endswith(('.html', '.htm')):
+            with open(os.path.join(corpus_dir, name), encoding='utf-8') as f:
+                pages[name] = f.read()
+    return pages
+
+
+def check_equivalence(pages):
+    """Return the names of pages where the two form parsers disagree"""
+    mismatches = []
+    for name, html in pages.items():
+        fast = PortalFormState._parse_form_lxml(html)
+        legacy = PortalFormState._parse_form_soup(html)
+        status = 'OK ' if fast == legacy else 'DIFF'
+        print(f"  {status} {name:<28} fields={len(legacy[0])} selects={len(legacy[2])}")
+        if fast != legacy:
+            mismatches.append(name)
+    return mismatches
+
+
+def parse_inline_soup(html):
+    return PortalFormState._parse_form_soup(html), OwnerExtractor.extract_legacy(html)
+
+
+def parse_inline_fast(html):
+    return PortalFormState.parse_form(html), OwnerExtractor.extract(html)
+
+
+async def parse_pool(html):
+    return (await parse_off_loop(PortalFormState.parse_form, html),
+            await parse_off_loop(OwnerExtractor.extract, html))
+
+
+async def run_sessions(mode, pages, sessions, pages_per_session, latency):
+    """N sessions on this loop; returns (pages/s, p99 and max timer lateness in ms)"""
+    html_list = list(pages.values())
+    lateness = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            lateness.append(time.perf_counter() - start - 0.01)
+
+    async def session(index):
+        for i in range(pages_per_session):
+            await asyncio.sleep(latency)  # Portal round trip
+            html = html_list[(index + i) % len(html_list)]
+            if mode == 'parse pool':
+                await parse_pool(html)
+            elif mode == 'inline (lxml)':
+                parse_inline_fast(html)
+            else:
+                parse_inline_soup(html)
+
+    tick = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    await asyncio.gather(*(session(i) for i in range(sessions)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await tick
+    lateness.sort()
+    p99 = lateness[int(len(lateness) * 0.99)] if lateness else 0.0
+    return sessions * pages_per_session / elapsed, p99 * 1000, (lateness[-1] if lateness else 0.0) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark async engine page parsing')
+    parser.add_argument('--sessions', type=int, nargs='+', default=[10, 50, 200], help='Concurrent sessions')
+    parser.add_argument('--pages', type=int, default=10, help='Pages parsed per session')
+    parser.add_argument('--latency', type=float, default=0.2, help='Simulated portal round trip (s)')
+    parser.add_argument('--corpus', default=CORPUS_DIR, help='Directory of saved result pages')
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus)
+    if not pages:
+        print(f"No pages found in {args.corpus}")
+        return 1
+    if lxml_html is None:
+        print("lxml is not installed - only the fallback parsers are available")
+        return 1
+
+    print(f"Form parser equivalence ({len(pages)} pages):")
+    mismatches = check_equivalence(pages)
+
+    # Start the pool before timing (process start-up is a one-off per server)
+    asyncio.run(parse_pool(next(iter(pages.values()))))
+
+    print(f"\nThroughput ({args.pages} pages per session, {args.latency * 1000:.0f}ms round trip, "
+          f"{Config.ASYNC_PARSE_PROCESSES} parse processes, {os.cpu_count()} CPUs):")
+    print(f"  {'sessions':>8}  {'mode':<22} {'pages/s':>9} {'timer p99':>10} {'timer max':>10}")
+    for sessions in args.sessions:
+        for mode in ('inline (BeautifulSoup)', 'inline (lxml)', 'parse pool'):
+            rate, p99, worst = asyncio.run(run_sessions(mode, pages, sessions, args.pages, args.latency))
+            print(f"  {sessions:>8}  {mode:<22} {rate:>9.1f} {p99:>8.1f}ms {worst:>8.1f}ms")
+
+    if mismatches:
+        print(f"\n✗ {len(mismatches)} page(s) differ: {', '.join(mismatches)}")
+        return 1
+    print("\n✓ lxml form parser matches the BeautifulSoup fallback on every page")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
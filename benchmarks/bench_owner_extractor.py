@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Owner extractor benchmark / equivalence check
+
+Runs every page in benchmarks/owner_pages through both OwnerExtractor paths,
+fails if either path's owners differ from the page's entry in
+owner_pages/expected_owners.json (so both paths agreeing on a wrong answer
+still fails), then reports pages/second for each.
+
+Usage:
+    python benchmarks/bench_owner_extractor.py [--rounds N] [--corpus DIR]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from owner_extractor import OwnerExtractor, lxml_html  # noqa: E402
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'owner_pages')
+EXPECTED_FILE = 'expected_owners.json'
+
+
+def load_corpus(corpus_dir):
+    pages = {}
+    for name in sorted(os.listdir(corpus_dir)):
+        if name.endswith(('.html', '.htm')):
+            with open(os.path.join(corpus_dir, name), encoding='utf-8') as f:
+                pages[name] = f.read()
+    return pages
+
+
+def load_expected(corpus_dir):
+    path = os.path.join(corpus_dir, EXPECTED_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def check_expected(pages, expected):
+    """Return the names of pages where either path differs from the expected owners"""
+    mismatches = []
+    for name, html in pages.items():
+        want = expected.get(name)
+        fast = OwnerExtractor.extract_fast(html)
+        legacy = OwnerExtractor.extract_legacy(html)
+        ok = want is not None and fast == want and legacy == want
+        status = 'OK ' if ok else 'DIFF'
+        print(f"  {status} {name:<28} owners={len(legacy)} expected={'-' if want is None else len(want)}")
+        if not ok:
+            mismatches.append(name)
+            if want is None:
+                print(f"       no entry in {EXPECTED_FILE}")
+            else:
+                print(f"       expected: {want}")
+            print(f"       fast:     {fast}")
+            print(f"       legacy:   {legacy}")
+    return mismatches
+
+
+def bench(label, func, pages, rounds):
+    html_list = list(pages.values())
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for html in html_list:
+            func(html)
+    elapsed = time.perf_counter() - start
+    total = rounds * len(html_list)
+    rate = total / elapsed if elapsed else float('inf')
+    print(f"  {label:<22} {total:>6} pages in {elapsed:7.3f}s  →  {rate:9.1f} pages/s")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark owner extraction paths')
+    parser.add_argument('--rounds', type=int, default=50, help='Passes over the corpus per path')
+    parser.add_argument('--corpus', default=CORPUS_DIR, help='Directory of saved result pages')
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus)
+    if not pages:
+        print(f"No pages found in {args.corpus}")
+        return 1
+    if lxml_html is None:
+        print("lxml is not installed - only the fallback path is available")
+        return 1
+
+    print(f"Expected owners ({len(pages)} pages):")
+    mismatches = check_expected(pages, load_expected(args.corpus))
+
+    print(f"\nThroughput ({args.rounds} rounds):")
+    fast_rate = bench('lxml fast path', OwnerExtractor.extract_fast, pages, args.rounds)
+    legacy_rate = bench('BeautifulSoup fallback', OwnerExtractor.extract_legacy, pages, args.rounds)
+    print(f"  speedup: {fast_rate / legacy_rate:.1f}x")
+
+    if mismatches:
+        print(f"\n✗ {len(mismatches)} page(s) differ from {EXPECTED_FILE}: {', '.join(mismatches)}")
+        return 1
+    print("\n✓ Both paths return the expected owners on every page")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+land_records schema benchmark
+
+Builds a synthetic database in the old flat land_records layout, measures its size
+and the queries DatabaseManager used to run on it, then opens a copy with
+DatabaseManager - which migrates it to the normalised schema - and times the same
+DatabaseManager calls (and one ad-hoc query through the land_records view).
+
+Usage:
+    python benchmarks/bench_records_schema.py [--rows N] [--dir DIR] [--keep]
+"""
+
+import os
+import sys
+import time
+import random
+import shutil
+import sqlite3
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bhoomi_web_APP_v3_10workers import DatabaseManager  # noqa: E402
+
+SESSIONS = 20
+TALUKS = 10
+HOBLIS_PER_TALUK = 5
+VILLAGES_PER_HOBLI = 40
+OWNERS = 500000
+PERIODS = ('2018-19', '2019-20', '2020-21', '2021-22')
+
+LEGACY_SCHEMA = '''
+    CREATE TABLE search_sessions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        session_id TEXT UNIQUE NOT NULL,
+        owner_name TEXT NOT NULL,
+        status TEXT DEFAULT 'running',
+        started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE land_records (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        session_id TEXT NOT NULL,
+        district TEXT,
+        taluk TEXT,
+        hobli TEXT,
+        village TEXT,
+        survey_no INTEGER,
+        surnoc TEXT,
+        hissa TEXT,
+        period TEXT,
+        owner_name TEXT,
+        extent TEXT,
+        khatah TEXT,
+        is_match INTEGER DEFAULT 0,
+        worker_id INTEGER DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+'''
+LEGACY_INDEXES = '''
+    CREATE INDEX idx_records_session ON land_records(session_id);
+    CREATE INDEX idx_records_village ON land_records(village);
+    CREATE INDEX idx_records_owner ON land_records(owner_name);
+    CREATE INDEX idx_records_match ON land_records(is_match);
+'''
+
+# (label, SQL the flat table was queried with, the same lookup on a migrated DatabaseManager -
+#  None runs the SQL itself through the land_records view)
+QUERIES = [
+    ('session page (100 newest)',
+     'SELECT * FROM land_records WHERE session_id = :session ORDER BY id DESC LIMIT 100',
+     lambda db, session, village: db.get_session_records(session, limit=100)),
+    ('session matches',
+     'SELECT * FROM land_records WHERE session_id = :session AND is_match = 1 ORDER BY id DESC',
+     lambda db, session, village: list(db.iter_session_records(session, is_match=True))),
+    ('session page (survey order)',
+     'SELECT * FROM land_records WHERE session_id = :session ORDER BY village, survey_no, id LIMIT 100',
+     lambda db, session, village: db.get_records_page(session, sort='survey')),
+    ('session stats', '''
+        SELECT COUNT(*), SUM(is_match), COUNT(DISTINCT village)
+        FROM land_records WHERE session_id = :session
+     ''', lambda db, session, village: db.get_session_stats(session)),
+    ('owner search (search_records)', '''
+        SELECT r.*, s.owner_name as search_owner, s.started_at as search_date
+        FROM land_records r
+        JOIN search_sessions s ON r.session_id = s.session_id
+        WHERE r.owner_name LIKE '%RAMAPPA 1234%'
+        ORDER BY r.created_at DESC
+        LIMIT 100
+     ''', lambda db, session, village: db.search_records('RAMAPPA 1234')),
+    ('count all', 'SELECT COUNT(*) FROM land_records',
+     lambda db, session, village: db.get_all_records_count()),
+    ('village records (ad-hoc, view)', 'SELECT COUNT(*) FROM land_records WHERE village = :village',
+     None),
+]
+
+
+def session_ids():
+    return [f"search_20260{1 + i % 9}15_1{i:05d}_{random.Random(i).getrandbits(32):08x}"
+            for i in range(SESSIONS)]
+
+
+def villages():
+    out = []
+    for t in range(TALUKS):
+        for h in range(HOBLIS_PER_TALUK):
+            for v in range(VILLAGES_PER_HOBLI):
+                out.append(('BENGALURU RURAL', f'TALUK {t:02d} DODDABALLAPURA',
+                            f'HOBLI {t:02d}{h} KASABA', f'VILLAGE {t:02d}{h}{v:02d} HALLI'))
+    return out
+
+
+def build_legacy(path, rows):
+    """Old flat layout: every row repeats the location names and the session id"""
+    rng = random.Random(42)
+    sessions = session_ids()
+    places = villages()
+    conn = sqlite3.connect(path)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=OFF')
+    conn.executescript(LEGACY_SCHEMA)
+    conn.executemany('INSERT INTO search_sessions (session_id, owner_name) VALUES (?, ?)',
+                     [(s, 'RAMAPPA') for s in sessions])
+
+    def generate():
+        # Consecutive rows share a survey and a hissa, one row per owner per period
+        n = 0
+        while n < rows:
+            session = sessions[rng.randrange(SESSIONS)]
+            place = places[rng.randrange(len(places))]
+            survey_no = rng.randint(1, 300)
+            for hissa in range(1, rng.randint(2, 4)):
+                owners = [f'RAMAPPA {rng.randrange(OWNERS):06d}' for _ in range(rng.randint(1, 3))]
+                for period in PERIODS:
+                    for owner in owners:
+                        yield (session, *place, survey_no, '*', str(hissa), period, owner,
+                               f'{rng.randint(0, 9)}.{rng.randint(0, 39):02d}.00',
+                               str(rng.randint(1, 999)), 1 if owner.endswith('7') else 0,
+                               rng.randint(1, 5), '2026-01-15 10:30:00')
+                        n += 1
+                        if n >= rows:
+                            return
+
+    conn.executemany('''
+        INSERT INTO land_records (session_id, district, taluk, hobli, village, survey_no, surnoc,
+                                  hissa, period, owner_name, extent, khatah, is_match, worker_id,
+                                  created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', generate())
+    conn.commit()
+    conn.executescript(LEGACY_INDEXES)
+    conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+    conn.close()
+    return sessions[0], places[0][3]
+
+
+def db_size(path):
+    return sum(os.path.getsize(path + suffix) for suffix in ('', '-wal') if os.path.exists(path + suffix))
+
+
+def best_of(func, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def time_legacy(path, session, village):
+    conn = sqlite3.connect(path)
+    params = {'session': session, 'village': village}
+    results = {label: best_of(lambda: conn.execute(sql, params).fetchall()) for label, sql, _ in QUERIES}
+    conn.close()
+    return results
+
+
+def time_manager(db, session, village):
+    results = {}
+    for label, sql, call in QUERIES:
+        if call is None:
+            def call_view():
+                with db.get_connection() as conn:
+                    conn.execute(sql, {'session': session, 'village': village}).fetchall()
+            results[label] = best_of(call_view)
+        else:
+            results[label] = best_of(lambda: call(db, session, village))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the normalised land_records schema')
+    parser.add_argument('--rows', type=int, default=10_000_000, help='Synthetic records to generate')
+    parser.add_argument('--dir', default=None, help='Working directory (default: a temp dir)')
+    parser.add_argument('--keep', action='store_true', help='Keep the generated databases')
+    args = parser.parse_args()
+
+    work_dir = args.dir or tempfile.mkdtemp(prefix='bhoomi_schema_')
+    os.makedirs(work_dir, exist_ok=True)
+    legacy_path = os.path.join(work_dir, 'legacy.db')
+    new_path = os.path.join(work_dir, 'normalised.db')
+    for path in (legacy_path, new_path):
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+    print(f"Building {args.rows:,} legacy rows in {work_dir} ...")
+    start = time.perf_counter()
+    session, village = build_legacy(legacy_path, args.rows)
+    print(f"  built in {time.perf_counter() - start:.0f}s")
+    legacy_size = db_size(legacy_path)
+    legacy_times = time_legacy(legacy_path, session, village)
+
+    print("Migrating a copy with DatabaseManager ...")
+    shutil.copyfile(legacy_path, new_path)
+    start = time.perf_counter()
+    db = DatabaseManager(new_path, pool_size=2)
+    while db._legacy_records and db._migration_thread.is_alive():
+        time.sleep(0.5)
+    db.close()
+    print(f"  migrated in {time.perf_counter() - start:.0f}s")
+    conn = sqlite3.connect(new_path)
+    conn.execute('VACUUM')  # Hand the legacy table's freed pages back before measuring
+    conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+    conn.close()
+    new_size = db_size(new_path)
+    db = DatabaseManager(new_path, pool_size=2)
+    new_times = time_manager(db, session, village)
+    db.close()
+
+    print(f"\nSize: {legacy_size / 2**20:,.0f} MB  →  {new_size / 2**20:,.0f} MB "
+          f"({new_size / legacy_size:.0%})")
+    print(f"\n  {'query':<32} {'flat table':>12} {'normalised':>12}")
+    for label, _, _ in QUERIES:
+        print(f"  {label:<32} {legacy_times[label] * 1000:>10.1f}ms {new_times[label] * 1000:>10.1f}ms")
+
+    if not args.keep and not args.dir:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -23,20 +23,29 @@ import os
 import sys
 import json
 import time
+import math
+import bisect
 import logging
 import threading
+import multiprocessing
 import queue
+import asyncio
 import platform
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from dataclasses import dataclass, field, asdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import contextmanager
+from collections import OrderedDict, deque
+import io
 import csv
+import zlib
+import itertools
 import traceback
 
 # Flask imports
-from flask import Flask, render_template_string, jsonify, request
+from flask import Flask, Response, render_template_string, jsonify, request, stream_with_context
 from flask_cors import CORS
 
 # HTTP imports
@@ -44,6 +53,15 @@ import requests
 import urllib3
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Async HTTP (optional - only needed for the 'async' fetch engine)
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Owner extraction (lxml fast path, BeautifulSoup fallback)
+from owner_extractor import OwnerExtractor, lxml_html
+
 # ═══════════════════════════════════════════════════════════════════════════════════════
 # CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════════════════════════
@@ -70,14 +88,37 @@ class Config:
     PORTAL_TIMEOUT_THRESHOLD = 5           # Consider slow if response > 5s
     AUTO_RESUME_ON_RECOVERY = True         # Auto-resume search when portal recovers
     MIN_WORKERS_DURING_THROTTLE = 2        # Minimum workers to keep active
-    THROTTLE_SCALE_DOWN_DELAY = 15         # Seconds between scaling down workers
-    THROTTLE_SCALE_UP_DELAY = 30           # Seconds between scaling up workers
+    
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    # ADAPTIVE CONCURRENCY (AIMD) - Active workers and request rate follow the portal
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    ENABLE_ADAPTIVE_CONCURRENCY = True     # Closed-loop control of live searches
+    AIMD_INTERVAL = 10                     # Seconds between controller decisions
+    AIMD_MIN_SAMPLES = 10                  # Fewer portal requests than this in a window = hold
+    AIMD_SLO_SUCCESS_RATE = 0.95           # Grow only while this share of requests succeeds...
+    AIMD_SLO_P95_LATENCY = 6.0             # ...and p95 portal latency (seconds) stays below this
+    AIMD_RATE_STEP = 0.5                   # Additive increase of the request rate (req/s)
+    AIMD_DECREASE_FACTOR = 0.5             # Multiplicative decrease on alerts, timeouts or SLO breach
+    AIMD_MIN_RATE = 0.5                    # Request rate floor (req/s)
+    AIMD_MAX_RATE = 10.0                   # Request rate ceiling (req/s)
+    
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    # PORTAL RATE LIMITS - One token bucket per operation: (requests/second, burst)
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    RATE_LIMITS = {
+        'navigation': (5.0, 20),           # Dropdown postbacks and page loads - cheap
+        'go': (2.0, 10),                   # Survey GO - portal looks up the surnoc list
+        'fetch': (1.5, 8),                 # RTC Fetch Details - the expensive call
+        'hierarchy_api': (5.0, 10),        # eChawadi district/taluk/hobli/village API
+    }
     
     # Timeouts (seconds) - Optimized for Mac speed
     PAGE_LOAD_TIMEOUT = 20
     ELEMENT_WAIT_TIMEOUT = 8
     POST_CLICK_WAIT = 4  # Faster clicks
     POST_SELECT_WAIT = 1.5  # Faster selections
+    POSTBACK_TIMEOUT = 15  # Max wait for an ASP.NET postback to finish (returns as soon as it does)
+    POSTBACK_POLL_INTERVAL = 0.05  # Seconds between postback-completion checks
     
     # Search Settings - INTELLIGENT SMART STOP
     DEFAULT_MAX_SURVEY = 200
@@ -90,6 +131,15 @@ class Config:
     MIN_SURVEYS_BEFORE_STOP = 10        # Check at least 10 surveys before allowing stop
     TRACK_SKIPPED_SURVEYS = True        # Track all skipped surveys for retry capability
     
+    # Period checkpoints - finished (surnoc, hissa, period) tuples of the survey in progress,
+    # so a resume continues mid-survey instead of repeating it
+    PERIOD_CHECKPOINT_BATCH = 25        # Buffered marks of owner-less periods written per transaction
+    
+    # Survey range splitting - idle workers take the upper half of a running village
+    SPLIT_SURVEY_RANGES = True
+    MIN_SURVEY_RANGE = 25               # Never split off fewer surveys than this
+    SPLIT_POLL_INTERVAL = 2             # Idle worker re-checks running villages for a split (seconds)
+    
     # Session Recovery Settings
     MAX_SESSION_RETRIES = 3  # Retry this many times on session expiry
     SESSION_REFRESH_WAIT = 3  # Wait after refreshing session
@@ -120,6 +170,97 @@ class Config:
     PORTAL_COOLDOWN_THRESHOLD = 3   # If 3+ workers fail simultaneously, pause all
     PORTAL_COOLDOWN_TIME = 30       # Seconds to wait during portal cooldown
     
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    # FETCH ENGINE - 'selenium' drives headless Chrome, 'http' replays the form postbacks,
+    # 'async' multiplexes the postback sessions on one asyncio event loop,
+    # 'offline' matches owners against the RTC cache of earlier crawls (no portal access)
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    DEFAULT_FETCH_ENGINE = 'selenium'
+    MAX_HTTP_WORKERS = 20              # Logical workers for the browserless engine (no Chrome per worker)
+    MAX_ASYNC_SESSIONS = 200           # Concurrent portal sessions on the event loop (rate limiter sets the pace)
+    MAX_OFFLINE_WORKERS = 4            # Workers replaying cached surveys (SQLite bound)
+    ASYNC_SINK_QUEUE_SIZE = 1000       # Pending DB/CSV writes before coroutines wait for the writer
+    ASYNC_PARSE_PROCESSES = min(4, (os.cpu_count() or 1) - 1)  # Parse processes for the async engine (0 = threads, e.g. 1 CPU)
+    HTTP_TIMEOUT = 30                  # Seconds per portal postback
+    
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    # MULTI-PROCESS MODE - Worker groups run in their own processes (own GIL, crash
+    # isolation); state deltas stream back to the coordinator. Not used by 'async'.
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    WORKER_PROCESSES = 0               # 0 = all workers as threads of the web server process
+    PROCESS_REPORT_INTERVAL = 0.5      # Seconds between state deltas from a worker process
+    WORKER_PROCESS_START_METHOD = 'spawn'  # 'spawn' works everywhere; 'fork' starts faster on Linux
+    
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    # VILLAGE LEASES - village_progress doubles as a job queue: a worker leases a village
+    # for LEASE_TTL seconds and renews while it searches, so any process or host on the
+    # same database can pull work; leases of crashed workers expire and are reclaimed
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    LEASE_TTL = 180                    # Seconds a lease lives without renewal
+    LEASE_RENEW_INTERVAL = 30          # Minimum seconds between renewals from one worker
+    
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    # REMOTE AGENTS - `--agent --coordinator URL` runs workers on another host (or as
+    # extra local processes); they lease villages and report over /api/agents/*
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    AGENT_WORKERS = 4                  # Workers per agent unless --workers says otherwise
+    AGENT_REPORT_INTERVAL = 2.0        # Seconds between an agent's state deltas
+    AGENT_TIMEOUT = 60                 # Coordinator drops an agent silent this long
+    AGENT_RETRY_SECONDS = 30           # Agent retries an unreachable coordinator this long
+    AGENT_POLL_INTERVAL = 5            # Idle agent re-checks for a running search (seconds)
+    AGENT_TOKEN = os.environ.get('BHOOMI_AGENT_TOKEN', '')  # Shared secret (X-Agent-Token); '' = open
+    
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    # RTC RESULT CACHE - Owners per (village, survey, surnoc, hissa, period) are reused
+    # across sessions, so a new owner search over a crawled taluk skips the portal
+    # (config.yaml: advanced.enable_cache / advanced.cache_ttl)
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    ENABLE_RTC_CACHE = True
+    RTC_CACHE_TTL = 7 * 24 * 3600      # Seconds a crawled survey stays fresh
+    
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    # LOCATION HIERARCHY STORE - District/taluk/hobli/village lists kept on disk and
+    # filled from the eChawadi JSON endpoints (no browser needed to start a search)
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    HIERARCHY_TTL = 7 * 24 * 3600      # Refresh a stored taluk in the background after this
+    HIERARCHY_FETCH_WORKERS = 8        # Parallel LoadVillage calls while filling a taluk
+    
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    # API RESPONSE CACHE - One process-wide LRU for eChawadi JSON, persisted in SQLite
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    API_CACHE_MAX_ENTRIES = 5000       # LRU bound (one entry per endpoint + arguments)
+    API_CACHE_TTL = 24 * 3600          # Seconds a district/taluk/hobli/village list stays fresh
+    API_HTTP_MAX_AGE = 3600            # Cache-Control max-age on the /api dropdown routes
+    
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    # DATABASE WRITER - One thread per process makes every SQLite write; whatever is
+    # queued within DB_GROUP_COMMIT_WINDOW goes in one transaction (group commit)
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    DB_WRITE_QUEUE_SIZE = 10000        # Queued writes before callers block
+    DB_GROUP_COMMIT_WINDOW = 0.005     # Seconds a group stays open after its first write
+    DB_GROUP_COMMIT_MAX = 500          # Writes per transaction at most
+    DB_DIMENSION_CACHE_SIZE = 200000   # Session/location/owner-name ids the writer remembers
+    DB_MIGRATION_BATCH = 20000         # Legacy land_records rows moved per write while migrating
+    
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    # DATABASE POOLS - Flask endpoints and progress reads use query_only reader
+    # connections; the writer pool only serves schema setup (crawl writes use the writer)
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    DB_WRITE_POOL_SIZE = 1             # Read-write connections outside the writer thread
+    DB_WRITER_CACHE_KB = 64000         # Page cache per read-write connection (64MB)
+    DB_WRITER_MMAP_SIZE = 268435456    # Memory-mapped I/O per read-write connection (256MB)
+    DB_READER_CACHE_KB = 16000         # Page cache per reader (16MB) - many readers, one writer
+    DB_READER_MMAP_SIZE = 1073741824   # Readers share the OS page cache through mmap (1GB)
+    DB_POOL_VALIDATE_IDLE = 60.0       # Seconds idle before a pooled connection is re-checked
+    
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    # RECORDS API - Session records are served in keyset pages (after_id), never whole;
+    # exports stream those pages to the client as they are read
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    RECORDS_PAGE_SIZE = 100            # Records per page when the caller gives no limit
+    RECORDS_PAGE_MAX = 1000            # Largest page a caller may ask for (also the export chunk)
+    EXPORT_CHUNK_BYTES = 65536         # Encoded CSV/NDJSON bytes per streamed chunk
+    
     # URLs
     ECHAWADI_BASE = "https://rdservices.karnataka.gov.in/echawadi/Home"
     SERVICE2_URL = "https://landrecords.karnataka.gov.in/Service2/"
@@ -137,6 +278,50 @@ class Config:
         'go_btn': 'ctl00_MainContent_btnCGo',
         'fetch_btn': 'ctl00_MainContent_btnCFetchDetails',
     }
+    
+    # Alert phrases that mean the portal is struggling (not our fault - retry)
+    PORTAL_ISSUE_PHRASES = [
+        'facing some issues',
+        'try after some time',
+        'currently facing',
+        'service unavailable',
+        'server error',
+        'technical difficulties',
+        'please try again',
+        'contact bhoomi@karnataka.gov.in'
+    ]
+    
+    # Page text that means the ASP.NET session is gone
+    SESSION_EXPIRED_INDICATORS = [
+        'session expired',
+        'please login again',
+        'session timeout',
+        'your session has expired',
+        'login again',
+        'session has been terminated',
+    ]
+
+
+def _apply_config_yaml(path: str = None):
+    """
+    Apply the config.yaml settings this edition honours.
+    A missing file (or PyYAML) leaves the Config defaults in place.
+    """
+    path = path or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.yaml')
+    try:
+        import yaml
+        with open(path, 'r') as f:
+            settings = yaml.safe_load(f) or {}
+    except Exception:
+        return
+    
+    advanced = settings.get('advanced') or {}
+    if 'enable_cache' in advanced:
+        Config.ENABLE_RTC_CACHE = bool(advanced['enable_cache'])
+    if 'cache_ttl' in advanced:
+        Config.RTC_CACHE_TTL = int(advanced['cache_ttl'])
+
+_apply_config_yaml()
 
 # ═══════════════════════════════════════════════════════════════════════════════════════
 # BROWSER CLEANUP UTILITY - CRITICAL FOR STABILITY
@@ -285,9 +470,24 @@ def _browser_cleanup_daemon():
         except Exception as e:
             logger.debug(f"Cleanup daemon error: {e}")
 
+def _is_web_server_process() -> bool:
+    """
+    True in the web server itself. Spawned worker processes re-import this module and
+    agents run it as a script, but neither serves the Flask routes.
+    """
+    return multiprocessing.parent_process() is None and '--agent' not in sys.argv
+
+def _owns_host_browsers() -> bool:
+    """
+    Host-wide Chrome housekeeping belongs to the web server process. Worker processes
+    and agents (which may share the host) would kill the other workers' browsers.
+    """
+    return _is_web_server_process()
+
 # Start cleanup daemon on module load
 _cleanup_thread = threading.Thread(target=_browser_cleanup_daemon, daemon=True, name="BrowserCleanupDaemon")
-_cleanup_thread.start()
+if _owns_host_browsers():
+    _cleanup_thread.start()
 
 # CRITICAL: Clean up any orphaned Chrome from previous runs on module load
 def _startup_cleanup():
@@ -300,7 +500,8 @@ def _startup_cleanup():
         print(f"Startup cleanup error: {e}")
 
 # Run startup cleanup
-threading.Thread(target=_startup_cleanup, daemon=True).start()
+if _owns_host_browsers():
+    threading.Thread(target=_startup_cleanup, daemon=True).start()
 
 # ═══════════════════════════════════════════════════════════════════════════════════════
 # ADAPTIVE WAIT STRATEGY - Reduces fixed waits by 60%
@@ -422,6 +623,306 @@ class WaitStrategy:
         """
         adaptive = cls.get_adaptive_timeout(element_type, default_seconds)
         time.sleep(min(adaptive, default_seconds))
+    
+    # ───────────────────────────────────────────────────────────────────────────
+    # Event-driven postback completion
+    # ───────────────────────────────────────────────────────────────────────────
+    
+    # Attribute stamped on an element before a postback; gone once the DOM is replaced
+    POSTBACK_MARKER = 'data-bhoomi-pending'
+    
+    # Stamps the element and zeroes a counter bumped by PageRequestManager endRequest
+    # (handler added once per page load), so an UpdatePanel refresh that leaves the
+    # element in place still ends the wait
+    _MARK_JS = """
+        var prm = null;
+        try { prm = Sys.WebForms.PageRequestManager.getInstance(); } catch (e) {}
+        if (prm && !window.__bhoomiEndHooked) {
+            prm.add_endRequest(function () { window.__bhoomiEndRequests = (window.__bhoomiEndRequests || 0) + 1; });
+            window.__bhoomiEndHooked = true;
+        }
+        window.__bhoomiEndRequests = 0;
+        var el = document.getElementById(arguments[0]);
+        if (!el) return false;
+        el.setAttribute(arguments[1], '1');
+        return true;
+    """
+    
+    _POSTBACK_STATE_JS = """
+        var el = arguments[0] ? document.getElementById(arguments[0]) : null;
+        var prm = null;
+        try { prm = Sys.WebForms.PageRequestManager.getInstance(); } catch (e) {}
+        return {
+            ready: document.readyState === 'complete',
+            busy: prm ? prm.get_isInAsyncPostBack() : false,
+            replaced: el !== null && !el.hasAttribute(arguments[1]),
+            ended: (window.__bhoomiEndRequests || 0) > 0
+        };
+    """
+    
+    _autopostback: Dict[str, bool] = {}     # element id -> fires __doPostBack on change
+    _missed_alerts: Dict[int, str] = {}     # id(driver) -> alert text consumed while polling
+    
+    @classmethod
+    def mark_element(cls, driver, element_id: str) -> bool:
+        """Stamp an element so wait_for_postback can tell when the postback replaced it or ended"""
+        try:
+            return bool(driver.execute_script(cls._MARK_JS, element_id, cls.POSTBACK_MARKER))
+        except Exception:
+            return False
+    
+    @classmethod
+    def has_autopostback(cls, driver, element_id: str) -> bool:
+        """True if changing this control fires __doPostBack (cached - the form layout is fixed)"""
+        if element_id not in cls._autopostback:
+            try:
+                result = driver.execute_script(
+                    "var el = document.getElementById(arguments[0]);"
+                    "return el ? (el.getAttribute('onchange') || '').indexOf('__doPostBack') >= 0 : null;",
+                    element_id
+                )
+            except Exception:
+                return True  # Unknown - assume a postback so we wait
+            if result is None:
+                return True
+            with cls._lock:
+                cls._autopostback[element_id] = bool(result)
+        return cls._autopostback[element_id]
+    
+    @classmethod
+    def wait_for_postback(cls, driver, element_type: str, marked_id: str,
+                          timeout: float = None) -> bool:
+        """
+        Wait for the postback triggered after mark_element(marked_id) to finish.
+        
+        Done when the document is complete, the ASP.NET PageRequestManager is idle and
+        either the marked element was replaced (full postback or UpdatePanel refresh of
+        that element), an async postback raised endRequest, or one was seen to start and
+        end. Returns as soon as that happens, or when an alert opens (left open for
+        _handle_alert).
+        
+        The timeout is deliberately not adaptive: a slow answer must not be mistaken for
+        a finished one. Observed latencies are still recorded under element_type.
+        
+        Returns:
+            True if completion was observed, False on timeout
+        """
+        from selenium.common.exceptions import NoAlertPresentException, UnexpectedAlertPresentException
+        
+        timeout = timeout or Config.POSTBACK_TIMEOUT
+        start_time = time.time()
+        seen_busy = False
+        
+        while time.time() - start_time < timeout:
+            try:
+                driver.switch_to.alert
+                cls.record_response_time(element_type, time.time() - start_time)
+                return True  # Portal answered with an alert
+            except NoAlertPresentException:
+                pass
+            except Exception:
+                pass
+            
+            try:
+                state = driver.execute_script(cls._POSTBACK_STATE_JS, marked_id, cls.POSTBACK_MARKER)
+            except UnexpectedAlertPresentException as e:
+                # Alert opened between the two checks and the driver consumed it
+                with cls._lock:
+                    cls._missed_alerts[id(driver)] = getattr(e, 'alert_text', None) or ''
+                cls.record_response_time(element_type, time.time() - start_time)
+                return True
+            except Exception:
+                state = None  # Page is navigating - keep polling
+            
+            if state:
+                seen_busy = seen_busy or state.get('busy')
+                done = state.get('replaced') or state.get('ended') or seen_busy
+                if state.get('ready') and not state.get('busy') and done:
+                    cls.record_response_time(element_type, time.time() - start_time)
+                    return True
+            
+            time.sleep(Config.POSTBACK_POLL_INTERVAL)
+        
+        cls.record_response_time(element_type, timeout)
+        return False
+    
+    @classmethod
+    def select_and_wait(cls, driver, select_id: str, element_type: str, dependent_id: str = None,
+                        text: str = None, value: str = None) -> bool:
+        """
+        Select a dropdown option and wait for its postback (if it posts back at all).
+        dependent_id is the element the postback repopulates (defaults to the dropdown itself).
+        """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import Select
+        from selenium.common.exceptions import NoSuchElementException
+        
+        posts_back = cls.has_autopostback(driver, select_id)
+        marked_id = dependent_id or select_id
+        if posts_back:
+            _global_rate_limiter.acquire('navigation')
+            cls.mark_element(driver, marked_id)
+        
+        select = Select(driver.find_element(By.ID, select_id))
+        if value is not None:
+            try:
+                select.select_by_value(value)
+            except NoSuchElementException:
+                # Stored codes are normalised ("2") - the page may render "2.0"
+                wanted = normalize_code(value)
+                match = next((o['value'] for o in DomReader.options(driver, select_id)
+                              if normalize_code(o['value']) == wanted), None)
+                if match is None:
+                    raise
+                select.select_by_value(match)
+        else:
+            select.select_by_visible_text(text)
+        
+        if not posts_back:
+            return True
+        return cls.wait_for_postback(driver, element_type, marked_id)
+    
+    @classmethod
+    def click_and_wait(cls, driver, button_id: str, element_type: str, dependent_id: str = None) -> bool:
+        """Click a submit button via JavaScript and wait for the resulting postback"""
+        from selenium.webdriver.common.by import By
+        
+        marked_id = dependent_id or button_id
+        cls.mark_element(driver, marked_id)
+        button = driver.find_element(By.ID, button_id)
+        started = time.time()
+        driver.execute_script("arguments[0].click();", button)
+        completed = cls.wait_for_postback(driver, element_type, marked_id)
+        get_concurrency_controller().record(time.time() - started, ok=completed, timed_out=not completed)
+        return completed
+    
+    @classmethod
+    def pop_missed_alert(cls, driver) -> Optional[str]:
+        """Alert text consumed by the driver while polling, if any"""
+        with cls._lock:
+            return cls._missed_alerts.pop(id(driver), None)
+    
+    @classmethod
+    def get_latency_stats(cls) -> Dict[str, Dict[str, float]]:
+        """p50/p90 of recorded response times per element type"""
+        stats = {}
+        with cls._lock:
+            for element_type, times in cls._response_times.items():
+                if not times:
+                    continue
+                ordered = sorted(times)
+                stats[element_type] = {
+                    'samples': len(ordered),
+                    'p50': round(ordered[len(ordered) // 2], 3),
+                    'p90': round(ordered[int(len(ordered) * 0.9)], 3),
+                }
+        return stats
+
+
+# ═══════════════════════════════════════════════════════════════════════════════════════
+# DOM READ LAYER - One WebDriver round-trip per dropdown read
+# ═══════════════════════════════════════════════════════════════════════════════════════
+
+class DomReader:
+    """
+    Batched reads of form controls.
+    
+    Iterating Select(...).options costs one WebDriver HTTP round-trip per option
+    (plus one per .text / get_attribute call). These helpers read a whole dropdown
+    in a single execute_script and return plain dicts shaped like
+    PortalFormState.options(): value, text, disabled, selected.
+    """
+    
+    _OPTIONS_JS = """
+        var el = document.getElementById(arguments[0]);
+        if (!el || !el.options) return null;
+        var out = [];
+        for (var i = 0; i < el.options.length; i++) {
+            var o = el.options[i];
+            out.push({value: o.value, text: o.text.trim(), disabled: o.disabled, selected: o.selected});
+        }
+        return out;
+    """
+    
+    @classmethod
+    def options(cls, driver, element_id: str) -> List[Dict]:
+        """
+        All options of a <select> in one round-trip.
+        Raises NoSuchElementException if the dropdown is not on the page (same as find_element).
+        """
+        from selenium.common.exceptions import NoSuchElementException
+        
+        result = driver.execute_script(cls._OPTIONS_JS, element_id)
+        if result is None:
+            raise NoSuchElementException(f"Dropdown not found: {element_id}")
+        return result
+    
+    @classmethod
+    def option_texts(cls, driver, element_id: str) -> List[str]:
+        """Visible texts of the real options (the "Select ..." placeholder is skipped)"""
+        return [o['text'] for o in cls.options(driver, element_id) if "Select" not in o['text']]
+    
+    @classmethod
+    def option_pairs(cls, driver, element_id: str) -> List[Tuple[str, str]]:
+        """(value, text) of the real options - placeholders and empty values skipped"""
+        return [(o['value'], o['text']) for o in cls.options(driver, element_id)
+                if o['value'] and "Select" not in o['text']]
+    
+    # Outermost tables / result-like divs, minus the controls _extract_owners discards anyway.
+    # Their subtrees hold every element the extractor scores, so it sees the same candidates.
+    _RESULTS_FRAGMENT_JS = """
+        var divPattern = /result|data|owner|record/i;
+        var strip = 'select, nav, header, footer, button, input, script, style';
+        var nodes = document.querySelectorAll('table, div');
+        var parts = [];
+        for (var i = 0; i < nodes.length; i++) {
+            var node = nodes[i];
+            if (node.tagName === 'DIV' && !divPattern.test(node.className || '')) continue;
+            var parent = node.parentElement, nested = false;
+            while (parent) {
+                if (parent.tagName === 'TABLE' ||
+                    (parent.tagName === 'DIV' && divPattern.test(parent.className || ''))) { nested = true; break; }
+                parent = parent.parentElement;
+            }
+            if (nested) continue;
+            var clone = node.cloneNode(true);
+            var junk = clone.querySelectorAll(strip);
+            for (var j = 0; j < junk.length; j++) junk[j].remove();
+            parts.push(clone.outerHTML);
+        }
+        var html = document.documentElement.innerHTML;
+        return {
+            html: parts.join(''),
+            session_expired: html.indexOf('Session expired') >= 0 || html.toLowerCase().indexOf('login again') >= 0
+        };
+    """
+    
+    @classmethod
+    def results_fragment(cls, driver) -> Optional[Dict[str, Any]]:
+        """
+        HTML of the result candidates only (instead of the whole page_source with every
+        dropdown), plus the session-expired flag computed in the browser.
+        Returns None if the script fails - callers fall back to page_source.
+        """
+        try:
+            result = driver.execute_script(cls._RESULTS_FRAGMENT_JS)
+        except Exception:
+            return None
+        if not isinstance(result, dict) or 'html' not in result:
+            return None
+        return result
+    
+    @classmethod
+    def page_contains_any(cls, driver, needles: List[str]) -> Optional[bool]:
+        """Case-insensitive substring check run in the browser. None if the script fails."""
+        try:
+            return bool(driver.execute_script(
+                "var html = document.documentElement.outerHTML.toLowerCase();"
+                "return arguments[0].some(function (n) { return html.indexOf(n) >= 0; });",
+                [n.lower() for n in needles]
+            ))
+        except Exception:
+            return None
 
 
 # ═══════════════════════════════════════════════════════════════════════════════════════
@@ -504,6 +1005,85 @@ class SmartNavigator:
                 self._state[f] = None
         except ValueError:
             pass
+    
+    # ───────────────────────────────────────────────────────────────────────────
+    # Navigation - only re-post what changed
+    # ───────────────────────────────────────────────────────────────────────────
+    
+    LOCATION_FIELDS = ('district', 'taluk', 'hobli', 'village')
+    
+    def needs_reload(self) -> bool:
+        """True if the form state is unknown (fresh browser, reset, or left the portal)"""
+        return self._state['district'] is None or not self.is_on_portal()
+    
+    def load_portal(self):
+        """Load a fresh portal page - every dropdown starts from scratch"""
+        _global_rate_limiter.acquire('navigation')
+        self.driver.get(Config.SERVICE2_URL)
+        self.reset_state()
+        self._last_page_url = self.driver.current_url
+        time.sleep(Config.POST_SELECT_WAIT)
+    
+    def _page_value(self, field: str) -> Optional[str]:
+        """Value the page currently shows for a dropdown/textbox"""
+        try:
+            return self.driver.execute_script(
+                "var el = document.getElementById(arguments[0]); return el ? el.value : null;",
+                Config.ELEMENT_IDS[field]
+            )
+        except Exception:
+            return None
+    
+    def ensure_location(self, district_code: str, taluk_code: str, hobli_code: str, village_code: str) -> int:
+        """
+        Make the location dropdowns hold these values, re-posting only the ones that changed.
+        Loads the portal first if the cached state is unknown or no longer matches the page.
+        
+        Returns:
+            Number of dropdowns that were re-selected (0 = same village, nothing posted)
+        """
+        if self.needs_reload():
+            self.load_portal()
+        elif normalize_code(self._page_value('village')) != normalize_code(self._state['village']):
+            # Page no longer matches what we think we selected - start over
+            self.logger.debug("Form state drifted from cache - reloading portal")
+            self.load_portal()
+        
+        changed = 0
+        targets = (district_code, taluk_code, hobli_code, village_code)
+        # Each dropdown repopulates the next one; the village repopulates itself
+        dependents = self.LOCATION_FIELDS[1:] + ('village',)
+        for key, value, dependent in zip(self.LOCATION_FIELDS, targets, dependents):
+            if not self.needs_dropdown_update(key, value):
+                continue
+            WaitStrategy.select_and_wait(
+                self.driver, Config.ELEMENT_IDS[key], f'{key}_postback',
+                dependent_id=Config.ELEMENT_IDS[dependent], value=value
+            )
+            self.update_state(**{key: value})
+            self.invalidate_below(key)
+            changed += 1
+        return changed
+    
+    def submit_survey(self, survey_no: int) -> bool:
+        """
+        Rewrite the survey textbox, click GO and wait for the surnoc dropdown to be
+        repopulated (caller applies rate limiting).
+        Returns True if the postback completed, False if it timed out.
+        """
+        from selenium.webdriver.common.by import By
+        
+        survey_input = self.driver.find_element(By.ID, Config.ELEMENT_IDS['survey_no'])
+        survey_input.clear()
+        survey_input.send_keys(str(survey_no))
+        
+        completed = WaitStrategy.click_and_wait(
+            self.driver, Config.ELEMENT_IDS['go_btn'], 'go_postback',
+            dependent_id=Config.ELEMENT_IDS['surnoc']
+        )
+        self.invalidate_below('village')
+        self.update_state(survey_no=str(survey_no))
+        return completed
 
 
 # ═══════════════════════════════════════════════════════════════════════════════════════
@@ -697,8 +1277,6 @@ class PortalHealthManager:
                 shutil.rmtree(user_data_dir, ignore_errors=True)
             
             from selenium import webdriver
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.support.ui import Select
             from selenium.webdriver.chrome.options import Options
             
             options = Options()
@@ -715,8 +1293,7 @@ class PortalHealthManager:
             driver.get(Config.SERVICE2_URL)
             
             # Check if district dropdown is present and has options
-            district_sel = Select(driver.find_element(By.ID, Config.ELEMENT_IDS['district']))
-            district_opts = [o for o in district_sel.options if o.get_attribute('value')]
+            district_opts = [o for o in DomReader.options(driver, Config.ELEMENT_IDS['district']) if o['value']]
             
             elapsed = time.time() - start_time
             
@@ -810,6 +1387,7 @@ class PortalHealthManager:
         Returns True if workers should pause (portal appears overloaded).
         """
         now = time.time()
+        get_concurrency_controller().record_alert(error_type)
         
         with self._health_lock:
             # Add error
@@ -1047,23 +1625,27 @@ class StateManager:
 # RATE LIMITER - Prevents overwhelming the portal
 # ═══════════════════════════════════════════════════════════════════════════════════════
 
-class RateLimiter:
+class TokenBucket:
     """
-    Token bucket rate limiter to prevent overwhelming the Bhoomi portal.
+    One named token bucket with FIFO waiters.
     
-    Coordinates across all workers to maintain a sustainable request rate.
-    This helps avoid triggering portal's DDoS protection and reduces false errors.
+    reserve() takes the next token under the lock - the balance may go negative - and
+    returns exactly how long the caller must wait for it. Waiters are therefore served
+    in arrival order without sleep-polling, and the wait recorded in the stats is the
+    wait the caller actually gets.
     """
     
-    def __init__(self, requests_per_second: float = 2.0, burst_size: int = 10):
-        """
-        Args:
-            requests_per_second: Average allowed request rate
-            burst_size: Maximum burst of requests allowed
-        """
-        self.rate = requests_per_second
+    # Upper bounds (seconds) of the wait-time histogram bins; the last bin is open-ended
+    WAIT_HISTOGRAM_BOUNDS = (0.0, 0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0)
+    
+    def __init__(self, name: str, rate: float, burst_size: int):
+        if rate <= 0 or burst_size < 1:
+            raise ValueError(f"Bucket '{name}' needs rate > 0 and burst >= 1")
+        self.name = name
+        self.base_rate = rate
         self.burst_size = burst_size
-        self._tokens = burst_size
+        self.scale = 1.0
+        self._tokens = float(burst_size)
         self._last_update = time.time()
         self._lock = threading.Lock()
         
@@ -1071,87 +1653,474 @@ class RateLimiter:
         self._total_requests = 0
         self._total_waits = 0
         self._total_wait_time = 0.0
+        self._max_wait = 0.0
+        self._histogram = [0] * (len(self.WAIT_HISTOGRAM_BOUNDS) + 1)
+    
+    @property
+    def rate(self) -> float:
+        """Effective rate: configured rate times the AIMD scale"""
+        return self.base_rate * self.scale
+    
+    def _refill(self, now: float):
+        self._tokens = min(self.burst_size, self._tokens + (now - self._last_update) * self.rate)
+        self._last_update = now
+    
+    def reserve(self, timeout: float) -> Optional[float]:
+        """Take the next token. Returns seconds until it is due, or None if that exceeds timeout."""
+        with self._lock:
+            self._refill(time.time())
+            wait = max(0.0, (1 - self._tokens) / self.rate)
+            if wait > timeout:
+                return None
+            self._tokens -= 1
+            self._total_requests += 1
+            if wait > 0:
+                self._total_waits += 1
+                self._total_wait_time += wait
+                self._max_wait = max(self._max_wait, wait)
+            self._histogram[bisect.bisect_left(self.WAIT_HISTOGRAM_BOUNDS, wait)] += 1
+            return wait
+    
+    def configure(self, rate: float = None, burst_size: int = None, scale: float = None):
+        """Retune the bucket; tokens earned so far are kept at the old rate"""
+        if (rate is not None and rate <= 0) or (burst_size is not None and burst_size < 1) \
+                or (scale is not None and scale <= 0):
+            raise ValueError(f"Bucket '{self.name}' needs rate > 0, burst >= 1 and scale > 0")
+        with self._lock:
+            self._refill(time.time())
+            if rate is not None:
+                self.base_rate = rate
+            if burst_size is not None:
+                self.burst_size = burst_size
+                self._tokens = min(self._tokens, burst_size)
+            if scale is not None:
+                self.scale = scale
+    
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._refill(time.time())
+            labels = ['0s'] + [f"≤{b:g}s" for b in self.WAIT_HISTOGRAM_BOUNDS[1:]] + [f">{self.WAIT_HISTOGRAM_BOUNDS[-1]:g}s"]
+            return {
+                'rate': round(self.rate, 3),
+                'configured_rate': self.base_rate,
+                'burst_size': self.burst_size,
+                'queued': max(0, math.ceil(-self._tokens)),
+                'total_requests': self._total_requests,
+                'total_waits': self._total_waits,
+                'total_wait_time': round(self._total_wait_time, 2),
+                'avg_wait_time': round(self._total_wait_time / self._total_waits, 3) if self._total_waits > 0 else 0,
+                'max_wait_time': round(self._max_wait, 3),
+                'wait_histogram': [{'wait': label, 'count': n} for label, n in zip(labels, self._histogram)],
+            }
+
+
+class RateLimiter:
+    """
+    Per-operation token buckets to prevent overwhelming the Bhoomi portal.
+    
+    Every worker and engine shares one budget per operation (Config.RATE_LIMITS):
+    - navigation:    dropdown postbacks and page loads (cheap)
+    - go:            survey GO, the portal looks up the surnoc list
+    - fetch:         RTC Fetch Details (expensive)
+    - hierarchy_api: eChawadi district/taluk/hobli/village API
+    
+    configure() retunes one bucket at runtime (/api/rate-limits); set_scale() is the
+    AIMD controller's knob, applied to every bucket on top of its configured rate.
+    set_share() is this node's fraction of the budget when remote agents take part.
+    """
+    
+    def __init__(self, limits: Dict[str, Tuple[float, int]] = None):
+        """
+        Args:
+            limits: operation -> (requests per second, burst size); Config.RATE_LIMITS by default
+        """
+        self._buckets = {
+            name: TokenBucket(name, rate, burst)
+            for name, (rate, burst) in (limits or Config.RATE_LIMITS).items()
+        }
+        self.scale = 1.0
+        self.share = 1.0
     
-    def acquire(self, timeout: float = 30.0) -> bool:
+    def bucket(self, operation: str) -> TokenBucket:
+        try:
+            return self._buckets[operation]
+        except KeyError:
+            raise ValueError(f"Unknown rate limit bucket '{operation}'") from None
+    
+    def acquire(self, operation: str = 'go', timeout: float = 30.0) -> bool:
         """
-        Acquire a token to make a request.
+        Acquire a token for one portal request.
         
         Args:
+            operation: Bucket to draw from
             timeout: Maximum time to wait for a token
         
         Returns:
             True if token acquired, False if timeout
         """
-        deadline = time.time() + timeout
-        
-        while True:
-            with self._lock:
-                now = time.time()
-                
-                # Add tokens based on elapsed time
-                elapsed = now - self._last_update
-                self._tokens = min(self.burst_size, self._tokens + elapsed * self.rate)
-                self._last_update = now
-                
-                if self._tokens >= 1:
-                    self._tokens -= 1
-                    self._total_requests += 1
-                    return True
-                
-                # Calculate wait time
-                wait_time = (1 - self._tokens) / self.rate
-            
-            if time.time() + wait_time > deadline:
-                return False  # Would exceed timeout
-            
-            self._total_waits += 1
-            self._total_wait_time += wait_time
-            time.sleep(min(wait_time, 0.5))  # Don't sleep too long, re-check frequently
+        wait = self.bucket(operation).reserve(timeout)
+        if wait is None:
+            return False  # Would exceed timeout
+        if wait > 0:
+            time.sleep(wait)
+        return True
+    
+    @property
+    def rate(self) -> float:
+        """Effective GO rate - the survey throughput the AIMD controller steers"""
+        return self.bucket('go').rate
+    
+    def configure(self, operation: str, rate: float = None, burst_size: int = None):
+        """Retune one bucket's configured rate/burst at runtime"""
+        self.bucket(operation).configure(rate=rate, burst_size=burst_size)
+        logger.info(f"🚦 Rate limit '{operation}': {self.bucket(operation).base_rate} req/s, "
+                    f"burst {self.bucket(operation).burst_size}")
+    
+    def settings(self) -> Dict[str, Tuple[float, int]]:
+        """Configured (rate, burst) of every bucket"""
+        return {name: (bucket.base_rate, bucket.burst_size) for name, bucket in self._buckets.items()}
+    
+    def set_scale(self, scale: float):
+        """Scale every bucket's configured rate (AIMD controller)"""
+        self.scale = scale
+        for bucket in self._buckets.values():
+            bucket.configure(scale=scale * self.share)
+    
+    def set_share(self, share: float):
+        """This node's fraction of the (AIMD-scaled) budget; the rest belongs to remote agents"""
+        self.share = share
+        for bucket in self._buckets.values():
+            bucket.configure(scale=self.scale * share)
     
     def get_stats(self) -> Dict[str, Any]:
-        """Get rate limiter statistics"""
-        with self._lock:
-            return {
-                'total_requests': self._total_requests,
-                'total_waits': self._total_waits,
-                'total_wait_time': round(self._total_wait_time, 2),
-                'avg_wait_time': round(self._total_wait_time / self._total_waits, 3) if self._total_waits > 0 else 0
-            }
-
+        """Get rate limiter statistics - totals plus one entry per bucket"""
+        buckets = {name: bucket.get_stats() for name, bucket in self._buckets.items()}
+        total_waits = sum(b['total_waits'] for b in buckets.values())
+        total_wait_time = sum(b['total_wait_time'] for b in buckets.values())
+        return {
+            'total_requests': sum(b['total_requests'] for b in buckets.values()),
+            'total_waits': total_waits,
+            'total_wait_time': round(total_wait_time, 2),
+            'avg_wait_time': round(total_wait_time / total_waits, 3) if total_waits > 0 else 0,
+            'scale': round(self.scale, 3),
+            'share': round(self.share, 3),
+            'buckets': buckets,
+        }
 
-# Global rate limiter shared by all workers
-# 10 workers at 3 req/sec = 30 req/sec burst, 3 req/sec sustained
-# Conservative for portal - each worker effectively gets 0.3 req/sec sustained
-_global_rate_limiter = RateLimiter(requests_per_second=3.0, burst_size=15)
 
-def rate_limited_request(func):
-    """Decorator to rate limit portal requests"""
-    def wrapper(*args, **kwargs):
-        _global_rate_limiter.acquire()
-        return func(*args, **kwargs)
-    return wrapper
+class AsyncRateLimiter:
+    """
+    Coroutine view of a RateLimiter for the asyncio engine.
+    
+    Draws from the same buckets as the thread workers, so every engine shares one
+    portal budget; a waiting coroutine sleeps for its reserved slot and yields to the
+    event loop instead of blocking a thread.
+    """
+    
+    def __init__(self, limiter: RateLimiter):
+        self.limiter = limiter
+    
+    async def acquire(self, operation: str = 'go', timeout: float = 30.0) -> bool:
+        """Acquire a token to make a request. Returns False on timeout."""
+        wait = self.limiter.bucket(operation).reserve(timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get rate limiter statistics"""
+        return self.limiter.get_stats()
 
-# ═══════════════════════════════════════════════════════════════════════════════════════
-# LOGGING SETUP
-# ═══════════════════════════════════════════════════════════════════════════════════════
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s | %(levelname)-7s | %(name)-15s | %(message)s',
-    datefmt='%H:%M:%S'
-)
-logger = logging.getLogger('POWER-BHOOMI')
+# Global rate limiter shared by all workers and engines
+_global_rate_limiter = RateLimiter()
 
-# Initialize global portal health manager now that logger is available
-portal_health = PortalHealthManager()
+def rate_limited_request(operation: str = 'go'):
+    """Decorator to rate limit portal requests against one bucket"""
+    def decorator(func):
+        def wrapper(*args, **kwargs):
+            _global_rate_limiter.acquire(operation)
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
 
 # ═══════════════════════════════════════════════════════════════════════════════════════
-# DATA CLASSES
+# ADAPTIVE CONCURRENCY - AIMD control of active workers and request rate
 # ═══════════════════════════════════════════════════════════════════════════════════════
 
-@dataclass
-class LandRecord:
-    """Represents a single land record"""
+class AdaptiveConcurrencyController:
+    """
+    Closed-loop (AIMD) control of how hard a live search presses the portal.
+    
+    Every GO/Fetch click reports its latency and outcome, and every worker alert sent
+    to PortalHealthManager is counted. Each AIMD_INTERVAL the window is judged:
+    - multiplicative decrease: any alert or timeout, success rate or p95 latency
+      outside the SLO, or a RATE_LIMITED/DOWN portal → active workers and request
+      rate multiplied by AIMD_DECREASE_FACTOR
+    - additive increase: enough requests and everything within the SLO → one more
+      active worker and AIMD_RATE_STEP more req/s
+    - otherwise hold
+    
+    Active workers are slots: a worker takes one before its next portal survey and
+    keeps it while busy; when the limit drops, the extra workers park until it rises
+    again. Idle workers hold no slot, so a parked worker always gets one back once the
+    others run out of work. The learned rate carries over to the next search.
+    
+    The request rate is the GO bucket's; the other rate limit buckets are scaled by
+    the same factor, keeping the ratios set in Config.RATE_LIMITS / /api/rate-limits.
+    """
+    
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._samples: List[Tuple[float, bool, bool]] = []  # (latency, ok, timed_out) this window
+        self._alerts: Dict[str, int] = {}
+        self._holders = set()
+        self._last_step = 0.0
+        self.enabled = False
+        self.max_workers = 0
+        self.worker_limit = 0
+        self.rate = _global_rate_limiter.rate
+        self.increases = 0
+        self.decreases = 0
+        self.last_decision: Optional[dict] = None
+        self.history = deque(maxlen=50)
+    
+    def start(self, max_workers: int):
+        """Begin controlling a live search that runs max_workers workers"""
+        with self._cond:
+            self._samples, self._alerts = [], {}
+            self._holders = set()
+            self._last_step = time.time()
+            self.enabled = Config.ENABLE_ADAPTIVE_CONCURRENCY
+            self.max_workers = self.worker_limit = max_workers
+            # The whole budget's rate, not this node's share of it
+            budget = _global_rate_limiter.bucket('go').base_rate * _global_rate_limiter.scale
+            self.rate = min(Config.AIMD_MAX_RATE, max(Config.AIMD_MIN_RATE, budget))
+            if self.enabled:
+                self._apply_rate()
+            self.increases = self.decreases = 0
+            self.last_decision = None
+            self.history.clear()
+            self._cond.notify_all()
+    
+    def _apply_rate(self):
+        """Scale every rate limit bucket so the GO bucket runs at self.rate"""
+        _global_rate_limiter.set_scale(self.rate / _global_rate_limiter.bucket('go').base_rate)
+    
+    def stop(self):
+        """Stop adjusting and release every parked worker"""
+        with self._cond:
+            self.enabled = False
+            self._holders.clear()
+            self._cond.notify_all()
+    
+    # ───────────────────────────────────────────────────────────────────────────
+    # Signals
+    # ───────────────────────────────────────────────────────────────────────────
+    
+    def record(self, latency: float, ok: bool, timed_out: bool = False):
+        """One portal request finished after latency seconds"""
+        if not self.enabled:
+            return
+        with self._cond:
+            self._samples.append((latency, ok, timed_out))
+    
+    def record_alert(self, error_type: str):
+        """A worker reported a portal error (rtc_access, fetch_error...)"""
+        if not self.enabled:
+            return
+        with self._cond:
+            self._alerts[error_type] = self._alerts.get(error_type, 0) + 1
+    
+    # ───────────────────────────────────────────────────────────────────────────
+    # Active worker slots
+    # ───────────────────────────────────────────────────────────────────────────
+    
+    def enter(self, worker_id: int, timeout: Optional[float] = None) -> bool:
+        """
+        Take (or keep) an active-worker slot before a portal survey.
+        Returns False if no slot freed up within timeout.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        with self._cond:
+            while self.enabled:
+                if worker_id in self._holders:
+                    if len(self._holders) <= self.worker_limit:
+                        return True
+                    self._holders.discard(worker_id)  # Limit dropped - hand the slot back
+                elif len(self._holders) < self.worker_limit:
+                    self._holders.add(worker_id)
+                    return True
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+    
+    def leave(self, worker_id: int):
+        """Give the slot back (worker idle or finished)"""
+        with self._cond:
+            if worker_id in self._holders:
+                self._holders.discard(worker_id)
+                self._cond.notify()
+    
+    def set_worker_limit(self, limit: int):
+        """Impose a limit decided elsewhere (a worker process gets its share of the coordinator's)"""
+        with self._cond:
+            self.worker_limit = limit
+            self._cond.notify_all()
+    
+    # ───────────────────────────────────────────────────────────────────────────
+    # Multi-process mode - worker processes forward their signals to the coordinator
+    # ───────────────────────────────────────────────────────────────────────────
+    
+    def drain_signals(self) -> Tuple[List[Tuple[float, bool, bool]], Dict[str, int]]:
+        """Take the samples and alerts recorded since the last drain"""
+        with self._cond:
+            samples, alerts = self._samples, self._alerts
+            self._samples, self._alerts = [], {}
+            return samples, alerts
+    
+    def merge_signals(self, samples: List[Tuple[float, bool, bool]], alerts: Dict[str, int]):
+        """Add signals drained in a worker process to this window"""
+        if not self.enabled:
+            return
+        with self._cond:
+            self._samples.extend(samples)
+            for error_type, count in alerts.items():
+                self._alerts[error_type] = self._alerts.get(error_type, 0) + count
+    
+    # ───────────────────────────────────────────────────────────────────────────
+    # Control loop
+    # ───────────────────────────────────────────────────────────────────────────
+    
+    def step(self, portal_state: str = 'UNKNOWN') -> Optional[dict]:
+        """
+        Judge the window since the last decision and adjust workers and rate.
+        Returns the decision, or None while the interval has not elapsed.
+        """
+        with self._cond:
+            now = time.time()
+            if not self.enabled or now - self._last_step < Config.AIMD_INTERVAL:
+                return None
+            samples, alerts = self._samples, self._alerts
+            self._samples, self._alerts = [], {}
+            self._last_step = now
+            
+            n = len(samples)
+            timeouts = sum(1 for _, _, timed_out in samples if timed_out)
+            success_rate = sum(1 for _, ok, _ in samples if ok) / n if n else 1.0
+            latencies = sorted(latency for latency, _, _ in samples)
+            p95 = latencies[min(n - 1, int(n * 0.95))] if n else 0.0
+            judged = n >= Config.AIMD_MIN_SAMPLES
+            
+            breaches = []
+            if alerts:
+                breaches.append('alerts ' + ', '.join(f"{k}×{v}" for k, v in alerts.items()))
+            if timeouts:
+                breaches.append(f"{timeouts} timeouts")
+            if portal_state in ('RATE_LIMITED', 'DOWN'):
+                breaches.append(f"portal {portal_state}")
+            if judged and success_rate < Config.AIMD_SLO_SUCCESS_RATE:
+                breaches.append(f"success {success_rate:.0%} < {Config.AIMD_SLO_SUCCESS_RATE:.0%}")
+            if judged and p95 > Config.AIMD_SLO_P95_LATENCY:
+                breaches.append(f"p95 {p95:.1f}s > {Config.AIMD_SLO_P95_LATENCY:.1f}s")
+            
+            old_limit, old_rate = self.worker_limit, self.rate
+            if breaches:
+                floor = min(self.max_workers, Config.MIN_WORKERS_DURING_THROTTLE)
+                self.worker_limit = max(floor, int(self.worker_limit * Config.AIMD_DECREASE_FACTOR))
+                self.rate = max(Config.AIMD_MIN_RATE, self.rate * Config.AIMD_DECREASE_FACTOR)
+                reason = '; '.join(breaches)
+            elif not judged:
+                reason = f"only {n} requests"
+            elif portal_state in ('DEGRADED', 'NETWORK_CONGESTION'):
+                reason = f"portal {portal_state}"
+            else:
+                self.worker_limit = min(self.max_workers, self.worker_limit + 1)
+                self.rate = min(Config.AIMD_MAX_RATE, self.rate + Config.AIMD_RATE_STEP)
+                reason = 'within SLO'
+            
+            if (self.worker_limit, self.rate) == (old_limit, old_rate):
+                action = 'hold'
+            elif breaches:
+                action = 'decrease'
+                self.decreases += 1
+            else:
+                action = 'increase'
+                self.increases += 1
+            
+            if self.rate != old_rate:
+                self._apply_rate()
+            if self.worker_limit > old_limit:
+                self._cond.notify_all()
+            
+            decision = {
+                'time': datetime.now().strftime('%H:%M:%S'),
+                'action': action,
+                'reason': reason,
+                'worker_limit': self.worker_limit,
+                'rate': round(self.rate, 2),
+                'requests': n,
+                'success_rate': round(success_rate, 3),
+                'p95_latency': round(p95, 2),
+            }
+            self.last_decision = decision
+            self.history.append(decision)
+            return decision
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Controller state for the status API"""
+        with self._cond:
+            return {
+                'enabled': self.enabled,
+                'worker_limit': self.worker_limit,
+                'max_workers': self.max_workers,
+                'active_workers': len(self._holders),
+                'rate': round(self.rate, 2),
+                'increases': self.increases,
+                'decreases': self.decreases,
+                'last_decision': self.last_decision,
+                'recent_decisions': list(self.history)[-10:],
+            }
+
+
+# Global AIMD controller (one live search at a time)
+concurrency_controller: Optional[AdaptiveConcurrencyController] = None
+_concurrency_controller_lock = threading.Lock()
+
+def get_concurrency_controller() -> AdaptiveConcurrencyController:
+    """Get or create the global adaptive concurrency controller"""
+    global concurrency_controller
+    if concurrency_controller is None:
+        with _concurrency_controller_lock:
+            if concurrency_controller is None:
+                concurrency_controller = AdaptiveConcurrencyController()
+    return concurrency_controller
+
+# ═══════════════════════════════════════════════════════════════════════════════════════
+# LOGGING SETUP
+# ═══════════════════════════════════════════════════════════════════════════════════════
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s | %(levelname)-7s | %(name)-15s | %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger('POWER-BHOOMI')
+
+# Initialize global portal health manager now that logger is available
+portal_health = PortalHealthManager()
+
+# ═══════════════════════════════════════════════════════════════════════════════════════
+# DATA CLASSES
+# ═══════════════════════════════════════════════════════════════════════════════════════
+
+@dataclass
+class LandRecord:
+    """Represents a single land record"""
     district: str
     taluk: str
     hobli: str
@@ -1170,12 +2139,13 @@ class LandRecord:
 class WorkerStatus:
     """Status of a single worker"""
     worker_id: int
-    status: str = 'idle'  # idle, running, completed, failed
+    status: str = 'idle'  # idle, running, parked, completed, failed
     current_village: str = ''
     current_survey: int = 0
     max_survey: int = 0
     villages_completed: int = 0
     villages_total: int = 0
+    queue_depth: int = 0  # Villages still waiting in this worker's queue
     records_found: int = 0
     matches_found: int = 0
     errors: int = 0
@@ -1216,6 +2186,8 @@ class SearchState:
     village_stats: Dict[str, Dict] = field(default_factory=dict)  # Per-village completion stats
     smart_stops: int = 0  # Count of villages stopped early via smart stop
     surveys_saved: int = 0  # Total surveys saved by smart stop (time savings metric)
+    surveys_from_cache: int = 0  # Surveys replayed from the RTC cache instead of the portal
+    villages_not_cached: List[str] = field(default_factory=list)  # Offline mode: no fresh crawl to replay
     
     # Worker details
     workers: Dict[int, WorkerStatus] = field(default_factory=dict)
@@ -1230,6 +2202,13 @@ class SearchState:
     # Real-time records storage (for UI display)
     all_records: List[Dict] = field(default_factory=list)
     matches: List[Dict] = field(default_factory=list)
+    
+    def recalculate_totals(self):
+        """Recompute the aggregate stats from the worker statuses (caller holds the state lock)"""
+        self.total_records = sum(ws.records_found for ws in self.workers.values())
+        self.total_matches = sum(ws.matches_found for ws in self.workers.values())
+        self.villages_completed = sum(ws.villages_completed for ws in self.workers.values())
+        self.active_workers = sum(1 for ws in self.workers.values() if ws.status == 'running')
 
 # ═══════════════════════════════════════════════════════════════════════════════════════
 # BUFFERED THREAD-SAFE CSV WRITER
@@ -1344,97 +2323,277 @@ class ThreadSafeCSVWriter:
         except Exception:
             pass
 
+# ═══════════════════════════════════════════════════════════════════════════════════════
+# STREAMING EXPORTS - CSV / NDJSON encoded chunk by chunk, optionally gzipped on the fly
+# ═══════════════════════════════════════════════════════════════════════════════════════
+
+# format -> (mimetype, file extension)
+EXPORT_FORMATS = {
+    'csv': ('text/csv', '.csv'),
+    'ndjson': ('application/x-ndjson', '.ndjson'),
+}
+
+def export_chunks(rows, fieldnames: List[str], fmt: str = 'csv', compress: bool = False) -> Iterator[bytes]:
+    """
+    Encode rows (dicts) as CSV or NDJSON, yielding about Config.EXPORT_CHUNK_BYTES at a time.
+    
+    CSV keeps the fieldnames columns; NDJSON writes each row whole. The CSV header goes
+    out before the first row is read, so a download starts at once. With compress the
+    output is one gzip stream, sync-flushed per chunk so every chunk can be sent as is.
+    """
+    compressor = zlib.compressobj(wbits=31) if compress else None  # wbits=31: gzip container
+    
+    def encode(text: str, last: bool = False) -> bytes:
+        data = text.encode('utf-8')
+        if compressor:
+            data = compressor.compress(data) + compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+        return data
+    
+    buffer = io.StringIO()
+    if fmt == 'csv':
+        writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction='ignore')
+        writer.writeheader()
+        yield encode(buffer.getvalue())
+        buffer.seek(0)
+        buffer.truncate()
+    
+    for row in rows:
+        if fmt == 'csv':
+            writer.writerow(row)
+        else:
+            buffer.write(json.dumps(row, ensure_ascii=False, default=str) + '\n')
+        if buffer.tell() >= Config.EXPORT_CHUNK_BYTES:
+            yield encode(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+    
+    tail = encode(buffer.getvalue(), last=True)
+    if tail:
+        yield tail
+
+def csv_file_rows(filepath: str) -> Iterator[dict]:
+    """
+    Rows of a CSV file that may still be appended to (the live search CSVs), as of now.
+    Stops at the size the file had when reading began and never yields a half-written row.
+    """
+    def complete_lines():
+        remaining = os.path.getsize(filepath)
+        with open(filepath, 'rb') as f:
+            for line in f:
+                remaining -= len(line)
+                if remaining < 0 or not line.endswith(b'\n'):
+                    return
+                yield line.decode('utf-8')
+    
+    yield from csv.DictReader(complete_lines())
+
 # ═══════════════════════════════════════════════════════════════════════════════════════
 # DATABASE CONNECTION POOL
 # ═══════════════════════════════════════════════════════════════════════════════════════
 
 import sqlite3
+import hashlib
 from contextlib import contextmanager
 
 class ConnectionPool:
     """
     Thread-safe SQLite connection pool to eliminate connection creation overhead.
     Maintains a pool of reusable connections for better performance under high concurrency.
+    
+    read_only=True gives query_only connections (a stray write fails instead of taking
+    the write lock) for the Flask endpoints and progress reads, which then never wait on
+    the crawl's writes. A returned connection is only re-checked when its last use raised
+    or it sat idle longer than DB_POOL_VALIDATE_IDLE, not with a query on every return.
     """
     
-    def __init__(self, db_path: str, pool_size: int = 10, timeout: float = 30.0):
+    def __init__(self, db_path: str, pool_size: int = 10, timeout: float = 30.0,
+                 read_only: bool = False, cache_kb: int = None, mmap_size: int = None):
         self.db_path = db_path
         self.pool_size = pool_size
         self.timeout = timeout
-        self._pool = queue.Queue(maxsize=pool_size)
+        self.read_only = read_only
+        self.cache_kb = cache_kb if cache_kb is not None else (
+            Config.DB_READER_CACHE_KB if read_only else Config.DB_WRITER_CACHE_KB)
+        self.mmap_size = mmap_size if mmap_size is not None else (
+            Config.DB_READER_MMAP_SIZE if read_only else Config.DB_WRITER_MMAP_SIZE)
+        self._pool = queue.Queue(maxsize=pool_size)  # (connection, last used)
         self._lock = threading.Lock()
         self._created = 0
         
+        # Stats tracking
+        self._stats_lock = threading.Lock()
+        self._stats_since = time.time()
+        self._checkouts = 0
+        self._waited = 0          # Checkouts that found every connection busy
+        self._timeouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._in_use = 0
+        self._peak_in_use = 0
+        self._busy_time = 0.0     # Connection-seconds spent checked out
+        self._validations = 0
+        self._discarded = 0
+        
         # Pre-create some connections
         for _ in range(min(3, pool_size)):
             conn = self._create_connection()
-            self._pool.put(conn)
+            self._pool.put((conn, time.time()))
             self._created += 1
     
     def _create_connection(self) -> sqlite3.Connection:
+        return self.connect(self.db_path, self.timeout, read_only=self.read_only,
+                            cache_kb=self.cache_kb, mmap_size=self.mmap_size)
+    
+    @staticmethod
+    def connect(db_path: str, timeout: float = 30.0, read_only: bool = False,
+                cache_kb: int = None, mmap_size: int = None) -> sqlite3.Connection:
         """Create a new optimized SQLite connection"""
-        conn = sqlite3.connect(self.db_path, timeout=self.timeout, check_same_thread=False)
+        conn = sqlite3.connect(db_path, timeout=timeout, check_same_thread=False)
         conn.row_factory = sqlite3.Row
-        # WAL mode for better concurrency (allows readers while writing)
-        conn.execute("PRAGMA journal_mode=WAL")
-        # Normal sync is safe enough with WAL and much faster
-        conn.execute("PRAGMA synchronous=NORMAL")
+        if read_only:
+            # Readers never write - the journal mode is the read-write side's to set
+            conn.execute("PRAGMA query_only=ON")
+        else:
+            # WAL mode for better concurrency (allows readers while writing)
+            conn.execute("PRAGMA journal_mode=WAL")
+            # Normal sync is safe enough with WAL and much faster
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # Natural-key hashing for SQL-side migrations (see DatabaseManager.owner_hash)
+            conn.create_function('owner_hash', 3, DatabaseManager.owner_hash, deterministic=True)
         # Larger cache for better read performance
-        conn.execute("PRAGMA cache_size=-64000")  # 64MB cache
+        conn.execute(f"PRAGMA cache_size=-{int(cache_kb or Config.DB_WRITER_CACHE_KB)}")
         # Memory-mapped I/O for faster reads
-        conn.execute("PRAGMA mmap_size=268435456")  # 256MB
+        conn.execute(f"PRAGMA mmap_size={int(Config.DB_WRITER_MMAP_SIZE if mmap_size is None else mmap_size)}")
         # Temp tables in memory
         conn.execute("PRAGMA temp_store=MEMORY")
         return conn
     
+    def _checkout(self) -> sqlite3.Connection:
+        """Take an idle connection, open a new one under the limit, or wait for a return"""
+        started = time.perf_counter()
+        waited = False
+        try:
+            conn, last_used = self._pool.get_nowait()
+        except queue.Empty:
+            conn = None
+            with self._lock:
+                if self._created < self.pool_size:
+                    self._created += 1
+                    create = True
+                else:
+                    create = False
+            if create:
+                try:
+                    conn = self._create_connection()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+                last_used = time.time()
+            else:
+                # Wait for a connection to be returned
+                waited = True
+                try:
+                    conn, last_used = self._pool.get(timeout=self.timeout)
+                except queue.Empty:
+                    with self._stats_lock:
+                        self._timeouts += 1
+                    raise
+        
+        if time.time() - last_used > Config.DB_POOL_VALIDATE_IDLE:
+            conn = self._validate(conn)
+        
+        wait = time.perf_counter() - started
+        with self._stats_lock:
+            self._checkouts += 1
+            self._waited += waited
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+            self._in_use += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+        return conn
+    
+    def _validate(self, conn: sqlite3.Connection) -> sqlite3.Connection:
+        """Return conn if it still answers, otherwise a fresh replacement"""
+        with self._stats_lock:
+            self._validations += 1
+        try:
+            conn.execute("SELECT 1")
+            return conn
+        except Exception:
+            with self._stats_lock:
+                self._discarded += 1
+            try:
+                conn.close()
+            except Exception:
+                pass
+            return self._create_connection()
+    
     @contextmanager
     def get_connection(self):
         """
         Get a connection from the pool.
         Creates new connection if pool is empty and under limit.
         """
-        conn = None
+        conn = self._checkout()
+        checked_out = time.perf_counter()
+        failed = False
         try:
-            # Try to get from pool (non-blocking)
-            try:
-                conn = self._pool.get_nowait()
-            except queue.Empty:
-                # Pool empty - create new if under limit
-                with self._lock:
-                    if self._created < self.pool_size:
-                        conn = self._create_connection()
-                        self._created += 1
-                    else:
-                        # Wait for a connection to be returned
-                        conn = self._pool.get(timeout=self.timeout)
-            
             yield conn
-            conn.commit()
+            if self.read_only:
+                if conn.in_transaction:
+                    conn.rollback()
+            else:
+                conn.commit()
             
         except Exception as e:
-            if conn:
-                try:
-                    conn.rollback()
-                except Exception:
-                    pass
+            failed = True
+            try:
+                conn.rollback()
+            except Exception:
+                pass
             raise e
         finally:
-            # Return connection to pool
-            if conn:
-                try:
-                    # Check if connection is still valid
-                    conn.execute("SELECT 1")
-                    self._pool.put_nowait(conn)
-                except Exception:
-                    # Connection is dead, decrement count
-                    with self._lock:
-                        self._created -= 1
+            with self._stats_lock:
+                self._in_use -= 1
+                self._busy_time += time.perf_counter() - checked_out
+            try:
+                # Only a connection whose last use raised is checked before reuse
+                if failed:
+                    conn = self._validate(conn)
+                self._pool.put_nowait((conn, time.time()))
+            except Exception:
+                # Connection is dead, decrement count
+                with self._lock:
+                    self._created -= 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Checkout wait times and utilisation since the pool was created"""
+        with self._stats_lock:
+            elapsed = max(time.time() - self._stats_since, 1e-9)
+            checkouts = self._checkouts
+            return {
+                'mode': 'read' if self.read_only else 'write',
+                'pool_size': self.pool_size,
+                'open': self._created,
+                'idle': self._pool.qsize(),
+                'in_use': self._in_use,
+                'peak_in_use': self._peak_in_use,
+                'utilisation': round(self._busy_time / (self.pool_size * elapsed), 4),
+                'checkouts': checkouts,
+                'waited': self._waited,
+                'timeouts': self._timeouts,
+                'avg_wait_ms': round(self._total_wait / checkouts * 1000, 3) if checkouts else 0,
+                'max_wait_ms': round(self._max_wait * 1000, 3),
+                'validations': self._validations,
+                'discarded': self._discarded,
+            }
     
     def close_all(self):
         """Close all pooled connections"""
         while not self._pool.empty():
             try:
-                conn = self._pool.get_nowait()
+                conn, _ = self._pool.get_nowait()
                 conn.close()
             except queue.Empty:
                 break
@@ -1444,6 +2603,190 @@ class ConnectionPool:
             self._created = 0
 
 
+# ═══════════════════════════════════════════════════════════════════════════════════════
+# SINGLE-WRITER GROUP COMMIT
+# ═══════════════════════════════════════════════════════════════════════════════════════
+
+class DatabaseWriter:
+    """
+    The one thread that writes a DatabaseManager's database.
+    
+    Write methods queue an operation - a function of the writer's cursor - and get a
+    Future. The writer takes everything queued within DB_GROUP_COMMIT_WINDOW of the first
+    operation (at most DB_GROUP_COMMIT_MAX) and commits it as one transaction. Each
+    operation runs in its own SAVEPOINT, so a failing one is rolled back and reported on
+    its own Future without sinking the group. Futures resolve after the COMMIT (durable ack);
+    their callbacks run on the writer thread and must not wait for another write.
+    
+    The queue is bounded - callers block only once DB_WRITE_QUEUE_SIZE writes wait. The
+    thread starts on first use in each process, so a forked worker process gets its own.
+    on_rollback() runs on the writer thread whenever an operation or a whole group is
+    rolled back, for callers that cache ids the rolled-back writes may have created.
+    """
+    
+    # Upper bounds (seconds) of the commit-latency histogram bins; the last bin is open-ended
+    COMMIT_HISTOGRAM_BOUNDS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+    
+    def __init__(self, db_path: str, timeout: float = 30.0, on_rollback=None):
+        self.db_path = db_path
+        self.timeout = timeout
+        self.on_rollback = on_rollback
+        self._queue: queue.Queue = queue.Queue(maxsize=Config.DB_WRITE_QUEUE_SIZE)
+        self._thread: Optional[threading.Thread] = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+        
+        # Stats tracking
+        self._stats_lock = threading.Lock()
+        self._commits = 0
+        self._writes = 0
+        self._failed_writes = 0
+        self._max_group = 0
+        self._max_queue_depth = 0
+        self._total_commit_time = 0.0
+        self._max_commit_time = 0.0
+        self._total_ack_time = 0.0
+        self._histogram = [0] * (len(self.COMMIT_HISTOGRAM_BOUNDS) + 1)
+    
+    def submit(self, op) -> Future:
+        """Queue op(cursor); the Future gets its return value (or exception) once committed"""
+        self._ensure_thread()
+        future = Future()
+        self._queue.put((op, future, time.perf_counter()))
+        depth = self._queue.qsize()
+        if depth > self._max_queue_depth:
+            self._max_queue_depth = depth
+        return future
+    
+    def sync(self):
+        """Block until every write queued so far is committed"""
+        self.submit(lambda cursor: None).result()
+    
+    def close(self):
+        """Commit whatever is queued, then stop the thread"""
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._thread = None
+    
+    def _ensure_thread(self):
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            if self._pid is not None and self._pid != os.getpid():
+                # Forked copy - the parent's queued writes are the parent's to commit
+                self._queue = queue.Queue(maxsize=Config.DB_WRITE_QUEUE_SIZE)
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, daemon=True, name="DBWriter")
+            self._thread.start()
+    
+    def _run(self):
+        conn = ConnectionPool.connect(self.db_path, self.timeout)
+        conn.isolation_level = None  # Transactions are managed here
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    return
+                group = [item]
+                closing = False
+                deadline = time.perf_counter() + Config.DB_GROUP_COMMIT_WINDOW
+                while len(group) < Config.DB_GROUP_COMMIT_MAX:
+                    try:
+                        item = self._queue.get(timeout=max(0.0, deadline - time.perf_counter()))
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        closing = True
+                        break
+                    group.append(item)
+                self._commit(conn, group)
+                if closing:
+                    return
+        finally:
+            conn.close()
+    
+    def _commit(self, conn: sqlite3.Connection, group: List[tuple]):
+        """Run a group in one transaction, then resolve its Futures"""
+        max_retries = 3
+        started = time.perf_counter()
+        for attempt in range(max_retries):
+            outcomes = []
+            try:
+                conn.execute('BEGIN IMMEDIATE')
+                for op, _, _ in group:
+                    conn.execute('SAVEPOINT write_op')
+                    try:
+                        outcomes.append((True, op(conn.cursor())))
+                    except Exception as e:
+                        conn.execute('ROLLBACK TO write_op')
+                        self._rolled_back()
+                        outcomes.append((False, e))
+                        logger.error(f"Database write failed: {e}")
+                    conn.execute('RELEASE write_op')
+                conn.execute('COMMIT')
+                break
+            except sqlite3.Error as e:
+                try:
+                    conn.execute('ROLLBACK')
+                except sqlite3.Error:
+                    pass
+                self._rolled_back()
+                if 'locked' in str(e).lower() and attempt < max_retries - 1:
+                    logger.warning(f"DB locked, retrying group of {len(group)} ({attempt + 1}/{max_retries})...")
+                    time.sleep(0.5 * (attempt + 1))  # Exponential backoff
+                    continue
+                logger.error(f"Group commit of {len(group)} writes failed: {e}")
+                outcomes = [(False, e)] * len(group)
+                break
+        
+        done = time.perf_counter()
+        elapsed = done - started
+        with self._stats_lock:
+            self._commits += 1
+            self._writes += len(group)
+            self._failed_writes += sum(1 for ok, _ in outcomes if not ok)
+            self._max_group = max(self._max_group, len(group))
+            self._total_commit_time += elapsed
+            self._max_commit_time = max(self._max_commit_time, elapsed)
+            self._total_ack_time += sum(done - queued_at for _, _, queued_at in group)
+            self._histogram[bisect.bisect_left(self.COMMIT_HISTOGRAM_BOUNDS, elapsed)] += 1
+        
+        for (_, future, _), (ok, value) in zip(group, outcomes):
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+    
+    def _rolled_back(self):
+        if self.on_rollback:
+            try:
+                self.on_rollback()
+            except Exception as e:
+                logger.error(f"Rollback callback failed: {e}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            bounds = self.COMMIT_HISTOGRAM_BOUNDS
+            labels = [f"≤{b * 1000:g}ms" for b in bounds] + [f">{bounds[-1] * 1000:g}ms"]
+            commits = self._commits
+            return {
+                'queue_depth': self._queue.qsize(),
+                'max_queue_depth': self._max_queue_depth,
+                'commits': commits,
+                'writes': self._writes,
+                'failed_writes': self._failed_writes,
+                'avg_group_size': round(self._writes / commits, 1) if commits else 0,
+                'max_group_size': self._max_group,
+                'avg_commit_ms': round(self._total_commit_time / commits * 1000, 2) if commits else 0,
+                'max_commit_ms': round(self._max_commit_time * 1000, 2),
+                'avg_ack_ms': round(self._total_ack_time / self._writes * 1000, 2) if self._writes else 0,
+                'commit_histogram': [{'latency': label, 'count': n} for label, n in zip(labels, self._histogram)],
+            }
+
+
 # ═══════════════════════════════════════════════════════════════════════════════════════
 # PERSISTENT DATABASE MANAGER (SQLite)
 # ═══════════════════════════════════════════════════════════════════════════════════════
@@ -1462,8 +2805,117 @@ class DatabaseManager:
     Database is stored in user's Documents/POWER-BHOOMI folder.
     """
     
-    # Database version for migrations
-    DB_VERSION = 1
+    # Database version for migrations (2 = normalised land_records)
+    DB_VERSION = 2
+    
+    # Compatibility view - land_records with its original columns over the normalised tables
+    _RECORDS_VIEW = '''
+        SELECT f.id, s.session_id, l.district, l.taluk, l.hobli, l.village,
+               f.survey_no, f.surnoc, f.hissa, f.period, o.name AS owner_name,
+               f.extent, f.khatah, f.is_match, f.worker_id,
+               datetime(f.created_at, 'unixepoch') AS created_at
+        FROM land_record_facts f
+        JOIN record_sessions s ON s.id = f.session_key
+        JOIN record_locations l ON l.id = f.location_id
+        JOIN owner_names o ON o.id = f.owner_id
+    '''
+    _LEGACY_RECORDS_VIEW = '''
+        UNION ALL
+        SELECT id, session_id, district, taluk, hobli, village, survey_no, surnoc, hissa, period,
+               owner_name, extent, khatah, is_match, worker_id, created_at
+        FROM land_records_legacy
+    '''
+    
+    # DELETE / UPDATE on the view act on the row's own table by id, so maintenance SQL
+    # (cleanup_corrupted_records.sql) keeps working. Owner columns have their own trigger:
+    # it needs owner_hash(), which only the app's connections define.
+    _RECORDS_VIEW_TRIGGERS = {
+        'land_records_delete': ('INSTEAD OF DELETE', '''
+            DELETE FROM land_record_facts WHERE id = OLD.id;
+        ''', '''
+            DELETE FROM land_records_legacy WHERE id = OLD.id;
+        '''),
+        'land_records_update': (
+            'INSTEAD OF UPDATE OF session_id, district, taluk, hobli, village, survey_no, surnoc, '
+            'hissa, period, is_match, worker_id, created_at', '''
+            INSERT OR IGNORE INTO record_sessions (session_id) VALUES (NEW.session_id);
+            INSERT OR IGNORE INTO record_locations (district, taluk, hobli, village)
+            VALUES (COALESCE(NEW.district, ''), COALESCE(NEW.taluk, ''),
+                    COALESCE(NEW.hobli, ''), COALESCE(NEW.village, ''));
+            UPDATE land_record_facts SET
+                session_key = (SELECT id FROM record_sessions WHERE session_id = NEW.session_id),
+                location_id = (SELECT id FROM record_locations
+                               WHERE district = COALESCE(NEW.district, '') AND taluk = COALESCE(NEW.taluk, '')
+                                 AND hobli = COALESCE(NEW.hobli, '') AND village = COALESCE(NEW.village, '')),
+                survey_no = NEW.survey_no, surnoc = COALESCE(NEW.surnoc, ''),
+                hissa = COALESCE(NEW.hissa, ''), period = COALESCE(NEW.period, ''),
+                is_match = NEW.is_match, worker_id = NEW.worker_id,
+                created_at = CAST(strftime('%s', NEW.created_at) AS INTEGER)
+            WHERE id = OLD.id;
+        ''', '''
+            UPDATE land_records_legacy SET
+                session_id = NEW.session_id, district = NEW.district, taluk = NEW.taluk,
+                hobli = NEW.hobli, village = NEW.village, survey_no = NEW.survey_no,
+                surnoc = NEW.surnoc, hissa = NEW.hissa, period = NEW.period, is_match = NEW.is_match,
+                worker_id = NEW.worker_id, created_at = NEW.created_at
+            WHERE id = OLD.id;
+        '''),
+        'land_records_update_owner': ('INSTEAD OF UPDATE OF owner_name, extent, khatah', '''
+            INSERT OR IGNORE INTO owner_names (name) VALUES (COALESCE(NEW.owner_name, ''));
+            UPDATE land_record_facts SET
+                owner_id = (SELECT id FROM owner_names WHERE name = COALESCE(NEW.owner_name, '')),
+                extent = NEW.extent, khatah = NEW.khatah,
+                owner_hash = owner_hash(NEW.owner_name, NEW.extent, NEW.khatah)
+            WHERE id = OLD.id;
+        ''', '''
+            UPDATE land_records_legacy SET
+                owner_name = NEW.owner_name, extent = NEW.extent, khatah = NEW.khatah
+            WHERE id = OLD.id;
+        '''),
+    }
+    
+    _NATURAL_KEY_INDEX = '''
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_facts_natural_key ON land_record_facts (
+            session_key, location_id, survey_no, surnoc, hissa, period, owner_hash
+        )
+    '''
+    
+    # Records page filters - (condition on the fact rows, the same on the land_records view)
+    _PAGE_FILTERS = {
+        'village': ('f.location_id IN (SELECT id FROM record_locations WHERE village = ?)', 'village = ?'),
+        'hobli': ('f.location_id IN (SELECT id FROM record_locations WHERE hobli = ?)', 'hobli = ?'),
+        'is_match': ('f.is_match = ?', 'is_match = ?'),
+        'owner_prefix': ('f.owner_id IN (SELECT id FROM owner_names WHERE name >= ? AND name < ?)',
+                         'owner_name >= ? AND owner_name < ?'),
+    }
+    
+    # location_id of a land_records row ({0} = its alias). Legacy rows' locations are
+    # registered when the migration starts, so this is set for every row on the view.
+    _VIEW_LOCATION_ID = ("(SELECT id FROM record_locations WHERE district = COALESCE({0}.district, '') "
+                         "AND taluk = COALESCE({0}.taluk, '') AND hobli = COALESCE({0}.hobli, '') "
+                         "AND village = COALESCE({0}.village, ''))")
+    
+    # Records page orders - (cursor condition, ORDER BY) on the fact rows, then on the view
+    # (aliased r). The cursor is always the last id seen; survey order looks its sort key
+    # up by id. Both paths sort by the same key, so a walk that spans the end of the
+    # migration neither skips nor repeats rows.
+    RECORD_SORTS = ('id', 'survey')
+    _PAGE_SORTS = {
+        'id': (('f.id < ?', 'f.id DESC'), ('r.id < ?', 'r.id DESC')),
+        'survey': (('(f.location_id, f.survey_no, f.id) > '
+                    '(SELECT location_id, survey_no, id FROM land_record_facts WHERE id = ?)',
+                    'f.location_id, f.survey_no, f.id'),
+                   (f'({_VIEW_LOCATION_ID.format("r")}, r.survey_no, r.id) > '
+                    f'(SELECT {_VIEW_LOCATION_ID.format("c")}, c.survey_no, c.id FROM land_records c WHERE c.id = ?)',
+                    f'{_VIEW_LOCATION_ID.format("r")}, r.survey_no, r.id')),
+    }
+    
+    # Dictionary tables behind land_record_facts and their natural-key columns
+    _DIMENSIONS = {
+        'record_sessions': ('session_id',),
+        'record_locations': ('district', 'taluk', 'hobli', 'village'),
+        'owner_names': ('name',),
+    }
     
     def __init__(self, db_path: str = None, pool_size: int = None):
         """Initialize database manager with optional custom path and connection pool"""
@@ -1482,30 +2934,71 @@ class DatabaseManager:
             self.db_path = db_path
             self.db_folder = os.path.dirname(db_path)
         
-        self.lock = threading.Lock()
+        self.lock = threading.Lock()  # Schema setup only - every later write goes through self.writer
         
-        # Initialize connection pool (size = workers + 4 for overhead: main + Flask + health monitor + margin)
+        # Read-write pool first - it sets WAL mode and creates the schema the readers query
+        self._write_pool = ConnectionPool(self.db_path, pool_size=Config.DB_WRITE_POOL_SIZE)
+        self._init_database()
+        
+        # Dictionary ids (see _DIMENSIONS) - only the writer thread touches this
+        self._dimension_ids: Dict[tuple, int] = {}
+        self.writer = DatabaseWriter(self.db_path, on_rollback=self._dimension_ids.clear)
+        
+        # Reader pool (size = workers + 4 for overhead: main + Flask + health monitor + margin)
         pool_size = pool_size or (Config.MAX_WORKERS + 4)
-        self._pool = ConnectionPool(self.db_path, pool_size=pool_size)
+        self._read_pool = ConnectionPool(self.db_path, pool_size=pool_size, read_only=True)
+        logger.info(f"📁 Database initialized with reader pool size {pool_size}: {self.db_path}")
         
-        self._init_database()
-        logger.info(f"📁 Database initialized with pool size {pool_size}: {self.db_path}")
+        self._migration_stop = threading.Event()
+        self._migration_thread = None
+        if self._legacy_records or self._dedupe_pending:
+            self._migration_thread = threading.Thread(target=self._upgrade_records, daemon=True,
+                                                      name="RecordsMigration")
+            self._migration_thread.start()
     
     @contextmanager
     def get_connection(self):
-        """Get a connection from the pool (thread-safe)"""
-        with self._pool.get_connection() as conn:
+        """Get a query_only connection from the reader pool (thread-safe) - writes go through _write"""
+        with self._read_pool.get_connection() as conn:
             yield conn
     
+    @contextmanager
+    def get_write_connection(self):
+        """Get a read-write connection for schema setup and maintenance outside the writer thread"""
+        with self._write_pool.get_connection() as conn:
+            yield conn
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Wait-time and utilisation metrics for both pools"""
+        return {'read': self._read_pool.get_stats(), 'write': self._write_pool.get_stats()}
+    
     def close(self):
-        """Close all database connections"""
-        self._pool.close_all()
+        """Commit queued writes, then close all database connections"""
+        self._migration_stop.set()
+        if self._migration_thread is not None:
+            self._migration_thread.join()  # At most the batch in flight
+        self.writer.close()
+        self._read_pool.close_all()
+        self._write_pool.close_all()
+    
+    def _write(self, op, durable: bool = True):
+        """
+        Run op(cursor) on the writer thread (see DatabaseWriter).
+        durable=True waits for the commit and returns op's result; durable=False returns the Future.
+        """
+        future = self.writer.submit(op)
+        return future.result() if durable else future
+    
+    def sync(self):
+        """Wait until every write queued so far (by any thread) is committed"""
+        self.writer.sync()
     
     def _init_database(self):
         """Initialize database schema"""
         with self.lock:
-            with self.get_connection() as conn:
+            with self.get_write_connection() as conn:
                 cursor = conn.cursor()
+                cursor.execute('BEGIN IMMEDIATE')  # Another process may be setting up too
                 
                 # Search Sessions Table - Track each search operation
                 cursor.execute('''
@@ -1534,28 +3027,99 @@ class DatabaseManager:
                     )
                 ''')
                 
-                # Land Records Table - All records found (REAL-TIME SAVES)
+                # Land Records - All records found (REAL-TIME SAVES), normalised: sessions,
+                # locations and owner names are integer-keyed dictionaries and each record is
+                # a compact land_record_facts row. land_records is a view with the old columns.
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS record_sessions (
+                        id INTEGER PRIMARY KEY,
+                        session_id TEXT UNIQUE NOT NULL
+                    )
+                ''')
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS record_locations (
+                        id INTEGER PRIMARY KEY,
+                        district TEXT NOT NULL,
+                        taluk TEXT NOT NULL,
+                        hobli TEXT NOT NULL,
+                        village TEXT NOT NULL,
+                        UNIQUE(district, taluk, hobli, village)
+                    )
+                ''')
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS owner_names (
+                        id INTEGER PRIMARY KEY,
+                        name TEXT UNIQUE NOT NULL
+                    )
+                ''')
                 cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS land_records (
+                    CREATE TABLE IF NOT EXISTS land_record_facts (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        session_id TEXT NOT NULL,
-                        district TEXT,
-                        taluk TEXT,
-                        hobli TEXT,
-                        village TEXT,
+                        session_key INTEGER NOT NULL REFERENCES record_sessions(id),
+                        location_id INTEGER NOT NULL REFERENCES record_locations(id),
                         survey_no INTEGER,
                         surnoc TEXT,
                         hissa TEXT,
                         period TEXT,
-                        owner_name TEXT,
+                        owner_id INTEGER NOT NULL REFERENCES owner_names(id),
                         extent TEXT,
                         khatah TEXT,
                         is_match INTEGER DEFAULT 0,
                         worker_id INTEGER DEFAULT 0,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (session_id) REFERENCES search_sessions(session_id)
+                        created_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),  -- Unix time
+                        owner_hash INTEGER  -- owner_hash(owner name, extent, khatah), part of the natural key
                     )
                 ''')
+                cursor.execute('PRAGMA table_info(land_record_facts)')
+                if 'owner_hash' not in {row[1] for row in cursor.fetchall()}:
+                    cursor.execute('ALTER TABLE land_record_facts ADD COLUMN owner_hash INTEGER')
+                
+                # Natural key - a retried period re-saves the same owners, which must not add
+                # rows. Built at once on an empty table; otherwise dedupe_records() cleans the
+                # existing rows first and then builds it.
+                cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'idx_facts_natural_key'")
+                self._dedupe_pending = False
+                if cursor.fetchone() is None:
+                    cursor.execute('SELECT 1 FROM land_record_facts LIMIT 1')
+                    if cursor.fetchone() is None:
+                        cursor.execute(self._NATURAL_KEY_INDEX)
+                    else:
+                        self._dedupe_pending = True
+                
+                # Databases from before the normalised schema - the old table becomes
+                # land_records_legacy, read through the view until _migrate_legacy_records
+                # has moved every row (new rows continue its ids)
+                cursor.execute("SELECT type FROM sqlite_master WHERE name = 'land_records'")
+                row = cursor.fetchone()
+                if row and row[0] == 'table':
+                    cursor.execute('ALTER TABLE land_records RENAME TO land_records_legacy')
+                    for index in ('idx_records_village', 'idx_records_owner', 'idx_records_match'):
+                        cursor.execute(f'DROP INDEX IF EXISTS {index}')
+                    cursor.execute('''
+                        SELECT MAX(COALESCE((SELECT MAX(id) FROM land_records_legacy), 0),
+                                   COALESCE((SELECT MAX(seq) FROM sqlite_sequence
+                                             WHERE name IN ('land_records', 'land_records_legacy',
+                                                            'land_record_facts')), 0))
+                    ''')
+                    last_id = cursor.fetchone()[0]
+                    cursor.execute("DELETE FROM sqlite_sequence WHERE name = 'land_record_facts'")
+                    cursor.execute("INSERT INTO sqlite_sequence (name, seq) VALUES ('land_record_facts', ?)",
+                                   (last_id,))
+                    logger.info("📦 Migrating land_records to the normalised schema in the background")
+                cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'land_records_legacy'")
+                self._legacy_records = cursor.fetchone() is not None
+                if self._legacy_records:
+                    # Give every legacy location its id now, in crawl order, so records
+                    # pages sort unmigrated rows by location_id like the migrated ones
+                    cursor.execute('''
+                        INSERT OR IGNORE INTO record_locations (district, taluk, hobli, village)
+                        SELECT COALESCE(district, ''), COALESCE(taluk, ''),
+                               COALESCE(hobli, ''), COALESCE(village, '')
+                        FROM land_records_legacy GROUP BY 1, 2, 3, 4 ORDER BY MIN(id)
+                    ''')
+                cursor.execute('CREATE VIEW IF NOT EXISTS land_records AS ' + self._RECORDS_VIEW +
+                               (self._LEGACY_RECORDS_VIEW if self._legacy_records else ''))
+                self._create_records_view_triggers(cursor, self._legacy_records)
                 
                 # Village Progress Table - Track which villages/surveys are done
                 cursor.execute('''
@@ -1574,16 +3138,32 @@ class DatabaseManager:
                         started_at TIMESTAMP,
                         completed_at TIMESTAMP,
                         error_message TEXT,
+                        worker_id INTEGER,  -- Worker that leased the village
+                        lease_owner TEXT,  -- host:pid holding the lease
+                        lease_expires_at REAL,  -- Unix time the lease lapses unless renewed
+                        lease_count INTEGER DEFAULT 0,  -- Times leased (repeated expiry = poison village)
                         FOREIGN KEY (session_id) REFERENCES search_sessions(session_id),
                         UNIQUE(session_id, village_code)
                     )
                 ''')
                 
+                # Databases created before the work-stealing scheduler / leases lack these columns
+                cursor.execute('PRAGMA table_info(village_progress)')
+                progress_columns = {row[1] for row in cursor.fetchall()}
+                for column, ddl in (('worker_id', 'INTEGER'), ('lease_owner', 'TEXT'),
+                                    ('lease_expires_at', 'REAL'), ('lease_count', 'INTEGER DEFAULT 0')):
+                    if column not in progress_columns:
+                        cursor.execute(f'ALTER TABLE village_progress ADD COLUMN {column} {ddl}')
+                
                 # Create indexes for fast lookups
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_records_session ON land_records(session_id)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_records_village ON land_records(village)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_records_owner ON land_records(owner_name)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_records_match ON land_records(is_match)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_facts_session ON land_record_facts(session_key)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_facts_location ON land_record_facts(location_id)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_facts_owner ON land_record_facts(owner_id)')
+                # Keyset pages - (session, is_match, id) for matches, (session, location, survey, id) for survey order
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_facts_match ON land_record_facts(session_key, is_match)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_facts_survey '
+                               'ON land_record_facts(session_key, location_id, survey_no)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_locations_village ON record_locations(village)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_progress_session ON village_progress(session_id)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_sessions_status ON search_sessions(status)')
                 
@@ -1621,6 +3201,87 @@ class DatabaseManager:
                 ''')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_checkpoint_session_village ON survey_checkpoints(session_id, village_code)')
                 
+                # Period Checkpoints Table - Finished (surnoc, hissa, period) tuples of surveys
+                # without a survey checkpoint yet; '*' as hissa/period marks a whole surnoc/hissa
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS period_checkpoints (
+                        session_id TEXT NOT NULL,
+                        village_code TEXT NOT NULL,
+                        survey_no INTEGER NOT NULL,
+                        surnoc TEXT NOT NULL,
+                        hissa TEXT NOT NULL,
+                        period TEXT NOT NULL,
+                        PRIMARY KEY (session_id, village_code, survey_no, surnoc, hissa, period)
+                    ) WITHOUT ROWID
+                ''')
+                
+                # Survey Range Table - How a split village's surveys were divided, so each
+                # range resumes from its own checkpoints
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS survey_ranges (
+                        session_id TEXT NOT NULL,
+                        village_code TEXT NOT NULL,
+                        range_start INTEGER NOT NULL,
+                        range_end INTEGER NOT NULL,
+                        status TEXT DEFAULT 'pending',  -- pending, completed
+                        worker_id INTEGER,
+                        PRIMARY KEY (session_id, village_code, range_start)
+                    )
+                ''')
+                
+                # RTC Cache Tables - Crawled owners reused across sessions (keyed by portal codes)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS rtc_survey_cache (
+                        district_code TEXT NOT NULL,
+                        taluk_code TEXT NOT NULL,
+                        hobli_code TEXT NOT NULL,
+                        village_code TEXT NOT NULL,
+                        survey_no INTEGER NOT NULL,
+                        has_data INTEGER DEFAULT 0,  -- 0 = portal returned no surnoc
+                        fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        PRIMARY KEY (district_code, taluk_code, hobli_code, village_code, survey_no)
+                    )
+                ''')
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS rtc_cache (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        district_code TEXT NOT NULL,
+                        taluk_code TEXT NOT NULL,
+                        hobli_code TEXT NOT NULL,
+                        village_code TEXT NOT NULL,
+                        survey_no INTEGER NOT NULL,
+                        surnoc TEXT,
+                        hissa TEXT,
+                        period TEXT,
+                        owners TEXT,  -- JSON list of {owner_name, extent, khatah}
+                        fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        UNIQUE(district_code, taluk_code, hobli_code, village_code, survey_no, surnoc, hissa, period)
+                    )
+                ''')
+                
+                # Location Hierarchy Table - '' in the lower code columns marks the
+                # district / taluk / hobli row itself (codes normalised, "2.0" -> "2")
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS location_hierarchy (
+                        district_code TEXT NOT NULL,
+                        taluk_code TEXT NOT NULL DEFAULT '',
+                        hobli_code TEXT NOT NULL DEFAULT '',
+                        village_code TEXT NOT NULL DEFAULT '',
+                        name TEXT,
+                        fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        PRIMARY KEY (district_code, taluk_code, hobli_code, village_code)
+                    )
+                ''')
+                
+                # API Response Cache Table - eChawadi JSON keyed by endpoint + arguments
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS api_cache (
+                        cache_key TEXT PRIMARY KEY,
+                        payload TEXT NOT NULL,
+                        fetched_at REAL NOT NULL
+                    )
+                ''')
+                
                 # Version tracking
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS db_meta (
@@ -1640,56 +3301,55 @@ class DatabaseManager:
         import uuid
         session_id = f"search_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
         
-        with self.lock:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO search_sessions (
-                        session_id, owner_name, owner_variants,
-                        district_code, district_name, taluk_code, taluk_name,
-                        hobli_code, hobli_name, village_code, village_name,
-                        max_survey, total_villages
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    session_id,
-                    params.get('owner_name', ''),
-                    json.dumps(params.get('owner_variants', [])),
-                    params.get('district_code', ''),
-                    params.get('district_name', ''),
-                    params.get('taluk_code', ''),
-                    params.get('taluk_name', ''),
-                    params.get('hobli_code', ''),
-                    params.get('hobli_name', ''),
-                    params.get('village_code', ''),
-                    params.get('village_name', ''),
-                    params.get('max_survey', 200),
-                    params.get('total_villages', 0)
-                ))
+        def write(cursor):
+            cursor.execute('''
+                INSERT INTO search_sessions (
+                    session_id, owner_name, owner_variants,
+                    district_code, district_name, taluk_code, taluk_name,
+                    hobli_code, hobli_name, village_code, village_name,
+                    max_survey, total_villages
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                session_id,
+                params.get('owner_name', ''),
+                json.dumps(params.get('owner_variants', [])),
+                params.get('district_code', ''),
+                params.get('district_name', ''),
+                params.get('taluk_code', ''),
+                params.get('taluk_name', ''),
+                params.get('hobli_code', ''),
+                params.get('hobli_name', ''),
+                params.get('village_code', ''),
+                params.get('village_name', ''),
+                params.get('max_survey', 200),
+                params.get('total_villages', 0)
+            ))
+        self._write(write)
         
         logger.info(f"📝 Created session: {session_id}")
         return session_id
     
     def update_session_status(self, session_id: str, status: str, **kwargs):
         """Update session status and optional fields"""
-        with self.lock:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                updates = ['status = ?']
-                values = [status]
-                
-                if status in ('completed', 'stopped'):
-                    updates.append('completed_at = CURRENT_TIMESTAMP')
-                
-                for key, value in kwargs.items():
-                    if key in ('villages_completed', 'total_records', 'total_matches', 'notes', 'total_villages'):
-                        updates.append(f'{key} = ?')
-                        values.append(value)
-                
-                values.append(session_id)
-                cursor.execute(f'''
-                    UPDATE search_sessions SET {', '.join(updates)} WHERE session_id = ?
-                ''', values)
+        def write(cursor):
+            
+            updates = ['status = ?']
+            values = [status]
+            
+            if status in ('completed', 'stopped'):
+                updates.append('completed_at = CURRENT_TIMESTAMP')
+            
+            for key, value in kwargs.items():
+                if key in ('villages_completed', 'total_records', 'total_matches', 'notes', 'total_villages',
+                           'district_name', 'taluk_name'):
+                    updates.append(f'{key} = ?')
+                    values.append(value)
+            
+            values.append(session_id)
+            cursor.execute(f'''
+                UPDATE search_sessions SET {', '.join(updates)} WHERE session_id = ?
+            ''', values)
+        return self._write(write)
     
     def get_session(self, session_id: str) -> Optional[dict]:
         """Get session details"""
@@ -1730,60 +3390,56 @@ class DatabaseManager:
     
     def register_villages(self, session_id: str, villages: List[tuple]):
         """Register all villages for a session (for resume tracking)"""
-        with self.lock:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                for village_code, village_name, hobli_code, hobli_name in villages:
-                    cursor.execute('''
-                        INSERT OR IGNORE INTO village_progress 
-                        (session_id, village_code, village_name, hobli_code, hobli_name)
-                        VALUES (?, ?, ?, ?, ?)
-                    ''', (session_id, village_code, village_name, hobli_code, hobli_name))
-    
-    def start_village(self, session_id: str, village_code: str, max_survey: int = 200):
-        """Mark village as in_progress"""
-        with self.lock:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
+        def write(cursor):
+            for village_code, village_name, hobli_code, hobli_name in villages:
                 cursor.execute('''
-                    UPDATE village_progress 
-                    SET status = 'in_progress', started_at = CURRENT_TIMESTAMP, max_survey_no = ?
-                    WHERE session_id = ? AND village_code = ?
-                ''', (max_survey, session_id, village_code))
+                    INSERT OR IGNORE INTO village_progress 
+                    (session_id, village_code, village_name, hobli_code, hobli_name)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', (session_id, village_code, village_name, hobli_code, hobli_name))
+        return self._write(write)
+    
+    def start_village(self, session_id: str, village_code: str, max_survey: int = 200, worker_id: int = None):
+        """Mark village as in_progress (leased by worker_id)"""
+        def write(cursor):
+            cursor.execute('''
+                UPDATE village_progress 
+                SET status = 'in_progress', started_at = CURRENT_TIMESTAMP, max_survey_no = ?, worker_id = ?
+                WHERE session_id = ? AND village_code = ?
+            ''', (max_survey, worker_id, session_id, village_code))
+        return self._write(write)
     
-    def update_village_progress(self, session_id: str, village_code: str, last_survey: int, records: int = 0, matches: int = 0):
+    def update_village_progress(self, session_id: str, village_code: str, last_survey: int, records: int = 0, matches: int = 0,
+                                durable: bool = True):
         """Update village progress (call periodically during search)"""
-        with self.lock:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    UPDATE village_progress 
-                    SET last_survey_no = ?, records_found = records_found + ?, matches_found = matches_found + ?
-                    WHERE session_id = ? AND village_code = ?
-                ''', (last_survey, records, matches, session_id, village_code))
+        def write(cursor):
+            cursor.execute('''
+                UPDATE village_progress 
+                SET last_survey_no = ?, records_found = records_found + ?, matches_found = matches_found + ?
+                WHERE session_id = ? AND village_code = ?
+            ''', (last_survey, records, matches, session_id, village_code))
+        return self._write(write, durable)
     
     def complete_village(self, session_id: str, village_code: str, records: int, matches: int):
         """Mark village as completed"""
-        with self.lock:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    UPDATE village_progress 
-                    SET status = 'completed', completed_at = CURRENT_TIMESTAMP,
-                        records_found = ?, matches_found = ?
-                    WHERE session_id = ? AND village_code = ?
-                ''', (records, matches, session_id, village_code))
+        def write(cursor):
+            cursor.execute('''
+                UPDATE village_progress 
+                SET status = 'completed', completed_at = CURRENT_TIMESTAMP,
+                    records_found = ?, matches_found = ?, lease_owner = NULL, lease_expires_at = NULL
+                WHERE session_id = ? AND village_code = ?
+            ''', (records, matches, session_id, village_code))
+        return self._write(write)
     
-    def fail_village(self, session_id: str, village_code: str, error: str):
+    def fail_village(self, session_id: str, village_code: str, error: str, durable: bool = True):
         """Mark village as failed"""
-        with self.lock:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    UPDATE village_progress 
-                    SET status = 'failed', error_message = ?
-                    WHERE session_id = ? AND village_code = ?
-                ''', (error, session_id, village_code))
+        def write(cursor):
+            cursor.execute('''
+                UPDATE village_progress 
+                SET status = 'failed', error_message = ?, lease_owner = NULL, lease_expires_at = NULL
+                WHERE session_id = ? AND village_code = ?
+            ''', (error, session_id, village_code))
+        return self._write(write, durable)
     
     def get_pending_villages(self, session_id: str) -> List[dict]:
         """Get villages that still need to be searched (for resume)"""
@@ -1796,125 +3452,503 @@ class DatabaseManager:
             ''', (session_id,))
             return [dict(row) for row in cursor.fetchall()]
     
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    # VILLAGE LEASES - Job queue over village_progress for any process / host on this DB
+    # Every claim is one conditional UPDATE, so SQLite's write lock makes it atomic
+    # across processes; within a process the writer thread already runs them one by one.
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    
+    # A village another owner may take: not done, and nobody holds a live lease on it
+    _LEASABLE = "status != 'completed' AND (lease_owner IS NULL OR lease_owner = ? OR COALESCE(lease_expires_at, 0) < ?)"
+    
+    @staticmethod
+    def lease_owner_id(pid: int = None) -> str:
+        """Lease owner for this process (or a child pid) - threads share it, so stealing/splitting needs no re-lease"""
+        return f"{platform.node()}:{pid or os.getpid()}"
+    
+    def lease_village(self, session_id: str, owner: str, village_code: str = None, ttl: float = None,
+                      worker_id: int = None, max_survey: int = None) -> Optional[dict]:
+        """
+        Lease a village to owner for ttl seconds (default Config.LEASE_TTL).
+        
+        With village_code, that village is leased unless it is completed or another
+        owner holds a live lease (leasing your own again just extends it). Without it,
+        the first pending village - or in-progress one whose lease lapsed - is taken.
+        
+        Returns the leased village_progress row, or None when nothing could be leased.
+        """
+        ttl = ttl or Config.LEASE_TTL
+        def write(cursor):
+            for _ in range(5):  # Candidates another process grabbed first are skipped
+                now = time.time()
+                code = village_code
+                if code is None:
+                    cursor.execute('''
+                        SELECT village_code FROM village_progress
+                        WHERE session_id = ? AND (status = 'pending'
+                              OR (status = 'in_progress' AND COALESCE(lease_expires_at, 0) < ?))
+                        ORDER BY id LIMIT 1
+                    ''', (session_id, now))
+                    row = cursor.fetchone()
+                    if not row:
+                        return None
+                    code = row['village_code']
+                cursor.execute(f'''
+                    UPDATE village_progress
+                    SET status = 'in_progress', started_at = COALESCE(started_at, CURRENT_TIMESTAMP),
+                        max_survey_no = COALESCE(?, max_survey_no), worker_id = ?,
+                        lease_count = lease_count + (CASE WHEN lease_owner IS ? THEN 0 ELSE 1 END),
+                        lease_owner = ?, lease_expires_at = ?
+                    WHERE session_id = ? AND village_code = ? AND {self._LEASABLE}
+                ''', (max_survey, worker_id, owner, owner, now + ttl, session_id, code, owner, now))
+                if cursor.rowcount:
+                    cursor.execute('SELECT * FROM village_progress WHERE session_id = ? AND village_code = ?',
+                                   (session_id, code))
+                    return dict(cursor.fetchone())
+                if village_code is not None:
+                    return None
+            return None
+        return self._write(write)
+    
+    def renew_lease(self, session_id: str, village_code: str, owner: str, ttl: float = None,
+                    last_survey: int = None, durable: bool = True) -> bool:
+        """Extend owner's lease (and record progress). False if the lease was lost to another owner."""
+        ttl = ttl or Config.LEASE_TTL
+        def write(cursor):
+            cursor.execute('''
+                UPDATE village_progress
+                SET lease_expires_at = ?, last_survey_no = COALESCE(?, last_survey_no)
+                WHERE session_id = ? AND village_code = ? AND lease_owner = ? AND status = 'in_progress'
+            ''', (time.time() + ttl, last_survey, session_id, village_code, owner))
+            return cursor.rowcount > 0
+        return self._write(write, durable)
+    
+    def complete_lease(self, session_id: str, village_code: str, owner: str, records: int, matches: int) -> bool:
+        """complete_village() for the lease holder. False (nothing written) if owner lost the lease."""
+        def write(cursor):
+            cursor.execute('''
+                UPDATE village_progress
+                SET status = 'completed', completed_at = CURRENT_TIMESTAMP,
+                    records_found = ?, matches_found = ?, lease_owner = NULL, lease_expires_at = NULL
+                WHERE session_id = ? AND village_code = ? AND (lease_owner = ? OR lease_owner IS NULL)
+            ''', (records, matches, session_id, village_code, owner))
+            return cursor.rowcount > 0
+        return self._write(write)
+    
+    def release_leases(self, session_id: str, owner: str, village_code: str = None) -> List[dict]:
+        """
+        Hand owner's unfinished villages (or just village_code) back to the queue as pending,
+        so another owner can take them without waiting for expiry. Returns the released rows.
+        """
+        where = "session_id = ? AND lease_owner = ? AND status = 'in_progress'"
+        params = [session_id, owner]
+        if village_code:
+            where += ' AND village_code = ?'
+            params.append(village_code)
+        def write(cursor):
+            cursor.execute(f'SELECT * FROM village_progress WHERE {where}', params)
+            released = [dict(row) for row in cursor.fetchall()]
+            cursor.execute(f'''
+                UPDATE village_progress
+                SET status = 'pending', lease_owner = NULL, lease_expires_at = NULL, worker_id = NULL
+                WHERE {where}
+            ''', params)
+            return released
+        return self._write(write)
+    
+    def expire_leases(self, session_id: str = None) -> int:
+        """Return in-progress villages whose lease lapsed (crashed workers) to pending; count reclaimed"""
+        query = '''
+            UPDATE village_progress
+            SET status = 'pending', lease_owner = NULL, lease_expires_at = NULL, worker_id = NULL
+            WHERE status = 'in_progress' AND COALESCE(lease_expires_at, 0) < ?
+        '''
+        params = [time.time()]
+        if session_id:
+            query += ' AND session_id = ?'
+            params.append(session_id)
+        def write(cursor):
+            cursor.execute(query, params)
+            return cursor.rowcount
+        return self._write(write)
+    
+    def get_lease_summary(self, session_id: str) -> dict:
+        """Village counts by queue state, plus the owners holding live leases"""
+        now = time.time()
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT
+                    SUM(status = 'pending') AS pending,
+                    SUM(status = 'in_progress' AND COALESCE(lease_expires_at, 0) >= ?) AS leased,
+                    SUM(status = 'in_progress' AND COALESCE(lease_expires_at, 0) < ?) AS expired,
+                    SUM(status = 'completed') AS completed,
+                    SUM(status = 'failed') AS failed
+                FROM village_progress WHERE session_id = ?
+            ''', (now, now, session_id))
+            summary = {k: v or 0 for k, v in dict(cursor.fetchone()).items()}
+            cursor.execute('''
+                SELECT lease_owner, COUNT(*) AS villages FROM village_progress
+                WHERE session_id = ? AND status = 'in_progress' AND lease_expires_at >= ?
+                GROUP BY lease_owner ORDER BY lease_owner
+            ''', (session_id, now))
+            summary['owners'] = {row['lease_owner']: row['villages'] for row in cursor.fetchall()}
+            return summary
+    
     # ═══════════════════════════════════════════════════════════════════════════════════
     # RECORD MANAGEMENT (REAL-TIME SAVES)
     # ═══════════════════════════════════════════════════════════════════════════════════
     
-    def save_record(self, session_id: str, record: dict, is_match: bool = False) -> int:
-        """Save a single record immediately (thread-safe, real-time)"""
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                with self.lock:
-                    with self.get_connection() as conn:
-                        cursor = conn.cursor()
-                        cursor.execute('''
-                            INSERT INTO land_records (
-                                session_id, district, taluk, hobli, village,
-                                survey_no, surnoc, hissa, period,
-                                owner_name, extent, khatah, is_match, worker_id
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ''', (
-                            session_id,
-                            record.get('district', ''),
-                            record.get('taluk', ''),
-                            record.get('hobli', ''),
-                            record.get('village', ''),
-                            record.get('survey_no', 0),
-                            record.get('surnoc', ''),
-                            record.get('hissa', ''),
-                            record.get('period', ''),
-                            record.get('owner_name', ''),
-                            record.get('extent', ''),
-                            record.get('khatah', ''),
-                            1 if is_match else 0,
-                            record.get('worker_id', 0)
-                        ))
-                        return cursor.lastrowid
-            except sqlite3.OperationalError as e:
-                if 'locked' in str(e).lower() and attempt < max_retries - 1:
-                    logger.warning(f"DB locked, retrying ({attempt + 1}/{max_retries})...")
-                    time.sleep(0.5 * (attempt + 1))  # Exponential backoff
-                else:
-                    logger.error(f"Database save failed after {max_retries} attempts: {e}")
-                    raise
-            except Exception as e:
-                logger.error(f"Database save error: {e}")
-                raise
-        return -1
+    # A record already saved under its natural key is skipped, not duplicated
+    _RECORD_INSERT = '''
+        INSERT INTO land_record_facts (
+            session_key, location_id, survey_no, surnoc, hissa, period,
+            owner_id, extent, khatah, is_match, worker_id, owner_hash
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT DO NOTHING
+    '''
+    
+    @staticmethod
+    def owner_hash(owner_name: Optional[str], extent: Optional[str], khatah: Optional[str]) -> int:
+        """Stable 64-bit hash of an owner row - the owner part of a record's natural key"""
+        text = '\x1f'.join(v or '' for v in (owner_name, extent, khatah))
+        return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'big', signed=True)
+    
+    def _dimension_id(self, cursor, table: str, values: tuple) -> int:
+        """Id of values in a dictionary table, added if new (writer thread only)"""
+        key = (table, *values)
+        dim_id = self._dimension_ids.get(key)
+        if dim_id is not None:
+            return dim_id
+        
+        columns = self._DIMENSIONS[table]
+        cursor.execute(f'SELECT id FROM {table} WHERE ' + ' AND '.join(f'{c} = ?' for c in columns), values)
+        row = cursor.fetchone()
+        if row:
+            dim_id = row[0]
+        else:
+            cursor.execute(f'INSERT INTO {table} ({", ".join(columns)}) '
+                           f'VALUES ({", ".join("?" * len(columns))})', values)
+            dim_id = cursor.lastrowid
+        
+        if len(self._dimension_ids) >= Config.DB_DIMENSION_CACHE_SIZE:
+            self._dimension_ids.clear()
+        self._dimension_ids[key] = dim_id
+        return dim_id
+    
+    def _record_row(self, cursor, session_key: int, record: dict, is_match: bool) -> tuple:
+        """_RECORD_INSERT parameters for one record dict"""
+        location = tuple(record.get(k) or '' for k in ('district', 'taluk', 'hobli', 'village'))
+        owner_name = record.get('owner_name') or ''
+        return (
+            session_key,
+            self._dimension_id(cursor, 'record_locations', location),
+            record.get('survey_no', 0),
+            record.get('surnoc') or '',  # '' not NULL - NULLs never collide in the natural key
+            record.get('hissa') or '',
+            record.get('period') or '',
+            self._dimension_id(cursor, 'owner_names', (owner_name,)),
+            record.get('extent', ''),
+            record.get('khatah', ''),
+            1 if is_match else 0,
+            record.get('worker_id', 0),
+            self.owner_hash(owner_name, record.get('extent'), record.get('khatah'))
+        )
     
-    def save_records_batch(self, session_id: str, records: List[dict], matches: List[bool] = None):
-        """Save multiple records in a single transaction (faster for batch)"""
+    def save_record(self, session_id: str, record: dict, is_match: bool = False,
+                    durable: bool = True) -> Optional[int]:
+        """Save a single record (thread-safe, real-time); its row id, None if already saved"""
+        def write(cursor):
+            session_key = self._dimension_id(cursor, 'record_sessions', (session_id,))
+            cursor.execute(self._RECORD_INSERT, self._record_row(cursor, session_key, record, is_match))
+            return cursor.lastrowid if cursor.rowcount else None
+        return self._write(write, durable)
+    
+    def save_records_batch(self, session_id: str, records: List[dict], matches: List[bool] = None,
+                           periods: List[tuple] = None, durable: bool = True):
+        """
+        Save multiple records in a single transaction (faster for batch). Returns one flag
+        per record, True if it was inserted - records already saved under their natural
+        key (by any worker, agent or earlier run) are skipped.
+        
+        Args:
+            periods: (village_code, survey_no, surnoc, hissa, period) tuples committed in the
+                     same transaction (see save_period_checkpoints), so a period's records
+                     and its checkpoint land together or not at all
+        """
         if not records:
             return
         
         if matches is None:
             matches = [False] * len(records)
         
-        with self.lock:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.executemany('''
-                    INSERT INTO land_records (
-                        session_id, district, taluk, hobli, village,
-                        survey_no, surnoc, hissa, period,
-                        owner_name, extent, khatah, is_match, worker_id
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', [
-                    (
-                        session_id,
-                        r.get('district', ''),
-                        r.get('taluk', ''),
-                        r.get('hobli', ''),
-                        r.get('village', ''),
-                        r.get('survey_no', 0),
-                        r.get('surnoc', ''),
-                        r.get('hissa', ''),
-                        r.get('period', ''),
-                        r.get('owner_name', ''),
-                        r.get('extent', ''),
-                        r.get('khatah', ''),
-                        1 if matches[i] else 0,
-                        r.get('worker_id', 0)
-                    )
-                    for i, r in enumerate(records)
-                ])
+        def write(cursor):
+            if periods:
+                cursor.executemany(self._PERIOD_CHECKPOINT_INSERT,
+                                   [(session_id, *period) for period in periods])
+            session_key = self._dimension_id(cursor, 'record_sessions', (session_id,))
+            inserted = []
+            for i, r in enumerate(records):
+                cursor.execute(self._RECORD_INSERT, self._record_row(cursor, session_key, r, matches[i]))
+                inserted.append(cursor.rowcount == 1)
+            return inserted
+        return self._write(write, durable)
+    
+    def get_record_keys(self, session_id: str, location: tuple) -> List[tuple]:
+        """
+        Natural keys (survey_no, surnoc, hissa, period, owner_hash) of the records saved so
+        far for one (district, taluk, hobli, village) of a session
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT survey_no, surnoc, hissa, period, owner_hash FROM land_record_facts
+                WHERE session_key = (SELECT id FROM record_sessions WHERE session_id = ?)
+                  AND location_id = (SELECT id FROM record_locations
+                                     WHERE district = ? AND taluk = ? AND hobli = ? AND village = ?)
+            ''', (session_id, *location))
+            return [tuple(row) for row in cursor.fetchall()]
+    
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    # RECORDS MIGRATION - Legacy land_records table into the normalised schema
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    
+    def _upgrade_records(self):
+        """Background land_records upgrades, in order: legacy migration, then the natural-key dedup"""
+        if self._legacy_records:
+            self._migrate_legacy_records()
+        if self._dedupe_pending and not self._legacy_records and not self._migration_stop.is_set():
+            try:
+                self.dedupe_records()
+            except Exception as e:
+                logger.error(f"land_records dedup stopped (resumes on restart): {e}")
+    
+    def dedupe_records(self) -> int:
+        """
+        One-off cleanup of records saved before the natural key existed: hash the owner
+        rows, delete every duplicate but the first, then build idx_facts_natural_key.
+        The hashing and per-session deletes go in DB_MIGRATION_BATCH-sized writes between
+        the crawl's own; the last write removes duplicates saved meanwhile and builds the
+        index in one transaction. Returns the number of rows deleted.
+        """
+        batch = Config.DB_MIGRATION_BATCH
+        started = time.time()
+        
+        with self.get_connection() as conn:
+            first, last = conn.execute(
+                'SELECT MIN(id), MAX(id) FROM land_record_facts WHERE owner_hash IS NULL').fetchone()
+            session_keys = [row[0] for row in conn.execute('SELECT id FROM record_sessions')]
+        
+        # Rows saved from here on carry their hash; only the older ones need it
+        def hash_batch(cursor, low):
+            cursor.execute('''
+                UPDATE land_record_facts
+                SET owner_hash = owner_hash((SELECT name FROM owner_names WHERE id = owner_id), extent, khatah)
+                WHERE id BETWEEN ? AND ? AND owner_hash IS NULL
+            ''', (low, low + batch - 1))
+        
+        if first is not None:
+            for low in range(first, last + 1, batch):
+                if self._migration_stop.is_set():
+                    return 0
+                self._write(lambda cursor, low=low: hash_batch(cursor, low))
+        
+        def dedupe_session(cursor, session_key):
+            cursor.execute('''
+                DELETE FROM land_record_facts
+                WHERE session_key = ? AND id NOT IN (
+                    SELECT MIN(id) FROM land_record_facts WHERE session_key = ?
+                    GROUP BY location_id, survey_no, surnoc, hissa, period, owner_hash
+                )
+            ''', (session_key, session_key))
+            return cursor.rowcount
+        
+        with self.get_connection() as conn:
+            watermark = conn.execute('SELECT COALESCE(MAX(id), 0) FROM land_record_facts').fetchone()[0]
+        removed = 0
+        for session_key in session_keys:
+            if self._migration_stop.is_set():
+                return removed
+            removed += self._write(lambda cursor, key=session_key: dedupe_session(cursor, key))
+        
+        def finish(cursor):
+            # Rows saved during the per-session passes - only those can still collide
+            cursor.execute('''
+                DELETE FROM land_record_facts
+                WHERE id > ? AND EXISTS (
+                    SELECT 1 FROM land_record_facts k
+                    WHERE k.location_id = land_record_facts.location_id
+                      AND k.session_key = land_record_facts.session_key
+                      AND k.survey_no IS land_record_facts.survey_no
+                      AND k.surnoc IS land_record_facts.surnoc
+                      AND k.hissa IS land_record_facts.hissa
+                      AND k.period IS land_record_facts.period
+                      AND k.owner_hash = land_record_facts.owner_hash
+                      AND k.id < land_record_facts.id
+                )
+            ''', (watermark,))
+            deleted = cursor.rowcount
+            cursor.execute(self._NATURAL_KEY_INDEX)
+            return deleted
+        
+        removed += self._write(finish)
+        self._dedupe_pending = False
+        logger.info(f"🧹 land_records dedup done: {removed} duplicate records removed in "
+                    f"{time.time() - started:.0f}s, natural key enforced")
+        return removed
+    
+    def _create_records_view_triggers(self, cursor, legacy: bool):
+        """Write triggers on the land_records view - legacy=True also covers land_records_legacy"""
+        for name, (event, facts_body, legacy_body) in self._RECORDS_VIEW_TRIGGERS.items():
+            cursor.execute(f'CREATE TRIGGER IF NOT EXISTS {name} {event} ON land_records BEGIN'
+                           f'{facts_body}{legacy_body if legacy else ""}END')
+    
+    def _migrate_legacy_records(self):
+        """
+        Move land_records_legacy into the normalised tables DB_MIGRATION_BATCH rows at a
+        time, each batch one write between the crawl's own. A batch copies and deletes its
+        rows in one transaction, so the view never shows a row twice or loses one, and
+        several processes can migrate at once. The last batch drops the legacy table.
+        """
+        batch = Config.DB_MIGRATION_BATCH
+        
+        def move_batch(cursor):
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'land_records_legacy'")
+            if cursor.fetchone() is None:
+                return None  # Another process finished
+            cursor.execute('SELECT MIN(id) FROM land_records_legacy')
+            first = cursor.fetchone()[0]
+            if first is None:
+                cursor.execute('DROP VIEW land_records')
+                cursor.execute('DROP TABLE land_records_legacy')
+                cursor.execute('CREATE VIEW land_records AS ' + self._RECORDS_VIEW)
+                self._create_records_view_triggers(cursor, legacy=False)  # Dropped with the old view
+                return None
+            
+            last = first + batch - 1
+            cursor.execute('''
+                INSERT OR IGNORE INTO record_sessions (session_id)
+                SELECT DISTINCT session_id FROM land_records_legacy WHERE id BETWEEN ? AND ?
+            ''', (first, last))
+            cursor.execute('''
+                INSERT OR IGNORE INTO record_locations (district, taluk, hobli, village)
+                SELECT DISTINCT COALESCE(district, ''), COALESCE(taluk, ''),
+                                COALESCE(hobli, ''), COALESCE(village, '')
+                FROM land_records_legacy WHERE id BETWEEN ? AND ?
+            ''', (first, last))
+            cursor.execute('''
+                INSERT OR IGNORE INTO owner_names (name)
+                SELECT DISTINCT COALESCE(owner_name, '') FROM land_records_legacy WHERE id BETWEEN ? AND ?
+            ''', (first, last))
+            cursor.execute('''
+                INSERT INTO land_record_facts (
+                    id, session_key, location_id, survey_no, surnoc, hissa, period,
+                    owner_id, extent, khatah, is_match, worker_id, created_at, owner_hash
+                )
+                SELECT r.id, s.id, l.id, r.survey_no, COALESCE(r.surnoc, ''), COALESCE(r.hissa, ''),
+                       COALESCE(r.period, ''), o.id, r.extent, r.khatah, r.is_match, r.worker_id,
+                       CAST(strftime('%s', r.created_at) AS INTEGER),
+                       owner_hash(r.owner_name, r.extent, r.khatah)
+                FROM land_records_legacy r
+                JOIN record_sessions s ON s.session_id = r.session_id
+                JOIN record_locations l ON l.district = COALESCE(r.district, '')
+                    AND l.taluk = COALESCE(r.taluk, '') AND l.hobli = COALESCE(r.hobli, '')
+                    AND l.village = COALESCE(r.village, '')
+                JOIN owner_names o ON o.name = COALESCE(r.owner_name, '')
+                WHERE r.id BETWEEN ? AND ?
+                ON CONFLICT DO NOTHING
+            ''', (first, last))
+            moved = cursor.rowcount  # Duplicates of an earlier row are dropped
+            cursor.execute('DELETE FROM land_records_legacy WHERE id BETWEEN ? AND ?', (first, last))
+            return moved
+        
+        started = time.time()
+        total = 0
+        try:
+            while not self._migration_stop.is_set():
+                moved = self._write(move_batch)
+                if moved is None:
+                    break
+                total += moved
+            else:
+                return
+            self._legacy_records = False
+            logger.info(f"📦 land_records migration done: {total} rows moved in {time.time() - started:.0f}s")
+        except Exception as e:
+            logger.error(f"land_records migration stopped after {total} rows (resumes on restart): {e}")
     
     # ═══════════════════════════════════════════════════════════════════════════════════
     # SURVEY-LEVEL CHECKPOINTING - For granular resume
     # ═══════════════════════════════════════════════════════════════════════════════════
     
     def save_survey_checkpoint(self, session_id: str, village_code: str, survey_no: int, 
-                               surnocs_processed: List[str] = None):
+                               surnocs_processed: List[str] = None, durable: bool = True):
         """
         Save a checkpoint after completing a survey.
         This allows resuming from the exact survey if interrupted.
         """
         surnoc_json = json.dumps(surnocs_processed or [])
         
-        with self.lock:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT OR REPLACE INTO survey_checkpoints 
-                    (session_id, village_code, survey_no, surnoc_processed, completed_at)
-                    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-                ''', (session_id, village_code, survey_no, surnoc_json))
+        def write(cursor):
+            cursor.execute('''
+                INSERT OR REPLACE INTO survey_checkpoints 
+                (session_id, village_code, survey_no, surnoc_processed, completed_at)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ''', (session_id, village_code, survey_no, surnoc_json))
+            # The survey checkpoint supersedes its period checkpoints
+            cursor.execute('''
+                DELETE FROM period_checkpoints WHERE session_id = ? AND village_code = ? AND survey_no = ?
+            ''', (session_id, village_code, survey_no))
+        return self._write(write, durable)
     
-    def get_last_checkpoint(self, session_id: str, village_code: str) -> Optional[Dict]:
+    _PERIOD_CHECKPOINT_INSERT = '''
+        INSERT OR IGNORE INTO period_checkpoints (session_id, village_code, survey_no, surnoc, hissa, period)
+        VALUES (?, ?, ?, ?, ?, ?)
+    '''
+    
+    def save_period_checkpoints(self, session_id: str, periods: List[tuple], durable: bool = True):
+        """
+        Mark finished parts of surveys in progress, all in one transaction.
+        
+        Args:
+            periods: (village_code, survey_no, surnoc, hissa, period) tuples;
+                     '*' as period (or hissa and period) marks a whole hissa (surnoc)
+        """
+        if not periods:
+            return
+        def write(cursor):
+            cursor.executemany(self._PERIOD_CHECKPOINT_INSERT, [(session_id, *period) for period in periods])
+        return self._write(write, durable)
+    
+    def get_period_checkpoints(self, session_id: str, village_code: str,
+                               survey_range: Tuple[int, int] = None) -> List[list]:
+        """[survey_no, surnoc, hissa, period] marks of a village's unfinished surveys (within survey_range)"""
+        start, end = survey_range or (0, 2 ** 31)
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT survey_no, surnoc, hissa, period FROM period_checkpoints
+                WHERE session_id = ? AND village_code = ? AND survey_no BETWEEN ? AND ?
+            ''', (session_id, village_code, start, end))
+            return [list(row) for row in cursor.fetchall()]
+    
+    def get_last_checkpoint(self, session_id: str, village_code: str,
+                            survey_range: Tuple[int, int] = None) -> Optional[Dict]:
         """
         Get the last completed survey for a village in this session.
+        With survey_range=(start, end) only checkpoints inside that range count.
         Returns None if no checkpoint exists.
         """
+        start, end = survey_range or (0, 2 ** 31)
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 SELECT survey_no, surnoc_processed, completed_at
                 FROM survey_checkpoints
-                WHERE session_id = ? AND village_code = ?
+                WHERE session_id = ? AND village_code = ? AND survey_no BETWEEN ? AND ?
                 ORDER BY survey_no DESC
                 LIMIT 1
-            ''', (session_id, village_code))
+            ''', (session_id, village_code, start, end))
             
             row = cursor.fetchone()
             if row:
@@ -1925,6 +3959,34 @@ class DatabaseManager:
                 }
             return None
     
+    def save_survey_ranges(self, session_id: str, village_code: str, ranges: List[dict], durable: bool = True):
+        """
+        Replace the stored ranges of a split village.
+        
+        Args:
+            ranges: [{range_start, range_end, status, worker_id}, ...]
+        """
+        def write(cursor):
+            cursor.execute('DELETE FROM survey_ranges WHERE session_id = ? AND village_code = ?',
+                           (session_id, village_code))
+            cursor.executemany('''
+                INSERT INTO survey_ranges (session_id, village_code, range_start, range_end, status, worker_id)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', [(session_id, village_code, r['range_start'], r['range_end'], r['status'], r['worker_id'])
+                  for r in ranges])
+        return self._write(write, durable)
+    
+    def get_survey_ranges(self, session_id: str, village_code: str) -> List[dict]:
+        """Stored ranges of a split village, lowest first (empty if it was never split)"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT range_start, range_end, status, worker_id FROM survey_ranges
+                WHERE session_id = ? AND village_code = ?
+                ORDER BY range_start
+            ''', (session_id, village_code))
+            return [dict(row) for row in cursor.fetchall()]
+    
     def get_all_checkpoints(self, session_id: str) -> Dict[str, int]:
         """
         Get all village checkpoints for a session.
@@ -1943,51 +4005,118 @@ class DatabaseManager:
     
     def clear_checkpoints(self, session_id: str, village_code: str = None):
         """Clear checkpoints for a session (optionally only for a specific village)"""
-        with self.lock:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
+        def write(cursor):
+            for table in ('survey_checkpoints', 'period_checkpoints'):
                 if village_code:
                     cursor.execute(
-                        'DELETE FROM survey_checkpoints WHERE session_id = ? AND village_code = ?',
+                        f'DELETE FROM {table} WHERE session_id = ? AND village_code = ?',
                         (session_id, village_code)
                     )
                 else:
                     cursor.execute(
-                        'DELETE FROM survey_checkpoints WHERE session_id = ?',
+                        f'DELETE FROM {table} WHERE session_id = ?',
                         (session_id,)
                     )
+        return self._write(write)
     
-    def get_session_records(self, session_id: str, limit: int = None, matches_only: bool = False) -> List[dict]:
-        """Get records for a session"""
+    def get_records_page(self, session_id: str, after_id: int = None, limit: int = None,
+                         sort: str = 'id', village: str = None, hobli: str = None,
+                         is_match: bool = None, owner_prefix: str = None) -> dict:
+        """
+        Get one keyset page of a session's records.
+        
+        Args:
+            after_id: next_after_id from the previous page (None = first page)
+            limit: Page size, capped at Config.RECORDS_PAGE_MAX
+            sort: 'id' (newest first) or 'survey' (village in crawl order, then survey number)
+            village/hobli: Exact location names
+            is_match: Only matches (True) or only non-matches (False)
+            owner_prefix: Owner names starting with this text (case-sensitive)
+        
+        Pages seek from the cursor instead of using OFFSET, so each costs the same at any
+        depth, and records the crawl inserts meanwhile never shift or repeat a page.
+        In survey order the cursor's sort key is read from its row, so if that record
+        is deleted between pages (e.g. by dedupe_records) the walk ends there.
+        Returns {'records': [...], 'next_after_id': id of the last record, or None at the end}.
+        """
+        if sort not in self.RECORD_SORTS:
+            raise ValueError(f"Unknown sort '{sort}' (expected one of {', '.join(self.RECORD_SORTS)})")
+        limit = max(1, min(limit or Config.RECORDS_PAGE_SIZE, Config.RECORDS_PAGE_MAX))
+        # Mid-migration rows are split across two tables - page the land_records view instead
+        on_view = int(self._legacy_records)
+        
+        if on_view:
+            query = 'SELECT * FROM land_records r WHERE session_id = ?'
+        else:
+            query = self._RECORDS_VIEW + ' WHERE f.session_key = (SELECT id FROM record_sessions WHERE session_id = ?)'
+        params = [session_id]
+        
+        for name, value in (('village', village), ('hobli', hobli), ('is_match', is_match),
+                            ('owner_prefix', owner_prefix)):
+            if value is None or value == '':
+                continue
+            query += ' AND ' + self._PAGE_FILTERS[name][on_view]
+            if name == 'owner_prefix':
+                params += [value, value + '\U0010ffff']
+            else:
+                params.append(int(value) if name == 'is_match' else value)
+        
+        cursor_condition, order = self._PAGE_SORTS[sort][on_view]
+        if after_id is not None:
+            query += ' AND ' + cursor_condition
+            params.append(after_id)
+        query += f' ORDER BY {order} LIMIT ?'
+        params.append(limit)
+        
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            query = 'SELECT * FROM land_records WHERE session_id = ?'
-            params = [session_id]
-            
-            if matches_only:
-                query += ' AND is_match = 1'
-            
-            query += ' ORDER BY id DESC'
-            
-            if limit:
-                query += ' LIMIT ?'
-                params.append(limit)
-            
             cursor.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+            records = [dict(row) for row in cursor.fetchall()]
+        
+        return {
+            'records': records,
+            'next_after_id': records[-1]['id'] if len(records) == limit else None
+        }
+    
+    def iter_session_records(self, session_id: str, sort: str = 'id', **filters) -> Iterator[dict]:
+        """Yield every record of a session, one RECORDS_PAGE_MAX page in memory at a time"""
+        after_id = None
+        while True:
+            page = self.get_records_page(session_id, after_id=after_id, limit=Config.RECORDS_PAGE_MAX,
+                                         sort=sort, **filters)
+            yield from page['records']
+            after_id = page['next_after_id']
+            if after_id is None:
+                return
+    
+    def get_session_records(self, session_id: str, limit: int = None, matches_only: bool = False) -> List[dict]:
+        """Get a session's newest records - one bounded page (iter_session_records walks them all)"""
+        return self.get_records_page(session_id, limit=limit, is_match=True if matches_only else None)['records']
     
     def get_session_stats(self, session_id: str) -> dict:
         """Get statistics for a session"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
-            cursor.execute('''
-                SELECT 
-                    COUNT(*) as total_records,
-                    SUM(is_match) as total_matches,
-                    COUNT(DISTINCT village) as villages_with_records
-                FROM land_records WHERE session_id = ?
-            ''', (session_id,))
+            if self._legacy_records:
+                cursor.execute('''
+                    SELECT 
+                        COUNT(*) as total_records,
+                        SUM(is_match) as total_matches,
+                        COUNT(DISTINCT village) as villages_with_records
+                    FROM land_records WHERE session_id = ?
+                ''', (session_id,))
+            else:
+                # Straight from the fact rows - the view would join every dictionary
+                cursor.execute('''
+                    SELECT 
+                        COUNT(*) as total_records,
+                        SUM(f.is_match) as total_matches,
+                        COUNT(DISTINCT l.village) as villages_with_records
+                    FROM land_record_facts f
+                    JOIN record_locations l ON l.id = f.location_id
+                    WHERE f.session_key = (SELECT id FROM record_sessions WHERE session_id = ?)
+                ''', (session_id,))
             
             row = cursor.fetchone()
             return {
@@ -2000,29 +4129,30 @@ class DatabaseManager:
     # EXPORT FUNCTIONS
     # ═══════════════════════════════════════════════════════════════════════════════════
     
+    # Columns of a records export, in order
+    EXPORT_FIELDS = ['district', 'taluk', 'hobli', 'village', 'survey_no', 
+                     'surnoc', 'hissa', 'period', 'owner_name', 'extent', 'khatah', 'created_at']
+    
     def export_to_csv(self, session_id: str, output_path: str, matches_only: bool = False) -> str:
-        """Export session records to CSV file"""
-        records = self.get_session_records(session_id, matches_only=matches_only)
-        
-        if not records:
+        """Export session records to CSV file, streamed page by page"""
+        records = self.iter_session_records(session_id, is_match=True if matches_only else None)
+        first = next(records, None)
+        if first is None:
             return None
         
-        fieldnames = ['district', 'taluk', 'hobli', 'village', 'survey_no', 
-                      'surnoc', 'hissa', 'period', 'owner_name', 'extent', 'khatah', 'created_at']
-        
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-            writer.writeheader()
-            writer.writerows(records)
+        with open(output_path, 'wb') as f:
+            for chunk in export_chunks(itertools.chain([first], records), self.EXPORT_FIELDS):
+                f.write(chunk)
         
-        logger.info(f"📁 Exported {len(records)} records to {output_path}")
+        logger.info(f"📁 Exported session {session_id} records to {output_path}")
         return output_path
     
     def get_all_records_count(self) -> int:
         """Get total records across all sessions"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('SELECT COUNT(*) FROM land_records')
+            cursor.execute('SELECT COUNT(*) FROM ' +
+                           ('land_records' if self._legacy_records else 'land_record_facts'))
             return cursor.fetchone()[0]
     
     # ═══════════════════════════════════════════════════════════════════════════════════
@@ -2030,16 +4160,16 @@ class DatabaseManager:
     # ═══════════════════════════════════════════════════════════════════════════════════
     
     def save_skipped_item(self, session_id: str, village_name: str, survey_no: int, 
-                          surnoc: str = '', hissa: str = '', period: str = '', error: str = ''):
+                          surnoc: str = '', hissa: str = '', period: str = '', error: str = '',
+                          durable: bool = True):
         """Save a skipped item for later retry"""
-        with self.lock:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO skipped_items 
-                    (session_id, village_name, survey_no, surnoc, hissa, period, error_message)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (session_id, village_name, survey_no, surnoc, hissa, period, error))
+        def write(cursor):
+            cursor.execute('''
+                INSERT INTO skipped_items 
+                (session_id, village_name, survey_no, surnoc, hissa, period, error_message)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (session_id, village_name, survey_no, surnoc, hissa, period, error))
+        return self._write(write, durable)
     
     def get_skipped_items(self, session_id: str) -> List[dict]:
         """Get all skipped items for a session"""
@@ -2052,6 +4182,23 @@ class DatabaseManager:
             ''', (session_id,))
             return [dict(row) for row in cursor.fetchall()]
     
+    def iter_skipped_items(self, session_id: str) -> Iterator[dict]:
+        """Yield a session's pending skipped items, one RECORDS_PAGE_MAX page in memory at a time"""
+        after_id = 0
+        while True:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT * FROM skipped_items 
+                    WHERE session_id = ? AND status = 'pending' AND id > ?
+                    ORDER BY id LIMIT ?
+                ''', (session_id, after_id, Config.RECORDS_PAGE_MAX))
+                items = [dict(row) for row in cursor.fetchall()]
+            yield from items
+            if len(items) < Config.RECORDS_PAGE_MAX:
+                return
+            after_id = items[-1]['id']
+    
     def get_skipped_count(self, session_id: str) -> int:
         """Get count of skipped items for a session"""
         with self.get_connection() as conn:
@@ -2062,15 +4209,227 @@ class DatabaseManager:
             ''', (session_id,))
             return cursor.fetchone()[0]
     
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    # API RESPONSE CACHE
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    
+    def get_api_cache_entries(self, max_age: float, limit: int) -> List[Tuple[str, Any, float]]:
+        """Fresh cached API responses, oldest first: [(cache_key, payload, fetched_at), ...]"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT cache_key, payload, fetched_at FROM (
+                    SELECT * FROM api_cache WHERE fetched_at >= ?
+                    ORDER BY fetched_at DESC LIMIT ?
+                ) ORDER BY fetched_at
+            ''', (time.time() - max_age, limit))
+            return [(r['cache_key'], json.loads(r['payload']), r['fetched_at']) for r in cursor.fetchall()]
+    
+    def save_api_cache_entry(self, cache_key: str, payload: Any, fetched_at: float, durable: bool = True):
+        """Insert or refresh one cached API response"""
+        def write(cursor):
+            cursor.execute('''
+                INSERT OR REPLACE INTO api_cache (cache_key, payload, fetched_at)
+                VALUES (?, ?, ?)
+            ''', (cache_key, json.dumps(payload, ensure_ascii=False), fetched_at))
+        return self._write(write, durable)
+    
+    def prune_api_cache(self, max_age: float, max_entries: int, durable: bool = True):
+        """Drop expired entries and anything beyond the newest max_entries"""
+        def write(cursor):
+            cursor.execute('DELETE FROM api_cache WHERE fetched_at < ?', (time.time() - max_age,))
+            cursor.execute('''
+                DELETE FROM api_cache WHERE cache_key NOT IN (
+                    SELECT cache_key FROM api_cache ORDER BY fetched_at DESC LIMIT ?
+                )
+            ''', (max_entries,))
+        return self._write(write, durable)
+    
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    # LOCATION HIERARCHY
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    
+    def save_taluk_hierarchy(self, district_code: str, district_name: str, taluk_code: str,
+                             taluk_name: str, hoblis: List[dict]):
+        """
+        Replace a taluk's hoblis and villages (single transaction).
+        
+        Args:
+            hoblis: [{code, name, villages: [{code, name}, ...]}, ...] with normalised codes
+        """
+        rows = [(district_code, '', '', '', district_name), (district_code, taluk_code, '', '', taluk_name)]
+        for hobli in hoblis:
+            rows.append((district_code, taluk_code, hobli['code'], '', hobli['name']))
+            rows.extend((district_code, taluk_code, hobli['code'], v['code'], v['name'])
+                        for v in hobli['villages'])
+        
+        def write(cursor):
+            cursor.execute('''
+                DELETE FROM location_hierarchy
+                WHERE district_code = ? AND taluk_code = ? AND hobli_code != ''
+            ''', (district_code, taluk_code))
+            cursor.executemany('''
+                INSERT OR REPLACE INTO location_hierarchy
+                (district_code, taluk_code, hobli_code, village_code, name, fetched_at)
+                VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ''', rows)
+        return self._write(write)
+    
+    def get_taluk_hierarchy(self, district_code: str, taluk_code: str) -> Optional[dict]:
+        """
+        Get a stored taluk.
+        
+        Returns:
+            None if never stored, else {district_name, taluk_name, age_seconds,
+            villages: [(village_code, village_name, hobli_code, hobli_name), ...]}
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT t.name AS taluk_name, d.name AS district_name,
+                       (julianday('now') - julianday(t.fetched_at)) * 86400 AS age_seconds
+                FROM location_hierarchy t
+                LEFT JOIN location_hierarchy d
+                  ON d.district_code = t.district_code AND d.taluk_code = '' AND d.hobli_code = '' AND d.village_code = ''
+                WHERE t.district_code = ? AND t.taluk_code = ? AND t.hobli_code = '' AND t.village_code = ''
+            ''', (district_code, taluk_code))
+            taluk = cursor.fetchone()
+            if not taluk:
+                return None
+            
+            cursor.execute('''
+                SELECT v.village_code, v.name AS village_name, v.hobli_code, h.name AS hobli_name
+                FROM location_hierarchy v
+                JOIN location_hierarchy h
+                  ON h.district_code = v.district_code AND h.taluk_code = v.taluk_code
+                 AND h.hobli_code = v.hobli_code AND h.village_code = ''
+                WHERE v.district_code = ? AND v.taluk_code = ? AND v.hobli_code != '' AND v.village_code != ''
+                ORDER BY CAST(v.hobli_code AS INTEGER), v.hobli_code, CAST(v.village_code AS INTEGER), v.village_code
+            ''', (district_code, taluk_code))
+            return {
+                'district_name': taluk['district_name'] or district_code,
+                'taluk_name': taluk['taluk_name'] or taluk_code,
+                'age_seconds': taluk['age_seconds'] or 0,
+                'villages': [(r['village_code'], r['village_name'], r['hobli_code'], r['hobli_name'])
+                             for r in cursor.fetchall()],
+            }
+    
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    # RTC RESULT CACHE
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    
+    def get_cached_survey(self, location_key: tuple, survey_no: int, max_age: int) -> Optional[List[dict]]:
+        """
+        Get a survey's cached fetch results if it was fully crawled within max_age seconds.
+        
+        Args:
+            location_key: (district_code, taluk_code, hobli_code, village_code)
+        
+        Returns:
+            None on a miss, [] for a survey the portal had no data for, otherwise one
+            {surnoc, hissa, period, owners} dict per fetched period in crawl order
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT has_data FROM rtc_survey_cache
+                WHERE district_code = ? AND taluk_code = ? AND hobli_code = ? AND village_code = ?
+                  AND survey_no = ? AND fetched_at >= datetime('now', ?)
+            ''', (*location_key, survey_no, f'-{int(max_age)} seconds'))
+            row = cursor.fetchone()
+            if not row:
+                return None
+            if not row['has_data']:
+                return []
+            
+            cursor.execute('''
+                SELECT surnoc, hissa, period, owners FROM rtc_cache
+                WHERE district_code = ? AND taluk_code = ? AND hobli_code = ? AND village_code = ?
+                  AND survey_no = ?
+                ORDER BY id
+            ''', (*location_key, survey_no))
+            entries = [{
+                'surnoc': r['surnoc'],
+                'hissa': r['hissa'],
+                'period': r['period'],
+                'owners': json.loads(r['owners'] or '[]'),
+            } for r in cursor.fetchall()]
+            return entries or None
+    
+    def get_cached_survey_numbers(self, location_key: tuple, max_age: int) -> Dict[int, bool]:
+        """Get {survey_no: has_data} for every survey of a village crawled within max_age seconds"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT survey_no, has_data FROM rtc_survey_cache
+                WHERE district_code = ? AND taluk_code = ? AND hobli_code = ? AND village_code = ?
+                  AND fetched_at >= datetime('now', ?)
+            ''', (*location_key, f'-{int(max_age)} seconds'))
+            return {row['survey_no']: bool(row['has_data']) for row in cursor.fetchall()}
+    
+    def get_crawled_villages(self, district_code: str, taluk_code: str) -> List[dict]:
+        """
+        Get every village earlier sessions registered for a taluk (offline search input).
+        Returns dicts with village_code, village_name, hobli_code, hobli_name, district_name, taluk_name.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT v.village_code, MAX(v.village_name) AS village_name,
+                       v.hobli_code, MAX(v.hobli_name) AS hobli_name,
+                       MAX(NULLIF(s.district_name, '')) AS district_name,
+                       MAX(NULLIF(s.taluk_name, '')) AS taluk_name
+                FROM village_progress v
+                JOIN search_sessions s ON v.session_id = s.session_id
+                WHERE s.district_code = ? AND s.taluk_code = ?
+                GROUP BY v.hobli_code, v.village_code
+                ORDER BY v.hobli_code, v.village_code
+            ''', (str(district_code), str(taluk_code)))
+            return [dict(row) for row in cursor.fetchall()]
+    
+    def save_cached_survey(self, location_key: tuple, survey_no: int, entries: List[dict], durable: bool = True):
+        """
+        Replace a survey's cached fetch results (single transaction).
+        
+        Args:
+            location_key: (district_code, taluk_code, hobli_code, village_code)
+            entries: {surnoc, hissa, period, owners} per fetched period; [] for an empty survey
+        """
+        def write(cursor):
+            cursor.execute('''
+                DELETE FROM rtc_cache
+                WHERE district_code = ? AND taluk_code = ? AND hobli_code = ? AND village_code = ?
+                  AND survey_no = ?
+            ''', (*location_key, survey_no))
+            cursor.executemany('''
+                INSERT OR REPLACE INTO rtc_cache (
+                    district_code, taluk_code, hobli_code, village_code,
+                    survey_no, surnoc, hissa, period, owners
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', [
+                (*location_key, survey_no, e['surnoc'], e['hissa'], e['period'],
+                 json.dumps(e['owners'], ensure_ascii=False))
+                for e in entries
+            ])
+            cursor.execute('''
+                INSERT OR REPLACE INTO rtc_survey_cache (
+                    district_code, taluk_code, hobli_code, village_code, survey_no, has_data, fetched_at
+                ) VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ''', (*location_key, survey_no, 1 if entries else 0))
+        return self._write(write, durable)
+    
     def search_records(self, owner_name: str, limit: int = 100) -> List[dict]:
         """Search records by owner name across all sessions"""
+        # Match against the owner-name dictionary once migrated - far fewer rows than records
+        owner_filter = ('r.owner_name LIKE ?' if self._legacy_records
+                        else 'r.owner_name IN (SELECT name FROM owner_names WHERE name LIKE ?)')
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
+            cursor.execute(f'''
                 SELECT r.*, s.owner_name as search_owner, s.started_at as search_date
                 FROM land_records r
                 JOIN search_sessions s ON r.session_id = s.session_id
-                WHERE r.owner_name LIKE ?
+                WHERE {owner_filter}
                 ORDER BY r.created_at DESC
                 LIMIT ?
             ''', (f'%{owner_name}%', limit))
@@ -2089,31 +4448,151 @@ def get_database() -> DatabaseManager:
 
 
 # ═══════════════════════════════════════════════════════════════════════════════════════
-# BHOOMI API CLIENT
+# API RESPONSE CACHE - Shared by every BhoomiAPI instance
 # ═══════════════════════════════════════════════════════════════════════════════════════
 
-class BhoomiAPI:
-    """Client for Karnataka Bhoomi eChawadi API"""
+class ApiResponseCache:
+    """
+    Process-wide LRU + TTL cache for eChawadi responses.
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'application/json, text/javascript, */*; q=0.01',
-            'Content-Type': 'application/json; charset=utf-8',
-        })
-        self._cache = {}
+    - Bounded (Config.API_CACHE_MAX_ENTRIES), least recently used evicted first
+    - Entries expire after Config.API_CACHE_TTL
+    - Persisted to the api_cache table, reloaded on first use after a restart
+    - Single-flight: concurrent misses for the same key wait on one portal call
+    """
+    
+    def __init__(self, db: DatabaseManager = None):
+        self.db = db or get_database()
+        self._entries: 'OrderedDict[str, Tuple[Any, float]]' = OrderedDict()  # key -> (payload, fetched_at)
+        self._in_flight: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+    
+    def _load(self):
+        """Pull fresh persisted entries into memory (called under self._lock)"""
+        self._loaded = True
+        try:
+            for key, payload, fetched_at in self.db.get_api_cache_entries(Config.API_CACHE_TTL, Config.API_CACHE_MAX_ENTRIES):
+                self._entries[key] = (payload, fetched_at)
+            self.db.prune_api_cache(Config.API_CACHE_TTL, Config.API_CACHE_MAX_ENTRIES, durable=False)
+        except Exception as e:
+            logger.warning(f"API cache load failed: {e}")
+    
+    def _lookup(self, key: str) -> Tuple[bool, Any]:
+        """(found, payload) for a fresh entry (called under self._lock)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        payload, fetched_at = entry
+        if time.time() - fetched_at > Config.API_CACHE_TTL:
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, payload
+    
+    def _store(self, key: str, payload: Any):
+        fetched_at = time.time()
+        with self._lock:
+            self._entries[key] = (payload, fetched_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > Config.API_CACHE_MAX_ENTRIES:
+                self._entries.popitem(last=False)
+        try:
+            self.db.save_api_cache_entry(key, payload, fetched_at, durable=False)
+        except Exception as e:
+            logger.debug(f"API cache persist failed for {key}: {e}")
+    
+    def get_or_fetch(self, key: str, fetch) -> Any:
+        """
+        Return the cached payload for key, or call fetch() once and cache its result.
+        A None result (request failed) is returned to every waiter but never cached.
+        """
+        while True:
+            with self._lock:
+                if not self._loaded:
+                    self._load()
+                found, payload = self._lookup(key)
+                if found:
+                    self.hits += 1
+                    return payload
+                event = self._in_flight.get(key)
+                if event is None:
+                    event = self._in_flight[key] = threading.Event()
+                    self.misses += 1
+                    leader = True
+                else:
+                    self.coalesced += 1
+                    leader = False
+            
+            if not leader:
+                event.wait(timeout=60)
+                with self._lock:
+                    found, payload = self._lookup(key)
+                if found:
+                    return payload
+                # Leader failed - take our own turn
+                continue
+            
+            try:
+                payload = fetch()
+                if payload is not None:
+                    self._store(key, payload)
+                return payload
+            finally:
+                with self._lock:
+                    self._in_flight.pop(key, None)
+                event.set()
+    
+    def stats(self) -> dict:
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits,
+                    'misses': self.misses, 'coalesced': self.coalesced}
+
+
+# Global API response cache
+api_response_cache: Optional[ApiResponseCache] = None
+_api_response_cache_lock = threading.Lock()
+
+def get_api_cache() -> ApiResponseCache:
+    """Get or create the global API response cache"""
+    global api_response_cache
+    if api_response_cache is None:
+        with _api_response_cache_lock:
+            if api_response_cache is None:
+                api_response_cache = ApiResponseCache()
+    return api_response_cache
+
+
+# ═══════════════════════════════════════════════════════════════════════════════════════
+# BHOOMI API CLIENT
+# ═══════════════════════════════════════════════════════════════════════════════════════
+
+class BhoomiAPI:
+    """Client for Karnataka Bhoomi eChawadi API"""
+    
+    def __init__(self):
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept': 'application/json, text/javascript, */*; q=0.01',
+            'Content-Type': 'application/json; charset=utf-8',
+        })
+        self._cache = get_api_cache()
     
     def _make_request(self, endpoint: str, data: dict = None, method: str = 'POST') -> Optional[dict]:
+        """Make API request through the shared response cache"""
+        cache_key = f"{endpoint}:{json.dumps(data, sort_keys=True)}"
+        return self._cache.get_or_fetch(cache_key, lambda: self._fetch(endpoint, data, method))
+    
+    def _fetch(self, endpoint: str, data: dict = None, method: str = 'POST') -> Optional[dict]:
         """Make API request with error handling"""
         url = f"{Config.ECHAWADI_BASE}/{endpoint}"
-        cache_key = f"{endpoint}:{json.dumps(data, sort_keys=True)}"
-        
-        # Check cache
-        if cache_key in self._cache:
-            return self._cache[cache_key]
         
         try:
+            _global_rate_limiter.acquire('hierarchy_api')
             if method == 'GET':
                 response = self.session.get(url, verify=False, timeout=30)
             else:
@@ -2126,8 +4605,6 @@ class BhoomiAPI:
             if isinstance(result, str):
                 result = json.loads(result)
             
-            # Cache result
-            self._cache[cache_key] = result
             return result
             
         except Exception as e:
@@ -2165,204 +4642,1440 @@ class BhoomiAPI:
             return sorted(result['data'], key=lambda x: x.get('village_name_kn', ''))
         return []
 
+
 # ═══════════════════════════════════════════════════════════════════════════════════════
-# SEARCH WORKER
+# LOCATION HIERARCHY STORE - Village lists without a browser
 # ═══════════════════════════════════════════════════════════════════════════════════════
 
-class SearchWorker:
+class HierarchyStore:
     """
-    Individual search worker that runs in its own thread with its own browser.
-    Each worker processes a subset of villages independently.
+    Persistent district → taluk → hobli → village store.
     
-    NOW WITH PERSISTENT DATABASE INTEGRATION:
-    - Every record saved to SQLite in real-time
-    - Survives browser crashes
-    - Supports resume functionality
+    Filled from the eChawadi JSON endpoints (LoadHobli + parallel LoadVillage) and kept
+    in the location_hierarchy table, so starting a search is a single SQLite read.
+    Stale taluks are served immediately and refreshed in the background.
     """
     
-    def __init__(
-        self,
-        worker_id: int,
-        search_params: dict,
-        villages: List[Tuple[str, str, str, str]],  # (village_code, village_name, hobli_code, hobli_name)
-        state: SearchState,
-        all_records_writer: ThreadSafeCSVWriter,
-        matches_writer: ThreadSafeCSVWriter,
-        state_lock: threading.Lock,
-        db: DatabaseManager = None,  # Persistent database
-        session_id: str = None  # Current search session ID
-    ):
-        self.worker_id = worker_id
-        self.params = search_params
-        self.villages = villages
-        self.state = state
-        self.all_records_writer = all_records_writer
-        self.matches_writer = matches_writer
-        self.state_lock = state_lock
+    def __init__(self, api: BhoomiAPI = None, db: DatabaseManager = None):
+        self.api = api or BhoomiAPI()
+        self.db = db or get_database()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _name(item: dict, prefix: str) -> str:
+        return item.get(f'{prefix}_name_kn') or item.get(f'{prefix}_name') or normalize_code(item.get(f'{prefix}_code'))
+    
+    def _lookup_name(self, items: List[dict], prefix: str, code: str) -> str:
+        for item in items:
+            if normalize_code(item.get(f'{prefix}_code')) == code:
+                return self._name(item, prefix)
+        return code
+    
+    def refresh_taluk(self, district_code, taluk_code) -> bool:
+        """Fetch a taluk's hoblis and villages from the API and store them"""
+        district_code, taluk_code = normalize_code(district_code), normalize_code(taluk_code)
+        
+        hoblis = [
+            {'code': normalize_code(h.get('hobli_code')), 'name': self._name(h, 'hobli'), 'villages': []}
+            for h in self.api.get_hoblis(district_code, taluk_code)
+        ]
+        if not hoblis:
+            logger.warning(f"Hierarchy refresh: no hoblis for {district_code}/{taluk_code}")
+            return False
         
-        # Database integration
-        self.db = db
-        self.session_id = session_id
+        with ThreadPoolExecutor(max_workers=min(Config.HIERARCHY_FETCH_WORKERS, len(hoblis))) as pool:
+            results = pool.map(lambda h: self.api.get_villages(district_code, taluk_code, h['code']), hoblis)
+            for hobli, villages in zip(hoblis, results):
+                hobli['villages'] = [
+                    {'code': normalize_code(v.get('village_code')), 'name': self._name(v, 'village')}
+                    for v in villages
+                ]
         
-        self.driver = None
-        self.logger = logging.getLogger(f'Worker-{worker_id}')
-        self._user_data_dir = None  # Set during browser init, used for cleanup
+        # LoadVillage answers [] on a failed request too - storing that would replace the
+        # good copy of the hobli (save_taluk_hierarchy rewrites the whole taluk), so keep it
+        empty = [h['code'] for h in hoblis if not h['villages']]
+        if empty:
+            logger.warning(f"Hierarchy refresh: no villages for {district_code}/{taluk_code} "
+                           f"hobli(s) {', '.join(empty)} - keeping the stored copy")
+            return False
         
-        # Worker-local stats
-        self.records_found = 0
-        self.matches_found = 0
-        self.errors = 0
+        district_name = self._lookup_name(self.api.get_districts(), 'district', district_code)
+        taluk_name = self._lookup_name(self.api.get_taluks(district_code), 'taluka', taluk_code)
+        self.db.save_taluk_hierarchy(district_code, district_name, taluk_code, taluk_name, hoblis)
         
-        # Browser stability tracking - prevents memory leaks
-        self.hissa_processed_count = 0
-        self.last_browser_restart = time.time()
+        logger.info(f"Hierarchy stored: {district_code}/{taluk_code} - {len(hoblis)} hoblis, "
+                    f"{sum(len(h['villages']) for h in hoblis)} villages")
+        return True
     
-    def _update_status(self, **kwargs):
-        """Thread-safe status update"""
-        with self.state_lock:
-            worker_status = self.state.workers.get(self.worker_id)
-            if worker_status:
-                for key, value in kwargs.items():
-                    if hasattr(worker_status, key):
-                        setattr(worker_status, key, value)
-                worker_status.last_update = datetime.now().isoformat()
+    def refresh_in_background(self, district_code, taluk_code):
+        """Refresh a taluk on a daemon thread (one refresh per taluk at a time)"""
+        key = (normalize_code(district_code), normalize_code(taluk_code))
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        
+        def run():
+            try:
+                self.refresh_taluk(*key)
+            except Exception as e:
+                logger.warning(f"Background hierarchy refresh failed for {key}: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+        
+        threading.Thread(target=run, daemon=True, name=f'hierarchy-{key[0]}-{key[1]}').start()
+    
+    def get_taluk(self, district_code, taluk_code) -> Optional[dict]:
+        """Stored taluk (see DatabaseManager.get_taluk_hierarchy); stale entries trigger a background refresh"""
+        taluk = self.db.get_taluk_hierarchy(normalize_code(district_code), normalize_code(taluk_code))
+        if taluk and taluk['age_seconds'] > Config.HIERARCHY_TTL:
+            self.refresh_in_background(district_code, taluk_code)
+        return taluk
+    
+    def warm(self, district_code, taluk_code):
+        """Start filling a taluk in the background if it is missing or stale"""
+        taluk = self.db.get_taluk_hierarchy(normalize_code(district_code), normalize_code(taluk_code))
+        if taluk is None or taluk['age_seconds'] > Config.HIERARCHY_TTL:
+            self.refresh_in_background(district_code, taluk_code)
+
+
+# Global hierarchy store
+hierarchy_store: Optional[HierarchyStore] = None
+
+def get_hierarchy_store() -> HierarchyStore:
+    """Get or create the global hierarchy store"""
+    global hierarchy_store
+    if hierarchy_store is None:
+        hierarchy_store = HierarchyStore()
+    return hierarchy_store
+
+# ═══════════════════════════════════════════════════════════════════════════════════════
+# BROWSERLESS HTTP FETCH ENGINE - Replays the Service2 ASP.NET postbacks
+# ═══════════════════════════════════════════════════════════════════════════════════════
+
+def normalize_code(code) -> str:
+    """Normalise portal codes so "2", "2.0" and 2 compare equal"""
+    text = str(code).strip() if code is not None else ''
+    try:
+        number = float(text)
+        if number.is_integer():
+            return str(int(number))
+    except ValueError:
+        pass
+    return text
+
+
+_shared_http_adapter = None
+_shared_http_adapter_lock = threading.Lock()
+
+def get_shared_http_adapter():
+    """
+    Get the process-wide HTTP connection pool.
+    Every HttpPortalSession mounts the same adapter, so logical workers share
+    keep-alive TCP/TLS connections while keeping their own cookie jar.
+    """
+    global _shared_http_adapter
+    if _shared_http_adapter is None:
+        with _shared_http_adapter_lock:
+            if _shared_http_adapter is None:
+                from requests.adapters import HTTPAdapter
+                _shared_http_adapter = HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=max(Config.MAX_HTTP_WORKERS, 10)
+                )
+    return _shared_http_adapter
+
+
+class PortalFormState:
+    """
+    Client-side model of the Service2 WebForms page.
     
-    def _add_log(self, message: str):
-        """Thread-safe log addition"""
-        with self.state_lock:
-            log_entry = f"[W{self.worker_id}] {message}"
-            self.state.logs.append(log_entry)
-            # Keep only last 100 logs
-            if len(self.state.logs) > 100:
-                self.state.logs = self.state.logs[-100:]
-        self.logger.info(message)
+    Holds what a browser would: the successful form controls (hidden
+    __VIEWSTATE/__EVENTVALIDATION included), dropdown options and which dropdowns
+    trigger __doPostBack. Transport lives in the subclasses (HttpPortalSession,
+    AsyncPortalSession), so both engines post back exactly the same form data.
+    """
     
-    def _update_global_stats(self):
-        """Update global statistics"""
-        with self.state_lock:
-            # Recalculate totals from all workers
-            total_records = 0
-            total_matches = 0
-            villages_completed = 0
-            active_workers = 0
-            
-            for wid, ws in self.state.workers.items():
-                total_records += ws.records_found
-                total_matches += ws.matches_found
-                villages_completed += ws.villages_completed
-                if ws.status == 'running':
-                    active_workers += 1
-            
-            self.state.total_records = total_records
-            self.state.total_matches = total_matches
-            self.state.villages_completed = villages_completed
-            self.state.active_workers = active_workers
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    }
     
-    def _calculate_village_confidence(self, surveys_checked: int, surveys_with_data: int,
-                                       last_survey_with_data: int, stopped_at_survey: int,
-                                       skipped_count: int, completion_reason: str,
-                                       max_survey: int) -> int:
+    def __init__(self, base_url: str = None, timeout: float = None):
+        self.base_url = base_url or Config.SERVICE2_URL
+        self.timeout = timeout or Config.HTTP_TIMEOUT
+        self.html = ''
+        self.url = self.base_url
+        self._action_url = self.base_url
+        self._fields: Dict[str, str] = {}          # name -> value (successful controls)
+        self._names: Dict[str, str] = {}           # element id -> form field name
+        self._options: Dict[str, List[Dict]] = {}  # select name -> options
+        self._autopostback: set = set()            # select names with __doPostBack onchange
+        self._buttons: Dict[str, str] = {}         # button name -> value
+    
+    def _clear_form(self):
+        self.html = ''
+        self._fields.clear()
+        self._names.clear()
+        self._options.clear()
+        self._autopostback.clear()
+        self._buttons.clear()
+    
+    @property
+    def is_loaded(self) -> bool:
+        return bool(self._fields)
+    
+    # ───────────────────────────────────────────────────────────────────────────
+    # Form parsing
+    # ───────────────────────────────────────────────────────────────────────────
+    
+    @staticmethod
+    def parse_form(html: str) -> tuple:
         """
-        Calculate confidence score (0-100) that a village was fully searched.
-        
-        High confidence when:
-        - Smart stop after many consecutive empties
-        - Last data found far from stop point
-        - Low skip rate
-        - All expected surveys checked
+        Form fields, dropdown options and postback targets of a page as plain data:
+        (fields, names, options, autopostback, buttons, action).
         
-        Returns:
-            Confidence score 0-100
+        A pure function of the HTML, so the async engine can run it in a parse process.
+        lxml when installed, BeautifulSoup html.parser otherwise (same result).
         """
-        confidence = 100
-        
-        # Factor 1: Skip rate penalty (max -30 points)
-        if surveys_checked > 0:
-            skip_rate = skipped_count / surveys_checked
-            if skip_rate > 0.2:  # >20% skipped
-                confidence -= 30
-            elif skip_rate > 0.1:  # >10% skipped
-                confidence -= 15
-            elif skip_rate > 0.05:  # >5% skipped
-                confidence -= 5
-        
-        # Factor 2: Gap between last data and stop point (max -20 points)
-        if last_survey_with_data > 0:
-            gap = stopped_at_survey - last_survey_with_data
-            if gap < 20:  # Stopped very close to last data
-                confidence -= 20
-            elif gap < 35:
-                confidence -= 10
-            elif gap < 50:
-                confidence -= 5
-            # >= 50 gap is good (full buffer used)
-        
-        # Factor 3: Completion reason bonus/penalty
-        if completion_reason == 'smart_stop':
-            # Smart stop is reliable if gap is good
-            if last_survey_with_data > 0 and (stopped_at_survey - last_survey_with_data) >= 50:
-                confidence += 5  # Bonus for clean smart stop
-        elif completion_reason == 'max_reached':
-            # Reached max survey - might have more data
-            confidence -= 10
-        elif completion_reason == 'error':
-            confidence -= 25
-        
-        # Factor 4: Data density (penalty if suspiciously sparse)
-        if surveys_checked > 50 and surveys_with_data < 3:
-            confidence -= 10  # Very sparse data might indicate issues
-        
-        # Factor 5: Bonus for finding substantial data
-        if surveys_with_data > 10:
-            confidence += 5
+        if lxml_html is not None and html and html.strip():
+            try:
+                return PortalFormState._parse_form_lxml(html)
+            except Exception:
+                pass
+        return PortalFormState._parse_form_soup(html)
+    
+    @staticmethod
+    def _parse_form_lxml(html: str) -> tuple:
+        root = lxml_html.document_fromstring(html)
+        form = next(root.iter('form'), root)
+        
+        fields, names, options, autopostback, buttons = {}, {}, {}, set(), {}
+        
+        for inp in form.iter('input'):
+            name = inp.get('name')
+            if not name:
+                continue
+            if inp.get('id'):
+                names[inp.get('id')] = name
+            input_type = (inp.get('type') or 'text').lower()
+            if input_type in ('submit', 'button', 'image', 'reset'):
+                buttons[name] = inp.get('value', '')
+                continue
+            if input_type in ('checkbox', 'radio') and inp.get('checked') is None:
+                continue
+            fields[name] = inp.get('value', '')
+        
+        for sel in form.iter('select'):
+            name = sel.get('name')
+            if not name:
+                continue
+            if sel.get('id'):
+                names[sel.get('id')] = name
+            opts = []
+            for o in sel.iter('option'):
+                text = ''.join(part.strip() for part in o.itertext())
+                opts.append({
+                    'value': o.get('value', text),
+                    'text': text,
+                    'disabled': o.get('disabled') is not None,
+                    'selected': o.get('selected') is not None,
+                })
+            options[name] = opts
+            enabled = [o for o in opts if not o['disabled']]
+            chosen = next((o for o in opts if o['selected']), enabled[0] if enabled else None)
+            if chosen is not None:
+                fields[name] = chosen['value']
+            if '__doPostBack' in (sel.get('onchange') or ''):
+                autopostback.add(name)
+        
+        for area in form.iter('textarea'):
+            if area.get('name'):
+                fields[area.get('name')] = ''.join(area.itertext())
+        
+        action = form.get('action') if form is not root else None
+        return fields, names, options, autopostback, buttons, action
+    
+    @staticmethod
+    def _parse_form_soup(html: str) -> tuple:
+        from bs4 import BeautifulSoup
         
-        return max(0, min(100, confidence))
+        soup = BeautifulSoup(html, 'html.parser')
+        form = soup.find('form') or soup
+        
+        fields, names, options, autopostback, buttons = {}, {}, {}, set(), {}
+        
+        for inp in form.find_all('input'):
+            name = inp.get('name')
+            if not name:
+                continue
+            if inp.get('id'):
+                names[inp['id']] = name
+            input_type = (inp.get('type') or 'text').lower()
+            if input_type in ('submit', 'button', 'image', 'reset'):
+                buttons[name] = inp.get('value', '')
+                continue
+            if input_type in ('checkbox', 'radio') and not inp.has_attr('checked'):
+                continue
+            fields[name] = inp.get('value', '')
+        
+        for sel in form.find_all('select'):
+            name = sel.get('name')
+            if not name:
+                continue
+            if sel.get('id'):
+                names[sel['id']] = name
+            opts = []
+            for o in sel.find_all('option'):
+                text = o.get_text(strip=True)
+                opts.append({
+                    'value': o.get('value', text),
+                    'text': text,
+                    'disabled': o.has_attr('disabled'),
+                    'selected': o.has_attr('selected'),
+                })
+            options[name] = opts
+            enabled = [o for o in opts if not o['disabled']]
+            chosen = next((o for o in opts if o['selected']), enabled[0] if enabled else None)
+            if chosen is not None:
+                fields[name] = chosen['value']
+            if '__doPostBack' in (sel.get('onchange') or ''):
+                autopostback.add(name)
+        
+        for area in form.find_all('textarea'):
+            if area.get('name'):
+                fields[area['name']] = area.get_text()
+        
+        action = form.get('action') if hasattr(form, 'get') else None
+        return fields, names, options, autopostback, buttons, action
+    
+    def _apply_form(self, html: str, parsed: tuple):
+        """Adopt a parse_form() result as the current page"""
+        from urllib.parse import urljoin
+        
+        fields, names, options, autopostback, buttons, action = parsed
+        self.html = html
+        self._fields, self._names, self._options = fields, names, options
+        self._autopostback, self._buttons = autopostback, buttons
+        self._action_url = urljoin(self.url, action) if action else self.url
+    
+    def _parse(self, html: str):
+        """Capture form fields, dropdown options and postback targets from a page"""
+        self._apply_form(html, self.parse_form(html))
+    
+    def _name(self, key: str) -> str:
+        """Map an ELEMENT_IDS key (or raw element id) to its form field name"""
+        element_id = Config.ELEMENT_IDS.get(key, key)
+        return self._names.get(element_id, element_id.replace('_', '$'))
+    
+    # ───────────────────────────────────────────────────────────────────────────
+    # Form state
+    # ───────────────────────────────────────────────────────────────────────────
+    
+    def _postback_data(self, event_target: str = '', extra: Dict[str, str] = None) -> Dict[str, str]:
+        """Form data a browser would POST for this event"""
+        data = dict(self._fields)
+        data['__EVENTTARGET'] = event_target
+        data['__EVENTARGUMENT'] = ''
+        if extra:
+            data.update(extra)
+        return data
+    
+    def options(self, key: str) -> List[Dict]:
+        """Options of a dropdown as dicts with value/text/disabled/selected"""
+        return list(self._options.get(self._name(key), []))
+    
+    def selected_value(self, key: str) -> Optional[str]:
+        return self._fields.get(self._name(key))
+    
+    def _resolve_value(self, key: str, value: str) -> str:
+        """Find the option value matching value, tolerating "2" vs "2.0" formats"""
+        opts = self.options(key)
+        for o in opts:
+            if o['value'] == value:
+                return value
+        wanted = normalize_code(value)
+        for o in opts:
+            if normalize_code(o['value']) == wanted:
+                return o['value']
+        raise ValueError(f"Option '{value}' not found in {key} ({len(opts)} options)")
+    
+    def _value_for_text(self, key: str, text: str) -> str:
+        for o in self.options(key):
+            if o['text'] == text:
+                return o['value']
+        raise ValueError(f"Option text '{text}' not found in {key}")
+    
+    def _stage_select(self, key: str, value: str, force: bool = False) -> Optional[str]:
+        """
+        Set a dropdown value in the form state.
+        Returns the __EVENTTARGET to post back, or None if no postback is needed.
+        """
+        name = self._name(key)
+        value = self._resolve_value(key, value)
+        if not force and self._fields.get(name) == value:
+            return None
+        self._fields[name] = value
+        return name if name in self._autopostback else None
     
-    def _init_browser(self, retry_count: int = 3):
-        """Initialize browser - Mac optimized for speed"""
-        import shutil
-        import tempfile
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.chrome.service import Service
-        from webdriver_manager.chrome import ChromeDriverManager
-        
-        # Clean user data directory for this worker - store as instance variable for cleanup
-        self._user_data_dir = os.path.join(tempfile.gettempdir(), f'bhoomi_chrome_{self.worker_id}')
-        if os.path.exists(self._user_data_dir):
+    def _button_data(self, key: str) -> Dict[str, str]:
+        name = self._name(key)
+        return {name: self._buttons.get(name, '')}
+    
+    def set_text(self, key: str, value: str):
+        """Set a textbox value (sent with the next postback)"""
+        self._fields[self._name(key)] = value
+    
+    # ───────────────────────────────────────────────────────────────────────────
+    # Page inspection
+    # ───────────────────────────────────────────────────────────────────────────
+    
+    def alert_text(self) -> str:
+        """Text of a startup alert() registered by the last response, if any"""
+        import re
+        match = re.search(r"alert\(\s*(['\"])(.*?)\1\s*\)", self.html, re.S)
+        return match.group(2) if match else ''
+    
+    def portal_issue(self) -> str:
+        """Return the alert text if the portal reported a transient issue, else ''"""
+        text = self.alert_text()
+        if text and any(phrase in text.lower() for phrase in Config.PORTAL_ISSUE_PHRASES):
+            return text
+        return ''
+    
+    def is_session_expired(self) -> bool:
+        page_lower = self.html.lower()
+        return any(indicator in page_lower for indicator in Config.SESSION_EXPIRED_INDICATORS)
+
+
+class HttpPortalSession(PortalFormState):
+    """
+    Drives the Service2 form with plain HTTP postbacks - no browser required.
+    
+    Each postback re-submits the whole form exactly like the browser would, so the
+    portal sees the same district → taluk → hobli → village → survey → surnoc →
+    hissa → period → Fetch sequence. Dropdowns are only re-posted when their value
+    actually changes.
+    
+    One instance per logical worker (the ASP.NET session lives in its cookies).
+    """
+    
+    def __init__(self, base_url: str = None, timeout: float = None):
+        super().__init__(base_url, timeout)
+        self.session = None
+        self.reset()
+    
+    def reset(self):
+        """Start a fresh ASP.NET session (new cookie jar, empty form state)"""
+        if self.session is not None:
             try:
-                shutil.rmtree(self._user_data_dir)
+                self.session.close()
             except Exception:
                 pass
-        
-        last_error = None
-        for attempt in range(retry_count):
+        self.session = requests.Session()
+        adapter = get_shared_http_adapter()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update(self.HEADERS)
+        self._clear_form()
+    
+    def close(self):
+        """Close the HTTP session"""
+        if self.session is not None:
             try:
-                options = Options()
-                
-                # Mac-optimized headless Chrome settings
-                options.add_argument('--headless=new')
-                options.add_argument('--no-sandbox')
-                options.add_argument('--disable-dev-shm-usage')
-                options.add_argument('--disable-gpu')
-                options.add_argument('--window-size=1920,1080')
-                
-                # Speed optimizations - disable unnecessary features
-                options.add_argument('--disable-extensions')
-                options.add_argument('--disable-images')
-                options.add_argument('--blink-settings=imagesEnabled=false')
-                options.add_argument('--disable-javascript-harmony-shipping')
-                options.add_argument('--disable-background-networking')
-                options.add_argument('--disable-sync')
-                options.add_argument('--disable-translate')
-                options.add_argument('--disable-default-apps')
-                options.add_argument('--mute-audio')
-                options.add_argument('--no-first-run')
-                
-                # Unique user data dir per worker
-                options.add_argument(f'--user-data-dir={self._user_data_dir}')
-                
-                # Page load strategy - don't wait for all resources
+                self.session.close()
+            except Exception:
+                pass
+            self.session = None
+    
+    def load(self):
+        """GET the portal page (starts the ASP.NET session)"""
+        _global_rate_limiter.acquire('navigation')
+        response = self.session.get(self.base_url, verify=False, timeout=self.timeout)
+        response.raise_for_status()
+        self.url = response.url
+        self._parse(response.text)
+    
+    def _postback(self, event_target: str = '', extra: Dict[str, str] = None):
+        """POST the current form state back to the portal"""
+        if not self.is_loaded:
+            self.load()
+        response = self.session.post(
+            self._action_url, data=self._postback_data(event_target, extra),
+            verify=False, timeout=self.timeout, headers={'Referer': self.url}
+        )
+        response.raise_for_status()
+        self.url = response.url
+        self._parse(response.text)
+    
+    def select(self, key: str, value: str, force: bool = False) -> bool:
+        """
+        Select a dropdown value, posting back only if the value changed.
+        Returns True if a postback was made.
+        """
+        event_target = self._stage_select(key, value, force)
+        if event_target:
+            _global_rate_limiter.acquire('navigation')
+            self._postback(event_target=event_target)
+            return True
+        return False
+    
+    def select_by_text(self, key: str, text: str, force: bool = False) -> bool:
+        """Select a dropdown option by its visible text"""
+        return self.select(key, self._value_for_text(key, text), force=force)
+    
+    def click(self, key: str):
+        """Submit the form through a button, like a browser click (timed for AIMD control)"""
+        controller = get_concurrency_controller()
+        started = time.time()
+        try:
+            self._postback(extra=self._button_data(key))
+        except Exception as e:
+            controller.record(time.time() - started, ok=False, timed_out=isinstance(e, requests.Timeout))
+            raise
+        controller.record(time.time() - started, ok=True)
+    
+    def ensure_location(self, district_code: str, taluk_code: str, hobli_code: str, village_code: str):
+        """Make sure the district/taluk/hobli/village dropdowns hold these values"""
+        if not self.is_loaded:
+            self.load()
+        for key, value in (('district', district_code), ('taluk', taluk_code),
+                           ('hobli', hobli_code), ('village', village_code)):
+            self.select(key, value)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════════════
+# ASYNC FETCH ENGINE - Many portal sessions multiplexed on one event loop
+# ═══════════════════════════════════════════════════════════════════════════════════════
+
+_parse_executor = None
+_parse_executor_lock = threading.Lock()
+
+def get_parse_executor():
+    """
+    Pool that parses portal pages for the async engine - ASYNC_PARSE_PROCESSES
+    processes (own GIL each), or two threads when that is 0.
+    """
+    global _parse_executor
+    with _parse_executor_lock:
+        if _parse_executor is None:
+            if Config.ASYNC_PARSE_PROCESSES > 0:
+                _parse_executor = ProcessPoolExecutor(
+                    max_workers=Config.ASYNC_PARSE_PROCESSES,
+                    mp_context=multiprocessing.get_context(Config.WORKER_PROCESS_START_METHOD)
+                )
+            else:
+                _parse_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='AsyncParse')
+        return _parse_executor
+
+async def parse_off_loop(func, *args):
+    """
+    Run a CPU-bound parse (a picklable module-level/static function) in the parse pool,
+    so one session's page never stalls the other coroutines on the loop.
+    """
+    global _parse_executor
+    executor = get_parse_executor()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+    except BrokenProcessPool:
+        # A parse process died - start a fresh pool for later pages, parse this one here
+        logger.warning("⚠️ Parse process pool broke - restarting it")
+        with _parse_executor_lock:
+            if _parse_executor is executor:
+                _parse_executor = None
+        return func(*args)
+
+class AsyncPortalSession(PortalFormState):
+    """
+    aiohttp twin of HttpPortalSession.
+    
+    Sessions own their cookie jar (one ASP.NET session each) but share the
+    coordinator's TCPConnector, so hundreds of them cost a handful of sockets
+    instead of a thread and a Chrome each. Responses are parsed in the parse
+    pool (parse_off_loop), not on the event loop.
+    """
+    
+    def __init__(self, connector, base_url: str = None, timeout: float = None,
+                 limiter: 'AsyncRateLimiter' = None):
+        super().__init__(base_url, timeout)
+        self.connector = connector
+        self.limiter = limiter  # Page loads and dropdown postbacks draw from 'navigation'
+        self.session = None
+    
+    async def reset(self):
+        """Start a fresh ASP.NET session (new cookie jar, empty form state)"""
+        await self.close()
+        self.session = aiohttp.ClientSession(
+            connector=self.connector,
+            connector_owner=False,
+            cookie_jar=aiohttp.CookieJar(unsafe=True),
+            headers=self.HEADERS,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+        self._clear_form()
+    
+    async def close(self):
+        """Close the HTTP session (the shared connector stays open)"""
+        if self.session is not None:
+            try:
+                await self.session.close()
+            except Exception:
+                pass
+            self.session = None
+    
+    async def load(self):
+        """GET the portal page (starts the ASP.NET session)"""
+        if self.session is None:
+            await self.reset()
+        if self.limiter:
+            await self.limiter.acquire('navigation')
+        async with self.session.get(self.base_url, ssl=False) as response:
+            response.raise_for_status()
+            html = await response.text()
+            self.url = str(response.url)
+        self._apply_form(html, await parse_off_loop(PortalFormState.parse_form, html))
+    
+    async def _postback(self, event_target: str = '', extra: Dict[str, str] = None):
+        """POST the current form state back to the portal"""
+        if not self.is_loaded:
+            await self.load()
+        async with self.session.post(
+            self._action_url, data=self._postback_data(event_target, extra),
+            ssl=False, headers={'Referer': self.url}
+        ) as response:
+            response.raise_for_status()
+            html = await response.text()
+            self.url = str(response.url)
+        self._apply_form(html, await parse_off_loop(PortalFormState.parse_form, html))
+    
+    async def select(self, key: str, value: str, force: bool = False) -> bool:
+        """Select a dropdown value, posting back only if the value changed"""
+        event_target = self._stage_select(key, value, force)
+        if event_target:
+            if self.limiter:
+                await self.limiter.acquire('navigation')
+            await self._postback(event_target=event_target)
+            return True
+        return False
+    
+    async def select_by_text(self, key: str, text: str, force: bool = False) -> bool:
+        """Select a dropdown option by its visible text"""
+        return await self.select(key, self._value_for_text(key, text), force=force)
+    
+    async def click(self, key: str):
+        """Submit the form through a button, like a browser click (timed for AIMD control)"""
+        controller = get_concurrency_controller()
+        started = time.time()
+        try:
+            await self._postback(extra=self._button_data(key))
+        except Exception as e:
+            controller.record(time.time() - started, ok=False, timed_out=isinstance(e, asyncio.TimeoutError))
+            raise
+        controller.record(time.time() - started, ok=True)
+    
+    async def ensure_location(self, district_code: str, taluk_code: str, hobli_code: str, village_code: str):
+        """Make sure the district/taluk/hobli/village dropdowns hold these values"""
+        if not self.is_loaded:
+            await self.load()
+        for key, value in (('district', district_code), ('taluk', taluk_code),
+                           ('hobli', hobli_code), ('village', village_code)):
+            await self.select(key, value)
+
+
+class AsyncRecordSink:
+    """
+    Async front for the blocking DB/CSV writes.
+    
+    Coroutines enqueue write calls; one drainer task runs them in order on a single
+    writer thread, so SQLite and the CSV writers never block the event loop. The
+    queue is bounded - if the writer falls behind, producers wait instead of
+    buffering without limit.
+    """
+    
+    def __init__(self, max_pending: int = None):
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending or Config.ASYNC_SINK_QUEUE_SIZE)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='AsyncSink')
+        self._drainer: Optional[asyncio.Task] = None
+        self.writes_done = 0
+        self.write_errors = 0
+    
+    def start(self):
+        self._drainer = asyncio.get_running_loop().create_task(self._drain())
+    
+    async def submit(self, func, *args, **kwargs):
+        """Queue a blocking write call"""
+        await self._queue.put((func, args, kwargs))
+    
+    async def _drain(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            func, args, kwargs = await self._queue.get()
+            try:
+                await loop.run_in_executor(self._executor, lambda: func(*args, **kwargs))
+                self.writes_done += 1
+            except Exception as e:
+                self.write_errors += 1
+                logger.error(f"Async sink write failed: {e}")
+            finally:
+                self._queue.task_done()
+    
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+    
+    async def flush(self):
+        """Wait until every write queued so far has been applied"""
+        await self._queue.join()
+    
+    async def close(self):
+        """Flush every queued write, then stop the writer thread"""
+        await self.flush()
+        if self._drainer:
+            self._drainer.cancel()
+        self._executor.shutdown(wait=True)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════════════
+# SURVEY RANGES - One village searched by several workers at once
+# ═══════════════════════════════════════════════════════════════════════════════════════
+
+@dataclass(eq=False)
+class SurveyRange:
+    """Contiguous survey numbers of one village, searched by one worker"""
+    plan: 'VillageSurveyPlan'
+    start: int
+    end: int  # Shrinks when an idle worker splits off the upper part
+    worker_id: Optional[int] = None
+    position: int = 0  # Survey being processed, 0 = not started
+    finished: bool = False
+    records_at_start: int = 0  # Worker counters when the range was taken
+    matches_at_start: int = 0
+
+
+class VillageSurveyPlan:
+    """
+    Shared state of a village whose survey range may be split across workers.
+    
+    - split() hands the upper half of the range with most surveys left to an idle worker
+    - stop() is the smart-stop signal: every survey above the stop point is cancelled
+    - add_result() collects each range's stats and returns the combined village result
+      once every range has reported (exactly once)
+    """
+    
+    def __init__(self, village: Tuple[str, str, str, str], max_survey: int, owner_id: int):
+        self.village = village
+        self.max_survey = max_survey
+        self.owner_id = owner_id  # Worker credited with the village in WorkerStatus
+        self.ranges: List[SurveyRange] = []
+        self.pending: deque = deque()  # Ranges restored from a previous session, not yet taken
+        self.stop_at: Optional[int] = None
+        self._results: Dict[int, Optional[dict]] = {}  # range start -> stats (None = failed)
+        self._finished_once = False
+        self._combined_once = False
+        self.lock = threading.Lock()
+    
+    def add_range(self, start: int, end: int, worker_id: int = None) -> SurveyRange:
+        rng = SurveyRange(plan=self, start=start, end=end, worker_id=worker_id)
+        self.ranges.append(rng)
+        return rng
+    
+    def cancelled(self, survey_no: int) -> bool:
+        stop_at = self.stop_at
+        return stop_at is not None and survey_no > stop_at
+    
+    def stop(self, survey_no: int):
+        with self.lock:
+            if self.stop_at is None or survey_no < self.stop_at:
+                self.stop_at = survey_no
+    
+    def take_pending(self, worker_id: int) -> Optional[SurveyRange]:
+        with self.lock:
+            while self.pending:
+                rng = self.pending.popleft()
+                if not self.cancelled(rng.start):
+                    rng.worker_id = worker_id
+                    return rng
+                rng.finished = True
+                self._results[rng.start] = {}
+            return None
+    
+    def split(self, worker_id: int, min_size: int) -> Optional[Tuple[SurveyRange, SurveyRange]]:
+        """Split the running range with most surveys left; returns (victim, new range)"""
+        with self.lock:
+            if self.stop_at is not None:
+                return None
+            best, best_left = None, 0
+            for rng in self.ranges:
+                if rng.finished or not rng.position:
+                    continue
+                left = rng.end - rng.position
+                if left > best_left:
+                    best, best_left = rng, left
+            if best is None or best_left < 2 * min_size:
+                return None
+            mid = best.position + best_left // 2
+            new = self.add_range(mid + 1, best.end, worker_id)
+            best.end = mid
+            return best, new
+    
+    def remaining(self) -> int:
+        """Surveys left in running ranges (split candidates)"""
+        return sum(r.end - r.position for r in self.ranges if r.position and not r.finished)
+    
+    def finish_range(self, rng: SurveyRange) -> bool:
+        """Mark a range done; True for exactly one caller - the one finishing the last range"""
+        with self.lock:
+            rng.finished = True
+            if self._finished_once or not all(r.finished for r in self.ranges):
+                return False
+            self._finished_once = True
+            return True
+    
+    @property
+    def failed(self) -> bool:
+        return any(result is None for result in self._results.values())
+    
+    def add_result(self, rng: SurveyRange, result: Optional[dict]) -> Optional[dict]:
+        """
+        Record a range's stats (None = range failed). Returns the combined village result
+        when this was the last range to report, otherwise None.
+        """
+        with self.lock:
+            self._results[rng.start] = result
+            if self._combined_once or any(r.start not in self._results for r in self.ranges):
+                return None
+            self._combined_once = True
+            return self._combine()
+    
+    def _combine(self) -> dict:
+        """Village totals over every range (called under self.lock)"""
+        done = [(start, res) for start, res in sorted(self._results.items()) if res]
+        combined = {
+            'surveys_checked': sum(res['surveys_checked'] for _, res in done),
+            'surveys_with_data': sum(res['surveys_with_data'] for _, res in done),
+            'last_survey_with_data': max((res['last_survey_with_data'] for _, res in done), default=0),
+            'skipped_in_village': [skip for _, res in done for skip in res['skipped_in_village']],
+            'records': sum(res['records'] for _, res in done),
+            'matches': sum(res['matches'] for _, res in done),
+            'ranges': len(self.ranges),
+        }
+        if self.failed:
+            combined['completion_reason'] = 'error'
+            combined['stopped_at_survey'] = max((res['stopped_at_survey'] for _, res in done), default=0)
+        elif self.stop_at is not None:
+            combined['completion_reason'] = 'smart_stop'
+            combined['stopped_at_survey'] = self.stop_at
+        elif done:
+            # Highest range decides how the village ended (max reached, browser death, ...)
+            combined['completion_reason'] = done[-1][1]['completion_reason']
+            combined['stopped_at_survey'] = done[-1][1]['stopped_at_survey']
+        else:
+            combined['completion_reason'] = 'smart_stop'
+            combined['stopped_at_survey'] = 0
+        return combined
+
+
+# ═══════════════════════════════════════════════════════════════════════════════════════
+# WORK-STEALING VILLAGE QUEUE
+# ═══════════════════════════════════════════════════════════════════════════════════════
+
+class VillageWorkQueue:
+    """
+    Per-worker village queues with stealing.
+    
+    Each worker starts with its round-robin share and takes from the front of its
+    own queue. A worker whose queue is empty steals from the back of the longest
+    other queue, so only not-yet-started villages move and nobody idles while
+    work remains.
+    """
+    
+    def __init__(self, chunks: Dict[int, List[Tuple]]):
+        self._queues: Dict[int, deque] = {wid: deque(items) for wid, items in chunks.items()}
+        self._plans: List[VillageSurveyPlan] = []  # Villages being searched
+        self._lock = threading.Lock()
+        self.steals = 0
+        self.splits = 0
+    
+    def take(self, worker_id: int) -> Tuple[Optional[Tuple], Optional[int]]:
+        """
+        Next item for worker_id.
+        
+        Returns:
+            (item, stolen_from) - stolen_from is the victim's worker id, or None when
+            the item came from the worker's own queue. (None, None) when all queues are empty.
+        """
+        with self._lock:
+            own = self._queues.setdefault(worker_id, deque())
+            if own:
+                return own.popleft(), None
+            
+            victim_id = max(self._queues, key=lambda wid: len(self._queues[wid]))
+            if not self._queues[victim_id]:
+                return None, None
+            self.steals += 1
+            return self._queues[victim_id].pop(), victim_id
+    
+    def depth(self, worker_id: int) -> int:
+        with self._lock:
+            return len(self._queues.get(worker_id, ()))
+    
+    def open_plan(self, village: Tuple[str, str, str, str], max_survey: int, worker_id: int,
+                  saved_ranges: List[dict] = None) -> SurveyRange:
+        """
+        Start a village. Returns the range for worker_id: the whole village, or - when a
+        previous session had split it - its first unfinished range, the rest left pending.
+        """
+        plan = VillageSurveyPlan(village, max_survey, worker_id)
+        todo = [r for r in saved_ranges or [] if r['status'] != 'completed']
+        if todo:
+            for r in saved_ranges:
+                rng = plan.add_range(r['range_start'], r['range_end'])
+                if r['status'] == 'completed':
+                    rng.finished = True
+                    plan._results[rng.start] = {}
+                elif r is not todo[0]:
+                    plan.pending.append(rng)
+            first = next(rng for rng in plan.ranges if rng.start == todo[0]['range_start'])
+            first.worker_id = worker_id
+        else:
+            first = plan.add_range(1, max_survey, worker_id)
+        with self._lock:
+            self._plans.append(plan)
+        return first
+    
+    def has_open_plans(self) -> bool:
+        """True while some village is still being searched (it may become splittable)"""
+        with self._lock:
+            return bool(self._plans)
+    
+    def close_plan(self, plan: VillageSurveyPlan):
+        with self._lock:
+            if plan in self._plans:
+                self._plans.remove(plan)
+    
+    def take_pending_range(self, worker_id: int) -> Optional[SurveyRange]:
+        """A restored range of a resumed village that nobody has picked up yet"""
+        with self._lock:
+            plans = list(self._plans)
+        for plan in plans:
+            rng = plan.take_pending(worker_id)
+            if rng:
+                return rng
+        return None
+    
+    def split_range(self, worker_id: int, min_size: int) -> Optional[Tuple[SurveyRange, SurveyRange]]:
+        """Split the running village with most surveys left; (victim range, new range) or None"""
+        with self._lock:
+            plans = sorted(self._plans, key=lambda p: p.remaining(), reverse=True)
+        for plan in plans:
+            split = plan.split(worker_id, min_size)
+            if split:
+                with self._lock:
+                    self.splits += 1
+                return split
+        return None
+    
+    def remaining(self) -> int:
+        with self._lock:
+            return sum(len(q) for q in self._queues.values())
+    
+    def requeue(self, villages: List[Tuple]) -> Dict[int, int]:
+        """Put villages back (a lost agent's) on the shortest queues; villages added per worker"""
+        added: Dict[int, int] = {}
+        with self._lock:
+            if not self._queues:
+                return added
+            for village in villages:
+                wid = min(self._queues, key=lambda w: len(self._queues[w]))
+                self._queues[wid].append(village)
+                added[wid] = added.get(wid, 0) + 1
+        return added
+
+
+# ═══════════════════════════════════════════════════════════════════════════════════════
+# PERIOD CHECKPOINTS - Exact mid-survey resume
+# ═══════════════════════════════════════════════════════════════════════════════════════
+
+class PeriodCheckpoints:
+    """
+    A worker's finished (surnoc, hissa, period) tuples in surveys without a survey
+    checkpoint yet. ALL as the period (or hissa and period) marks a whole hissa (surnoc),
+    so a resumed survey skips those dropdown postbacks as well.
+    
+    - A period that found owners is checkpointed in the transaction saving its
+      land_records rows (take() + save_records_batch), so they are never written twice
+    - Other marks are buffered: they ride along with the next such transaction, or
+      go alone once PERIOD_CHECKPOINT_BATCH are pending
+    - finish_survey() drops a survey's marks once its survey checkpoint is written
+    """
+    
+    ALL = '*'
+    
+    def __init__(self, db, session_id: str):
+        self.db = db
+        self.session_id = session_id
+        self._done: Dict[Tuple[str, int], set] = {}  # (village_code, survey_no) -> {(surnoc, hissa, period)}
+        self._pending: List[tuple] = []
+        self._lock = threading.Lock()
+    
+    def load(self, village_code: str, survey_range: Tuple[int, int] = None) -> Dict[int, int]:
+        """Read a village's stored marks; returns survey_no -> marks for the partly done surveys"""
+        rows = self.db.get_period_checkpoints(self.session_id, village_code, survey_range)
+        found: Dict[int, int] = {}
+        with self._lock:
+            for survey_no, surnoc, hissa, period in rows:
+                self._done.setdefault((village_code, survey_no), set()).add((surnoc, hissa, period))
+                found[survey_no] = found.get(survey_no, 0) + 1
+        return found
+    
+    def resumed(self, village_code: str, survey_no: int) -> bool:
+        """Part of this survey is already done (so it cannot be cached or replayed whole)"""
+        return bool(self._done.get((village_code, survey_no)))
+    
+    def is_done(self, village_code: str, survey_no: int, surnoc: str, hissa: str = ALL, period: str = ALL) -> bool:
+        done = self._done.get((village_code, survey_no))
+        if not done:
+            return False
+        return ((surnoc, self.ALL, self.ALL) in done or (surnoc, hissa, self.ALL) in done
+                or (surnoc, hissa, period) in done)
+    
+    def add(self, village_code: str, survey_no: int, surnoc: str, hissa: str = ALL, period: str = ALL):
+        """Record a mark that is already stored"""
+        with self._lock:
+            self._done.setdefault((village_code, survey_no), set()).add((surnoc, hissa, period))
+    
+    def mark(self, village_code: str, survey_no: int, surnoc: str, hissa: str = ALL, period: str = ALL):
+        """Record a mark and buffer it for the database"""
+        with self._lock:
+            self._done.setdefault((village_code, survey_no), set()).add((surnoc, hissa, period))
+            if not (self.db and self.session_id):
+                return
+            self._pending.append((village_code, survey_no, surnoc, hissa, period))
+            if len(self._pending) < Config.PERIOD_CHECKPOINT_BATCH:
+                return
+        self.flush()
+    
+    def mark_if_complete(self, village_code: str, survey_no: int, surnoc: str, hissa: str = ALL,
+                         parts: List[str] = ()):
+        """Mark a hissa (parts = its periods) or a surnoc (parts = its hissas) once every part is done"""
+        if hissa == self.ALL:
+            complete = all(self.is_done(village_code, survey_no, surnoc, part) for part in parts)
+        else:
+            complete = all(self.is_done(village_code, survey_no, surnoc, hissa, part) for part in parts)
+        if parts and complete:
+            self.mark(village_code, survey_no, surnoc, hissa)
+    
+    def take(self) -> List[tuple]:
+        """Hand the buffered marks to a caller that commits them in its own transaction"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        return pending
+    
+    def restore(self, pending: List[tuple]):
+        """Put back marks whose transaction failed"""
+        with self._lock:
+            self._pending[:0] = pending
+    
+    def add_when_written(self, written: Future, village_code: str, survey_no: int, surnoc: str,
+                         hissa: str = ALL, period: str = ALL):
+        """add() a mark committed by the write behind `written` - once, and only if, it succeeds"""
+        written.add_done_callback(
+            lambda f: f.exception() is None and self.add(village_code, survey_no, surnoc, hissa, period))
+    
+    def restore_on_failure(self, written: Future, pending: List[tuple]):
+        """restore() pending if the write carrying it fails"""
+        if pending:
+            written.add_done_callback(lambda f: f.exception() is not None and self.restore(pending))
+    
+    def flush(self):
+        pending = self.take()
+        if not pending:
+            return
+        try:
+            self.restore_on_failure(self.db.save_period_checkpoints(self.session_id, pending, durable=False), pending)
+        except Exception as e:
+            self.restore(pending)
+            logger.debug(f"Period checkpoint save failed: {e}")
+    
+    def finish_survey(self, village_code: str, survey_no: int):
+        with self._lock:
+            self._done.pop((village_code, survey_no), None)
+            self._pending = [p for p in self._pending if (p[0], p[1]) != (village_code, survey_no)]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════════════
+# SEARCH WORKER
+# ═══════════════════════════════════════════════════════════════════════════════════════
+
+class SearchWorker:
+    """
+    Individual search worker that runs in its own thread with its own browser.
+    Each worker processes a subset of villages independently.
+    
+    NOW WITH PERSISTENT DATABASE INTEGRATION:
+    - Every record saved to SQLite in real-time
+    - Survives browser crashes
+    - Supports resume functionality
+    """
+    
+    def __init__(
+        self,
+        worker_id: int,
+        search_params: dict,
+        villages: List[Tuple[str, str, str, str]],  # (village_code, village_name, hobli_code, hobli_name)
+        state: SearchState,
+        all_records_writer: ThreadSafeCSVWriter,
+        matches_writer: ThreadSafeCSVWriter,
+        state_lock: threading.Lock,
+        db: DatabaseManager = None,  # Persistent database
+        session_id: str = None,  # Current search session ID
+        work_queue: VillageWorkQueue = None  # Shared queue; None = work through `villages` alone
+    ):
+        self.worker_id = worker_id
+        self.params = search_params
+        self.villages = villages
+        self.work_queue = work_queue or VillageWorkQueue({worker_id: villages})
+        self.villages_done = 0
+        self.current_range: Optional[SurveyRange] = None  # Surveys the engine loop walks
+        self.lease_owner = DatabaseManager.lease_owner_id()
+        self._lease_renewed_at = 0.0
+        self._leases_lost = set()  # Village codes another owner took over (warned once)
+        self.period_checkpoints = PeriodCheckpoints(db, session_id)
+        self._record_keys_place: Optional[tuple] = None  # Village _record_keys belongs to
+        self._record_keys: set = set()  # Natural keys already saved for that village
+        self.state = state
+        self.all_records_writer = all_records_writer
+        self.matches_writer = matches_writer
+        self.state_lock = state_lock
+        
+        # Database integration
+        self.db = db
+        self.session_id = session_id
+        
+        self.driver = None
+        self.navigator: Optional[SmartNavigator] = None  # Form state of self.driver
+        self.http: Optional[HttpPortalSession] = None  # Browserless engine session
+        self.engine = search_params.get('fetch_engine') or Config.DEFAULT_FETCH_ENGINE
+        self.logger = logging.getLogger(f'Worker-{worker_id}')
+        self._user_data_dir = None  # Set during browser init, used for cleanup
+        
+        # Worker-local stats
+        self.records_found = 0
+        self.matches_found = 0
+        self.errors = 0
+        
+        # Browser stability tracking - prevents memory leaks
+        self.hissa_processed_count = 0
+        self.last_browser_restart = time.time()
+    
+    def _update_status(self, **kwargs):
+        """Thread-safe status update"""
+        with self.state_lock:
+            worker_status = self.state.workers.get(self.worker_id)
+            if worker_status:
+                for key, value in kwargs.items():
+                    if hasattr(worker_status, key):
+                        setattr(worker_status, key, value)
+                worker_status.last_update = datetime.now().isoformat()
+    
+    def _add_log(self, message: str):
+        """Thread-safe log addition"""
+        with self.state_lock:
+            log_entry = f"[W{self.worker_id}] {message}"
+            self.state.logs.append(log_entry)
+            # Keep only last 100 logs
+            if len(self.state.logs) > 100:
+                self.state.logs = self.state.logs[-100:]
+        self.logger.info(message)
+    
+    def _update_global_stats(self):
+        """Update global statistics"""
+        with self.state_lock:
+            self.state.recalculate_totals()
+    
+    def _take_village(self) -> Optional[Tuple[str, str, str, str]]:
+        """Next village from own queue, stealing one if it is empty; keeps both workers' status current"""
+        village, stolen_from = self.work_queue.take(self.worker_id)
+        with self.state_lock:
+            own = self.state.workers.get(self.worker_id)
+            if own:
+                own.queue_depth = self.work_queue.depth(self.worker_id)
+                if stolen_from is not None:
+                    own.villages_total += 1
+            victim = self.state.workers.get(stolen_from) if stolen_from is not None else None
+            if victim:
+                victim.villages_total -= 1
+                victim.queue_depth = self.work_queue.depth(stolen_from)
+        if stolen_from is not None:
+            self._add_log(f"🤝 Took {village[1]} from W{stolen_from}'s queue")
+        return village
+    
+    def _take_work(self) -> Optional[Tuple[SurveyRange, bool]]:
+        """
+        Next survey range to search and whether it starts a new village.
+        Order: restored ranges of a resumed village, own queue, a stolen village, then
+        (queues drained) the upper half of the running village with most surveys left.
+        """
+        get_concurrency_controller().leave(self.worker_id)  # No slot held while idle
+        rng = self.work_queue.take_pending_range(self.worker_id)
+        if rng:
+            self._add_log(f"▶️ {rng.plan.village[1]}: resuming surveys {rng.start}-{rng.end}")
+            return rng, False
+        
+        village = self._take_village()
+        while village and not self._lease_village(village[0]):
+            # Another process / host on this database is already searching it
+            self._add_log(f"🔒 {village[1]} is leased by another worker - skipped")
+            with self.state_lock:
+                own = self.state.workers.get(self.worker_id)
+                if own:
+                    own.villages_total -= 1
+            village = self._take_village()
+        if village:
+            saved_ranges = []
+            if self.db and self.session_id:
+                try:
+                    saved_ranges = self.db.get_survey_ranges(self.session_id, village[0])
+                except Exception as range_err:
+                    self.logger.debug(f"Survey range lookup failed: {range_err}")
+            max_survey = self.params.get('max_survey', Config.DEFAULT_MAX_SURVEY)
+            return self.work_queue.open_plan(village, max_survey, self.worker_id, saved_ranges), True
+        
+        if Config.SPLIT_SURVEY_RANGES:
+            split = self.work_queue.split_range(self.worker_id, Config.MIN_SURVEY_RANGE)
+            if split:
+                victim, rng = split
+                self._add_log(f"✂️ {rng.plan.village[1]}: took surveys {rng.start}-{rng.end} from W{victim.worker_id}")
+                return rng, False
+        return None
+    
+    def _wait_for_slot(self) -> bool:
+        """Take an active-worker slot from the AIMD controller. False if the search stopped."""
+        controller = get_concurrency_controller()
+        parked = False
+        while not controller.enter(self.worker_id, timeout=1.0):
+            if not self.state.running:
+                return False
+            if not parked:
+                parked = True
+                self._update_status(status='parked')
+                self._add_log(f"⏸️ Parked by adaptive concurrency (limit {controller.worker_limit} workers)")
+        if parked:
+            self._update_status(status='running')
+            self._add_log("▶️ Slot free - resuming")
+        return True
+    
+    def _begin_range(self, rng: SurveyRange, new_village: bool):
+        """Bookkeeping before a range is searched (refresh the village lease / store the split)"""
+        rng.records_at_start, rng.matches_at_start = self.records_found, self.matches_found
+        if new_village:
+            self._renew_lease(rng.plan.village[0], force=True)  # The wait for a slot may have been long
+        else:
+            self._save_survey_ranges(rng.plan)
+    
+    def _save_survey_ranges(self, plan: VillageSurveyPlan):
+        if not (self.db and self.session_id) or len(plan.ranges) < 2:
+            return  # Unsplit villages resume from survey checkpoints alone
+        try:
+            self.db.save_survey_ranges(self.session_id, plan.village[0], [
+                {'range_start': r.start, 'range_end': r.end, 'worker_id': r.worker_id,
+                 'status': 'completed' if r.finished else 'pending'}
+                for r in sorted(plan.ranges, key=lambda r: r.start)
+            ], durable=False)
+        except Exception as range_err:
+            self.logger.debug(f"Survey range save failed: {range_err}")
+    
+    def _fail_range(self, rng: SurveyRange, error: str):
+        """A range gave up after retries - the village is reported as failed"""
+        self._fail_village(rng.plan.village[0], error)
+        combined = rng.plan.add_result(rng, None)
+        if combined:
+            self._publish_village(rng.plan.village[0], rng.plan.village[1], combined, rng.plan.max_survey)
+    
+    def _settle_range(self, rng: SurveyRange, last: bool):
+        """
+        Bookkeeping after a range is done (rng.plan.finish_range() already called).
+        The worker finishing the village's last range counts the village.
+        """
+        plan = rng.plan
+        self._save_survey_ranges(plan)
+        if not last:
+            return
+        self.work_queue.close_plan(plan)
+        if plan.failed:
+            return
+        
+        with self.state_lock:
+            if plan.village[1] not in self.state.villages_processed:
+                self.state.villages_processed.append(plan.village[1])
+            if plan.owner_id != self.worker_id:
+                # Village was assigned to another worker; the credit moves with the finish
+                owner = self.state.workers.get(plan.owner_id)
+                own = self.state.workers.get(self.worker_id)
+                if owner and own:
+                    owner.villages_total -= 1
+                    own.villages_total += 1
+        self.villages_done += 1
+        self._update_status(villages_completed=self.villages_done)
+        self._update_global_stats()
+    
+    def _lease_village(self, village_code: str) -> bool:
+        """Lease the village in village_progress for this process. False if another owner holds it."""
+        if not (self.db and self.session_id):
+            return True
+        try:
+            leased = self.db.lease_village(self.session_id, self.lease_owner, village_code,
+                                           worker_id=self.worker_id,
+                                           max_survey=self.params.get('max_survey', Config.DEFAULT_MAX_SURVEY))
+        except Exception as lease_err:
+            self.logger.debug(f"Village lease failed: {lease_err}")
+            return True  # Search it anyway; the lease is bookkeeping, not the scheduler
+        self._lease_renewed_at = time.time()
+        return leased is not None
+    
+    def _renew_lease(self, village_code: str, last_survey: int = None, force: bool = False):
+        """Keep the village lease alive while searching (at most every LEASE_RENEW_INTERVAL)"""
+        if not (self.db and self.session_id):
+            return
+        now = time.time()
+        if not force and now - self._lease_renewed_at < Config.LEASE_RENEW_INTERVAL:
+            return
+        self._lease_renewed_at = now
+        try:
+            renewal = self.db.renew_lease(self.session_id, village_code, self.lease_owner,
+                                          last_survey=last_survey, durable=False)
+        except Exception as lease_err:
+            self.logger.debug(f"Lease renewal failed: {lease_err}")
+            return
+        renewal.add_done_callback(lambda f: self._lease_renewed(village_code, f))
+    
+    def _lease_renewed(self, village_code: str, renewal: Future):
+        """Outcome of a renewal, on the database writer thread"""
+        if renewal.exception() is not None:
+            self.logger.debug(f"Lease renewal failed: {renewal.exception()}")
+        elif not renewal.result() and village_code not in self._leases_lost:
+            self._leases_lost.add(village_code)
+            self._add_log(f"⚠️ Lease on village {village_code} lapsed - another worker may repeat it")
+    
+    def _complete_village(self, village_code: str, records: int, matches: int):
+        if self.db and self.session_id:
+            if not self.db.complete_lease(self.session_id, village_code, self.lease_owner, records, matches):
+                self._add_log(f"⚠️ Village {village_code} finished after its lease moved on - progress not overwritten")
+    
+    def _fail_village(self, village_code: str, error: str):
+        if self.db and self.session_id:
+            self.db.fail_village(self.session_id, village_code, error, durable=False)
+    
+    def _calculate_village_confidence(self, surveys_checked: int, surveys_with_data: int,
+                                       last_survey_with_data: int, stopped_at_survey: int,
+                                       skipped_count: int, completion_reason: str,
+                                       max_survey: int) -> int:
+        """
+        Calculate confidence score (0-100) that a village was fully searched.
+        
+        High confidence when:
+        - Smart stop after many consecutive empties
+        - Last data found far from stop point
+        - Low skip rate
+        - All expected surveys checked
+        
+        Returns:
+            Confidence score 0-100
+        """
+        if completion_reason == 'not_cached':
+            return 0  # Offline search had no crawl data for this village
+        
+        confidence = 100
+        
+        # Factor 1: Skip rate penalty (max -30 points)
+        if surveys_checked > 0:
+            skip_rate = skipped_count / surveys_checked
+            if skip_rate > 0.2:  # >20% skipped
+                confidence -= 30
+            elif skip_rate > 0.1:  # >10% skipped
+                confidence -= 15
+            elif skip_rate > 0.05:  # >5% skipped
+                confidence -= 5
+        
+        # Factor 2: Gap between last data and stop point (max -20 points)
+        if last_survey_with_data > 0:
+            gap = stopped_at_survey - last_survey_with_data
+            if gap < 20:  # Stopped very close to last data
+                confidence -= 20
+            elif gap < 35:
+                confidence -= 10
+            elif gap < 50:
+                confidence -= 5
+            # >= 50 gap is good (full buffer used)
+        
+        # Factor 3: Completion reason bonus/penalty
+        if completion_reason == 'smart_stop':
+            # Smart stop is reliable if gap is good
+            if last_survey_with_data > 0 and (stopped_at_survey - last_survey_with_data) >= 50:
+                confidence += 5  # Bonus for clean smart stop
+        elif completion_reason in ('max_reached', 'crawl_end'):
+            # Reached max survey (or the end of the offline crawl) - might have more data
+            confidence -= 10
+        elif completion_reason == 'error':
+            confidence -= 25
+        
+        # Factor 4: Data density (penalty if suspiciously sparse)
+        if surveys_checked > 50 and surveys_with_data < 3:
+            confidence -= 10  # Very sparse data might indicate issues
+        
+        # Factor 5: Bonus for finding substantial data
+        if surveys_with_data > 10:
+            confidence += 5
+        
+        return max(0, min(100, confidence))
+    
+    def _init_browser(self, retry_count: int = 3):
+        """Initialize browser - Mac optimized for speed"""
+        import shutil
+        import tempfile
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        from webdriver_manager.chrome import ChromeDriverManager
+        
+        # Clean user data directory for this worker - store as instance variable for cleanup
+        self._user_data_dir = os.path.join(tempfile.gettempdir(), f'bhoomi_chrome_{self.worker_id}')
+        if os.path.exists(self._user_data_dir):
+            try:
+                shutil.rmtree(self._user_data_dir)
+            except Exception:
+                pass
+        
+        last_error = None
+        for attempt in range(retry_count):
+            try:
+                options = Options()
+                
+                # Mac-optimized headless Chrome settings
+                options.add_argument('--headless=new')
+                options.add_argument('--no-sandbox')
+                options.add_argument('--disable-dev-shm-usage')
+                options.add_argument('--disable-gpu')
+                options.add_argument('--window-size=1920,1080')
+                
+                # Speed optimizations - disable unnecessary features
+                options.add_argument('--disable-extensions')
+                options.add_argument('--disable-images')
+                options.add_argument('--blink-settings=imagesEnabled=false')
+                options.add_argument('--disable-javascript-harmony-shipping')
+                options.add_argument('--disable-background-networking')
+                options.add_argument('--disable-sync')
+                options.add_argument('--disable-translate')
+                options.add_argument('--disable-default-apps')
+                options.add_argument('--mute-audio')
+                options.add_argument('--no-first-run')
+                
+                # Unique user data dir per worker
+                options.add_argument(f'--user-data-dir={self._user_data_dir}')
+                
+                # Page load strategy - don't wait for all resources
                 options.page_load_strategy = 'eager'
                 
                 # Use cached ChromeDriver path for faster startup
@@ -2373,6 +6086,9 @@ class SearchWorker:
                 # Implicit wait for elements
                 self.driver.implicitly_wait(2)
                 
+                # Fresh browser - navigator starts with unknown form state
+                self.navigator = SmartNavigator(self.driver, self.worker_id)
+                
                 self._add_log(f"✅ Worker {self.worker_id} browser ready!")
                 return  # Success
                 
@@ -2428,12 +6144,37 @@ class SearchWorker:
         # Step 4: Give OS time to release resources
         time.sleep(0.5)
     
-    def _handle_alert(self) -> tuple:
+    def _init_engine(self):
+        """Start the configured fetch engine (browser or HTTP session)"""
+        if self.engine == 'offline':
+            return  # Cached data only - nothing to start
+        if self.engine == 'http':
+            self.http = HttpPortalSession()
+            self._add_log(f"✅ Worker {self.worker_id} HTTP session ready (browserless)")
+        else:
+            self._init_browser()
+    
+    def _close_engine(self):
+        """Stop the configured fetch engine"""
+        if self.engine == 'offline':
+            return
+        if self.engine == 'http':
+            if self.http:
+                self.http.close()
+                self.http = None
+        else:
+            self._close_browser()
+    
+    def _handle_alert(self, timeout: float = 1) -> tuple:
         """
         Handle any JavaScript alert that might be blocking the page.
         Returns (had_alert: bool, alert_text: str, is_portal_issue: bool)
         
         For 100% accuracy, we detect portal issues and retry instead of failing.
+        
+        Args:
+            timeout: Seconds to wait for an alert to appear (0 = check once, used
+                     when WaitStrategy already saw the postback finish)
         """
         try:
             from selenium.webdriver.common.alert import Alert
@@ -2441,25 +6182,21 @@ class SearchWorker:
             from selenium.webdriver.support import expected_conditions as EC
             from selenium.common.exceptions import NoAlertPresentException, TimeoutException
             
+            # Alert the driver already consumed while WaitStrategy was polling
+            missed_alert = WaitStrategy.pop_missed_alert(self.driver)
+            if missed_alert is not None:
+                is_portal_issue = any(phrase in missed_alert.lower() for phrase in Config.PORTAL_ISSUE_PHRASES)
+                self._add_log(f"⚠️ Alert dismissed: {missed_alert[:50]}...")
+                return (True, missed_alert, is_portal_issue)
+            
             # Check if there's an alert (with short timeout)
             try:
-                WebDriverWait(self.driver, 1).until(EC.alert_is_present())
+                WebDriverWait(self.driver, timeout).until(EC.alert_is_present())
                 alert = Alert(self.driver)
                 alert_text = alert.text
                 
                 # Check if this is a portal issue (not our fault)
-                portal_issues = [
-                    'facing some issues',
-                    'try after some time',
-                    'currently facing',
-                    'service unavailable',
-                    'server error',
-                    'technical difficulties',
-                    'please try again',
-                    'contact bhoomi@karnataka.gov.in'
-                ]
-                
-                is_portal_issue = any(phrase in alert_text.lower() for phrase in portal_issues)
+                is_portal_issue = any(phrase in alert_text.lower() for phrase in Config.PORTAL_ISSUE_PHRASES)
                 
                 # Dismiss the alert
                 alert.accept()
@@ -2492,6 +6229,8 @@ class SearchWorker:
             # Try to access the portal
             try:
                 self.driver.get(Config.SERVICE2_URL)
+                if self.navigator:
+                    self.navigator.reset_state()
                 time.sleep(2)
                 
                 # Check for alerts
@@ -2526,20 +6265,15 @@ class SearchWorker:
                     return True  # Still having issues, treat as session issue
             
             if page_source is None:
+                # Ask the browser instead of transferring the whole page
+                expired = DomReader.page_contains_any(self.driver, Config.SESSION_EXPIRED_INDICATORS)
+                if expired is not None:
+                    return expired
                 page_source = self.driver.page_source
             
             # Check for session expiry messages
-            session_expired_indicators = [
-                'session expired',
-                'please login again',
-                'session timeout',
-                'your session has expired',
-                'login again',
-                'session has been terminated',
-            ]
-            
             page_lower = page_source.lower()
-            for indicator in session_expired_indicators:
+            for indicator in Config.SESSION_EXPIRED_INDICATORS:
                 if indicator in page_lower:
                     return True
             
@@ -2561,6 +6295,8 @@ class SearchWorker:
         
         # This will raise an exception if browser is dead
         # Let the caller handle browser restart
+        if self.navigator:
+            self.navigator.reset_state()
         self.driver.delete_all_cookies()
         self.driver.get(Config.SERVICE2_URL)
         time.sleep(Config.SESSION_REFRESH_WAIT)
@@ -2578,167 +6314,399 @@ class SearchWorker:
         Extract owner details from page source.
         
         IMPROVED: Multi-strategy extraction with validation and fuzzy matching.
+        Runs on lxml when installed; the BeautifulSoup extractor is the fallback
+        (see owner_extractor.py).
         """
-        from bs4 import BeautifulSoup
-        import re
+        return OwnerExtractor.extract(page_source, self.logger)
+    
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # SHARED VILLAGE HELPERS - Used by both the browser and the HTTP fetch engines
+    # ═══════════════════════════════════════════════════════════════════════════════
+    
+    def _get_resume_survey(self, village_code: str, village_name: str) -> int:
+        """Return the first survey to process, skipping surveys already checkpointed (within the current range)"""
+        rng = self.current_range
+        start_survey = rng.start if rng else 1
+        if self.db and self.session_id:
+            try:
+                self.db.sync()  # A retried village must see the checkpoints its last attempt queued
+                checkpoint = self.db.get_last_checkpoint(self.session_id, village_code,
+                                                         (rng.start, rng.end) if rng else None)
+                if checkpoint:
+                    start_survey = checkpoint['survey_no'] + 1  # Resume from next survey
+                    self._add_log(f"📍 Resuming {village_name} from survey {start_survey} (checkpoint found)")
+                partial = self.period_checkpoints.load(village_code, (start_survey, rng.end if rng else 2 ** 31))
+                for survey_no, marks in sorted(partial.items()):
+                    self._add_log(f"📍 {village_name} Sy:{survey_no} resumes mid-survey ({marks} parts already done)")
+            except Exception as chkpt_err:
+                self.logger.debug(f"Checkpoint lookup failed: {chkpt_err}")
+        return start_survey
+    
+    def _checkpoint_survey(self, village_code: str, survey_no: int, surnocs: List[str]):
+        """Save the survey-level checkpoint (it replaces the survey's period checkpoints) and renew the lease"""
+        if self.db and self.session_id:
+            try:
+                self.db.save_survey_checkpoint(
+                    session_id=self.session_id,
+                    village_code=village_code,
+                    survey_no=survey_no,
+                    surnocs_processed=surnocs,
+                    durable=False
+                )
+                self.period_checkpoints.finish_survey(village_code, survey_no)
+            except Exception as chkpt_err:
+                self.logger.debug(f"Checkpoint save failed: {chkpt_err}")
+        self._renew_lease(village_code, survey_no)
+    
+    def _record_owners(self, owners: List[dict], location: dict, owner_variants: List[str],
+                       village_code: str = None):
+        """
+        Persist extracted owners (SQLite + CSV) and publish them to the UI state.
+        
+        Args:
+            owners: Output of _extract_owners()
+            location: district, taluk, hobli, village, survey_no, surnoc, hissa, period
+            owner_variants: Owner name variants that count as a match
+            village_code: Given, the period is checkpointed - with its records, in one transaction
+        """
+        owners, keys = self._unsaved_owners(owners, location)
+        records = [asdict(LandRecord(
+            **location,
+            owner_name=owner['owner_name'],
+            extent=owner['extent'],
+            khatah=owner['khatah'],
+            worker_id=self.worker_id
+        )) for owner in owners]
+        matches = [any(v.lower() in owner['owner_name'].lower() for v in owner_variants if v) for owner in owners]
+        period = ((village_code, location['survey_no'], location['surnoc'], location['hissa'], location['period'])
+                  if village_code else None)
+        
+        # SAVE TO PERSISTENT DATABASE (REAL-TIME) - one transaction per period. Counters,
+        # CSVs and the UI follow once it commits, for the records it actually inserted.
+        if records and self.db and self.session_id:
+            pending = self.period_checkpoints.take() if period else []
+            try:
+                written = self.db.save_records_batch(self.session_id, records, matches,
+                                                     periods=pending + [period] if period else None, durable=False)
+            except Exception as db_err:
+                self.period_checkpoints.restore(pending)
+                self._records_written(None, owners, records, matches, keys, location, db_err)
+                return
+            self.period_checkpoints.restore_on_failure(written, pending)
+            if period:
+                self.period_checkpoints.add_when_written(written, *period)
+            written.add_done_callback(
+                lambda f: self._records_written(f.result() if f.exception() is None else None, owners,
+                                                records, matches, keys, location, f.exception()))
+            return
+        
+        if period:
+            self.period_checkpoints.mark(*period)
+        self._records_written([True] * len(records), owners, records, matches, keys, location)
+    
+    def _records_written(self, inserted: Optional[List[bool]], owners: List[dict], records: List[dict],
+                         matches: List[bool], keys: List[tuple], location: dict, error: Exception = None):
+        """
+        Publish the records a save inserted (CSV, counters, UI). On a failed save the
+        owners' keys are forgotten so a retry of the period writes them. Runs on the DB
+        writer thread when the save was queued.
+        """
+        if error is not None:
+            with self.state_lock:
+                self._record_keys.difference_update(keys)
+            self.logger.error(f"DB save failed: {error}")
+            return
+        
+        for owner, record_dict, is_match, new in zip(owners, records, matches, inserted):
+            if not new:
+                continue  # Saved meanwhile by another worker, agent or range
+            
+            # Write to CSV (backup - always succeeds)
+            try:
+                self.all_records_writer.write_record(record_dict)
+            except Exception as csv_err:
+                self.logger.error(f"CSV save failed: {csv_err}")
+            
+            # Add to state for real-time UI display
+            with self.state_lock:
+                self.records_found += 1
+                self.state.all_records.append(record_dict)
+                if len(self.state.all_records) > 500:
+                    self.state.all_records = self.state.all_records[-500:]
+            
+            # FIXED: Sync worker stats to shared state for UI display
+            self._update_status(records_found=self.records_found)
+            
+            if is_match:
+                self.matches_writer.write_record(record_dict)
+                with self.state_lock:
+                    self.matches_found += 1
+                    self.state.matches.append(record_dict)
+                # FIXED: Sync match count too
+                self._update_status(matches_found=self.matches_found)
+                self._add_log(f"🎯 MATCH: {owner['owner_name']} in {location['village']} Sy:{location['survey_no']}")
+    
+    def _unsaved_owners(self, owners: List[dict], location: dict) -> Tuple[List[dict], List[tuple]]:
+        """
+        Drop owners already saved (or being saved) for this period - hissa retries, browser
+        restarts and village retries re-extract periods - so they are not written again.
+        Returns the remaining owners and their natural keys. Keys are loaded from the
+        database when the village changes; the unique natural key in the database decides
+        across workers, and _records_written() only counts what it inserted.
+        """
+        place = tuple(location.get(k) or '' for k in ('district', 'taluk', 'hobli', 'village'))
+        if place != self._record_keys_place:
+            self._record_keys_place = place
+            self._record_keys = set()
+            if self.db and self.session_id:
+                try:
+                    self._record_keys = {tuple(key) for key in self.db.get_record_keys(self.session_id, place)}
+                except Exception as key_err:
+                    self.logger.debug(f"Record key lookup failed: {key_err}")
+        
+        unsaved, keys = [], []
+        with self.state_lock:  # A failed save's callback removes keys from the writer thread
+            for owner in owners:
+                key = (location['survey_no'], location['surnoc'] or '', location['hissa'] or '',
+                       location['period'] or '',
+                       DatabaseManager.owner_hash(owner['owner_name'], owner['extent'], owner['khatah']))
+                if key not in self._record_keys:
+                    self._record_keys.add(key)
+                    unsaved.append(owner)
+                    keys.append(key)
+        return unsaved, keys
+    
+    def _settle_record_writes(self):
+        """Wait for queued record saves, so the counters include every record they inserted"""
+        if self.db and self.session_id:
+            try:
+                self.db.sync()
+            except Exception as sync_err:
+                self.logger.debug(f"Record write sync failed: {sync_err}")
+    
+    def _record_skip(self, skipped_in_village: List[dict], village_name: str, village_code: str,
+                     survey_no: int, reason: str, surnoc: str = '', hissa: str = '', period: str = ''):
+        """Track a skipped item in the village list, the UI state and the database"""
+        skip_record = {
+            'village': village_name,
+            'village_code': village_code,
+            'survey_no': survey_no,
+            'surnoc': surnoc,
+            'hissa': hissa,
+            'period': period,
+            'reason': reason,
+            'timestamp': datetime.now().isoformat()
+        }
+        skipped_in_village.append(skip_record)
+        with self.state_lock:
+            self.state.skipped_surveys.append(skip_record)
+        if self.db and self.session_id:
+            try:
+                self.db.save_skipped_item(
+                    session_id=self.session_id,
+                    village_name=village_name,
+                    survey_no=survey_no,
+                    surnoc=surnoc,
+                    hissa=hissa,
+                    period=period,
+                    error=reason,
+                    durable=False
+                )
+            except Exception:
+                pass
+    
+    def _check_smart_stop(self, village_name: str, survey_no: int, max_survey: int, surveys_checked: int,
+                          empty_count: int, last_survey_with_data: int) -> bool:
+        """Return True (and record the saved surveys) once enough consecutive surveys were empty"""
+        if not (Config.SMART_STOP_ENABLED and
+                surveys_checked >= Config.MIN_SURVEYS_BEFORE_STOP and
+                empty_count >= Config.EMPTY_SURVEY_THRESHOLD):
+            return False
+        surveys_saved = max_survey - survey_no
+        self._stop_higher_ranges(survey_no)
+        self._add_log(f"🏁 SMART STOP: {village_name} after {empty_count} consecutive empty surveys (last data at {last_survey_with_data})")
+        with self.state_lock:
+            self.state.smart_stops += 1
+            self.state.surveys_saved += surveys_saved
+        return True
+    
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # SURVEY RANGES - The engines walk self.current_range, not always the whole village
+    # ═══════════════════════════════════════════════════════════════════════════════
+    
+    def _in_range(self, survey_no: int, max_survey: int) -> bool:
+        """Loop condition of the survey walk - range end, or a smart stop in a lower range"""
+        rng = self.current_range
+        if rng is None:
+            return survey_no <= max_survey
+        if rng.plan.cancelled(survey_no):
+            self._add_log(f"✂️ {rng.plan.village[1]}: surveys {survey_no}-{rng.end} dropped "
+                          f"(smart stop at {rng.plan.stop_at})")
+            rng.position = rng.end
+            return False
+        if survey_no > rng.end:
+            return False
+        rng.position = survey_no
+        return True
+    
+    def _range_end(self, max_survey: int) -> int:
+        return self.current_range.end if self.current_range else max_survey
+    
+    def _stop_higher_ranges(self, survey_no: int):
+        """Smart stop signal - ranges above survey_no (other workers) stop at their next survey"""
+        if self.current_range is not None:
+            self.current_range.plan.stop(survey_no)
+    
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # RTC RESULT CACHE - Surveys crawled by earlier sessions are replayed, not re-fetched
+    # ═══════════════════════════════════════════════════════════════════════════════
+    
+    def _rtc_cache_key(self, hobli_code: str, village_code: str) -> tuple:
+        return (normalize_code(self.params.get('district_code', '')), normalize_code(self.params.get('taluk_code', '')),
+                normalize_code(hobli_code), normalize_code(village_code))
+    
+    def _get_cached_survey(self, hobli_code: str, village_code: str, survey_no: int) -> Optional[List[dict]]:
+        """Fresh cached fetch results for a survey (see DatabaseManager.get_cached_survey), None on a miss"""
+        if not (Config.ENABLE_RTC_CACHE and self.db):
+            return None
+        try:
+            return self.db.get_cached_survey(self._rtc_cache_key(hobli_code, village_code),
+                                             survey_no, Config.RTC_CACHE_TTL)
+        except Exception as cache_err:
+            self.logger.debug(f"RTC cache lookup failed: {cache_err}")
+            return None
+    
+    def _save_cached_survey(self, hobli_code: str, village_code: str, survey_no: int,
+                            entries: Optional[List[dict]], skipped_in_village: List[dict]):
+        """
+        Cache a crawled survey. Surveys with any skipped part (or entries=None)
+        are left out so a replay is never missing a period.
+        """
+        if not (Config.ENABLE_RTC_CACHE and self.db) or entries is None:
+            return
+        if any(skip.get('survey_no') == survey_no for skip in skipped_in_village):
+            return
+        try:
+            self.db.save_cached_survey(self._rtc_cache_key(hobli_code, village_code), survey_no, entries, durable=False)
+        except Exception as cache_err:
+            self.logger.debug(f"RTC cache save failed: {cache_err}")
+    
+    def _replay_cached_survey(self, entries: List[dict], hobli_name: str, village_code: str,
+                              village_name: str, survey_no: int, owner_variants: List[str]):
+        """Record a cached survey exactly as if its periods had just been fetched"""
+        for entry in entries:
+            if self.period_checkpoints.is_done(village_code, survey_no, entry['surnoc'], entry['hissa'], entry['period']):
+                continue  # Saved before an interruption
+            self._record_owners(entry['owners'], {
+                'district': self.params.get('district_name', 'Unknown'),
+                'taluk': self.params.get('taluk_name', 'Unknown'),
+                'hobli': hobli_name,
+                'village': village_name,
+                'survey_no': survey_no,
+                'surnoc': entry['surnoc'],
+                'hissa': entry['hissa'],
+                'period': entry['period'],
+            }, owner_variants, village_code)
+            with self.state_lock:
+                self.state.total_periods_processed += 1
+        with self.state_lock:
+            self.state.surveys_from_cache += 1
+        self._update_global_stats()
+        
+        if entries:
+            self._checkpoint_survey(village_code, survey_no, list(dict.fromkeys(e['surnoc'] for e in entries)))
+        else:
+            self._renew_lease(village_code, survey_no)
+    
+    def _finish_village(self, village_code: str, village_name: str, surveys_checked: int,
+                        surveys_with_data: int, last_survey_with_data: int, stopped_at_survey: int,
+                        skipped_in_village: List[dict], completion_reason: str, max_survey: int,
+                        survey_range: SurveyRange = None):
+        """
+        Report a finished survey range. The last range of the village publishes the
+        combined stats (a village that was never split is a single range).
+        """
+        if survey_range is None:
+            survey_range = VillageSurveyPlan((village_code, village_name, '', ''), max_survey,
+                                             self.worker_id).add_range(1, max_survey, self.worker_id)
+        self._settle_record_writes()
+        combined = survey_range.plan.add_result(survey_range, {
+            'surveys_checked': surveys_checked,
+            'surveys_with_data': surveys_with_data,
+            'last_survey_with_data': last_survey_with_data,
+            'stopped_at_survey': stopped_at_survey,
+            'skipped_in_village': skipped_in_village,
+            'completion_reason': completion_reason,
+            'records': self.records_found - survey_range.records_at_start,
+            'matches': self.matches_found - survey_range.matches_at_start,
+        })
+        if combined is None:
+            self._add_log(f"✅ {village_name} surveys {survey_range.start}-{survey_range.end} done "
+                          f"({surveys_checked} checked) - other ranges still running")
+            return
+        self._publish_village(village_code, village_name, combined, max_survey)
+    
+    def _publish_village(self, village_code: str, village_name: str, combined: dict, max_survey: int):
+        """Compute the confidence score and publish per-village completion stats"""
+        surveys_checked = combined['surveys_checked']
+        surveys_with_data = combined['surveys_with_data']
+        last_survey_with_data = combined['last_survey_with_data']
+        stopped_at_survey = combined['stopped_at_survey']
+        skipped_in_village = combined['skipped_in_village']
+        completion_reason = combined['completion_reason']
+        
+        # ═══════════════════════════════════════════════════════════════════════════════
+        # VILLAGE COMPLETION STATS - Comprehensive tracking for user confidence
+        # ═══════════════════════════════════════════════════════════════════════════════
+        
+        # Calculate confidence score
+        confidence_score = self._calculate_village_confidence(
+            surveys_checked=surveys_checked,
+            surveys_with_data=surveys_with_data,
+            last_survey_with_data=last_survey_with_data,
+            stopped_at_survey=stopped_at_survey,
+            skipped_count=len(skipped_in_village),
+            completion_reason=completion_reason,
+            max_survey=max_survey
+        )
+        
+        # Build village stats
+        village_completion = {
+            'village_name': village_name,
+            'village_code': village_code,
+            'surveys_checked': surveys_checked,
+            'surveys_with_data': surveys_with_data,
+            'records_found': combined['records'],
+            'matches_found': combined['matches'],
+            'survey_ranges': combined['ranges'],
+            'last_survey_with_data': last_survey_with_data,
+            'stopped_at_survey': stopped_at_survey,
+            'completion_reason': completion_reason,
+            'skipped_count': len(skipped_in_village),
+            'skipped_surveys': skipped_in_village[-10:] if skipped_in_village else [],  # Last 10
+            'confidence_score': confidence_score,
+            'confidence_level': 'HIGH' if confidence_score >= 80 else ('MEDIUM' if confidence_score >= 50 else 'LOW'),
+            'time_saved_surveys': max_survey - stopped_at_survey if completion_reason == 'smart_stop' else 0,
+            'timestamp': datetime.now().isoformat()
+        }
         
-        owners = []
-        try:
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            # CRITICAL FIX: Exclude form elements and dropdowns
-            # Remove all select dropdowns, form elements, and navigation before parsing
-            for unwanted in soup.find_all(['select', 'nav', 'header', 'footer', 'button', 'input', 'script', 'style']):
-                unwanted.decompose()
-            
-            # ═══════════════════════════════════════════════════════════════════════
-            # STRATEGY 1: Look for the RESULTS table by structural patterns
-            # ═══════════════════════════════════════════════════════════════════════
-            results_table = None
-            
-            # Keywords that indicate actual results vs form elements
-            RESULT_KEYWORDS = ['Owner', 'ಮಾಲೀಕರ', 'Extent', 'ವಿಸ್ತೀರ್ಣ', 'Khata', 'ಖಾತಾ', 'Name', 'ಹೆಸರು']
-            FORM_KEYWORDS = [
-                'Select District', 'Select Taluk', 'Select Hobli', 'Select Village',
-                'Select Survey', 'Select Surnoc', 'Select Hissa', 'Select Period',
-                'Toggle navigation', 'ಜಿಲ್ಲೆ ಆಯ್ಕೆಮಾಡಿ', 'ತಾಲ್ಲೂಕು ಆಯ್ಕೆಮಾಡಿ'
-            ]
-            SKIP_PATTERNS = re.compile(r'^(Sl\.?\s*No\.?|ಕ್ರಮ|ಸಂ|#|\d{1,3})$', re.IGNORECASE)
-            
-            for table in soup.find_all('table'):
-                table_text = table.get_text()
-                table_html = str(table).lower()
-                
-                # Score this table
-                score = 0
-                
-                # Positive: has result keywords
-                for kw in RESULT_KEYWORDS:
-                    if kw in table_text:
-                        score += 10
-                
-                # Negative: has form keywords
-                for kw in FORM_KEYWORDS:
-                    if kw in table_text:
-                        score -= 50
-                
-                # Negative: has select tags
-                if '<select' in table_html:
-                    score -= 100
-                
-                # Positive: has reasonable rows
-                num_rows = len(table.find_all('tr'))
-                if 2 <= num_rows <= 100:
-                    score += 5
-                
-                # Positive: has numeric cells (extent data)
-                if re.search(r'\d+[\.\-]\d+[\.\-]\d+', table_text):
-                    score += 15
-                
-                if score > 0 and (results_table is None or score > getattr(results_table, '_score', 0)):
-                    results_table = table
-                    results_table._score = score
-            
-            if not results_table:
-                # ═══════════════════════════════════════════════════════════════════════
-                # STRATEGY 2: Try to find owner data in divs with specific classes
-                # ═══════════════════════════════════════════════════════════════════════
-                for div in soup.find_all('div', class_=re.compile(r'result|data|owner|record', re.I)):
-                    div_text = div.get_text(strip=True)
-                    if len(div_text) > 50 and not any(kw in div_text for kw in FORM_KEYWORDS):
-                        # Try to parse owner info from this div
-                        name_match = re.search(r'(?:Owner|Name|ಮಾಲೀಕ)[:\s]*([^\n,]+)', div_text)
-                        extent_match = re.search(r'(?:Extent|ವಿಸ್ತೀರ್ಣ)[:\s]*(\d+[\.\-]\d+[\.\-]\d+)', div_text)
-                        if name_match:
-                            owners.append({
-                                'owner_name': name_match.group(1).strip(),
-                                'extent': extent_match.group(1) if extent_match else '',
-                                'khatah': ''
-                            })
-                
-                if not owners:
-                    self.logger.debug(f"No valid results table or div found in page")
-                    return owners
-            
-            if results_table:
-                # Extract from the validated results table only
-                rows = results_table.find_all('tr')
-                header_idx = {}  # Track column indices for better extraction
-                
-                for row_idx, row in enumerate(rows):
-                    cells = row.find_all(['td', 'th'])
-                    if len(cells) >= 2:
-                        cell_texts = [c.get_text(strip=True) for c in cells]
-                        row_text = ' '.join(cell_texts)
-                        
-                        # Detect header row and build column map
-                        if row_idx == 0 or any(h.lower() in row_text.lower() for h in ['owner', 'extent', 'slno', 'name']):
-                            for i, txt in enumerate(cell_texts):
-                                txt_lower = txt.lower()
-                                if 'owner' in txt_lower or 'name' in txt_lower or 'ಮಾಲೀಕ' in txt or 'ಹೆಸರು' in txt:
-                                    header_idx['owner'] = i
-                                elif 'extent' in txt_lower or 'ವಿಸ್ತೀರ್ಣ' in txt:
-                                    header_idx['extent'] = i
-                                elif 'khata' in txt_lower or 'ಖಾತಾ' in txt:
-                                    header_idx['khatah'] = i
-                            continue  # Skip header row
-                        
-                        # Skip rows that look like form elements
-                        is_form_row = any(pattern in row_text for pattern in FORM_KEYWORDS)
-                        is_district_list = re.search(r'[A-Z]{5,}[A-Z]{5,}', row_text.replace(' ', ''))
-                        
-                        if is_form_row or is_district_list:
-                            continue
-                        
-                        # Skip serial number only rows
-                        if SKIP_PATTERNS.match(cell_texts[0]):
-                            cell_texts = cell_texts[1:]  # Shift left, skip serial number
-                            if not cell_texts:
-                                continue
-                        
-                        # Extract owner data using column indices or positional fallback
-                        owner_idx = header_idx.get('owner', 0)
-                        extent_idx = header_idx.get('extent', 1)
-                        khatah_idx = header_idx.get('khatah', 2)
-                        
-                        owner_name = cell_texts[owner_idx] if owner_idx < len(cell_texts) else ''
-                        extent = cell_texts[extent_idx] if extent_idx < len(cell_texts) else ''
-                        khatah = cell_texts[khatah_idx] if khatah_idx < len(cell_texts) else ''
-                        
-                        # Validate owner name
-                        if not owner_name or len(owner_name) < 2:
-                            continue
-                        if owner_name.isdigit():
-                            continue
-                        if any(skip in owner_name for skip in ['Select', 'ಆಯ್ಕೆ', 'Toggle']):
-                            continue
-                        
-                        owner_entry = {
-                            'owner_name': owner_name,
-                            'extent': extent,
-                            'khatah': khatah,
-                        }
-                        
-                        # Avoid duplicates
-                        if owner_entry not in owners:
-                            owners.append(owner_entry)
-            
-            # Log extraction result for debugging
-            if not owners:
-                self.logger.debug(f"No owners extracted from page")
-                
-        except Exception as e:
-            self.logger.error(f"Extract error: {e}")
+        # Store village stats
+        with self.state_lock:
+            self.state.village_stats[village_code] = village_completion
+        if completion_reason != 'error':
+            self._complete_village(village_code, combined['records'], combined['matches'])
         
-        return owners
+        # End of village summary with confidence
+        confidence_emoji = '🟢' if confidence_score >= 80 else ('🟡' if confidence_score >= 50 else '🔴')
+        split_note = f" across {combined['ranges']} ranges" if combined['ranges'] > 1 else ''
+        self._add_log(f"✅ {village_name} COMPLETE: {surveys_checked} surveys, {surveys_with_data} with data, {combined['records']} records{split_note}")
+        self._add_log(f"   {confidence_emoji} Confidence: {confidence_score}% ({village_completion['confidence_level']})")
     
     def _search_village(self, village_code: str, village_name: str, hobli_code: str, hobli_name: str):
         """
         Search a single village for all survey numbers.
         NOW WITH SESSION EXPIRATION DETECTION AND RECOVERY!
         """
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import Select
         from selenium.webdriver.support.ui import WebDriverWait
         from selenium.webdriver.support import expected_conditions as EC
         from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
@@ -2778,21 +6746,13 @@ class SearchWorker:
         # ═══════════════════════════════════════════════════════════════════════
         # CHECK FOR RESUME CHECKPOINT - Skip already completed surveys
         # ═══════════════════════════════════════════════════════════════════════
-        start_survey = 1
-        if self.db and self.session_id:
-            try:
-                checkpoint = self.db.get_last_checkpoint(self.session_id, village_code)
-                if checkpoint:
-                    start_survey = checkpoint['survey_no'] + 1  # Resume from next survey
-                    self._add_log(f"📍 Resuming {village_name} from survey {start_survey} (checkpoint found)")
-            except Exception as chkpt_err:
-                self.logger.debug(f"Checkpoint lookup failed: {chkpt_err}")
+        start_survey = self._get_resume_survey(village_code, village_name)
 
-        self._add_log(f"🏘️ Starting {village_name}: Surveys {start_survey} to {max_survey}")
+        self._add_log(f"🏘️ Starting {village_name}: Surveys {start_survey} to {self._range_end(max_survey)}")
         
         # SEQUENTIAL SURVEY ITERATION: 1, 2, 3... NO SKIPPING
         survey_no = start_survey
-        while survey_no <= max_survey:
+        while self._in_range(survey_no, max_survey):
             if not self.state.running:
                 self._add_log(f"⏹️ Stopped at survey {survey_no}/{max_survey}")
                 return
@@ -2804,15 +6764,42 @@ class SearchWorker:
             if survey_no == 1 or survey_no % 10 == 0:
                 self._add_log(f"📍 {village_name}: Survey {survey_no}/{max_survey} (found {surveys_with_data})")
             
+            # RTC CACHE - A recent crawl of this survey is replayed without touching the portal
+            cached = self._get_cached_survey(hobli_code, village_code, survey_no)
+            if cached is not None:
+                self._replay_cached_survey(cached, hobli_name, village_code, village_name, survey_no, owner_variants)
+                if cached:
+                    empty_count = 0
+                    surveys_with_data += 1
+                    last_survey_with_data = survey_no
+                else:
+                    empty_count += 1
+                    if self._check_smart_stop(village_name, survey_no, max_survey, surveys_checked,
+                                              empty_count, last_survey_with_data):
+                        completion_reason = 'smart_stop'
+                        break
+                survey_no += 1
+                continue
+            
+            # ADAPTIVE CONCURRENCY - Park while the AIMD controller allows fewer busy workers
+            if not self._wait_for_slot():
+                self._add_log(f"⏹️ Stopped at survey {survey_no}/{max_survey}")
+                return
+            
             try:
-                # Navigate to portal
-                self.driver.get(Config.SERVICE2_URL)
-                time.sleep(Config.POST_SELECT_WAIT)
+                # ═══════════════════════════════════════════════════════════════════════
+                # SMART NAVIGATION - Full page load only when the form state is unknown
+                # (first survey, session refresh, browser restart). Consecutive surveys
+                # in the same village just rewrite the survey box and click GO.
+                # ═══════════════════════════════════════════════════════════════════════
+                portal_loaded = self.navigator.needs_reload()
+                if portal_loaded:
+                    self.navigator.load_portal()
                 
                 # ═══════════════════════════════════════════════════════════════════════
                 # SESSION EXPIRATION CHECK #1 - After loading portal
                 # ═══════════════════════════════════════════════════════════════════════
-                if self._is_session_expired():
+                if portal_loaded and self._is_session_expired():
                     self._add_log(f"⚠️ Session expired at {village_name} survey {survey_no}")
                     if session_retries < Config.MAX_SESSION_RETRIES:
                         session_retries += 1
@@ -2833,29 +6820,14 @@ class SearchWorker:
                 # Reset session retries on successful page load
                 session_retries = 0
                 
-                # Select location (fast sequence)
-                Select(self.driver.find_element(By.ID, IDS['district'])).select_by_value(self.params['district_code'])
-                time.sleep(Config.POST_SELECT_WAIT)
-                
-                Select(self.driver.find_element(By.ID, IDS['taluk'])).select_by_value(self.params['taluk_code'])
-                time.sleep(Config.POST_SELECT_WAIT)
-                
-                Select(self.driver.find_element(By.ID, IDS['hobli'])).select_by_value(hobli_code)
-                time.sleep(Config.POST_SELECT_WAIT)
-                
-                Select(self.driver.find_element(By.ID, IDS['village'])).select_by_value(village_code)
-                time.sleep(Config.POST_SELECT_WAIT)
-                
-                # Enter survey number
-                survey_input = self.driver.find_element(By.ID, IDS['survey_no'])
-                survey_input.clear()
-                survey_input.send_keys(str(survey_no))
+                # Select location - only dropdowns that changed are re-posted
+                self.navigator.ensure_location(
+                    self.params['district_code'], self.params['taluk_code'], hobli_code, village_code
+                )
                 
-                # Click GO using JavaScript (rate limited to prevent portal overload)
-                _global_rate_limiter.acquire()
-                go_btn = self.driver.find_element(By.ID, IDS['go_btn'])
-                self.driver.execute_script("arguments[0].click();", go_btn)
-                time.sleep(Config.POST_CLICK_WAIT)
+                # Enter survey number and click GO (rate limited to prevent portal overload)
+                _global_rate_limiter.acquire('go')
+                go_completed = self.navigator.submit_survey(survey_no)
                 
                 # ═══════════════════════════════════════════════════════════════════════
                 # ROBUST PORTAL ISSUE HANDLING - Prevents false positive skips
@@ -2867,11 +6839,13 @@ class SearchWorker:
                 # ═══════════════════════════════════════════════════════════════════════
                 
                 # First, handle any portal alerts (e.g., "facing issues" messages)
-                had_alert, alert_text, is_portal_issue = self._handle_alert()
+                # Postback already finished - any alert is open by now, no need to wait for one
+                had_alert, alert_text, is_portal_issue = self._handle_alert(timeout=0 if go_completed else 1)
                 
                 if is_portal_issue:
                     portal_retries += 1
                     consecutive_errors += 1
+                    self.navigator.reset_state()  # Page state unknown after portal error
                     
                     # ═══════════════════════════════════════════════════════════════════════
                     # CONSECUTIVE ERROR BROWSER RESTART - Browser might be unhealthy
@@ -2983,8 +6957,7 @@ class SearchWorker:
                 consecutive_errors = 0
                 portal_health.report_success(self.worker_id)
                 
-                page_source = self.driver.page_source
-                if self._is_session_expired(page_source):
+                if self._is_session_expired():
                     self._add_log(f"⚠️ Session expired after GO click - {village_name} survey {survey_no}")
                     if session_retries < Config.MAX_SESSION_RETRIES:
                         session_retries += 1
@@ -2994,11 +6967,11 @@ class SearchWorker:
                         raise Exception(f"Persistent session expiry for {village_name}")
                 
                 # Check if surnoc populated
-                surnoc_sel = Select(self.driver.find_element(By.ID, IDS['surnoc']))
-                surnoc_opts = [o.text for o in surnoc_sel.options if "Select" not in o.text]
+                surnoc_opts = DomReader.option_texts(self.driver, IDS['surnoc'])
                 
                 if not surnoc_opts:
                     # This is a genuinely empty survey (not session expired)
+                    self._save_cached_survey(hobli_code, village_code, survey_no, [], skipped_in_village)
                     empty_count += 1
                     
                     # ═══════════════════════════════════════════════════════════════════════
@@ -3011,6 +6984,7 @@ class SearchWorker:
                         
                         completion_reason = 'smart_stop'
                         surveys_saved = max_survey - survey_no
+                        self._stop_higher_ranges(survey_no)
                         
                         self._add_log(f"🏁 SMART STOP: {village_name}")
                         self._add_log(f"   └─ Reason: {empty_count} consecutive empty surveys")
@@ -3034,42 +7008,49 @@ class SearchWorker:
                 portal_retries = 0  # Reset portal retry counter on success
                 surveys_with_data += 1
                 last_survey_with_data = survey_no  # Track last successful survey
+                checkpoints = self.period_checkpoints
+                # Fetched periods, cached once the whole survey is done (never for a resumed survey)
+                survey_results = None if checkpoints.resumed(village_code, survey_no) else []
                 
                 # Process each surnoc
                 for surnoc in surnoc_opts:
                     if not self.state.running:
                         return
+                    if checkpoints.is_done(village_code, survey_no, surnoc):
+                        continue  # Finished before an interruption
                     
                     try:
-                        surnoc_sel = Select(self.driver.find_element(By.ID, IDS['surnoc']))
-                        surnoc_sel.select_by_visible_text(surnoc)
-                        time.sleep(Config.POST_SELECT_WAIT + 1)
+                        WaitStrategy.select_and_wait(
+                            self.driver, IDS['surnoc'], 'surnoc_postback',
+                            dependent_id=IDS['hissa'], text=surnoc
+                        )
                         
                         # Get hissa options
-                        hissa_sel = Select(self.driver.find_element(By.ID, IDS['hissa']))
-                        hissa_opts = [o.text for o in hissa_sel.options if "Select" not in o.text]
+                        hissa_opts = DomReader.option_texts(self.driver, IDS['hissa'])
                         
                         # Process each hissa
                         for hissa in hissa_opts:
                             if not self.state.running:
                                 return
+                            if checkpoints.is_done(village_code, survey_no, surnoc, hissa):
+                                continue
                             
                             hissa_retry_count = 0
                             max_hissa_retries = 2
                             
                             while hissa_retry_count <= max_hissa_retries:
                                 try:
-                                    hissa_sel = Select(self.driver.find_element(By.ID, IDS['hissa']))
-                                    hissa_sel.select_by_visible_text(hissa)
-                                    time.sleep(Config.POST_SELECT_WAIT)
+                                    WaitStrategy.select_and_wait(
+                                        self.driver, IDS['hissa'], 'hissa_postback',
+                                        dependent_id=IDS['period'], text=hissa
+                                    )
                                     
                                     # ═══════════════════════════════════════════════════════════════════════
                                     # PERIOD PROCESSING: Respects PROCESS_ALL_PERIODS config
                                     # If True: Process ALL periods for 100% accuracy
                                     # If False: Process only the latest available period for speed
                                     # ═══════════════════════════════════════════════════════════════════════
-                                    period_sel = Select(self.driver.find_element(By.ID, IDS['period']))
-                                    period_opts = [o.text for o in period_sel.options if "Select" not in o.text]
+                                    period_opts = DomReader.option_texts(self.driver, IDS['period'])
                                     
                                     if not period_opts:
                                         self._add_log(f"⚠️ No periods for Sy:{survey_no} H:{hissa}")
@@ -3096,7 +7077,8 @@ class SearchWorker:
                                                     surnoc=surnoc,
                                                     hissa=hissa,
                                                     period='',
-                                                    error='No periods available in dropdown'
+                                                    error='No periods available in dropdown',
+                                                    durable=False
                                                 )
                                             except Exception:
                                                 pass
@@ -3116,11 +7098,17 @@ class SearchWorker:
                                             return
                                         
                                         period = period_opts[period_idx]
+                                        if checkpoints.is_done(village_code, survey_no, surnoc, hissa, period):
+                                            period_selected = True
+                                            if not Config.PROCESS_ALL_PERIODS:
+                                                break
+                                            continue
                                         
                                         try:
-                                            period_sel = Select(self.driver.find_element(By.ID, IDS['period']))
-                                            period_sel.select_by_visible_text(period)
-                                            time.sleep(1)
+                                            WaitStrategy.select_and_wait(
+                                                self.driver, IDS['period'], 'period_postback',
+                                                dependent_id=IDS['fetch_btn'], text=period
+                                            )
                                             
                                             # ═══════════════════════════════════════════════════════════════════════
                                             # ROBUST FETCH WITH RETRY - This is where most RTC errors occur!
@@ -3132,13 +7120,15 @@ class SearchWorker:
                                             
                                             while not fetch_success and fetch_retries < max_fetch_retries:
                                                 # Click Fetch Details with verification (rate limited)
-                                                _global_rate_limiter.acquire()
-                                                fetch_btn = self.driver.find_element(By.ID, IDS['fetch_btn'])
-                                                self.driver.execute_script("arguments[0].click();", fetch_btn)
-                                                time.sleep(Config.POST_CLICK_WAIT)
+                                                _global_rate_limiter.acquire('fetch')
+                                                fetch_completed = WaitStrategy.click_and_wait(
+                                                    self.driver, IDS['fetch_btn'], 'fetch_postback'
+                                                )
                                                 
                                                 # Handle any portal alerts after Fetch
-                                                had_alert, alert_text, is_portal_issue = self._handle_alert()
+                                                had_alert, alert_text, is_portal_issue = self._handle_alert(
+                                                    timeout=0 if fetch_completed else 1
+                                                )
                                                 
                                                 if is_portal_issue:
                                                     fetch_retries += 1
@@ -3158,9 +7148,10 @@ class SearchWorker:
                                                         if fetch_retries == 2:
                                                             try:
                                                                 # Re-select the period to reset state
-                                                                period_sel = Select(self.driver.find_element(By.ID, IDS['period']))
-                                                                period_sel.select_by_visible_text(period)
-                                                                time.sleep(1)
+                                                                WaitStrategy.select_and_wait(
+                                                                    self.driver, IDS['period'], 'period_postback',
+                                                                    dependent_id=IDS['fetch_btn'], text=period
+                                                                )
                                                             except Exception:
                                                                 pass
                                                         
@@ -3195,7 +7186,8 @@ class SearchWorker:
                                                                     surnoc=surnoc,
                                                                     hissa=hissa,
                                                                     period=period,
-                                                                    error=f'FETCH failed after {max_fetch_retries} retries'
+                                                                    error=f'FETCH failed after {max_fetch_retries} retries',
+                                                                    durable=False
                                                                 )
                                                             except Exception:
                                                                 pass
@@ -3208,9 +7200,16 @@ class SearchWorker:
                                             if not fetch_success:
                                                 continue  # Try next period
                                             
-                                            # Verify page loaded (look for owner table)
-                                            page_source = self.driver.page_source
-                                            if 'Session expired' in page_source or 'login again' in page_source.lower():
+                                            # Verify page loaded (look for owner table) - only the
+                                            # results fragment crosses the wire; full page is the fallback
+                                            fragment = DomReader.results_fragment(self.driver)
+                                            if fragment is not None:
+                                                page_source = fragment['html']
+                                                session_expired = fragment['session_expired']
+                                            else:
+                                                page_source = self.driver.page_source
+                                                session_expired = 'Session expired' in page_source or 'login again' in page_source.lower()
+                                            if session_expired:
                                                 raise Exception("Session expired during fetch")
                                             
                                             # Successfully selected period - log it
@@ -3219,61 +7218,20 @@ class SearchWorker:
                                             
                                             # Extract owners
                                             owners = self._extract_owners(page_source)
+                                            if survey_results is not None:
+                                                survey_results.append({'surnoc': surnoc, 'hissa': hissa,
+                                                                       'period': period, 'owners': owners})
                                             
-                                            for owner in owners:
-                                                record = LandRecord(
-                                                    district=district_name,
-                                                    taluk=taluk_name,
-                                                    hobli=hobli_name,
-                                                    village=village_name,
-                                                    survey_no=survey_no,
-                                                    surnoc=surnoc,
-                                                    hissa=hissa,
-                                                    period=period,
-                                                    owner_name=owner['owner_name'],
-                                                    extent=owner['extent'],
-                                                    khatah=owner['khatah'],
-                                                    worker_id=self.worker_id
-                                                )
-                                                
-                                                record_dict = asdict(record)
-                                                
-                                                # Check for match
-                                                is_match = any(v.lower() in owner['owner_name'].lower() for v in owner_variants if v)
-                                                
-                                                # SAVE TO PERSISTENT DATABASE (REAL-TIME)
-                                                try:
-                                                    if self.db and self.session_id:
-                                                        self.db.save_record(self.session_id, record_dict, is_match=is_match)
-                                                except Exception as db_err:
-                                                    self.logger.error(f"DB save failed: {db_err}")
-                                                    # Continue even if DB fails - CSV is backup
-                                                
-                                                # Write to CSV (backup - always succeeds)
-                                                try:
-                                                    self.all_records_writer.write_record(record_dict)
-                                                except Exception as csv_err:
-                                                    self.logger.error(f"CSV save failed: {csv_err}")
-                                                
-                                                self.records_found += 1
-                                                
-                                                # FIXED: Sync worker stats to shared state for UI display
-                                                self._update_status(records_found=self.records_found)
-                                                
-                                                # Add to state for real-time UI display
-                                                with self.state_lock:
-                                                    self.state.all_records.append(record_dict)
-                                                    if len(self.state.all_records) > 500:
-                                                        self.state.all_records = self.state.all_records[-500:]
-                                                
-                                                if is_match:
-                                                    self.matches_writer.write_record(record_dict)
-                                                    self.matches_found += 1
-                                                    # FIXED: Sync match count too
-                                                    self._update_status(matches_found=self.matches_found)
-                                                    with self.state_lock:
-                                                        self.state.matches.append(record_dict)
-                                                    self._add_log(f"🎯 MATCH: {owner['owner_name']} in {village_name} Sy:{survey_no}")
+                                            self._record_owners(owners, {
+                                                'district': district_name,
+                                                'taluk': taluk_name,
+                                                'hobli': hobli_name,
+                                                'village': village_name,
+                                                'survey_no': survey_no,
+                                                'surnoc': surnoc,
+                                                'hissa': hissa,
+                                                'period': period,
+                                            }, owner_variants, village_code)
                                             
                                             # Successfully processed this period
                                             period_selected = True
@@ -3306,6 +7264,7 @@ class SearchWorker:
                                         
                                         except Exception as period_error:
                                             # This period had an error, try the next one
+                                            survey_results = None  # Incomplete survey - don't cache it
                                             if Config.PROCESS_ALL_PERIODS:
                                                 # When processing all periods, log each error but continue
                                                 self.logger.debug(f"Period {period} error: {str(period_error)[:40]}")
@@ -3321,6 +7280,12 @@ class SearchWorker:
                                     if not period_selected:
                                         # No period could be selected - log and continue
                                         self._add_log(f"⚠️ No available period for Sy:{survey_no} H:{hissa}")
+                                        survey_results = None
+                                    elif Config.PROCESS_ALL_PERIODS:
+                                        checkpoints.mark_if_complete(village_code, survey_no, surnoc, hissa,
+                                                                     period_opts[:max_period_attempts])
+                                    else:
+                                        checkpoints.mark(village_code, survey_no, surnoc, hissa)
                                     
                                     # Update stats after processing all periods for this hissa
                                     self._update_status(
@@ -3340,22 +7305,15 @@ class SearchWorker:
                                         self._add_log(f"🔄 Retry {hissa_retry_count}/{max_hissa_retries} for Hissa {hissa}: {error_msg}")
                                         # Reload page for retry
                                         try:
-                                            self.driver.get(Config.SERVICE2_URL)
-                                            time.sleep(Config.POST_SELECT_WAIT)
-                                            Select(self.driver.find_element(By.ID, IDS['district'])).select_by_value(self.params['district_code'])
-                                            time.sleep(Config.POST_SELECT_WAIT)
-                                            Select(self.driver.find_element(By.ID, IDS['taluk'])).select_by_value(self.params['taluk_code'])
-                                            time.sleep(Config.POST_SELECT_WAIT)
-                                            Select(self.driver.find_element(By.ID, IDS['hobli'])).select_by_value(hobli_code)
-                                            time.sleep(Config.POST_SELECT_WAIT)
-                                            Select(self.driver.find_element(By.ID, IDS['village'])).select_by_value(village_code)
-                                            time.sleep(Config.POST_SELECT_WAIT)
-                                            self.driver.find_element(By.ID, IDS['survey_no']).send_keys(str(survey_no))
-                                            go_btn = self.driver.find_element(By.ID, IDS['go_btn'])
-                                            self.driver.execute_script("arguments[0].click();", go_btn)
-                                            time.sleep(Config.POST_CLICK_WAIT)
-                                            Select(self.driver.find_element(By.ID, IDS['surnoc'])).select_by_visible_text(surnoc)
-                                            time.sleep(Config.POST_SELECT_WAIT)
+                                            self.navigator.load_portal()
+                                            self.navigator.ensure_location(
+                                                self.params['district_code'], self.params['taluk_code'], hobli_code, village_code
+                                            )
+                                            self.navigator.submit_survey(survey_no)
+                                            WaitStrategy.select_and_wait(
+                                                self.driver, IDS['surnoc'], 'surnoc_postback',
+                                                dependent_id=IDS['hissa'], text=surnoc
+                                            )
                                         except (NoSuchElementException, StaleElementReferenceException, TimeoutException) as retry_err:
                                             self.logger.debug(f"Retry setup failed: {retry_err}")
                                     else:
@@ -3384,10 +7342,13 @@ class SearchWorker:
                                                     surnoc=surnoc,
                                                     hissa=hissa,
                                                     period='',
-                                                    error=f'Hissa failed after {max_hissa_retries} retries: {error_msg}'
+                                                    error=f'Hissa failed after {max_hissa_retries} retries: {error_msg}',
+                                                    durable=False
                                                 )
                                             except Exception:
                                                 pass
+                        
+                        checkpoints.mark_if_complete(village_code, survey_no, surnoc, parts=hissa_opts)
                                 
                     except Exception as surnoc_error:
                         error_msg = str(surnoc_error)[:40]
@@ -3416,7 +7377,8 @@ class SearchWorker:
                                     surnoc=surnoc,
                                     hissa='*',
                                     period='',
-                                    error=f'Surnoc error: {error_msg}'
+                                    error=f'Surnoc error: {error_msg}',
+                                    durable=False
                                 )
                             except Exception:
                                 pass
@@ -3426,23 +7388,20 @@ class SearchWorker:
                 # SUCCESSFULLY PROCESSED SURVEY - Save checkpoint and move to next
                 # ═══════════════════════════════════════════════════════════════════════
                 
+                self._save_cached_survey(hobli_code, village_code, survey_no, survey_results, skipped_in_village)
+                
                 # Save survey-level checkpoint for granular resume capability
-                if self.db and self.session_id:
-                    try:
-                        self.db.save_survey_checkpoint(
-                            session_id=self.session_id,
-                            village_code=village_code,
-                            survey_no=survey_no,
-                            surnocs_processed=surnoc_opts  # Save which surnocs were processed
-                        )
-                    except Exception as chkpt_err:
-                        self.logger.debug(f"Checkpoint save failed: {chkpt_err}")
+                self._checkpoint_survey(village_code, survey_no, surnoc_opts)
                 
                 survey_no += 1
                         
             except Exception as e:
                 error_str = str(e).lower()
                 
+                # Whatever failed, the page no longer matches the navigator's cache
+                if self.navigator:
+                    self.navigator.reset_state()
+                
                 # ═══════════════════════════════════════════════════════════════════════
                 # CRITICAL: Detect browser death (invalid session id) vs session expiry
                 # ═══════════════════════════════════════════════════════════════════════
@@ -3491,7 +7450,8 @@ class SearchWorker:
                                     surnoc='*',
                                     hissa='*',
                                     period='',
-                                    error=f'Browser died - surveys {survey_no}-{max_survey} not processed'
+                                    error=f'Browser died - surveys {survey_no}-{max_survey} not processed',
+                                    durable=False
                                 )
                             except Exception:
                                 pass
@@ -3542,7 +7502,8 @@ class SearchWorker:
                                             surnoc='*',
                                             hissa='*',
                                             period='',
-                                            error=f'Browser restart failed - surveys {survey_no}-{max_survey} not processed'
+                                            error=f'Browser restart failed - surveys {survey_no}-{max_survey} not processed',
+                                            durable=False
                                         )
                                     except Exception:
                                         pass
@@ -3583,7 +7544,8 @@ class SearchWorker:
                                         surnoc='*',
                                         hissa='*',
                                         period='',
-                                        error=f'Session expired, browser restart failed - surveys {survey_no}-{max_survey} not processed'
+                                        error=f'Session expired, browser restart failed - surveys {survey_no}-{max_survey} not processed',
+                                        durable=False
                                     )
                                 except Exception:
                                     pass
@@ -3617,7 +7579,8 @@ class SearchWorker:
                                 surnoc='*',
                                 hissa='*',
                                 period='',
-                                error=f'Unknown error: {error_str[:50]}'
+                                error=f'Unknown error: {error_str[:50]}',
+                                durable=False
                             )
                         except Exception:
                             pass
@@ -3627,6 +7590,7 @@ class SearchWorker:
                         surveys_checked >= Config.MIN_SURVEYS_BEFORE_STOP and
                         empty_count >= Config.EMPTY_SURVEY_THRESHOLD):
                         completion_reason = 'smart_stop'
+                        self._stop_higher_ranges(survey_no)
                         self._add_log(f"🏁 SMART STOP (error recovery): {village_name}")
                         break
         
@@ -3651,35 +7615,21 @@ class SearchWorker:
                     if wait_time > 0:
                         time.sleep(wait_time)
                     
-                    # Navigate and retry
-                    self.driver.get(Config.SERVICE2_URL)
-                    time.sleep(2)
-                    
-                    Select(self.driver.find_element(By.ID, IDS['district'])).select_by_value(self.params['district_code'])
-                    time.sleep(Config.POST_SELECT_WAIT)
-                    Select(self.driver.find_element(By.ID, IDS['taluk'])).select_by_value(self.params['taluk_code'])
-                    time.sleep(Config.POST_SELECT_WAIT)
-                    Select(self.driver.find_element(By.ID, IDS['hobli'])).select_by_value(hobli_code)
-                    time.sleep(Config.POST_SELECT_WAIT)
-                    Select(self.driver.find_element(By.ID, IDS['village'])).select_by_value(village_code)
-                    time.sleep(Config.POST_SELECT_WAIT)
-                    
-                    survey_input = self.driver.find_element(By.ID, IDS['survey_no'])
-                    survey_input.clear()
-                    survey_input.send_keys(str(retry_survey_no))
+                    # Navigate and retry (fresh page - the survey failed on the old one)
+                    self.navigator.load_portal()
+                    self.navigator.ensure_location(
+                        self.params['district_code'], self.params['taluk_code'], hobli_code, village_code
+                    )
                     
-                    _global_rate_limiter.acquire()
-                    go_btn = self.driver.find_element(By.ID, IDS['go_btn'])
-                    self.driver.execute_script("arguments[0].click();", go_btn)
-                    time.sleep(Config.POST_CLICK_WAIT + 2)  # Extra wait for retry
+                    _global_rate_limiter.acquire('go')
+                    self.navigator.submit_survey(retry_survey_no)
                     
                     # Check for alert
                     had_alert, alert_text, is_portal_issue = self._handle_alert()
                     
                     if not is_portal_issue:
                         # Check if surnoc populated
-                        surnoc_sel = Select(self.driver.find_element(By.ID, IDS['surnoc']))
-                        surnoc_opts = [o.text for o in surnoc_sel.options if "Select" not in o.text]
+                        surnoc_opts = DomReader.option_texts(self.driver, IDS['surnoc'])
                         
                         if surnoc_opts:
                             # SUCCESS! Survey is now accessible
@@ -3689,130 +7639,448 @@ class SearchWorker:
                             
                             self._add_log(f"⚠️ RETRY PARTIAL SUCCESS: Survey {retry_survey_no} accessible (not fully processed)")
                             
-                            # Don't count as full success since we're not extracting data
-                            # Add to final_skipped with note
-                            final_skipped.append({
-                                **retry_item,
-                                'reason_updated': 'Accessible but not fully processed in retry pass'
-                            })
-                            continue
-                    
-                    # Still failing - add to final skipped
-                    final_skipped.append(retry_item)
+                            # Don't count as full success since we're not extracting data
+                            # Add to final_skipped with note
+                            final_skipped.append({
+                                **retry_item,
+                                'reason_updated': 'Accessible but not fully processed in retry pass'
+                            })
+                            continue
+                    
+                    # Still failing - add to final skipped
+                    final_skipped.append(retry_item)
+                    
+                except Exception as retry_err:
+                    self._add_log(f"⚠️ Retry failed for Sy:{retry_survey_no}: {str(retry_err)[:30]}")
+                    final_skipped.append(retry_item)
+            
+            # Now add final skipped to the permanent skip list
+            for item in final_skipped:
+                skip_record = {
+                    'village': village_name,
+                    'village_code': village_code,
+                    'survey_no': item['survey_no'],
+                    'reason': f'RTC access issue after {Config.MAX_PORTAL_RETRIES} retries + 1 retry pass',
+                    'timestamp': datetime.now().isoformat()
+                }
+                with self.state_lock:
+                    self.state.skipped_surveys.append(skip_record)
+                
+                # PERSIST to database
+                if self.db and self.session_id:
+                    try:
+                        self.db.save_skipped_item(
+                            session_id=self.session_id,
+                            village_name=village_name,
+                            survey_no=item['survey_no'],
+                            surnoc='',
+                            hissa='',
+                            period='',
+                            error=f'RTC access issue after {Config.MAX_PORTAL_RETRIES} retries + retry pass',
+                            durable=False
+                        )
+                    except Exception as skip_err:
+                        self.logger.debug(f"Failed to save final skipped item: {skip_err}")
+            
+            if retry_successes > 0:
+                self._add_log(f"🎉 Retry pass: {retry_successes}/{len(retry_queue)} surveys recovered!")
+            
+            # Update skipped count with final results
+            skipped_in_village = final_skipped
+        
+        self._finish_village(
+            village_code=village_code,
+            village_name=village_name,
+            surveys_checked=surveys_checked,
+            surveys_with_data=surveys_with_data,
+            last_survey_with_data=last_survey_with_data,
+            stopped_at_survey=survey_no,
+            skipped_in_village=skipped_in_village,
+            completion_reason=completion_reason,
+            max_survey=max_survey,
+            survey_range=self.current_range
+        )
+    
+    def _search_village_http(self, village_code: str, village_name: str, hobli_code: str, hobli_name: str):
+        """
+        Browserless variant of _search_village.
+        Walks the same form sequence through HttpPortalSession and feeds the returned
+        HTML to _extract_owners. Retry, skip tracking and smart stop mirror the browser path.
+        """
+        max_survey = self.params.get('max_survey', Config.DEFAULT_MAX_SURVEY)
+        owner_variants = self.state.owner_variants
+        district_name = self.params.get('district_name', 'Unknown')
+        taluk_name = self.params.get('taluk_name', 'Unknown')
+        
+        self._update_status(current_village=village_name, current_survey=0, max_survey=max_survey)
+        
+        empty_count = 0
+        surveys_checked = 0
+        surveys_with_data = 0
+        last_survey_with_data = 0
+        session_retries = 0
+        portal_retries = 0
+        skipped_in_village = []
+        completion_reason = 'max_reached'
+        
+        start_survey = self._get_resume_survey(village_code, village_name)
+        self._add_log(f"🏘️ Starting {village_name} (HTTP): Surveys {start_survey} to {self._range_end(max_survey)}")
+        
+        survey_no = start_survey
+        while self._in_range(survey_no, max_survey):
+            if not self.state.running:
+                self._add_log(f"⏹️ Stopped at survey {survey_no}/{max_survey}")
+                return
+            
+            if portal_retries == 0 and session_retries == 0:
+                surveys_checked += 1
+            self._update_status(current_survey=survey_no)
+            if survey_no == 1 or survey_no % 10 == 0:
+                self._add_log(f"📍 {village_name}: Survey {survey_no}/{max_survey} (found {surveys_with_data})")
+            
+            # RTC CACHE - A recent crawl of this survey is replayed without touching the portal
+            cached = self._get_cached_survey(hobli_code, village_code, survey_no)
+            if cached is not None:
+                self._replay_cached_survey(cached, hobli_name, village_code, village_name, survey_no, owner_variants)
+                if cached:
+                    empty_count = 0
+                    surveys_with_data += 1
+                    last_survey_with_data = survey_no
+                else:
+                    empty_count += 1
+                    if self._check_smart_stop(village_name, survey_no, max_survey, surveys_checked,
+                                              empty_count, last_survey_with_data):
+                        completion_reason = 'smart_stop'
+                        break
+                survey_no += 1
+                continue
+            
+            # ADAPTIVE CONCURRENCY - Park while the AIMD controller allows fewer busy workers
+            if not self._wait_for_slot():
+                self._add_log(f"⏹️ Stopped at survey {survey_no}/{max_survey}")
+                return
+            
+            try:
+                http = self.http
+                http.ensure_location(self.params['district_code'], self.params['taluk_code'], hobli_code, village_code)
+                http.set_text('survey_no', str(survey_no))
+                
+                _global_rate_limiter.acquire('go')
+                http.click('go_btn')
+                
+                alert_text = http.portal_issue()
+                if alert_text:
+                    portal_retries += 1
+                    portal_health.report_error(self.worker_id, 'rtc_access')
+                    wait_time = portal_health.should_wait()
+                    if wait_time > 0:
+                        self._add_log(f"⏸️ Portal cooldown: waiting {int(wait_time)}s for portal recovery...")
+                        time.sleep(wait_time)
+                        continue
+                    if portal_retries <= Config.MAX_PORTAL_RETRIES:
+                        backoff_wait = min(
+                            Config.RETRY_BACKOFF_BASE * (Config.RETRY_BACKOFF_MULTIPLIER ** (portal_retries - 1)),
+                            Config.RETRY_MAX_WAIT
+                        )
+                        self._add_log(f"⚠️ RTC issue at {village_name} Sy:{survey_no} (retry {portal_retries}/{Config.MAX_PORTAL_RETRIES}, wait {int(backoff_wait)}s)")
+                        if portal_retries == Config.BROWSER_REFRESH_ON_RETRY:
+                            http.reset()  # Fresh ASP.NET session
+                        time.sleep(backoff_wait)
+                        continue
+                    self._add_log(f"⏭️ Skipping Sy:{survey_no} after {Config.MAX_PORTAL_RETRIES} retries")
+                    self._record_skip(skipped_in_village, village_name, village_code, survey_no,
+                                      f'RTC access issue after {Config.MAX_PORTAL_RETRIES} retries')
+                    portal_retries = 0
+                    survey_no += 1
+                    continue
+                
+                if http.is_session_expired():
+                    raise Exception(f"Session expired after GO - {village_name} survey {survey_no}")
+                
+                portal_health.report_success(self.worker_id)
+                portal_retries = 0
+                session_retries = 0
+                
+                surnoc_opts = [o['text'] for o in http.options('surnoc') if "Select" not in o['text']]
+                if not surnoc_opts:
+                    self._save_cached_survey(hobli_code, village_code, survey_no, [], skipped_in_village)
+                    empty_count += 1
+                    if self._check_smart_stop(village_name, survey_no, max_survey, surveys_checked,
+                                              empty_count, last_survey_with_data):
+                        completion_reason = 'smart_stop'
+                        break
+                    survey_no += 1
+                    continue
+                
+                empty_count = 0
+                surveys_with_data += 1
+                last_survey_with_data = survey_no
+                checkpoints = self.period_checkpoints
+                survey_results = None if checkpoints.resumed(village_code, survey_no) else []
+                
+                for surnoc in surnoc_opts:
+                    if not self.state.running:
+                        return
+                    if checkpoints.is_done(village_code, survey_no, surnoc):
+                        continue
+                    http.select_by_text('surnoc', surnoc, force=True)
+                    hissa_opts = [o['text'] for o in http.options('hissa') if "Select" not in o['text']]
+                    
+                    for hissa in hissa_opts:
+                        if not self.state.running:
+                            return
+                        if checkpoints.is_done(village_code, survey_no, surnoc, hissa):
+                            continue
+                        http.select_by_text('hissa', hissa, force=True)
+                        period_opts = [o['text'] for o in http.options('period')
+                                       if "Select" not in o['text'] and not o['disabled']]
+                        
+                        if not period_opts:
+                            self._add_log(f"⚠️ No periods for Sy:{survey_no} H:{hissa}")
+                            self._record_skip(skipped_in_village, village_name, village_code, survey_no,
+                                              'No periods available in dropdown', surnoc=surnoc, hissa=hissa)
+                            continue
+                        
+                        if not Config.PROCESS_ALL_PERIODS:
+                            period_opts = period_opts[:1]
+                        
+                        for period in period_opts:
+                            if not self.state.running:
+                                return
+                            if checkpoints.is_done(village_code, survey_no, surnoc, hissa, period):
+                                continue
+                            http.select_by_text('period', period)
+                            
+                            fetch_retries = 0
+                            max_fetch_retries = 3
+                            fetched = False
+                            while fetch_retries < max_fetch_retries:
+                                _global_rate_limiter.acquire('fetch')
+                                http.click('fetch_btn')
+                                if not http.portal_issue():
+                                    fetched = True
+                                    portal_health.report_success(self.worker_id)
+                                    break
+                                fetch_retries += 1
+                                portal_health.report_error(self.worker_id, 'fetch_error')
+                                wait_time = portal_health.should_wait()
+                                time.sleep(wait_time if wait_time > 0 else Config.RETRY_BACKOFF_BASE * fetch_retries)
+                            
+                            if not fetched:
+                                self._add_log(f"⏭️ FETCH failed after {max_fetch_retries} retries: Sy:{survey_no} H:{hissa} P:{period[:15]}")
+                                self._record_skip(skipped_in_village, village_name, village_code, survey_no,
+                                                  f'FETCH failed after {max_fetch_retries} retries',
+                                                  surnoc=surnoc, hissa=hissa, period=period)
+                                continue
+                            
+                            if http.is_session_expired():
+                                raise Exception("Session expired during fetch")
+                            
+                            owners = self._extract_owners(http.html)
+                            if survey_results is not None:
+                                survey_results.append({'surnoc': surnoc, 'hissa': hissa, 'period': period,
+                                                       'owners': owners})
+                            self._record_owners(owners, {
+                                'district': district_name,
+                                'taluk': taluk_name,
+                                'hobli': hobli_name,
+                                'village': village_name,
+                                'survey_no': survey_no,
+                                'surnoc': surnoc,
+                                'hissa': hissa,
+                                'period': period,
+                            }, owner_variants, village_code)
+                            
+                            with self.state_lock:
+                                self.state.total_periods_processed += 1
+                        
+                        checkpoints.mark_if_complete(village_code, survey_no, surnoc, hissa, period_opts)
+                        self._update_global_stats()
                     
-                except Exception as retry_err:
-                    self._add_log(f"⚠️ Retry failed for Sy:{retry_survey_no}: {str(retry_err)[:30]}")
-                    final_skipped.append(retry_item)
-            
-            # Now add final skipped to the permanent skip list
-            for item in final_skipped:
-                skip_record = {
-                    'village': village_name,
-                    'village_code': village_code,
-                    'survey_no': item['survey_no'],
-                    'reason': f'RTC access issue after {Config.MAX_PORTAL_RETRIES} retries + 1 retry pass',
-                    'timestamp': datetime.now().isoformat()
-                }
-                with self.state_lock:
-                    self.state.skipped_surveys.append(skip_record)
+                    checkpoints.mark_if_complete(village_code, survey_no, surnoc, parts=hissa_opts)
                 
-                # PERSIST to database
-                if self.db and self.session_id:
-                    try:
-                        self.db.save_skipped_item(
-                            session_id=self.session_id,
-                            village_name=village_name,
-                            survey_no=item['survey_no'],
-                            surnoc='',
-                            hissa='',
-                            period='',
-                            error=f'RTC access issue after {Config.MAX_PORTAL_RETRIES} retries + retry pass'
-                        )
-                    except Exception as skip_err:
-                        self.logger.debug(f"Failed to save final skipped item: {skip_err}")
-            
-            if retry_successes > 0:
-                self._add_log(f"🎉 Retry pass: {retry_successes}/{len(retry_queue)} surveys recovered!")
-            
-            # Update skipped count with final results
-            skipped_in_village = final_skipped
-        
-        # ═══════════════════════════════════════════════════════════════════════════════
-        # VILLAGE COMPLETION STATS - Comprehensive tracking for user confidence
-        # ═══════════════════════════════════════════════════════════════════════════════
+                self._save_cached_survey(hobli_code, village_code, survey_no, survey_results, skipped_in_village)
+                self._checkpoint_survey(village_code, survey_no, surnoc_opts)
+                
+                survey_no += 1
+                
+            except Exception as e:
+                error_str = str(e).lower()
+                if (isinstance(e, requests.RequestException) or 'session' in error_str
+                        or 'expired' in error_str) and session_retries < Config.MAX_SESSION_RETRIES:
+                    # Network hiccup or lost ASP.NET session - start over with a fresh session
+                    session_retries += 1
+                    self._add_log(f"🔄 HTTP session reset {session_retries}/{Config.MAX_SESSION_RETRIES} at Sy:{survey_no}: {str(e)[:40]}")
+                    self.http.reset()
+                    time.sleep(Config.SESSION_REFRESH_WAIT)
+                    continue  # RETRY same survey
+                
+                self.errors += 1
+                empty_count += 1
+                session_retries = 0
+                self._record_skip(skipped_in_village, village_name, village_code, survey_no,
+                                  f'Unknown error: {error_str[:50]}', surnoc='*', hissa='*')
+                survey_no += 1
         
-        # Calculate confidence score
-        confidence_score = self._calculate_village_confidence(
+        self._finish_village(
+            village_code=village_code,
+            village_name=village_name,
             surveys_checked=surveys_checked,
             surveys_with_data=surveys_with_data,
             last_survey_with_data=last_survey_with_data,
             stopped_at_survey=survey_no,
-            skipped_count=len(skipped_in_village),
+            skipped_in_village=skipped_in_village,
             completion_reason=completion_reason,
-            max_survey=max_survey
+            max_survey=max_survey,
+            survey_range=self.current_range
         )
+    
+    def _search_village_offline(self, village_code: str, village_name: str, hobli_code: str, hobli_name: str):
+        """
+        Offline variant of _search_village - replays the RTC cache, never contacts the portal.
+        Surveys without fresh cached data are recorded as skipped so they can be topped up
+        with a live search; a village with no fresh crawl at all is reported as not cached.
+        Only surveys cached as empty count toward smart stop, and the walk ends at the last
+        crawled survey.
+        """
+        max_survey = self.params.get('max_survey', Config.DEFAULT_MAX_SURVEY)
+        owner_variants = self.state.owner_variants
         
-        # Build village stats
-        village_completion = {
-            'village_name': village_name,
-            'village_code': village_code,
-            'surveys_checked': surveys_checked,
-            'surveys_with_data': surveys_with_data,
-            'records_found': self.records_found,
-            'matches_found': self.matches_found,
-            'last_survey_with_data': last_survey_with_data,
-            'stopped_at_survey': survey_no,
-            'completion_reason': completion_reason,
-            'skipped_count': len(skipped_in_village),
-            'skipped_surveys': skipped_in_village[-10:] if skipped_in_village else [],  # Last 10
-            'confidence_score': confidence_score,
-            'confidence_level': 'HIGH' if confidence_score >= 80 else ('MEDIUM' if confidence_score >= 50 else 'LOW'),
-            'time_saved_surveys': max_survey - survey_no if completion_reason == 'smart_stop' else 0,
-            'timestamp': datetime.now().isoformat()
-        }
+        self._update_status(current_village=village_name, current_survey=0, max_survey=max_survey)
         
-        # Store village stats
-        with self.state_lock:
-            self.state.village_stats[village_code] = village_completion
+        empty_count = 0
+        surveys_checked = 0
+        surveys_with_data = 0
+        last_survey_with_data = 0
+        skipped_in_village = []
+        completion_reason = 'max_reached'
+        
+        crawled = {}
+        if self.db:
+            crawled = self.db.get_cached_survey_numbers(self._rtc_cache_key(hobli_code, village_code),
+                                                        Config.RTC_CACHE_TTL)
+        if not crawled:
+            self._add_log(f"📭 {village_name}: no fresh crawl data - search it live")
+            with self.state_lock:
+                if village_name not in self.state.villages_not_cached:
+                    self.state.villages_not_cached.append(village_name)
+            self._record_skip(skipped_in_village, village_name, village_code, 0,
+                              'Village not in RTC cache (needs live search)', surnoc='*', hissa='*')
+            self._finish_village(
+                village_code=village_code,
+                village_name=village_name,
+                surveys_checked=0,
+                surveys_with_data=0,
+                last_survey_with_data=0,
+                stopped_at_survey=0,
+                skipped_in_village=skipped_in_village,
+                completion_reason='not_cached',
+                max_survey=max_survey,
+                survey_range=self.current_range
+            )
+            return
         
-        # End of village summary with confidence
-        confidence_emoji = '🟢' if confidence_score >= 80 else ('🟡' if confidence_score >= 50 else '🔴')
-        self._add_log(f"✅ {village_name} COMPLETE: {surveys_checked} surveys, {surveys_with_data} with data, {self.records_found} records")
-        self._add_log(f"   {confidence_emoji} Confidence: {confidence_score}% ({village_completion['confidence_level']})")
+        start_survey = self._get_resume_survey(village_code, village_name)
+        last_crawled = max(crawled)
+        self._add_log(f"🏘️ Starting {village_name} (offline): Surveys {start_survey} to {self._range_end(max_survey)}, {len(crawled)} cached")
+        
+        missing = 0
+        survey_no = start_survey
+        while self._in_range(survey_no, max_survey):
+            if survey_no > last_crawled:
+                self._add_log(f"🏁 {village_name}: crawl data ends at survey {last_crawled}")
+                completion_reason = 'crawl_end'
+                break
+            if not self.state.running:
+                self._add_log(f"⏹️ Stopped at survey {survey_no}/{max_survey}")
+                return
+            
+            surveys_checked += 1
+            self._update_status(current_survey=survey_no)
+            
+            cached = self._get_cached_survey(hobli_code, village_code, survey_no) if survey_no in crawled else None
+            if cached is None:
+                # A gap in the crawl says nothing about the survey - not an empty for smart stop
+                self._record_skip(skipped_in_village, village_name, village_code, survey_no,
+                                  'No fresh cached data (needs live fetch)', surnoc='*', hissa='*')
+                missing += 1
+                survey_no += 1
+                continue
+            
+            self._replay_cached_survey(cached, hobli_name, village_code, village_name, survey_no, owner_variants)
+            if cached:
+                empty_count = 0
+                surveys_with_data += 1
+                last_survey_with_data = survey_no
+            else:
+                empty_count += 1
+            
+            if empty_count and self._check_smart_stop(village_name, survey_no, max_survey, surveys_checked,
+                                                      empty_count, last_survey_with_data):
+                completion_reason = 'smart_stop'
+                break
+            survey_no += 1
+        
+        if missing:
+            self._add_log(f"⚠️ {village_name}: {missing} surveys missing from the crawl - top up with a live search")
+        
+        self._finish_village(
+            village_code=village_code,
+            village_name=village_name,
+            surveys_checked=surveys_checked,
+            surveys_with_data=surveys_with_data,
+            last_survey_with_data=last_survey_with_data,
+            stopped_at_survey=survey_no,
+            skipped_in_village=skipped_in_village,
+            completion_reason=completion_reason,
+            max_survey=max_survey,
+            survey_range=self.current_range
+        )
     
     def run(self):
         """Main worker execution with browser crash recovery"""
-        self._update_status(status='running', villages_total=len(self.villages))
-        self._add_log(f"Starting with {len(self.villages)} villages")
+        self._update_status(status='running')
+        self._add_log(f"Starting with {self.work_queue.depth(self.worker_id)} villages queued")
         
         browser_crashes = 0
         max_browser_crashes = 3
         
         try:
-            self._init_browser()
-            
-            idx = 0
-            while idx < len(self.villages):
+            self._init_engine()
+            search_village = {
+                'http': self._search_village_http,
+                'offline': self._search_village_offline,
+            }.get(self.engine, self._search_village)
+            
+            rng = None  # Kept across retries of the same village / survey range
+            while True:
                 if not self.state.running:
                     self._add_log("Stopped by user")
                     break
                 
-                village_code, village_name, hobli_code, hobli_name = self.villages[idx]
+                if rng is None:
+                    work = self._take_work()
+                    if work is None:
+                        if Config.SPLIT_SURVEY_RANGES and self.work_queue.has_open_plans():
+                            time.sleep(Config.SPLIT_POLL_INTERVAL)  # A running village may grow splittable
+                            continue
+                        break  # Every queue drained, nothing left worth splitting
+                    rng, new_village = work
+                    self.current_range = rng
+                    self._begin_range(rng, new_village)
+                
+                village_code, village_name, hobli_code, hobli_name = rng.plan.village
                 
                 try:
-                    self._add_log(f"🏘️ Village {idx+1}/{len(self.villages)}: {village_name}")
-                    self._search_village(village_code, village_name, hobli_code, hobli_name)
+                    self._add_log(f"🏘️ Village {self.villages_done + 1} "
+                                  f"({self.work_queue.depth(self.worker_id)} queued): {village_name}")
+                    search_village(village_code, village_name, hobli_code, hobli_name)
                     
                     # ═══════════════════════════════════════════════════════════════════════
-                    # SUCCESSFULLY PROCESSED - Track it!
+                    # SUCCESSFULLY PROCESSED - Track it! (counted once its last range is done)
                     # ═══════════════════════════════════════════════════════════════════════
-                    with self.state_lock:
-                        if village_name not in self.state.villages_processed:
-                            self.state.villages_processed.append(village_name)
-                    
-                    self._update_status(villages_completed=idx + 1)
-                    self._update_global_stats()
-                    idx += 1  # Move to next village
+                    self._settle_range(rng, rng.plan.finish_range(rng))
+                    rng = None  # Move to next village
                     browser_crashes = 0  # Reset crash count on success
                     
                 except Exception as village_error:
@@ -3820,7 +8088,7 @@ class SearchWorker:
                     self._add_log(f"⚠️ Village error: {str(village_error)[:80]}")
                     
                     # Check if it's a browser/session crash
-                    if any(x in error_str for x in ['session', 'chrome', 'browser', 'expired', 'webdriver']):
+                    if any(x in error_str for x in ['session', 'chrome', 'browser', 'expired', 'webdriver', 'connection', 'timed out']):
                         browser_crashes += 1
                         self._add_log(f"🔄 Browser/session issue #{browser_crashes}/{max_browser_crashes}")
                         
@@ -3831,11 +8099,11 @@ class SearchWorker:
                             self.state.session_recoveries += 1
                         
                         # Try to restart browser and RETRY the same village
-                        self._close_browser()
+                        self._close_engine()
                         time.sleep(3)
                         
                         try:
-                            self._init_browser()
+                            self._init_engine()
                             
                             # Only skip village after max retries
                             if browser_crashes >= max_browser_crashes:
@@ -3844,7 +8112,9 @@ class SearchWorker:
                                 with self.state_lock:
                                     if village_name not in self.state.villages_failed:
                                         self.state.villages_failed.append(village_name)
-                                idx += 1
+                                self._fail_range(rng, str(village_error)[:200])
+                                self._settle_range(rng, rng.plan.finish_range(rng))
+                                rng = None
                                 browser_crashes = 0
                             else:
                                 self._add_log(f"🔁 Retrying village {village_name}...")
@@ -3858,9 +8128,376 @@ class SearchWorker:
                         # Non-browser error, log and move to next village
                         self.errors += 1
                         self._add_log(f"📝 Non-critical error, continuing: {str(village_error)[:50]}")
-                        idx += 1
+                        self._fail_range(rng, str(village_error)[:200])
+                        self._settle_range(rng, rng.plan.finish_range(rng))
+                        rng = None
+            
+            self._settle_record_writes()
+            self._update_status(status='completed', queue_depth=0)
+            self._add_log(f"✅ Completed: {self.records_found} records, {self.matches_found} matches")
             
-            self._update_status(status='completed')
+        except Exception as e:
+            self._update_status(status='failed', errors=self.errors + 1)
+            self._add_log(f"Error: {str(e)[:100]}")
+            self.logger.error(f"Worker failed: {traceback.format_exc()}")
+            
+        finally:
+            get_concurrency_controller().leave(self.worker_id)
+            self.period_checkpoints.flush()
+            self._close_engine()
+            self._update_global_stats()
+
+class AsyncSearchWorker(SearchWorker):
+    """
+    Coroutine flavour of SearchWorker for the 'async' fetch engine.
+    
+    Walks villages with an AsyncPortalSession and awaits the shared AsyncRateLimiter
+    before every GO/Fetch. Record, skip, checkpoint and village-summary writes reuse
+    the SearchWorker helpers but run on the AsyncRecordSink writer thread, in order,
+    so the event loop never blocks on SQLite or CSV; form parsing and owner extraction
+    run in the parse pool, so it does not block on BeautifulSoup/lxml either. Status
+    and logs go to the same SearchState/WorkerStatus as the thread workers.
+    """
+    
+    def __init__(self, *args, limiter: 'AsyncRateLimiter' = None, sink: 'AsyncRecordSink' = None,
+                 connector=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.engine = 'async'
+        self.limiter = limiter
+        self.sink = sink
+        self.connector = connector
+        self.http: Optional[AsyncPortalSession] = None
+    
+    async def _wait_for_slot_async(self) -> bool:
+        """_wait_for_slot for coroutines - polls the controller instead of blocking the loop"""
+        controller = get_concurrency_controller()
+        parked = False
+        while not controller.enter(self.worker_id, timeout=0):
+            if not self.state.running:
+                return False
+            if not parked:
+                parked = True
+                self._update_status(status='parked')
+                self._add_log(f"⏸️ Parked by adaptive concurrency (limit {controller.worker_limit} workers)")
+            await asyncio.sleep(0.5)
+        if parked:
+            self._update_status(status='running')
+            self._add_log("▶️ Slot free - resuming")
+        return True
+    
+    async def _search_village_async(self, village_code: str, village_name: str, hobli_code: str, hobli_name: str):
+        """Coroutine version of _search_village_http"""
+        max_survey = self.params.get('max_survey', Config.DEFAULT_MAX_SURVEY)
+        owner_variants = self.state.owner_variants
+        district_name = self.params.get('district_name', 'Unknown')
+        taluk_name = self.params.get('taluk_name', 'Unknown')
+        
+        self._update_status(current_village=village_name, current_survey=0, max_survey=max_survey)
+        
+        empty_count = 0
+        surveys_checked = 0
+        surveys_with_data = 0
+        last_survey_with_data = 0
+        session_retries = 0
+        portal_retries = 0
+        skipped_in_village = []
+        completion_reason = 'max_reached'
+        
+        loop = asyncio.get_running_loop()
+        start_survey = await loop.run_in_executor(None, self._get_resume_survey, village_code, village_name)
+        self._add_log(f"🏘️ Starting {village_name} (async): Surveys {start_survey} to {self._range_end(max_survey)}")
+        
+        survey_no = start_survey
+        while self._in_range(survey_no, max_survey):
+            if not self.state.running:
+                self._add_log(f"⏹️ Stopped at survey {survey_no}/{max_survey}")
+                return
+            
+            if portal_retries == 0 and session_retries == 0:
+                surveys_checked += 1
+            self._update_status(current_survey=survey_no)
+            if survey_no == 1 or survey_no % 10 == 0:
+                self._add_log(f"📍 {village_name}: Survey {survey_no}/{max_survey} (found {surveys_with_data})")
+            
+            # RTC CACHE - A recent crawl of this survey is replayed without touching the portal
+            cached = await loop.run_in_executor(None, self._get_cached_survey, hobli_code, village_code, survey_no)
+            if cached is not None:
+                await self.sink.submit(self._replay_cached_survey, cached, hobli_name, village_code, village_name,
+                                       survey_no, owner_variants)
+                if cached:
+                    empty_count = 0
+                    surveys_with_data += 1
+                    last_survey_with_data = survey_no
+                else:
+                    empty_count += 1
+                    if self._check_smart_stop(village_name, survey_no, max_survey, surveys_checked,
+                                              empty_count, last_survey_with_data):
+                        completion_reason = 'smart_stop'
+                        break
+                survey_no += 1
+                continue
+            
+            # ADAPTIVE CONCURRENCY - Park while the AIMD controller allows fewer busy workers
+            if not await self._wait_for_slot_async():
+                self._add_log(f"⏹️ Stopped at survey {survey_no}/{max_survey}")
+                return
+            
+            try:
+                http = self.http
+                await http.ensure_location(self.params['district_code'], self.params['taluk_code'], hobli_code, village_code)
+                http.set_text('survey_no', str(survey_no))
+                
+                await self.limiter.acquire('go')
+                await http.click('go_btn')
+                
+                alert_text = http.portal_issue()
+                if alert_text:
+                    portal_retries += 1
+                    portal_health.report_error(self.worker_id, 'rtc_access')
+                    wait_time = portal_health.should_wait()
+                    if wait_time > 0:
+                        self._add_log(f"⏸️ Portal cooldown: waiting {int(wait_time)}s for portal recovery...")
+                        await asyncio.sleep(wait_time)
+                        continue
+                    if portal_retries <= Config.MAX_PORTAL_RETRIES:
+                        backoff_wait = min(
+                            Config.RETRY_BACKOFF_BASE * (Config.RETRY_BACKOFF_MULTIPLIER ** (portal_retries - 1)),
+                            Config.RETRY_MAX_WAIT
+                        )
+                        self._add_log(f"⚠️ RTC issue at {village_name} Sy:{survey_no} (retry {portal_retries}/{Config.MAX_PORTAL_RETRIES}, wait {int(backoff_wait)}s)")
+                        if portal_retries == Config.BROWSER_REFRESH_ON_RETRY:
+                            await http.reset()  # Fresh ASP.NET session
+                        await asyncio.sleep(backoff_wait)
+                        continue
+                    self._add_log(f"⏭️ Skipping Sy:{survey_no} after {Config.MAX_PORTAL_RETRIES} retries")
+                    await self.sink.submit(self._record_skip, skipped_in_village, village_name, village_code, survey_no,
+                                           f'RTC access issue after {Config.MAX_PORTAL_RETRIES} retries')
+                    portal_retries = 0
+                    survey_no += 1
+                    continue
+                
+                if http.is_session_expired():
+                    raise Exception(f"Session expired after GO - {village_name} survey {survey_no}")
+                
+                portal_health.report_success(self.worker_id)
+                portal_retries = 0
+                session_retries = 0
+                
+                surnoc_opts = [o['text'] for o in http.options('surnoc') if "Select" not in o['text']]
+                if not surnoc_opts:
+                    await self.sink.submit(self._save_cached_survey, hobli_code, village_code, survey_no,
+                                           [], skipped_in_village)
+                    empty_count += 1
+                    if self._check_smart_stop(village_name, survey_no, max_survey, surveys_checked,
+                                              empty_count, last_survey_with_data):
+                        completion_reason = 'smart_stop'
+                        break
+                    survey_no += 1
+                    continue
+                
+                empty_count = 0
+                surveys_with_data += 1
+                last_survey_with_data = survey_no
+                checkpoints = self.period_checkpoints
+                survey_results = None if checkpoints.resumed(village_code, survey_no) else []
+                
+                for surnoc in surnoc_opts:
+                    if not self.state.running:
+                        return
+                    if checkpoints.is_done(village_code, survey_no, surnoc):
+                        continue
+                    await http.select_by_text('surnoc', surnoc, force=True)
+                    hissa_opts = [o['text'] for o in http.options('hissa') if "Select" not in o['text']]
+                    
+                    for hissa in hissa_opts:
+                        if not self.state.running:
+                            return
+                        if checkpoints.is_done(village_code, survey_no, surnoc, hissa):
+                            continue
+                        await http.select_by_text('hissa', hissa, force=True)
+                        period_opts = [o['text'] for o in http.options('period')
+                                       if "Select" not in o['text'] and not o['disabled']]
+                        
+                        if not period_opts:
+                            self._add_log(f"⚠️ No periods for Sy:{survey_no} H:{hissa}")
+                            await self.sink.submit(self._record_skip, skipped_in_village, village_name, village_code,
+                                                   survey_no, 'No periods available in dropdown',
+                                                   surnoc=surnoc, hissa=hissa)
+                            continue
+                        
+                        if not Config.PROCESS_ALL_PERIODS:
+                            period_opts = period_opts[:1]
+                        
+                        for period in period_opts:
+                            if not self.state.running:
+                                return
+                            if checkpoints.is_done(village_code, survey_no, surnoc, hissa, period):
+                                continue
+                            await http.select_by_text('period', period)
+                            
+                            fetch_retries = 0
+                            max_fetch_retries = 3
+                            fetched = False
+                            while fetch_retries < max_fetch_retries:
+                                await self.limiter.acquire('fetch')
+                                await http.click('fetch_btn')
+                                if not http.portal_issue():
+                                    fetched = True
+                                    portal_health.report_success(self.worker_id)
+                                    break
+                                fetch_retries += 1
+                                portal_health.report_error(self.worker_id, 'fetch_error')
+                                wait_time = portal_health.should_wait()
+                                await asyncio.sleep(wait_time if wait_time > 0 else Config.RETRY_BACKOFF_BASE * fetch_retries)
+                            
+                            if not fetched:
+                                self._add_log(f"⏭️ FETCH failed after {max_fetch_retries} retries: Sy:{survey_no} H:{hissa} P:{period[:15]}")
+                                await self.sink.submit(self._record_skip, skipped_in_village, village_name, village_code,
+                                                       survey_no, f'FETCH failed after {max_fetch_retries} retries',
+                                                       surnoc=surnoc, hissa=hissa, period=period)
+                                continue
+                            
+                            if http.is_session_expired():
+                                raise Exception("Session expired during fetch")
+                            
+                            owners = await parse_off_loop(OwnerExtractor.extract, http.html)
+                            if survey_results is not None:
+                                survey_results.append({'surnoc': surnoc, 'hissa': hissa, 'period': period,
+                                                       'owners': owners})
+                            await self.sink.submit(self._record_owners, owners, {
+                                'district': district_name,
+                                'taluk': taluk_name,
+                                'hobli': hobli_name,
+                                'village': village_name,
+                                'survey_no': survey_no,
+                                'surnoc': surnoc,
+                                'hissa': hissa,
+                                'period': period,
+                            }, owner_variants, village_code)
+                            
+                            with self.state_lock:
+                                self.state.total_periods_processed += 1
+                        
+                        # On the writer thread, after this hissa's period marks
+                        await self.sink.submit(checkpoints.mark_if_complete, village_code, survey_no,
+                                               surnoc, hissa, period_opts)
+                        self._update_global_stats()
+                    
+                    await self.sink.submit(checkpoints.mark_if_complete, village_code, survey_no,
+                                           surnoc, parts=hissa_opts)
+                
+                await self.sink.submit(self._save_cached_survey, hobli_code, village_code, survey_no,
+                                       survey_results, skipped_in_village)
+                await self.sink.submit(self._checkpoint_survey, village_code, survey_no, surnoc_opts)
+                survey_no += 1
+                
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                error_str = str(e).lower()
+                if (isinstance(e, (aiohttp.ClientError, asyncio.TimeoutError)) or 'session' in error_str
+                        or 'expired' in error_str) and session_retries < Config.MAX_SESSION_RETRIES:
+                    # Network hiccup or lost ASP.NET session - start over with a fresh session
+                    session_retries += 1
+                    self._add_log(f"🔄 Async session reset {session_retries}/{Config.MAX_SESSION_RETRIES} at Sy:{survey_no}: {str(e)[:40]}")
+                    await self.http.reset()
+                    await asyncio.sleep(Config.SESSION_REFRESH_WAIT)
+                    await self.sink.submit(self._settle_record_writes)
+                    await self.sink.flush()  # Period marks of this attempt are applied before the retry reads them
+                    continue  # RETRY same survey
+                
+                self.errors += 1
+                empty_count += 1
+                session_retries = 0
+                await self.sink.submit(self._record_skip, skipped_in_village, village_name, village_code, survey_no,
+                                       f'Unknown error: {error_str[:50]}', surnoc='*', hissa='*')
+                survey_no += 1
+        
+        # Queued behind this village's writes so records/skips are counted
+        await self.sink.submit(
+            self._finish_village,
+            village_code=village_code,
+            village_name=village_name,
+            surveys_checked=surveys_checked,
+            surveys_with_data=surveys_with_data,
+            last_survey_with_data=last_survey_with_data,
+            stopped_at_survey=survey_no,
+            skipped_in_village=skipped_in_village,
+            completion_reason=completion_reason,
+            max_survey=max_survey,
+            survey_range=self.current_range
+        )
+    
+    async def run_async(self):
+        """Coroutine equivalent of run() with session crash recovery"""
+        self._update_status(status='running')
+        self._add_log(f"Starting with {self.work_queue.depth(self.worker_id)} villages queued (async)")
+        
+        session_crashes = 0
+        max_session_crashes = 3
+        
+        try:
+            self.http = AsyncPortalSession(self.connector, limiter=self.limiter)
+            await self.http.reset()
+            
+            loop = asyncio.get_running_loop()
+            rng = None  # Kept across retries of the same village / survey range
+            while True:
+                if not self.state.running:
+                    self._add_log("Stopped by user")
+                    break
+                
+                if rng is None:
+                    work = await loop.run_in_executor(None, self._take_work)
+                    if work is None:
+                        if Config.SPLIT_SURVEY_RANGES and self.work_queue.has_open_plans():
+                            await asyncio.sleep(Config.SPLIT_POLL_INTERVAL)  # A running village may grow splittable
+                            continue
+                        break  # Every queue drained, nothing left worth splitting
+                    rng, new_village = work
+                    self.current_range = rng
+                    # Counters are read on the writer thread, after earlier ranges' writes
+                    await self.sink.submit(self._begin_range, rng, new_village)
+                
+                village_code, village_name, hobli_code, hobli_name = rng.plan.village
+                
+                try:
+                    self._add_log(f"🏘️ Village {self.villages_done + 1} "
+                                  f"({self.work_queue.depth(self.worker_id)} queued): {village_name}")
+                    await self._search_village_async(village_code, village_name, hobli_code, hobli_name)
+                    
+                    await self.sink.submit(self._settle_range, rng, rng.plan.finish_range(rng))
+                    rng = None
+                    session_crashes = 0
+                    
+                except asyncio.CancelledError:
+                    raise
+                except Exception as village_error:
+                    session_crashes += 1
+                    self._add_log(f"⚠️ Village error #{session_crashes}/{max_session_crashes}: {str(village_error)[:80]}")
+                    with self.state_lock:
+                        if village_name not in self.state.villages_retried:
+                            self.state.villages_retried.append(village_name)
+                        self.state.session_recoveries += 1
+                    
+                    await self.http.reset()
+                    await asyncio.sleep(3)
+                    
+                    if session_crashes >= max_session_crashes:
+                        self._add_log(f"❌ Max retries reached for {village_name}, moving to next")
+                        with self.state_lock:
+                            if village_name not in self.state.villages_failed:
+                                self.state.villages_failed.append(village_name)
+                        await self.sink.submit(self._fail_range, rng, str(village_error)[:200])
+                        await self.sink.submit(self._settle_range, rng, rng.plan.finish_range(rng))
+                        rng = None
+                        session_crashes = 0
+            
+            # Wait for queued writes before reporting completion
+            await self.sink.submit(self.period_checkpoints.flush)
+            await self.sink.submit(self._settle_record_writes)
+            await self.sink.flush()
+            self._update_status(status='completed', queue_depth=0)
             self._add_log(f"✅ Completed: {self.records_found} records, {self.matches_found} matches")
             
         except Exception as e:
@@ -3869,9 +8506,432 @@ class SearchWorker:
             self.logger.error(f"Worker failed: {traceback.format_exc()}")
             
         finally:
-            self._close_browser()
+            get_concurrency_controller().leave(self.worker_id)
+            if self.http:
+                await self.http.close()
             self._update_global_stats()
 
+# ═══════════════════════════════════════════════════════════════════════════════════════
+# WORKER PROCESSES - Worker groups in their own processes, SearchState stays in the server
+# ═══════════════════════════════════════════════════════════════════════════════════════
+
+class ProcessCSVBuffer:
+    """
+    Stands in for ThreadSafeCSVWriter inside a worker process.
+    Rows travel to the coordinator with the next state delta and are written there,
+    so each CSV file keeps a single writer.
+    """
+    
+    def __init__(self):
+        self._rows: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+    
+    def write_record(self, record: Dict[str, Any]):
+        with self._lock:
+            self._rows.append(dict(record))
+    
+    def write_records(self, records: List[Dict[str, Any]]):
+        with self._lock:
+            self._rows.extend(dict(r) for r in records)
+    
+    def drain(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows, self._rows = self._rows, []
+            return rows
+    
+    def flush(self):
+        pass
+    
+    def close(self):
+        pass
+
+
+class WorkerProcessHost:
+    """
+    Runs one group of SearchWorkers as threads inside a worker process.
+    
+    The workers update a process-local SearchState exactly as they do in the server.
+    Every PROCESS_REPORT_INTERVAL the host drains what changed (new logs, records,
+    skipped surveys and village stats, counter values, its workers' status, CSV rows,
+    AIMD signals) and sends it to the coordinator, which keeps the authoritative
+    SearchState. The coordinator sends back 'stop' and rate/worker-limit updates.
+    
+    Records and progress go to SQLite directly: WAL mode serialises writers across
+    processes, and every record is durable before the coordinator hears of it.
+    """
+    
+    APPEND_FIELDS = ('logs', 'all_records', 'matches', 'skipped_surveys')
+    UNIQUE_FIELDS = ('villages_processed', 'villages_retried', 'villages_failed', 'villages_not_cached')
+    COUNTER_FIELDS = ('smart_stops', 'surveys_saved', 'surveys_from_cache',
+                      'total_periods_processed', 'session_recoveries')
+    
+    def __init__(self, spec: dict, out_queue, control_queue):
+        self.spec = spec
+        self.group_id = spec['group_id']
+        self.out_queue = out_queue
+        self.control_queue = control_queue
+        self.state = SearchState(running=True, owner_variants=spec['owner_variants'])
+        self.state_lock = threading.Lock()
+        self.all_records_writer = ProcessCSVBuffer()
+        self.matches_writer = ProcessCSVBuffer()
+        self.chunks = dict(zip(spec['worker_ids'], spec['chunks']))
+        self.work_queue = VillageWorkQueue(self.chunks)
+        for wid, chunk in self.chunks.items():
+            self.state.workers[wid] = WorkerStatus(worker_id=wid, villages_total=len(chunk), queue_depth=len(chunk))
+        self.report_interval = Config.PROCESS_REPORT_INTERVAL
+        self._finished = threading.Event()
+    
+    def _open_database(self):
+        return DatabaseManager(self.spec['db_path'], pool_size=len(self.chunks) + 2)
+    
+    def run(self):
+        params = self.spec['params']
+        engine = params.get('fetch_engine') or Config.DEFAULT_FETCH_ENGINE
+        db = self._open_database()
+        if engine != 'offline':
+            get_concurrency_controller().start(len(self.chunks))
+        self._apply_limits(self.spec['limits'])
+        threading.Thread(target=self._control_loop, daemon=True, name="ProcessControl").start()
+        reporter = threading.Thread(target=self._report_loop, daemon=True, name="ProcessReporter")
+        reporter.start()
+        
+        try:
+            with ThreadPoolExecutor(max_workers=len(self.chunks)) as pool:
+                for i, (wid, chunk) in enumerate(self.chunks.items()):
+                    worker = SearchWorker(
+                        worker_id=wid,
+                        search_params=params,
+                        villages=chunk,
+                        state=self.state,
+                        all_records_writer=self.all_records_writer,
+                        matches_writer=self.matches_writer,
+                        state_lock=self.state_lock,
+                        db=db,
+                        session_id=self.spec['session_id'],
+                        work_queue=self.work_queue
+                    )
+                    pool.submit(worker.run)
+                    # Staggered Chrome startup, as in the server process
+                    if engine not in ('http', 'offline') and i < len(self.chunks) - 1:
+                        time.sleep(Config.WORKER_STARTUP_DELAY)
+        finally:
+            self._finished.set()
+            reporter.join()
+            try:
+                db.close()  # Queued writes are committed before the server hears 'done'
+            except Exception as e:
+                # An agent's coordinator can be gone for good; 'done' is still worth a try
+                logger.error(f"❌ Group {self.group_id}: final database flush failed: {e}")
+            self.out_queue.put(('done', self.group_id,
+                                {'steals': self.work_queue.steals, 'splits': self.work_queue.splits}))
+    
+    def _report_loop(self):
+        while not self._finished.wait(self.report_interval):
+            self.out_queue.put(('delta', self.group_id, self._collect_delta()))
+        self.out_queue.put(('delta', self.group_id, self._collect_delta()))  # Final state
+    
+    def _collect_delta(self) -> dict:
+        """Everything that changed since the last delta"""
+        delta = {}
+        with self.state_lock:
+            for name in self.APPEND_FIELDS + self.UNIQUE_FIELDS:
+                items = getattr(self.state, name)
+                delta[name] = list(items)
+                items.clear()
+            delta['counters'] = {name: getattr(self.state, name) for name in self.COUNTER_FIELDS}
+            delta['village_stats'] = dict(self.state.village_stats)
+            self.state.village_stats.clear()
+            delta['workers'] = {wid: asdict(ws) for wid, ws in self.state.workers.items()}
+        delta['all_records_rows'] = self.all_records_writer.drain()
+        delta['matches_rows'] = self.matches_writer.drain()
+        delta['aimd_signals'] = get_concurrency_controller().drain_signals()
+        return delta
+    
+    def _control_loop(self):
+        while True:
+            message = self.control_queue.get()
+            if message is None:
+                return
+            kind, payload = message
+            if kind == 'stop':
+                self.state.running = False
+            elif kind == 'limits':
+                self._apply_limits(payload)
+    
+    def _apply_limits(self, limits: tuple):
+        """Take this process's share of the coordinator's rate budget and worker limit"""
+        settings, scale, worker_limit, adaptive, share = limits
+        groups = self.spec['group_count']
+        for name, (rate, burst) in settings.items():
+            _global_rate_limiter.bucket(name).configure(rate=rate / groups, burst_size=max(1, burst // groups))
+        _global_rate_limiter.set_scale(scale)
+        _global_rate_limiter.set_share(share)
+        if adaptive:
+            share = math.ceil(worker_limit * len(self.chunks) / self.spec['total_workers'])
+            get_concurrency_controller().set_worker_limit(max(1, share))
+
+
+def _worker_process_main(spec: dict, out_queue, control_queue):
+    """Entry point of a worker process (module level so 'spawn' can import it)"""
+    WorkerProcessHost(spec, out_queue, control_queue).run()
+
+
+@dataclass
+class WorkerProcessGroup:
+    """Coordinator-side handle of one worker process"""
+    group_id: int
+    worker_ids: List[int]
+    process: Any
+    control: Any
+    done: bool = False
+    crashed: bool = False
+    counters: Dict[str, int] = field(default_factory=dict)  # Last counter values reported
+
+
+# ═══════════════════════════════════════════════════════════════════════════════════════
+# REMOTE AGENTS - WorkerProcessHost on another host, talking to the coordinator over HTTP
+# ═══════════════════════════════════════════════════════════════════════════════════════
+
+class LeasedWorkQueue(VillageWorkQueue):
+    """
+    VillageWorkQueue fed by the session's village leases instead of pre-assigned chunks.
+    take() leases the next pending village, so agents on any number of hosts pull work
+    until none is left. Splitting a running village stays inside the agent.
+    """
+    
+    def __init__(self, db, session_id: str, owner: str, max_survey: int, on_lease=None):
+        super().__init__({})
+        self.db = db
+        self.session_id = session_id
+        self.owner = owner
+        self.max_survey = max_survey
+        self.on_lease = on_lease  # Called with the worker id of every leased village
+    
+    def take(self, worker_id: int) -> Tuple[Optional[Tuple], Optional[int]]:
+        row = self.db.lease_village(self.session_id, self.owner, worker_id=worker_id, max_survey=self.max_survey)
+        if not row:
+            return None, None
+        if self.on_lease:
+            self.on_lease(worker_id)
+        return (row['village_code'], row['village_name'], row['hobli_code'], row['hobli_name']), None
+
+
+class CoordinatorClient:
+    """JSON over HTTP from an agent to the coordinator's /api/agents endpoints"""
+    
+    def __init__(self, base_url: str, token: str = None):
+        self.base_url = base_url.rstrip('/')
+        self.session = requests.Session()
+        token = Config.AGENT_TOKEN if token is None else token
+        if token:
+            self.session.headers['X-Agent-Token'] = token
+        self._lock = threading.Lock()  # One request at a time on the shared session
+    
+    def post(self, path: str, payload: dict) -> dict:
+        """
+        POST payload and return the JSON reply. Connection errors and 5xx replies are
+        retried for AGENT_RETRY_SECONDS; a 4xx reply raises requests.HTTPError at once.
+        """
+        deadline = time.time() + Config.AGENT_RETRY_SECONDS
+        delay = 0.5
+        while True:
+            try:
+                with self._lock:
+                    response = self.session.post(self.base_url + path, json=payload, timeout=Config.HTTP_TIMEOUT)
+                if response.status_code < 500:
+                    response.raise_for_status()
+                    return response.json()
+                error = requests.HTTPError(f"Coordinator replied {response.status_code}", response=response)
+            except requests.HTTPError:
+                raise
+            except requests.RequestException as e:
+                error = e
+            if time.time() + delay > deadline:
+                raise error
+            time.sleep(delay)
+            delay = min(delay * 2, 5.0)
+
+
+class AgentDatabase:
+    """
+    DatabaseManager stand-in for an agent's workers.
+    
+    The methods SearchWorker calls run on the coordinator, against the search's own
+    database. Writes (records, checkpoints, skips, survey ranges, cache rows) queue up
+    and go in one batch with the next report; a read or lease call sends the queued
+    writes first, so it always sees them. Like DatabaseManager, a durable=False call
+    returns a Future - a queued write's resolves with the coordinator's answer once its
+    batch is sent (a failed send keeps the write queued and the Future pending).
+    """
+    
+    WRITE_METHODS = frozenset({'save_record', 'save_records_batch', 'save_survey_checkpoint',
+                               'save_period_checkpoints', 'save_skipped_item', 'save_survey_ranges',
+                               'fail_village', 'save_cached_survey'})
+    READ_METHODS = frozenset({'get_last_checkpoint', 'get_period_checkpoints', 'get_survey_ranges',
+                              'get_cached_survey', 'get_record_keys', 'lease_village', 'renew_lease',
+                              'complete_lease', 'release_leases', 'sync'})
+    
+    def __init__(self, client: CoordinatorClient, agent_id: str):
+        self.client = client
+        self.agent_id = agent_id
+        self._outbox: List[dict] = []
+        self._waiting: List[Optional[Future]] = []  # Future of each queued write (None = durable)
+        self._lock = threading.Lock()  # Held across the request, so calls reach the coordinator in order
+    
+    def __getattr__(self, name: str):
+        if name in self.WRITE_METHODS:
+            return lambda *args, **kwargs: self._queue(name, args, kwargs)
+        if name in self.READ_METHODS:
+            return lambda *args, **kwargs: self._result(
+                self.flush([{'method': name, 'args': args, 'kwargs': kwargs}])[-1], kwargs)
+        raise AttributeError(f"Agents cannot call DatabaseManager.{name}")
+    
+    def _queue(self, name: str, args: tuple, kwargs: dict):
+        future = None if kwargs.get('durable', True) else Future()
+        with self._lock:
+            self._outbox.append({'method': name, 'args': args, 'kwargs': kwargs})
+            self._waiting.append(future)
+        return future
+    
+    @staticmethod
+    def _result(value: Any, kwargs: dict):
+        if kwargs.get('durable', True):
+            return value
+        future = Future()
+        future.set_result(value)
+        return future
+    
+    def flush(self, calls: List[dict] = ()) -> list:
+        """Send the queued writes (then calls) to the coordinator; results in call order"""
+        with self._lock:
+            batch = self._outbox + list(calls)
+            if not batch:
+                return []
+            try:
+                results = self.client.post(f'/api/agents/{self.agent_id}/db', {'calls': batch})['results']
+            except Exception:
+                self._outbox = batch[:len(self._outbox)]  # Writes go again with the next batch
+                raise
+            waiting, self._outbox, self._waiting = self._waiting, [], []
+        # Outside the lock - callbacks may queue more writes
+        for future, result in zip(waiting, results):
+            if future is not None:
+                future.set_result(result)
+        return results
+    
+    def close(self):
+        self.flush()
+
+
+class AgentUplink:
+    """
+    The out_queue of an AgentHost: each message is POSTed as a report, and the
+    'stop'/'limits' messages in the reply go to the host's control queue.
+    """
+    
+    def __init__(self, client: CoordinatorClient, agent_id: str, db: AgentDatabase, control_queue):
+        self.client = client
+        self.agent_id = agent_id
+        self.db = db
+        self.control_queue = control_queue
+    
+    def put(self, message: tuple):
+        kind, _, payload = message
+        try:
+            self.db.flush()  # Records reach the database before the counters that include them
+            reply = self.client.post(f'/api/agents/{self.agent_id}/report', {'kind': kind, 'payload': payload})
+        except Exception as e:
+            logger.error(f"🛰️ Coordinator unreachable - stopping this agent's workers: {e}")
+            self.control_queue.put(('stop', None))
+            return
+        for kind, payload in reply.get('control', []):
+            self.control_queue.put((kind, payload))
+
+
+class AgentHost(WorkerProcessHost):
+    """
+    Runs a remote agent's SearchWorkers: a WorkerProcessHost whose coordinator link is
+    HTTP (AgentUplink / AgentDatabase) and whose villages are leased, not assigned.
+    """
+    
+    def __init__(self, client: CoordinatorClient, spec: dict):
+        self.db = AgentDatabase(client, spec['agent_id'])
+        control = queue.Queue()
+        super().__init__(spec, AgentUplink(client, spec['agent_id'], self.db, control), control)
+        self.report_interval = Config.AGENT_REPORT_INTERVAL
+        self.work_queue = LeasedWorkQueue(
+            self.db, spec['session_id'], DatabaseManager.lease_owner_id(),
+            spec['params'].get('max_survey', Config.DEFAULT_MAX_SURVEY), on_lease=self._count_lease
+        )
+    
+    def _open_database(self):
+        return self.db
+    
+    def _count_lease(self, worker_id: int):
+        with self.state_lock:
+            ws = self.state.workers.get(worker_id)
+            if ws:
+                ws.villages_total += 1
+    
+    def run(self):
+        try:
+            super().run()
+        finally:
+            self.control_queue.put(None)
+
+
+@dataclass
+class RemoteAgentLink:
+    """Coordinator-side handle of one remote agent"""
+    agent_id: str
+    name: str
+    owner: str  # Lease owner (host:pid) of the agent's workers
+    worker_ids: List[int]
+    last_seen: float = field(default_factory=time.time)
+    done: bool = False
+    lost: bool = False
+    limits_sent: Optional[tuple] = None
+    counters: Dict[str, int] = field(default_factory=dict)  # Last counter values reported
+
+
+def run_agent(coordinator_url: str, workers: int = None, name: str = None, once: bool = False):
+    """
+    Headless agent: wait for a live search on the coordinator, join it with `workers`
+    workers until its villages run out, then wait for the next search (once=True: exit).
+    """
+    client = CoordinatorClient(coordinator_url)
+    workers = workers or Config.AGENT_WORKERS
+    name = name or platform.node()
+    last_session = None
+    logger.info(f"🛰️ Agent {name} ({workers} workers) for coordinator {coordinator_url}")
+    
+    while True:
+        try:
+            spec = client.post('/api/agents/register', {
+                'name': name, 'workers': workers, 'owner': DatabaseManager.lease_owner_id(),
+                'after_session': last_session,
+            })
+        except requests.RequestException as e:
+            if getattr(e, 'response', None) is None or e.response.status_code != 409:
+                logger.warning(f"🛰️ Coordinator not reachable: {e}")
+            time.sleep(Config.AGENT_POLL_INTERVAL)  # 409 = no search to join yet
+            continue
+        
+        ids = spec['worker_ids']
+        logger.info(f"🛰️ Joined session {spec['session_id']} as W{ids[0]}-W{ids[-1]}")
+        try:
+            AgentHost(client, spec).run()
+        except Exception as e:
+            logger.error(f"🛰️ Session {spec['session_id']} failed on this agent: {e}")
+            if once:
+                return
+            time.sleep(Config.AGENT_POLL_INTERVAL)
+            continue  # Back to polling - rejoins the session if it is still live
+        logger.info(f"🛰️ Session {spec['session_id']} finished on this agent")
+        last_session = spec['session_id']
+        if once:
+            return
+
 # ═══════════════════════════════════════════════════════════════════════════════════════
 # PARALLEL SEARCH COORDINATOR
 # ═══════════════════════════════════════════════════════════════════════════════════════
@@ -3892,6 +8952,11 @@ class ParallelSearchCoordinator:
         self.state_lock = threading.Lock()
         self.executor: Optional[ThreadPoolExecutor] = None
         self.workers: List[SearchWorker] = []
+        self.work_queue: Optional[VillageWorkQueue] = None
+        self.process_groups: List[WorkerProcessGroup] = []  # Multi-process mode only
+        self.agents: Dict[str, RemoteAgentLink] = {}  # Remote agents that joined this search
+        self.search_params: Optional[dict] = None
+        self.local_workers = 0  # Workers of this node (threads, processes or async sessions)
         self.all_records_writer: Optional[ThreadSafeCSVWriter] = None
         self.matches_writer: Optional[ThreadSafeCSVWriter] = None
         self.api = BhoomiAPI()
@@ -3910,6 +8975,46 @@ class ParallelSearchCoordinator:
         Prepare list of all villages to search.
         Returns: List of (village_code, village_name, hobli_code, hobli_name)
         
+        Reads the persistent hierarchy store (filled from the eChawadi API on first use);
+        falls back to walking the portal dropdowns in a browser if the API gives nothing.
+        """
+        store = get_hierarchy_store()
+        district_code, taluk_code = params['district_code'], params['taluk_code']
+        hobli_code_param = normalize_code(params.get('hobli_code', 'all'))
+        village_code_param = normalize_code(params.get('village_code', 'all'))
+        
+        def select(taluk):
+            return [
+                (v, vn, h, hn) for v, vn, h, hn in taluk['villages']
+                if hobli_code_param in ('all', '') or h == hobli_code_param
+                if village_code_param in ('all', '') or v == village_code_param
+            ]
+        
+        try:
+            taluk = store.get_taluk(district_code, taluk_code)
+            if taluk is None and store.refresh_taluk(district_code, taluk_code):
+                taluk = store.get_taluk(district_code, taluk_code)
+            
+            villages = select(taluk) if taluk else []
+            if taluk and not villages and store.refresh_taluk(district_code, taluk_code):
+                # Hobli/village may be newer than the stored copy
+                taluk = store.get_taluk(district_code, taluk_code)
+                villages = select(taluk)
+            
+            if villages:
+                params['district_name'] = taluk['district_name']
+                params['taluk_name'] = taluk['taluk_name']
+                logger.info(f"Found {len(villages)} villages to search (hierarchy store)")
+                return villages
+        except Exception as e:
+            logger.warning(f"Hierarchy store unavailable, using browser: {e}")
+        
+        return self._prepare_villages_browser(params)
+    
+    def _prepare_villages_browser(self, params: dict) -> List[Tuple[str, str, str, str]]:
+        """
+        Prepare the village list by walking the portal dropdowns in Chrome.
+        
         STABILITY: Uses guaranteed browser cleanup to prevent memory leaks.
         """
         import shutil
@@ -3965,7 +9070,7 @@ class ParallelSearchCoordinator:
             
             # Wait for options to load
             time.sleep(1)
-            dist_opts = {o.get_attribute('value'): o.text for o in dist_sel.options if o.get_attribute('value')}
+            dist_opts = {o['value']: o['text'] for o in DomReader.options(driver, IDS['district']) if o['value']}
             logger.info(f"Found {len(dist_opts)} districts. First 5: {list(dist_opts.keys())[:5]}")
             
             params['district_name'] = dist_opts.get(params['district_code'], 'Unknown')
@@ -3993,7 +9098,7 @@ class ParallelSearchCoordinator:
             
             # Wait for options to load
             time.sleep(1)
-            taluk_opts = {o.get_attribute('value'): o.text for o in taluk_sel.options if o.get_attribute('value')}
+            taluk_opts = {o['value']: o['text'] for o in DomReader.options(driver, IDS['taluk']) if o['value']}
             logger.info(f"Found {len(taluk_opts)} taluks. First 5: {list(taluk_opts.keys())[:5]}")
             
             params['taluk_name'] = taluk_opts.get(params['taluk_code'], 'Unknown')
@@ -4016,9 +9121,7 @@ class ParallelSearchCoordinator:
             time.sleep(3)  # Wait for hobli to load
             
             # Get all hoblis
-            hobli_sel = Select(driver.find_element(By.ID, IDS['hobli']))
-            all_hoblis = [(o.get_attribute('value'), o.text) for o in hobli_sel.options 
-                         if o.get_attribute('value') and 'Select' not in o.text]
+            all_hoblis = DomReader.option_pairs(driver, IDS['hobli'])
             
             # Filter hoblis
             hobli_code_param = params.get('hobli_code', 'all')
@@ -4040,10 +9143,8 @@ class ParallelSearchCoordinator:
                 Select(driver.find_element(By.ID, IDS['hobli'])).select_by_value(hobli_code)
                 time.sleep(2)
                 
-                village_sel = Select(driver.find_element(By.ID, IDS['village']))
-                villages = [(o.get_attribute('value'), o.text, hobli_code, hobli_name) 
-                           for o in village_sel.options 
-                           if o.get_attribute('value') and 'Select' not in o.text]
+                villages = [(v, vn, hobli_code, hobli_name)
+                            for v, vn in DomReader.option_pairs(driver, IDS['village'])]
                 
                 # Filter villages
                 village_code_param = params.get('village_code', 'all')
@@ -4070,6 +9171,28 @@ class ParallelSearchCoordinator:
             except Exception:
                 pass
     
+    def _prepare_villages_offline(self, params: dict) -> List[Tuple[str, str, str, str]]:
+        """
+        Village list for an offline search - villages earlier sessions registered for the
+        taluk, filtered like _prepare_villages. No browser, no portal.
+        """
+        crawled = self.db.get_crawled_villages(params['district_code'], params['taluk_code'])
+        
+        hobli_code_param = params.get('hobli_code', 'all')
+        village_code_param = params.get('village_code', 'all')
+        villages = []
+        for v in crawled:
+            if hobli_code_param != 'all' and hobli_code_param and v['hobli_code'] != str(hobli_code_param):
+                continue
+            if village_code_param != 'all' and village_code_param and v['village_code'] != str(village_code_param):
+                continue
+            villages.append((v['village_code'], v['village_name'], v['hobli_code'], v['hobli_name']))
+            params.setdefault('district_name', v['district_name'] or 'Unknown')
+            params.setdefault('taluk_name', v['taluk_name'] or 'Unknown')
+        
+        logger.info(f"Found {len(villages)} crawled villages for offline search")
+        return villages
+    
     def _distribute_villages(self, villages: List[Tuple], num_workers: int) -> List[List[Tuple]]:
         """Distribute villages evenly across workers"""
         chunks = [[] for _ in range(num_workers)]
@@ -4147,19 +9270,28 @@ class ParallelSearchCoordinator:
             with self.state_lock:
                 self.state.logs.append("📊 State Manager initialized - crash recovery enabled")
             
+            engine = params.get('fetch_engine') or Config.DEFAULT_FETCH_ENGINE
+            if engine == 'async' and aiohttp is None:
+                engine = params['fetch_engine'] = 'http'
+                with self.state_lock:
+                    self.state.logs.append("⚠️ aiohttp not installed - falling back to HTTP engine")
+            
             # ═══════════════════════════════════════════════════════════════════════
             # START PORTAL HEALTH MONITORING - Proactive portal monitoring
+            # (offline searches never touch the portal)
             # ═══════════════════════════════════════════════════════════════════════
-            portal_health.start_monitoring()
-            with self.state_lock:
-                self.state.logs.append("🏥 Portal Health Manager started - proactive monitoring active")
-            
-            # Start portal state response monitor (pause/resume based on portal health)
-            self.portal_state_monitor_thread = threading.Thread(
-                target=self._monitor_portal_state_and_respond, 
-                daemon=True
-            )
-            self.portal_state_monitor_thread.start()
+            if engine != 'offline':
+                portal_health.start_monitoring()
+                with self.state_lock:
+                    self.state.logs.append("🏥 Portal Health Manager started - proactive monitoring active")
+                
+                # Start portal state response monitor (pause/resume based on portal health)
+                self._stop_portal_monitor.clear()
+                self.portal_state_monitor_thread = threading.Thread(
+                    target=self._monitor_portal_state_and_respond, 
+                    daemon=True
+                )
+                self.portal_state_monitor_thread.start()
             
             # Initialize CSV writers (backup to database)
             fieldnames = ['district', 'taluk', 'hobli', 'village', 'survey_no', 
@@ -4173,11 +9305,17 @@ class ParallelSearchCoordinator:
             with self.state_lock:
                 self.state.logs.append("Preparing village list...")
             
-            villages = self._prepare_villages(params)
+            if engine == 'offline':
+                villages = self._prepare_villages_offline(params)
+            else:
+                villages = self._prepare_villages(params)
             
             if not villages:
                 with self.state_lock:
-                    self.state.logs.append("No villages found to search")
+                    if engine == 'offline':
+                        self.state.logs.append("No crawled villages found for this taluk - run a live search first")
+                    else:
+                        self.state.logs.append("No villages found to search")
                     self.state.running = False
                 return False
             
@@ -4200,24 +9338,56 @@ class ParallelSearchCoordinator:
             
             # Register villages in database for resume capability
             self.db.register_villages(self.current_session_id, villages)
-            self.db.update_session_status(self.current_session_id, 'running', total_villages=len(villages))
+            self.db.update_session_status(
+                self.current_session_id, 'running', total_villages=len(villages),
+                district_name=params.get('district_name', ''), taluk_name=params.get('taluk_name', ''),
+                notes='offline (RTC cache)' if engine == 'offline' else None
+            )
             
             # Determine number of workers
-            num_workers = min(Config.MAX_WORKERS, len(villages))
+            # HTTP engine has no Chrome footprint, so it can run a wider pool
+            max_workers = {
+                'http': Config.MAX_HTTP_WORKERS,
+                'async': Config.MAX_ASYNC_SESSIONS,
+                'offline': Config.MAX_OFFLINE_WORKERS,
+            }.get(engine, Config.MAX_WORKERS)
+            num_workers = min(max_workers, len(villages))
             self.state.total_workers = num_workers
+            _global_rate_limiter.set_share(1.0)  # Agents joining later take their share
+            if engine != 'offline':
+                get_concurrency_controller().start(num_workers)
             
-            # Distribute villages
+            # Distribute villages - round-robin start, idle workers steal the rest
             village_chunks = self._distribute_villages(villages, num_workers)
+            self.work_queue = VillageWorkQueue(dict(enumerate(village_chunks)))
             
             # Initialize worker statuses
             for i in range(num_workers):
                 self.state.workers[i] = WorkerStatus(
                     worker_id=i,
-                    villages_total=len(village_chunks[i])
+                    villages_total=len(village_chunks[i]),
+                    queue_depth=len(village_chunks[i])
                 )
             
             with self.state_lock:
-                self.state.logs.append(f"🚀 Starting {num_workers} workers for {len(villages)} villages")
+                self.state.logs.append(f"🚀 Starting {num_workers} workers for {len(villages)} villages (engine: {engine})")
+                self.search_params, self.local_workers = params, num_workers  # Remote agents can join from here
+            
+            process_count = min(int(params.get('worker_processes') or Config.WORKER_PROCESSES), num_workers)
+            if process_count and engine != 'async':
+                # Worker groups in their own processes - deltas flow back into self.state
+                self._start_worker_processes(params, village_chunks, process_count)
+                threading.Thread(target=self._monitor_completion, daemon=True).start()
+                return True
+            
+            if engine == 'async':
+                # All sessions run as coroutines on one event loop thread
+                threading.Thread(
+                    target=lambda: asyncio.run(self._run_async_engine(params, village_chunks)),
+                    daemon=True, name="AsyncSearchEngine"
+                ).start()
+                threading.Thread(target=self._monitor_completion, daemon=True).start()
+                return True
             
             # Start workers with staggered startup to avoid Chrome conflicts
             self.executor = ThreadPoolExecutor(max_workers=num_workers)
@@ -4232,13 +9402,14 @@ class ParallelSearchCoordinator:
                     matches_writer=self.matches_writer,
                     state_lock=self.state_lock,
                     db=self.db,  # Persistent database
-                    session_id=self.current_session_id  # Current session ID
+                    session_id=self.current_session_id,  # Current session ID
+                    work_queue=self.work_queue
                 )
                 self.workers.append(worker)
                 self.executor.submit(worker.run)
                 
                 # Staggered startup on Windows to prevent Chrome crashes
-                if i < num_workers - 1:  # Don't wait after last worker
+                if engine not in ('http', 'offline') and i < num_workers - 1:  # Don't wait after last worker
                     time.sleep(Config.WORKER_STARTUP_DELAY)
                     with self.state_lock:
                         self.state.logs.append(f"Worker {i} started, launching next...")
@@ -4254,6 +9425,345 @@ class ParallelSearchCoordinator:
                 self.state.running = False
                 self.state.logs.append(f"❌ Search failed to start: {str(e)[:100]}")
     
+    async def _run_async_engine(self, params: dict, village_chunks: List[List[Tuple]]):
+        """Run every worker as a coroutine sharing one rate limiter, connector and sink"""
+        limiter = AsyncRateLimiter(_global_rate_limiter)
+        requests_before = limiter.get_stats()['total_requests']
+        connector = aiohttp.TCPConnector(limit=Config.MAX_HTTP_WORKERS, ssl=False)
+        sink = AsyncRecordSink()
+        sink.start()
+        
+        workers = []
+        for i, chunk in enumerate(village_chunks):
+            worker = AsyncSearchWorker(
+                worker_id=i,
+                search_params=params,
+                villages=chunk,
+                state=self.state,
+                all_records_writer=self.all_records_writer,
+                matches_writer=self.matches_writer,
+                state_lock=self.state_lock,
+                db=self.db,
+                session_id=self.current_session_id,
+                work_queue=self.work_queue,
+                limiter=limiter,
+                sink=sink,
+                connector=connector
+            )
+            workers.append(worker)
+        self.workers.extend(workers)
+        
+        try:
+            await asyncio.gather(*(w.run_async() for w in workers))
+        finally:
+            await sink.close()
+            await connector.close()
+            portal_requests = limiter.get_stats()['total_requests'] - requests_before
+            with self.state_lock:
+                self.state.logs.append(
+                    f"⚡ Async engine done: {portal_requests} portal requests, "
+                    f"{sink.writes_done} writes ({sink.write_errors} failed), {self.work_queue.steals} villages stolen, "
+                f"{self.work_queue.splits} survey ranges split"
+                )
+    
+    def _start_worker_processes(self, params: dict, village_chunks: List[List[Tuple]], process_count: int):
+        """Run the workers in process_count processes; a pump thread feeds their deltas into self.state"""
+        ctx = multiprocessing.get_context(Config.WORKER_PROCESS_START_METHOD)
+        self._process_events = ctx.Queue()
+        self.process_groups = []
+        limits = self._process_limits()
+        worker_ids = list(range(len(village_chunks)))
+        
+        for group_id in range(process_count):
+            ids = worker_ids[group_id::process_count]
+            spec = {
+                'group_id': group_id,
+                'group_count': process_count,
+                'total_workers': len(worker_ids),
+                'worker_ids': ids,
+                'chunks': [village_chunks[i] for i in ids],
+                'params': params,
+                'session_id': self.current_session_id,
+                'db_path': self.db.db_path,
+                'owner_variants': self.state.owner_variants,
+                'limits': limits,
+            }
+            control = ctx.Queue()
+            process = ctx.Process(
+                target=_worker_process_main, args=(spec, self._process_events, control),
+                daemon=True, name=f"BhoomiWorkers-{group_id}"
+            )
+            process.start()
+            self.process_groups.append(WorkerProcessGroup(group_id, ids, process, control))
+        
+        with self.state_lock:
+            self.state.logs.append(
+                f"🧩 {process_count} worker processes started "
+                f"({', '.join(f'PID {g.process.pid}: W{min(g.worker_ids)}+' for g in self.process_groups)})"
+            )
+        threading.Thread(target=self._pump_worker_processes, args=(limits,), daemon=True,
+                         name="WorkerProcessPump").start()
+    
+    def _process_limits(self, share: float = None) -> tuple:
+        """
+        Rate budget and worker limit the worker processes share. share is the recipient's
+        fraction of the budget - this node's by default, an agent's for an agent.
+        """
+        controller = get_concurrency_controller()
+        return (_global_rate_limiter.settings(), _global_rate_limiter.scale,
+                controller.worker_limit, controller.enabled,
+                _global_rate_limiter.share if share is None else share)
+    
+    def _pump_worker_processes(self, limits_sent: tuple):
+        """
+        Apply state deltas from the worker processes, forward stop and limit changes,
+        and fail the workers of a process that died without finishing.
+        """
+        groups = {g.group_id: g for g in self.process_groups}
+        stop_sent = False
+        last_check = 0.0
+        
+        while True:
+            try:
+                kind, group_id, payload = self._process_events.get(timeout=Config.PROCESS_REPORT_INTERVAL)
+                group = groups[group_id]
+                if kind == 'delta' and not group.crashed:
+                    self._apply_process_delta(group, payload)
+                elif kind == 'done':
+                    self.work_queue.steals += payload['steals']
+                    self.work_queue.splits += payload['splits']
+                    self._close_process_group(group)
+            except queue.Empty:
+                pass
+            
+            live = [g for g in groups.values() if not (g.done or g.crashed)]
+            if not live:
+                break
+            if time.time() - last_check < Config.PROCESS_REPORT_INTERVAL:
+                continue
+            last_check = time.time()
+            
+            if not self.state.running and not stop_sent:
+                for g in live:
+                    g.control.put(('stop', None))
+                stop_sent = True
+            
+            limits = self._process_limits()
+            if limits != limits_sent:
+                for g in live:
+                    g.control.put(('limits', limits))
+                limits_sent = limits
+            
+            for g in live:
+                if not g.process.is_alive() and g.process.exitcode != 0:
+                    self._close_process_group(g, crashed=True)
+        
+        for g in groups.values():
+            g.control.put(None)
+            g.process.join(timeout=5)
+        logger.info("🧩 Worker processes finished")
+    
+    def _apply_process_delta(self, group, delta: dict):
+        """Merge one delta from a worker process or remote agent (its WorkerProcessGroup /
+        RemoteAgentLink) into the authoritative SearchState"""
+        with self.state_lock:
+            state = self.state
+            for name in WorkerProcessHost.APPEND_FIELDS:
+                getattr(state, name).extend(delta[name])
+            for name in WorkerProcessHost.UNIQUE_FIELDS:
+                items = getattr(state, name)
+                items.extend(item for item in dict.fromkeys(delta[name]) if item not in items)
+            # Same caps as the in-process workers keep
+            if len(state.logs) > 100:
+                state.logs = state.logs[-100:]
+            if len(state.all_records) > 500:
+                state.all_records = state.all_records[-500:]
+            
+            for name, value in delta['counters'].items():
+                setattr(state, name, getattr(state, name) + value - group.counters.get(name, 0))
+                group.counters[name] = value
+            state.village_stats.update(delta['village_stats'])
+            
+            for wid, fields in delta['workers'].items():
+                ws = state.workers.get(wid)
+                if ws:
+                    for key, value in fields.items():
+                        setattr(ws, key, value)
+            state.recalculate_totals()
+        
+        if delta['all_records_rows']:
+            self.all_records_writer.write_records(delta['all_records_rows'])
+        if delta['matches_rows']:
+            self.matches_writer.write_records(delta['matches_rows'])
+        get_concurrency_controller().merge_signals(*delta['aimd_signals'])
+    
+    def _close_process_group(self, group: WorkerProcessGroup, crashed: bool = False):
+        """
+        A worker process finished or died. Workers it never reported as finished are
+        failed; a crashed process's village leases go straight back to pending for resume.
+        """
+        group.done, group.crashed = not crashed, crashed
+        with self.state_lock:
+            unfinished = self._fail_unfinished_workers(group.worker_ids)
+            if crashed:
+                self.state.logs.append(
+                    f"💥 Worker process {group.group_id} (PID {group.process.pid}) exited with code "
+                    f"{group.process.exitcode} - its unfinished villages can be resumed"
+                )
+        if crashed:
+            logger.error(f"Worker process {group.group_id} crashed (exit code {group.process.exitcode})")
+            try:
+                released = self.db.release_leases(self.current_session_id,
+                                                  DatabaseManager.lease_owner_id(group.process.pid))
+                if released:
+                    logger.info(f"🔓 Released {len(released)} village leases of crashed worker process {group.group_id}")
+            except Exception as lease_err:
+                logger.debug(f"Lease release failed: {lease_err}")
+        elif unfinished:
+            logger.warning(f"Worker process {group.group_id} ended with W{unfinished} unfinished")
+    
+    def _fail_unfinished_workers(self, worker_ids: List[int]) -> List[int]:
+        """Fail the workers of a departed process/agent that never reported finishing (state_lock held)"""
+        unfinished = [wid for wid in worker_ids
+                      if self.state.workers.get(wid) and self.state.workers[wid].status not in ('completed', 'failed')]
+        for wid in unfinished:
+            self.state.workers[wid].status = 'failed'
+        self.state.recalculate_totals()
+        return unfinished
+    
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    # REMOTE AGENTS - /api/agents/* land here; agent workers are ordinary SearchState workers
+    # ═══════════════════════════════════════════════════════════════════════════════════
+    
+    def register_agent(self, name: str, workers: int, owner: str, after_session: str = None) -> dict:
+        """
+        Add a remote agent's workers to the running search.
+        Returns the spec its AgentHost runs; ValueError when there is nothing to join.
+        """
+        import uuid
+        with self.state_lock:
+            if not (self.state.running and self.search_params and self.current_session_id):
+                raise ValueError("No live search to join")
+            if after_session == self.current_session_id:
+                raise ValueError("Agent already worked this session")
+            params = dict(self.search_params)
+            engine = params.get('fetch_engine') or Config.DEFAULT_FETCH_ENGINE
+            if engine == 'offline':
+                raise ValueError("Offline searches run on the coordinator only")
+            if engine == 'async':
+                params['fetch_engine'] = 'http'  # Agents run thread workers; same postbacks
+            
+            first = max(self.state.workers, default=-1) + 1
+            worker_ids = list(range(first, first + max(1, int(workers))))
+            for wid in worker_ids:
+                self.state.workers[wid] = WorkerStatus(worker_id=wid)
+            self.state.total_workers += len(worker_ids)
+            link = RemoteAgentLink(uuid.uuid4().hex[:12], name, owner, worker_ids)
+            self.agents[link.agent_id] = link
+            self.state.logs.append(f"🛰️ Agent {name} joined with {len(worker_ids)} workers (W{first}-W{worker_ids[-1]})")
+        
+        self._rebalance_rate_shares()
+        link.limits_sent = self._process_limits(self._rate_share(len(worker_ids)))
+        logger.info(f"🛰️ Agent {name} ({owner}) registered as {link.agent_id}")
+        return {
+            'agent_id': link.agent_id,
+            'group_id': link.agent_id,
+            'group_count': 1,
+            'total_workers': self.local_workers,
+            'worker_ids': worker_ids,
+            'chunks': [[] for _ in worker_ids],
+            'params': params,
+            'session_id': self.current_session_id,
+            'owner_variants': self.state.owner_variants,
+            'limits': link.limits_sent,
+        }
+    
+    def agent_db_calls(self, agent_id: str, calls: List[dict]) -> list:
+        """Run an agent's batched DatabaseManager calls in order; their results"""
+        link = self.agents.get(agent_id)
+        if link is None:
+            raise KeyError(agent_id)
+        link.last_seen = time.time()
+        allowed = AgentDatabase.WRITE_METHODS | AgentDatabase.READ_METHODS
+        results = []
+        for call in calls:
+            if call['method'] not in allowed:
+                raise ValueError(f"Method not available to agents: {call['method']}")
+            if call['method'] in AgentDatabase.READ_METHODS:
+                results = [r.result() if isinstance(r, Future) else r for r in results]  # Reads see the writes
+            results.append(getattr(self.db, call['method'])(*call.get('args', ()), **call.get('kwargs', {})))
+        # durable=False writes of the batch share group commits; answer once they are durable
+        return [r.result() if isinstance(r, Future) else r for r in results]
+    
+    def agent_report(self, agent_id: str, kind: str, payload: dict) -> List[tuple]:
+        """Apply an agent's delta / done report; returns the control messages for it"""
+        link = self.agents.get(agent_id)
+        if link is None or link.done or link.lost:
+            return [('stop', None)]
+        link.last_seen = time.time()
+        if kind == 'done':
+            with self.state_lock:
+                if self.work_queue:
+                    self.work_queue.steals += payload['steals']
+                    self.work_queue.splits += payload['splits']
+            self._close_agent(link)
+            return []
+        
+        payload['workers'] = {int(wid): fields for wid, fields in payload['workers'].items()}  # JSON keys
+        self._apply_process_delta(link, payload)
+        control = []
+        if not self.state.running:
+            control.append(('stop', None))
+        limits = self._process_limits(self._rate_share(len(link.worker_ids)))
+        if limits != link.limits_sent:
+            control.append(('limits', limits))
+            link.limits_sent = limits
+        return control
+    
+    def _close_agent(self, link: RemoteAgentLink, lost: bool = False):
+        """An agent finished or went silent; a lost agent's leases go back to pending at once"""
+        link.done, link.lost = not lost, lost
+        with self.state_lock:
+            unfinished = self._fail_unfinished_workers(link.worker_ids)
+            if lost:
+                self.state.logs.append(f"📡 Agent {link.name} silent for {Config.AGENT_TIMEOUT}s - "
+                                       f"W{link.worker_ids[0]}-W{link.worker_ids[-1]} dropped")
+        if lost:
+            try:
+                released = self.db.release_leases(self.current_session_id, link.owner)
+            except Exception as lease_err:
+                logger.debug(f"Lease release failed: {lease_err}")
+                released = []
+            if released and self.work_queue and not self.process_groups:
+                # Local workers already passed these villages by; queue them again
+                added = self.work_queue.requeue([(v['village_code'], v['village_name'], v['hobli_code'], v['hobli_name'])
+                                                 for v in released])
+                with self.state_lock:
+                    for wid, count in added.items():
+                        if wid in self.state.workers:
+                            self.state.workers[wid].villages_total += count
+                            self.state.workers[wid].queue_depth = self.work_queue.depth(wid)
+            if released:
+                logger.info(f"🔓 Released {len(released)} village leases of lost agent {link.name}")
+        elif unfinished:
+            logger.warning(f"Agent {link.name} left with W{unfinished} unfinished")
+        self._rebalance_rate_shares()
+    
+    def _check_agents(self):
+        """Drop agents that stopped reporting (host down, network gone)"""
+        for link in list(self.agents.values()):
+            if not (link.done or link.lost) and time.time() - link.last_seen > Config.AGENT_TIMEOUT:
+                self._close_agent(link, lost=True)
+    
+    def _rate_share(self, workers: int) -> float:
+        """Fraction of the global rate budget for `workers` workers - shared by worker count"""
+        total = self.local_workers + sum(len(a.worker_ids) for a in self.agents.values() if not (a.done or a.lost))
+        return workers / total if total else 1.0
+    
+    def _rebalance_rate_shares(self):
+        """Local share of the budget after an agent joined or left (agents get theirs with the next report)"""
+        _global_rate_limiter.set_share(self._rate_share(self.local_workers))
+    
     def _monitor_portal_state_and_respond(self):
         """
         Monitor portal health and intelligently pause/resume workers.
@@ -4294,13 +9804,10 @@ class ParallelSearchCoordinator:
                         # Workers will naturally pause as they check portal_health.should_wait()
                         
                     elif portal_state == 'RATE_LIMITED':
-                        # Being rate limited - initiate gradual scale-down
+                        # Being rate limited - the AIMD controller cuts workers and rate
                         with self.state_lock:
                             self.state.logs.append("⚠️ RATE LIMITED - Throttling workers...")
                         
-                        # TODO: Implement worker throttling (reduce active workers)
-                        # For now, cooldown mechanism handles this
-                        
                     elif portal_state == 'NETWORK_CONGESTION':
                         # Network issues - increase timeouts, don't stop
                         with self.state_lock:
@@ -4324,6 +9831,11 @@ class ParallelSearchCoordinator:
                     
                     last_state = portal_state
                 
+                # ADAPTIVE CONCURRENCY - One AIMD decision per interval
+                decision = get_concurrency_controller().step(portal_state)
+                if decision:
+                    self._log_aimd_decision(decision)
+                
                 # Save periodic state snapshots (in background to avoid blocking)
                 if self.state_manager:
                     now = time.time()
@@ -4342,8 +9854,22 @@ class ParallelSearchCoordinator:
             except Exception as e:
                 logger.error(f"Portal state monitor error: {e}")
         
+        get_concurrency_controller().stop()
         logger.info("🧠 Portal state response monitor stopped")
     
+    def _log_aimd_decision(self, decision: dict):
+        """Changes go to the search log, holds only to the debug log"""
+        summary = (f"{decision['reason']} → {decision['worker_limit']} workers @ {decision['rate']} req/s "
+                   f"({decision['requests']} requests, {decision['success_rate']:.0%} ok, "
+                   f"p95 {decision['p95_latency']}s)")
+        if decision['action'] == 'hold':
+            logger.debug(f"🎚️ AIMD hold: {summary}")
+            return
+        icon = '📈' if decision['action'] == 'increase' else '📉'
+        logger.info(f"{icon} AIMD {decision['action']}: {summary}")
+        with self.state_lock:
+            self.state.logs.append(f"{icon} AIMD {decision['action']}: {summary}")
+    
     def _monitor_completion(self):
         """Monitor workers and mark search as complete when all done"""
         # Wait a bit for workers to initialize before starting to monitor
@@ -4356,6 +9882,7 @@ class ParallelSearchCoordinator:
                     break
             
             time.sleep(2)
+            self._check_agents()
             
             with self.state_lock:
                 # Don't check completion if no workers exist yet (race condition prevention)
@@ -4416,6 +9943,10 @@ class ParallelSearchCoordinator:
                     self.state.logs.append(f"║    📝 Total records: {self.state.total_records}".ljust(63) + "║")
                     self.state.logs.append(f"║    🎯 Owner matches: {self.state.total_matches}".ljust(63) + "║")
                     self.state.logs.append(f"║    📅 Periods processed: {self.state.total_periods_processed}".ljust(63) + "║")
+                    self.state.logs.append(f"║    💾 Surveys from RTC cache: {self.state.surveys_from_cache}".ljust(63) + "║")
+                    if self.work_queue:
+                        self.state.logs.append(f"║    🤝 Villages stolen by idle workers: {self.work_queue.steals}".ljust(63) + "║")
+                        self.state.logs.append(f"║    ✂️ Survey ranges split off: {self.work_queue.splits}".ljust(63) + "║")
                     
                     self.state.logs.append("║".ljust(63) + "║")
                     
@@ -4443,6 +9974,8 @@ class ParallelSearchCoordinator:
                     # Final Status
                     if failed > 0:
                         self.state.logs.append(f"║  ⚠️ FAILED: {', '.join(self.state.villages_failed[:5])}".ljust(63) + "║")
+                    if self.state.villages_not_cached:
+                        self.state.logs.append(f"║  📭 NOT CRAWLED: {', '.join(self.state.villages_not_cached[:5])}".ljust(63) + "║")
                     
                     if processed < total_villages:
                         missing = total_villages - processed
@@ -4616,6 +10149,12 @@ class ParallelSearchCoordinator:
             except Exception:
                 state_mgmt_info = {'is_paused': False, 'pause_reason': '', 'can_resume': False}
             
+            # Observed postback latencies (WaitStrategy has its own lock)
+            wait_latencies = WaitStrategy.get_latency_stats()
+            
+            # AIMD controller decisions (controller has its own lock)
+            adaptive_concurrency = get_concurrency_controller().get_status()
+            
             # STABILITY: Use timeout lock acquisition
             lock_acquired = self.state_lock.acquire(timeout=2.0)
             if not lock_acquired:
@@ -4659,6 +10198,7 @@ class ParallelSearchCoordinator:
                                 'max_survey': ws.max_survey or 0,
                                 'villages_completed': ws.villages_completed or 0,
                                 'villages_total': ws.villages_total or 0,
+                                'queue_depth': ws.queue_depth or 0,
                                 'records_found': ws.records_found or 0,
                                 'matches_found': ws.matches_found or 0,
                                 'progress': int((ws.villages_completed / max(ws.villages_total, 1)) * 100) if ws.villages_total else 0
@@ -4693,6 +10233,7 @@ class ParallelSearchCoordinator:
                         'failed': len(self.state.villages_failed) if self.state.villages_failed else 0,
                         'session_recoveries': self.state.session_recoveries or 0,
                         'failed_villages': list(self.state.villages_failed[-10:]) if self.state.villages_failed else [],
+                        'not_cached_villages': list(self.state.villages_not_cached) if self.state.villages_not_cached else [],
                     },
                     # ═══════════════════════════════════════════════════════════════════════
                     # SMART STOP & ACCURACY METRICS - For user confidence
@@ -4703,6 +10244,7 @@ class ParallelSearchCoordinator:
                         'smart_stops': self.state.smart_stops or 0,
                         'surveys_saved': self.state.surveys_saved or 0,
                         'estimated_time_saved': f"{(self.state.surveys_saved or 0) * 3 // 60} min",
+                        'surveys_from_cache': self.state.surveys_from_cache or 0,
                     },
                     'accuracy_metrics': {
                         'skipped_surveys_count': len(self.state.skipped_surveys) if self.state.skipped_surveys else 0,
@@ -4724,6 +10266,14 @@ class ParallelSearchCoordinator:
                     'portal_health': portal_health_stats,
                     # State management (fetched outside lock)
                     'state_management': state_mgmt_info,
+                    'wait_latencies': wait_latencies,
+                    'adaptive_concurrency': adaptive_concurrency,
+                    'agents': [
+                        {'agent_id': a.agent_id, 'name': a.name, 'workers': a.worker_ids,
+                         'status': 'lost' if a.lost else 'done' if a.done else 'active',
+                         'last_seen': round(time.time() - a.last_seen, 1)}
+                        for a in self.agents.values()
+                    ],
                     'workers': workers_dict
                 }
                 return state_dict
@@ -4766,9 +10316,11 @@ class ParallelSearchCoordinator:
 app = Flask(__name__)
 CORS(app)
 
-# Global instances
-api = BhoomiAPI()
-coordinator = ParallelSearchCoordinator()
+# Global instances - web server only. A worker process or agent importing the module
+# would otherwise open a second DatabaseManager (writer thread, reader pool, migrations)
+# on the same file just to back routes it never serves.
+api = BhoomiAPI() if _is_web_server_process() else None
+coordinator = ParallelSearchCoordinator() if _is_web_server_process() else None
 
 # ═══════════════════════════════════════════════════════════════════════════════════════
 # HTML TEMPLATE (Enhanced with parallel worker visualization)
@@ -5038,6 +10590,7 @@ HTML_TEMPLATE = '''
         .worker-status.completed { background: rgba(59, 130, 246, 0.2); color: var(--info); }
         .worker-status.failed { background: rgba(239, 68, 68, 0.2); color: var(--error); }
         .worker-status.idle { background: rgba(107, 114, 128, 0.2); color: var(--text-muted); }
+        .worker-status.parked { background: rgba(245, 158, 11, 0.2); color: var(--warning); }
         
         .worker-village {
             font-size: 0.8rem;
@@ -5502,6 +11055,16 @@ HTML_TEMPLATE = '''
                 <input type="number" id="maxSurvey" class="form-input" value="200" min="1" max="1000">
             </div>
             
+            <div class="form-group">
+                <label class="form-label">Fetch Engine</label>
+                <select id="fetchEngine" class="form-select">
+                    <option value="selenium">Browser (Selenium)</option>
+                    <option value="http">Browserless (HTTP)</option>
+                    <option value="async">Browserless (Async, many sessions)</option>
+                    <option value="offline">Offline (crawled data only)</option>
+                </select>
+            </div>
+            
             <button id="searchBtn" class="btn btn-primary">
                 <span>⚡</span>
                 <span>Start Parallel Search</span>
@@ -5667,6 +11230,11 @@ HTML_TEMPLATE = '''
                         <span>✓ Success Rate: <strong id="portalSuccessRate">--</strong></span>
                         <span id="portalCooldown" style="display: none;">⏸️ Cooldown: <strong id="portalCooldownTime">0s</strong></span>
                     </div>
+                    <div style="display: flex; gap: 1rem; margin-top: 0.25rem; font-size: 0.75rem; color: var(--text-muted);">
+                        <span>🎚️ Concurrency: <strong id="aimdWorkers">--</strong></span>
+                        <span>⏱️ Rate: <strong id="aimdRate">--</strong></span>
+                        <span id="aimdDecision"></span>
+                    </div>
                 </div>
             </div>
             
@@ -5970,6 +11538,7 @@ HTML_TEMPLATE = '''
         const searchBtn = document.getElementById('searchBtn');
         const ownerInput = document.getElementById('ownerName');
         const maxSurveyInput = document.getElementById('maxSurvey');
+        const fetchEngineSelect = document.getElementById('fetchEngine');
         
         // Initialize
         document.addEventListener('DOMContentLoaded', () => {
@@ -6239,7 +11808,8 @@ HTML_TEMPLATE = '''
                         taluk_code: talukCode,
                         hobli_code: hobliCode,
                         village_code: villageCode,
-                        max_survey: parseInt(maxSurveyInput.value) || 200
+                        max_survey: parseInt(maxSurveyInput.value) || 200,
+                        fetch_engine: fetchEngineSelect.value
                     })
                 });
                 
@@ -6429,7 +11999,7 @@ HTML_TEMPLATE = '''
                             
                             if (progressEl) progressEl.style.width = (w.progress || 0) + '%';
                             if (statsEl) statsEl.innerHTML = 
-                                `<span>${w.villages_completed || 0}/${w.villages_total || 0} villages</span><span class="worker-records-count">${w.records_found || 0} records</span>`;
+                                `<span>${w.villages_completed || 0}/${w.villages_total || 0} villages${w.queue_depth ? ` · ${w.queue_depth} queued` : ''}</span><span class="worker-records-count">${w.records_found || 0} records</span>`;
                         }
                     });
                 }
@@ -6580,6 +12150,14 @@ HTML_TEMPLATE = '''
                         }
                     }
                     
+                    const aimd = status.adaptive_concurrency;
+                    if (aimd && aimd.enabled) {
+                        document.getElementById('aimdWorkers').textContent = `${aimd.active_workers}/${aimd.worker_limit} of ${aimd.max_workers} workers`;
+                        document.getElementById('aimdRate').textContent = `${aimd.rate} req/s`;
+                        const d = aimd.last_decision;
+                        document.getElementById('aimdDecision').textContent = d ? `${d.time} ${d.action}: ${d.reason}` : '';
+                    }
+                    
                     // ═══════════════════════════════════════════════════════════════════════
                     // PORTAL HEALTH ALERT BANNER - Show alerts for critical states
                     // ═══════════════════════════════════════════════════════════════════════
@@ -6782,21 +12360,37 @@ HTML_TEMPLATE = '''
 def index():
     return render_template_string(HTML_TEMPLATE)
 
+def _cacheable_json(data):
+    """
+    JSON response for the dropdown routes with ETag + Cache-Control, answering
+    If-None-Match with 304. Empty lists (portal error) are not cached.
+    """
+    response = jsonify(data)
+    if not data:
+        response.cache_control.no_store = True
+        return response
+    response.add_etag()
+    response.cache_control.public = True
+    response.cache_control.max_age = Config.API_HTTP_MAX_AGE
+    return response.make_conditional(request)
+
 @app.route('/api/districts')
 def get_districts():
-    return jsonify(api.get_districts())
+    return _cacheable_json(api.get_districts())
 
 @app.route('/api/taluks/<int:district_code>')
 def get_taluks(district_code):
-    return jsonify(api.get_taluks(district_code))
+    return _cacheable_json(api.get_taluks(district_code))
 
 @app.route('/api/hoblis/<int:district_code>/<int:taluk_code>')
 def get_hoblis(district_code, taluk_code):
-    return jsonify(api.get_hoblis(district_code, taluk_code))
+    # Taluk picked - have its villages stored before the search starts
+    get_hierarchy_store().warm(district_code, taluk_code)
+    return _cacheable_json(api.get_hoblis(district_code, taluk_code))
 
 @app.route('/api/villages/<int:district_code>/<int:taluk_code>/<int:hobli_code>')
 def get_villages(district_code, taluk_code, hobli_code):
-    return jsonify(api.get_villages(district_code, taluk_code, hobli_code))
+    return _cacheable_json(api.get_villages(district_code, taluk_code, hobli_code))
 
 @app.route('/api/search/start', methods=['POST'])
 def start_search():
@@ -6818,19 +12412,36 @@ def stop_search():
     coordinator.stop_search()
     return jsonify({'status': 'stopped'})
 
+def stream_export(rows, fieldnames: List[str], filename: str):
+    """
+    Streaming download of rows - format=csv|ndjson and gzip=true come from the query.
+    
+    filename has no extension; the format's (plus .gz) is added.
+    """
+    fmt = request.args.get('format', 'csv').lower()
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({'error': f"Unknown format '{fmt}' (expected one of {', '.join(EXPORT_FORMATS)})"}), 400
+    compress = request.args.get('gzip', 'false').lower() == 'true'
+    mimetype, ext = EXPORT_FORMATS[fmt]
+    
+    response = Response(stream_with_context(export_chunks(rows, fieldnames, fmt, compress)),
+                        mimetype='application/gzip' if compress else mimetype)
+    response.headers.set('Content-Disposition', 'attachment',
+                         filename=filename + ext + ('.gz' if compress else ''))
+    response.headers['X-Accel-Buffering'] = 'no'  # Reverse proxies pass chunks straight through
+    return response
+
 @app.route('/api/download/<file_type>')
 def download_csv(file_type):
-    """Download CSV file with custom filename"""
-    from flask import send_file, request
-    
+    """Download the live search CSV with custom filename (format=csv|ndjson, gzip=true)"""
     state = coordinator.get_state()
     
     if file_type == 'records':
         filepath = state.get('all_records_file', '')
-        default_name = 'all_records.csv'
+        default_name = 'all_records'
     elif file_type == 'matches':
         filepath = state.get('matches_file', '')
-        default_name = 'owner_matches.csv'
+        default_name = 'owner_matches'
     else:
         return jsonify({'error': 'Invalid file type'}), 400
     
@@ -6839,15 +12450,13 @@ def download_csv(file_type):
     
     # Get custom filename from query param or use default
     custom_name = request.args.get('filename', default_name)
-    if not custom_name.endswith('.csv'):
-        custom_name += '.csv'
+    for ext in ('.gz', '.csv', '.ndjson'):
+        if custom_name.endswith(ext):
+            custom_name = custom_name[:-len(ext)]
     
-    return send_file(
-        filepath,
-        mimetype='text/csv',
-        as_attachment=True,
-        download_name=custom_name
-    )
+    with open(filepath, newline='', encoding='utf-8') as f:
+        fieldnames = next(csv.reader(f), [])
+    return stream_export(csv_file_rows(filepath), fieldnames, custom_name)
 
 @app.route('/api/files/info')
 def get_files_info():
@@ -6889,6 +12498,67 @@ def get_portal_health():
     """Get current portal health status"""
     return jsonify(portal_health.get_stats())
 
+@app.route('/api/rate-limits')
+def get_rate_limits():
+    """Per-operation rate limit buckets with wait-time histograms"""
+    return jsonify(_global_rate_limiter.get_stats())
+
+@app.route('/api/rate-limits', methods=['POST'])
+def set_rate_limits():
+    """
+    Retune buckets at runtime.
+    Body: {"fetch": {"rate": 1.0, "burst": 5}, "navigation": {"rate": 8}}
+    """
+    data = request.json or {}
+    try:
+        for operation, limits in data.items():
+            _global_rate_limiter.configure(operation, rate=limits.get('rate'), burst_size=limits.get('burst'))
+    except (ValueError, TypeError, AttributeError) as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify(_global_rate_limiter.get_stats())
+
+# ═══════════════════════════════════════════════════════════════════════════════════════
+# REMOTE AGENT API - Agents started with --agent join the running search
+# ═══════════════════════════════════════════════════════════════════════════════════════
+
+def _agent_authorized() -> bool:
+    return not Config.AGENT_TOKEN or request.headers.get('X-Agent-Token') == Config.AGENT_TOKEN
+
+@app.route('/api/agents/register', methods=['POST'])
+def register_agent():
+    """Body: {"name": "node-2", "workers": 4, "owner": "node-2:1234", "after_session": null}"""
+    if not _agent_authorized():
+        return jsonify({'error': 'Bad agent token'}), 403
+    data = request.json or {}
+    try:
+        spec = coordinator.register_agent(data.get('name') or request.remote_addr,
+                                          int(data.get('workers') or Config.AGENT_WORKERS),
+                                          data.get('owner') or request.remote_addr, data.get('after_session'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 409
+    return jsonify(spec)
+
+@app.route('/api/agents/<agent_id>/db', methods=['POST'])
+def agent_db_calls(agent_id):
+    """Body: {"calls": [{"method": "save_record", "args": [...], "kwargs": {...}}, ...]}"""
+    if not _agent_authorized():
+        return jsonify({'error': 'Bad agent token'}), 403
+    try:
+        results = coordinator.agent_db_calls(agent_id, (request.json or {}).get('calls', []))
+    except KeyError:
+        return jsonify({'error': 'Unknown agent'}), 404
+    except (ValueError, TypeError) as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify({'results': results})
+
+@app.route('/api/agents/<agent_id>/report', methods=['POST'])
+def agent_report(agent_id):
+    """Body: {"kind": "delta" | "done", "payload": {...}} - reply carries stop / limit updates"""
+    if not _agent_authorized():
+        return jsonify({'error': 'Bad agent token'}), 403
+    data = request.json or {}
+    return jsonify({'control': coordinator.agent_report(agent_id, data.get('kind'), data.get('payload') or {})})
+
 @app.route('/api/search/pause', methods=['POST'])
 def pause_search():
     """Manually pause search"""
@@ -6919,7 +12589,9 @@ def get_database_info():
         'db_folder': db.db_folder,
         'total_records': db.get_all_records_count(),
         'exists': os.path.exists(db.db_path),
-        'size_mb': round(os.path.getsize(db.db_path) / (1024 * 1024), 2) if os.path.exists(db.db_path) else 0
+        'size_mb': round(os.path.getsize(db.db_path) / (1024 * 1024), 2) if os.path.exists(db.db_path) else 0,
+        'writer': db.writer.get_stats(),
+        'pools': db.get_pool_stats()
     })
 
 @app.route('/api/db/sessions')
@@ -6944,46 +12616,57 @@ def get_session_details(session_id):
 
 @app.route('/api/db/sessions/<session_id>/records')
 def get_session_records(session_id):
-    """Get records for a session"""
+    """
+    Get one page of a session's records.
+    
+    Query: limit, after_id (next_after_id of the previous page), sort=id|survey,
+    village, hobli, is_match=true|false (matches_only=true still works), owner_prefix
+    """
     db = get_database()
-    limit = request.args.get('limit', 100, type=int)
-    matches_only = request.args.get('matches_only', 'false').lower() == 'true'
+    args = request.args
+    is_match = args.get('is_match')
+    if is_match is None and args.get('matches_only', 'false').lower() == 'true':
+        is_match = 'true'
+    
+    try:
+        page = db.get_records_page(
+            session_id,
+            after_id=args.get('after_id', type=int),
+            limit=args.get('limit', Config.RECORDS_PAGE_SIZE, type=int),
+            sort=args.get('sort', 'id'),
+            village=args.get('village'),
+            hobli=args.get('hobli'),
+            is_match=None if is_match is None else is_match.lower() == 'true',
+            owner_prefix=args.get('owner_prefix')
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
-    records = db.get_session_records(session_id, limit=limit, matches_only=matches_only)
     return jsonify({
         'session_id': session_id,
-        'count': len(records),
-        'records': records
+        'count': len(page['records']),
+        'records': page['records'],
+        'next_after_id': page['next_after_id']
     })
 
 @app.route('/api/db/sessions/<session_id>/export')
 def export_session_to_csv(session_id):
-    """Export session records to CSV"""
-    from flask import send_file
-    
+    """Export session records (streamed; format=csv|ndjson, gzip=true)"""
     db = get_database()
     matches_only = request.args.get('matches_only', 'false').lower() == 'true'
     
-    # Create export filename
     session = db.get_session(session_id)
     if not session:
         return jsonify({'error': 'Session not found'}), 404
     
-    suffix = '_matches' if matches_only else '_all'
-    filename = f"bhoomi_export_{session_id}{suffix}.csv"
-    filepath = os.path.join(db.db_folder, filename)
-    
-    db.export_to_csv(session_id, filepath, matches_only=matches_only)
-    
-    if not os.path.exists(filepath):
+    records = db.iter_session_records(session_id, is_match=True if matches_only else None)
+    first = next(records, None)
+    if first is None:
         return jsonify({'error': 'No records to export'}), 404
     
-    return send_file(
-        filepath,
-        mimetype='text/csv',
-        as_attachment=True,
-        download_name=filename
-    )
+    suffix = '_matches' if matches_only else '_all'
+    return stream_export(itertools.chain([first], records), db.EXPORT_FIELDS,
+                         f"bhoomi_export_{session_id}{suffix}")
 
 @app.route('/api/db/search')
 def search_database():
@@ -7026,35 +12709,16 @@ def get_session_skipped_surveys(session_id):
 
 @app.route('/api/db/sessions/<session_id>/skipped/export')
 def export_skipped_surveys_csv(session_id):
-    """Export skipped surveys to CSV for later retry"""
-    from flask import send_file
-    import csv
-    
+    """Export skipped surveys for later retry (streamed; format=csv|ndjson, gzip=true)"""
     db = get_database()
-    skipped = db.get_skipped_items(session_id)
+    skipped = db.iter_skipped_items(session_id)
+    first = next(skipped, None)
     
-    if not skipped:
+    if first is None:
         return jsonify({'error': 'No skipped surveys found for this session'}), 404
     
-    # Create CSV file
-    filename = f"skipped_surveys_{session_id}.csv"
-    filepath = os.path.join(db.db_folder, filename)
-    
     fieldnames = ['village_name', 'survey_no', 'surnoc', 'hissa', 'period', 'error_message', 'created_at', 'status']
-    
-    with open(filepath, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-        writer.writeheader()
-        writer.writerows(skipped)
-    
-    logger.info(f"📁 Exported {len(skipped)} skipped surveys to {filepath}")
-    
-    return send_file(
-        filepath,
-        mimetype='text/csv',
-        as_attachment=True,
-        download_name=filename
-    )
+    return stream_export(itertools.chain([first], skipped), fieldnames, f"skipped_surveys_{session_id}")
 
 @app.route('/api/skipped/current')
 def get_current_skipped_surveys():
@@ -7068,43 +12732,33 @@ def get_current_skipped_surveys():
 
 @app.route('/api/skipped/current/export')
 def export_current_skipped_csv():
-    """Export current search's skipped surveys to CSV"""
-    from flask import send_file
-    import csv
-    
+    """Export current search's skipped surveys (streamed; format=csv|ndjson, gzip=true)"""
     state = coordinator.get_state()
     skipped = state.get('accuracy_metrics', {}).get('skipped_surveys', [])
-    session_id = state.get('database', {}).get('session_id', 'unknown')
     
     if not skipped:
         return jsonify({'error': 'No skipped surveys in current search'}), 404
     
-    # Create CSV in Downloads folder
-    downloads = os.path.join(os.path.expanduser('~'), 'Downloads')
-    filename = f"skipped_surveys_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-    filepath = os.path.join(downloads, filename)
-    
     fieldnames = ['village', 'village_code', 'survey_no', 'reason', 'timestamp']
-    
-    with open(filepath, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(skipped)
-    
-    logger.info(f"📁 Exported {len(skipped)} skipped surveys to {filepath}")
-    
-    return send_file(
-        filepath,
-        mimetype='text/csv',
-        as_attachment=True,
-        download_name=filename
-    )
+    return stream_export(skipped, fieldnames, f"skipped_surveys_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
 
 # ═══════════════════════════════════════════════════════════════════════════════════════
 # MAIN
 # ═══════════════════════════════════════════════════════════════════════════════════════
 
 if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description='POWER-BHOOMI web server, or a headless worker agent')
+    parser.add_argument('--agent', action='store_true', help='Run as a worker agent for a remote coordinator')
+    parser.add_argument('--coordinator', default=f'http://localhost:{Config.PORT}', help='Coordinator base URL')
+    parser.add_argument('--workers', type=int, default=Config.AGENT_WORKERS, help='Agent worker count')
+    parser.add_argument('--name', help='Agent name shown on the coordinator (default: host name)')
+    parser.add_argument('--once', action='store_true', help='Agent exits after one search')
+    args = parser.parse_args()
+    if args.agent:
+        run_agent(args.coordinator, args.workers, args.name, args.once)
+        sys.exit(0)
+    
     print("""
 ╔══════════════════════════════════════════════════════════════════════════════════════╗
 ║            POWER-BHOOMI v4.0 - ENTERPRISE EDITION (10 WORKERS + HEALTH MGR)          ║
@@ -121,7 +121,7 @@ SELECT '' as '';
 --    OR LENGTH(owner_name) > 200
 --    OR LENGTH(owner_name) < 3;
 
--- SELECT 'Deleted ' || changes() || ' corrupted records' as result;
+-- SELECT 'Deleted ' || total_changes() || ' corrupted records' as result;
 
 -- COMMIT;
 
@@ -169,7 +169,7 @@ SELECT '' as '';
 --        OR LENGTH(owner_name) > 200
 -- );
 
--- SELECT 'Deleted all records from ' || changes() || ' affected sessions' as result;
+-- SELECT 'Deleted all records from ' || total_changes() || ' affected sessions' as result;
 
 -- COMMIT;
 
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Owner Extractor for POWER-BHOOMI
+Pulls owner rows (name, extent, khatah) out of Service2 result pages
+
+Two parsers share the same scoring and row rules:
+  • fast path   - lxml (C parser), used whenever lxml is installed
+  • legacy path - BeautifulSoup html.parser, the original multi-strategy
+                  extractor, kept as the verified fallback
+
+benchmarks/bench_owner_extractor.py checks both paths return the owners
+recorded in owner_pages/expected_owners.json for every saved page and reports
+pages/second for each.
+"""
+
+import re
+import logging
+from typing import List, Optional
+
+# Optional - fast owner extraction
+try:
+    import lxml.html as lxml_html
+except ImportError:
+    lxml_html = None
+
+logger = logging.getLogger('POWER-BHOOMI')
+
+
+class OwnerExtractor:
+    """
+    Result-page owner extraction.
+
+    STRATEGY 1: Score every table and read the best scoring one (results table)
+    STRATEGY 2: Fall back to divs whose class looks like result/data/owner/record
+    """
+
+    # Elements removed before parsing - dropdowns, form controls and page chrome
+    UNWANTED_TAGS = ('select', 'nav', 'header', 'footer', 'button', 'input', 'script', 'style')
+
+    # Keywords that indicate actual results vs form elements
+    RESULT_KEYWORDS = ['Owner', 'ಮಾಲೀಕರ', 'Extent', 'ವಿಸ್ತೀರ್ಣ', 'Khata', 'ಖಾತಾ', 'Name', 'ಹೆಸರು']
+    FORM_KEYWORDS = [
+        'Select District', 'Select Taluk', 'Select Hobli', 'Select Village',
+        'Select Survey', 'Select Surnoc', 'Select Hissa', 'Select Period',
+        'Toggle navigation', 'ಜಿಲ್ಲೆ ಆಯ್ಕೆಮಾಡಿ', 'ತಾಲ್ಲೂಕು ಆಯ್ಕೆಮಾಡಿ'
+    ]
+    HEADER_HINTS = ['owner', 'extent', 'slno', 'name']
+    MIN_TABLE_SCORE = 10  # At least one result keyword or extent - else it is the form/layout table
+    NAME_REJECT = ['Select', 'ಆಯ್ಕೆ', 'Toggle']
+
+    SKIP_PATTERNS = re.compile(r'^(Sl\.?\s*No\.?|ಕ್ರಮ|ಸಂ|#|\d{1,3})$', re.IGNORECASE)
+    EXTENT_PATTERN = re.compile(r'\d+[\.\-]\d+[\.\-]\d+')
+    DISTRICT_LIST_PATTERN = re.compile(r'[A-Z]{60,}')  # Dropdown options glued together, far longer than a name
+    RESULT_DIV_CLASS = re.compile(r'result|data|owner|record', re.I)
+    DIV_NAME_PATTERN = re.compile(r'(?:Owner|Name|ಮಾಲೀಕ)[:\s]*([^\n,]+)')
+    DIV_EXTENT_PATTERN = re.compile(r'(?:Extent|ವಿಸ್ತೀರ್ಣ)[:\s]*(\d+[\.\-]\d+[\.\-]\d+)')
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # SHARED RULES - Parser independent, so both paths agree row for row
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    @classmethod
+    def score_table(cls, table_text: str, num_rows: int) -> int:
+        """Score a candidate table from its full text and row count"""
+        score = 0
+
+        # Positive: has result keywords
+        for kw in cls.RESULT_KEYWORDS:
+            if kw in table_text:
+                score += 10
+
+        # Negative: has form keywords
+        for kw in cls.FORM_KEYWORDS:
+            if kw in table_text:
+                score -= 50
+
+        # Positive: has reasonable rows
+        if 2 <= num_rows <= 100:
+            score += 5
+
+        # Positive: has numeric cells (extent data)
+        if cls.EXTENT_PATTERN.search(table_text):
+            score += 15
+
+        return score
+
+    @classmethod
+    def owners_from_rows(cls, rows: List[List[str]]) -> List[dict]:
+        """
+        Turn the stripped cell texts of the results table into owner entries.
+
+        Args:
+            rows: One list of cell texts per <tr>, in document order
+        """
+        owners = []
+        header_idx = {}  # Track column indices for better extraction
+
+        for row_idx, cell_texts in enumerate(rows):
+            if len(cell_texts) < 2:
+                continue
+            row_text = ' '.join(cell_texts)
+
+            # Detect header row and build column map
+            row_lower = row_text.lower()
+            if row_idx == 0 or any(h in row_lower for h in cls.HEADER_HINTS):
+                for i, txt in enumerate(cell_texts):
+                    txt_lower = txt.lower()
+                    if 'owner' in txt_lower or 'name' in txt_lower or 'ಮಾಲೀಕ' in txt or 'ಹೆಸರು' in txt:
+                        header_idx['owner'] = i
+                    elif 'extent' in txt_lower or 'ವಿಸ್ತೀರ್ಣ' in txt:
+                        header_idx['extent'] = i
+                    elif 'khata' in txt_lower or 'ಖಾತಾ' in txt:
+                        header_idx['khatah'] = i
+                continue  # Skip header row
+
+            # Skip rows that look like form elements
+            if any(pattern in row_text for pattern in cls.FORM_KEYWORDS):
+                continue
+            if cls.DISTRICT_LIST_PATTERN.search(row_text.replace(' ', '')):
+                continue
+
+            # Skip serial number column when there is no header column map to index by
+            if 'owner' not in header_idx and cls.SKIP_PATTERNS.match(cell_texts[0]):
+                cell_texts = cell_texts[1:]  # Shift left, skip serial number
+
+            # Extract owner data using column indices or positional fallback
+            owner_idx = header_idx.get('owner', 0)
+            extent_idx = header_idx.get('extent', 1)
+            khatah_idx = header_idx.get('khatah', 2)
+
+            owner_name = cell_texts[owner_idx] if owner_idx < len(cell_texts) else ''
+            extent = cell_texts[extent_idx] if extent_idx < len(cell_texts) else ''
+            khatah = cell_texts[khatah_idx] if khatah_idx < len(cell_texts) else ''
+
+            # Validate owner name
+            if not owner_name or len(owner_name) < 2:
+                continue
+            if owner_name.isdigit():
+                continue
+            if any(skip in owner_name for skip in cls.NAME_REJECT):
+                continue
+
+            owner_entry = {
+                'owner_name': owner_name,
+                'extent': extent,
+                'khatah': khatah,
+            }
+
+            # Avoid duplicates
+            if owner_entry not in owners:
+                owners.append(owner_entry)
+
+        return owners
+
+    @classmethod
+    def owner_from_div_text(cls, div_text: str) -> Optional[dict]:
+        """Parse a single owner out of a result-looking div (STRATEGY 2)"""
+        if len(div_text) <= 50 or any(kw in div_text for kw in cls.FORM_KEYWORDS):
+            return None
+        name_match = cls.DIV_NAME_PATTERN.search(div_text)
+        if not name_match:
+            return None
+        extent_match = cls.DIV_EXTENT_PATTERN.search(div_text)
+        return {
+            'owner_name': name_match.group(1).strip(),
+            'extent': extent_match.group(1) if extent_match else '',
+            'khatah': ''
+        }
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # FAST PATH - lxml
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def _lxml_text(element, strip: bool = False) -> str:
+        """lxml equivalent of BeautifulSoup get_text() / get_text(' ', strip=True)"""
+        if strip:
+            return ' '.join(s.strip() for s in element.itertext() if s.strip())
+        return ''.join(element.itertext())
+
+    @classmethod
+    def extract_fast(cls, page_source: str) -> Optional[List[dict]]:
+        """
+        Extract owners with lxml.
+
+        Returns None when lxml is unavailable or the page cannot be parsed,
+        so the caller can fall back to extract_legacy().
+        """
+        if lxml_html is None or not page_source or not page_source.strip():
+            return None
+
+        try:
+            root = lxml_html.document_fromstring(page_source)
+        except Exception:
+            return None
+
+        # Remove unwanted elements but keep their tail text as its own node,
+        # matching decompose() so per-string stripping lines up with the legacy path
+        for unwanted in list(root.iter(*cls.UNWANTED_TAGS)):
+            parent = unwanted.getparent()
+            if parent is None:
+                continue
+            if unwanted.tail:
+                tail = lxml_html.Element('span')
+                tail.text = unwanted.tail
+                unwanted.addnext(tail)
+            parent.remove(unwanted)
+
+        # STRATEGY 1: Look for the RESULTS table by structural patterns
+        results_table = None
+        best_score = 0
+        for table in root.iter('table'):
+            score = cls.score_table(cls._lxml_text(table), sum(1 for _ in table.iter('tr')))
+            if score > best_score and score >= cls.MIN_TABLE_SCORE:
+                results_table = table
+                best_score = score
+
+        if results_table is not None:
+            rows = [
+                [cls._lxml_text(cell, strip=True) for cell in row.iter('td', 'th')]
+                for row in results_table.iter('tr')
+            ]
+            return cls.owners_from_rows(rows)
+
+        # STRATEGY 2: Try to find owner data in divs with specific classes
+        owners = []
+        for div in root.iter('div'):
+            if not cls.RESULT_DIV_CLASS.search(div.get('class', '')):
+                continue
+            owner = cls.owner_from_div_text(cls._lxml_text(div, strip=True))
+            if owner:
+                owners.append(owner)
+        return owners
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # LEGACY PATH - BeautifulSoup (verified fallback)
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    @classmethod
+    def extract_legacy(cls, page_source: str, log: logging.Logger = None) -> List[dict]:
+        """Extract owners with BeautifulSoup html.parser"""
+        from bs4 import BeautifulSoup
+
+        log = log or logger
+        owners = []
+        try:
+            soup = BeautifulSoup(page_source, 'html.parser')
+
+            # CRITICAL FIX: Exclude form elements and dropdowns
+            # Remove all select dropdowns, form elements, and navigation before parsing
+            for unwanted in soup.find_all(list(cls.UNWANTED_TAGS)):
+                unwanted.decompose()
+
+            # STRATEGY 1: Look for the RESULTS table by structural patterns
+            results_table = None
+            best_score = 0
+            for table in soup.find_all('table'):
+                score = cls.score_table(table.get_text(), len(table.find_all('tr')))
+                if score > best_score and score >= cls.MIN_TABLE_SCORE:
+                    results_table = table
+                    best_score = score
+
+            if results_table is not None:
+                rows = [
+                    [c.get_text(' ', strip=True) for c in row.find_all(['td', 'th'])]
+                    for row in results_table.find_all('tr')
+                ]
+                owners = cls.owners_from_rows(rows)
+            else:
+                # STRATEGY 2: Try to find owner data in divs with specific classes
+                for div in soup.find_all('div', class_=cls.RESULT_DIV_CLASS):
+                    owner = cls.owner_from_div_text(div.get_text(' ', strip=True))
+                    if owner:
+                        owners.append(owner)
+
+                if not owners:
+                    log.debug("No valid results table or div found in page")
+
+        except Exception as e:
+            log.error(f"Extract error: {e}")
+
+        return owners
+
+    @classmethod
+    def extract(cls, page_source: str, log: logging.Logger = None) -> List[dict]:
+        """Extract owners - lxml fast path first, BeautifulSoup if it is unavailable"""
+        owners = None
+        try:
+            owners = cls.extract_fast(page_source)
+        except Exception as e:
+            (log or logger).debug(f"Fast extract failed, using fallback: {e}")
+        if owners is None:
+            owners = cls.extract_legacy(page_source, log)
+        if not owners:
+            (log or logger).debug("No owners extracted from page")
+        return owners